@@ -0,0 +1,58 @@
+"""
+Deterministic stand-in for the chat models used by workflows.
+
+Benchmarks must not depend on a provider's latency or on API keys. ``FakeChatModel`` answers
+every call with a fixed completion after an optional simulated latency, and counts its calls so
+scenarios can report how many LLM round trips a run needed.
+"""
+
+import asyncio
+from typing import Any, Callable
+
+from browser_use.llm.views import ChatInvokeCompletion
+
+
+class FakeCompletion(ChatInvokeCompletion[Any]):
+	"""Completion that also exposes ``content``, which some callers read instead of ``completion``."""
+
+	@property
+	def content(self) -> Any:
+		return self.completion
+
+
+class FakeChatModel:
+	"""Chat model that returns canned answers without network access."""
+
+	provider = 'fake'
+
+	def __init__(
+		self, answer: str | Callable[[Any], str] = 'Form submitted', latency: float = 0.0, model: str = 'benchmark'
+	) -> None:
+		"""
+		Args:
+			answer: Text returned for free-form calls, or a function of the messages returning it
+			latency: Simulated seconds per call
+			model: Model name reported to caches and logs
+		"""
+		self.model = model
+		self.answer = answer
+		self.latency = latency
+		self.calls = 0
+
+	@property
+	def name(self) -> str:
+		return self.model
+
+	@property
+	def model_name(self) -> str:
+		return self.model
+
+	async def ainvoke(self, messages: Any, output_format: type | None = None, **kwargs: Any) -> FakeCompletion:
+		self.calls += 1
+		if self.latency:
+			await asyncio.sleep(self.latency)
+		if output_format is not None:
+			# Structured output: an instance built from the model's defaults, without validation
+			return FakeCompletion(completion=output_format.model_construct(), usage=None)
+		answer = self.answer(messages) if callable(self.answer) else self.answer
+		return FakeCompletion(completion=answer, usage=None)
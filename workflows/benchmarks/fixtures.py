@@ -0,0 +1,187 @@
+"""
+Generated fixture sites for hermetic benchmarks.
+
+Pages are built deterministically from their size, so every run (and the stored baseline) sees
+the same DOM: ``/elements/<n>`` holds ``n`` interactive elements laid out in labelled sections,
+and ``/form/<i>`` is step ``i`` of a multi-step form whose last page shows a result. A
+``FixtureServer`` serves them from a local ``ThreadingHTTPServer`` on an ephemeral port, so no
+benchmark touches the network.
+
+``element_records`` returns the records the in-page semantic extraction script would report for
+``/elements/<n>``, which lets the mapping and lookup scenarios run without a browser.
+"""
+
+import html
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+# Elements per labelled section on /elements/<n>
+SECTION_SIZE = 20
+
+# Element kinds cycle in this order within a section
+ELEMENT_KINDS = ['input', 'button', 'select', 'a', 'checkbox']
+
+# Field labels of one form page; every page has the same fields with its step number appended
+FORM_FIELDS = ['First name', 'Last name', 'Email', 'City']
+
+
+def _element_label(index: int) -> str:
+	kind = ELEMENT_KINDS[index % len(ELEMENT_KINDS)]
+	return f'{kind.capitalize()} {index}'
+
+
+def elements_page(count: int) -> str:
+	"""HTML page with ``count`` interactive elements."""
+	sections = []
+	for start in range(0, count, SECTION_SIZE):
+		items = []
+		for index in range(start, min(start + SECTION_SIZE, count)):
+			kind = ELEMENT_KINDS[index % len(ELEMENT_KINDS)]
+			label = html.escape(_element_label(index))
+			if kind == 'input':
+				items.append(
+					f'<label for="field-{index}">{label}</label><input id="field-{index}" name="field_{index}" type="text">'
+				)
+			elif kind == 'button':
+				items.append(f'<button type="button" id="button-{index}" class="btn">{label}</button>')
+			elif kind == 'select':
+				items.append(
+					f'<label for="select-{index}">{label}</label>'
+					f'<select id="select-{index}" name="select_{index}"><option>One</option><option>Two</option></select>'
+				)
+			elif kind == 'a':
+				items.append(f'<a href="#item-{index}" id="link-{index}">{label}</a>')
+			else:
+				items.append(f'<label><input type="checkbox" id="check-{index}" name="check_{index}">{label}</label>')
+		sections.append(
+			f'<section id="section-{start // SECTION_SIZE}"><h2>Section {start // SECTION_SIZE}</h2>{"".join(items)}</section>'
+		)
+
+	return f'<!doctype html><html><head><title>{count} elements</title></head><body>{"".join(sections)}</body></html>'
+
+
+def form_page(step: int, total_steps: int) -> str:
+	"""HTML page for step ``step`` (1-based) of a ``total_steps`` form; ``total_steps + 1`` is the result page."""
+	if step > total_steps:
+		return '<!doctype html><html><head><title>Done</title></head><body><h1 id="result">Form submitted</h1></body></html>'
+
+	fields = ''.join(
+		f'<label for="f{step}-{i}">{html.escape(label)} {step}</label><input id="f{step}-{i}" name="f{step}_{i}" type="text">'
+		for i, label in enumerate(FORM_FIELDS)
+	)
+	return (
+		f'<!doctype html><html><head><title>Step {step}</title></head><body>'
+		f'<form method="get" action="/form/{step + 1}?steps={total_steps}"><h1>Step {step} of {total_steps}</h1>{fields}'
+		f'<button type="submit" id="next-{step}">Next {step}</button></form></body></html>'
+	)
+
+
+def element_records(count: int) -> List[Dict[str, Any]]:
+	"""Records as reported by the in-page extraction script for ``elements_page(count)``."""
+	records = []
+	for index in range(count):
+		kind = ELEMENT_KINDS[index % len(ELEMENT_KINDS)]
+		label = _element_label(index)
+		section = index // SECTION_SIZE
+		tag, input_type, element_id = {
+			'input': ('INPUT', 'text', f'field-{index}'),
+			'button': ('BUTTON', 'button', f'button-{index}'),
+			'select': ('SELECT', 'select-one', f'select-{index}'),
+			'a': ('A', '', f'link-{index}'),
+			'checkbox': ('INPUT', 'checkbox', f'check-{index}'),
+		}[kind]
+		selector = f'#{element_id}'
+		records.append(
+			{
+				'tag': tag,
+				'type': input_type,
+				'role': '',
+				'id': element_id,
+				'name': element_id.replace('-', '_') if kind != 'button' else '',
+				'class': 'btn' if kind == 'button' else '',
+				'text_content': label if kind in ('button', 'a') else '',
+				'placeholder': '',
+				'title': '',
+				'aria_label': '',
+				'value': '',
+				'label_text': label if kind in ('input', 'select', 'checkbox') else '',
+				'parent_text': f'Section {section}',
+				'css_selector': selector,
+				'hierarchical_selector': f'#section-{section} > {selector}',
+				'fallback_selector': tag.lower(),
+				'text_xpath': f'//{tag.lower()}[contains(text(), "{label}")]',
+				'dom_path': f'#section-{section} > {selector}',
+				'container_context': {'type': 'section', 'id': f'section-{section}', 'text': f'Section {section}'},
+				'sibling_context': None,
+				'position': {'x': 10, 'y': 30 * index, 'width': 120, 'height': 24},
+			}
+		)
+	return records
+
+
+def element_labels(count: int) -> List[str]:
+	"""Visible labels of the elements on ``elements_page(count)``, in page order."""
+	return [_element_label(index) for index in range(count)]
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+	def do_GET(self) -> None:  # noqa: N802 - http.server naming
+		path, _, query = self.path.partition('?')
+		steps = int(re.search(r'steps=(\d+)', query).group(1)) if 'steps=' in query else 3
+
+		if match := re.fullmatch(r'/elements/(\d+)', path):
+			body = elements_page(int(match.group(1)))
+		elif match := re.fullmatch(r'/form/(\d+)', path):
+			body = form_page(int(match.group(1)), steps)
+		else:
+			self.send_error(404)
+			return
+
+		payload = body.encode('utf-8')
+		self.send_response(200)
+		self.send_header('Content-Type', 'text/html; charset=utf-8')
+		self.send_header('Content-Length', str(len(payload)))
+		self.end_headers()
+		self.wfile.write(payload)
+
+	def log_message(self, format: str, *args: Any) -> None:
+		pass  # keep benchmark output clean
+
+
+class FixtureServer:
+	"""Serves the fixture pages on 127.0.0.1 from a background thread."""
+
+	def __init__(self) -> None:
+		self._server: ThreadingHTTPServer | None = None
+		self._thread: threading.Thread | None = None
+
+	@property
+	def base_url(self) -> str:
+		if self._server is None:
+			raise RuntimeError('FixtureServer is not running')
+		host, port = self._server.server_address[:2]
+		return f'http://{host}:{port}'
+
+	def url(self, path: str) -> str:
+		return f'{self.base_url}{path}'
+
+	def start(self) -> 'FixtureServer':
+		if self._server is None:
+			self._server = ThreadingHTTPServer(('127.0.0.1', 0), _FixtureHandler)
+			self._thread = threading.Thread(target=self._server.serve_forever, name='benchmark-fixtures', daemon=True)
+			self._thread.start()
+		return self
+
+	def stop(self) -> None:
+		if self._server is not None:
+			self._server.shutdown()
+			self._server.server_close()
+			self._server = None
+
+	def __enter__(self) -> 'FixtureServer':
+		return self.start()
+
+	def __exit__(self, *exc_info: Any) -> None:
+		self.stop()
@@ -0,0 +1,166 @@
+"""
+Measurement and baseline comparison for the benchmark suite.
+
+A scenario runs ``repeat`` times. Each run reports how many workflow steps (or equivalent
+operations) it completed and records per-phase samples through a ``PhaseTimer``. The harness
+derives throughput (steps/sec), p50/p95 per phase and the peak Python heap of one extra,
+``tracemalloc``-instrumented run (kept separate so allocation tracking does not skew timings).
+
+Results are compared against a stored baseline (``baseline.json``). A scenario regresses when its
+throughput drops, or a phase's p95 or its peak memory grows, by more than the tolerance.
+"""
+
+import json
+import math
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+DEFAULT_TOLERANCE = 0.25
+
+# Phases faster than this are too noisy to flag as regressions (seconds)
+MIN_COMPARABLE_PHASE_SECONDS = 0.001
+
+
+def percentile(samples: List[float], q: float) -> float:
+	"""Linearly interpolated percentile (``q`` in 0..100) of ``samples``."""
+	if not samples:
+		return 0.0
+	ordered = sorted(samples)
+	rank = (len(ordered) - 1) * q / 100
+	low, high = math.floor(rank), math.ceil(rank)
+	return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class PhaseTimer:
+	"""Collects duration samples per named phase."""
+
+	def __init__(self) -> None:
+		self.samples: Dict[str, List[float]] = {}
+
+	@contextmanager
+	def phase(self, name: str) -> Iterator[None]:
+		start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.record(name, time.perf_counter() - start)
+
+	def record(self, name: str, seconds: float) -> None:
+		self.samples.setdefault(name, []).append(seconds)
+
+
+@dataclass
+class ScenarioResult:
+	"""Measurements of one scenario over all its runs."""
+
+	name: str
+	steps: int = 0
+	wall_time: float = 0.0
+	phases: Dict[str, List[float]] = field(default_factory=dict)
+	peak_memory_mb: float = 0.0
+	skipped: Optional[str] = None
+
+	@property
+	def steps_per_sec(self) -> float:
+		return self.steps / self.wall_time if self.wall_time > 0 else 0.0
+
+	def metrics(self) -> Dict[str, Any]:
+		"""JSON-serializable summary, in the format stored in the baseline."""
+		return {
+			'steps_per_sec': round(self.steps_per_sec, 3),
+			'peak_memory_mb': round(self.peak_memory_mb, 3),
+			'phases': {
+				phase: {
+					'p50': round(percentile(samples, 50), 6),
+					'p95': round(percentile(samples, 95), 6),
+					'count': len(samples),
+				}
+				for phase, samples in sorted(self.phases.items())
+			},
+		}
+
+
+# A scenario run: records phases on the timer and returns the number of steps it completed
+ScenarioRun = Callable[[PhaseTimer], Awaitable[int]]
+
+
+async def measure(name: str, run: ScenarioRun, repeat: int = 3, warmup: int = 1, track_memory: bool = True) -> ScenarioResult:
+	"""Run a scenario ``warmup + repeat`` times and aggregate the timed runs."""
+	for _ in range(warmup):
+		await run(PhaseTimer())
+
+	result = ScenarioResult(name=name)
+	for _ in range(repeat):
+		timer = PhaseTimer()
+		start = time.perf_counter()
+		result.steps += await run(timer)
+		result.wall_time += time.perf_counter() - start
+		for phase, samples in timer.samples.items():
+			result.phases.setdefault(phase, []).extend(samples)
+
+	if track_memory:
+		tracemalloc.start()
+		try:
+			await run(PhaseTimer())
+			_, peak = tracemalloc.get_traced_memory()
+		finally:
+			tracemalloc.stop()
+		result.peak_memory_mb = peak / (1024 * 1024)
+
+	return result
+
+
+def compare_to_baseline(metrics: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+	"""Regressions of one scenario's metrics against its baseline entry (empty when within tolerance)."""
+	regressions = []
+
+	expected_rate = baseline.get('steps_per_sec') or 0
+	if expected_rate and metrics['steps_per_sec'] < expected_rate * (1 - tolerance):
+		regressions.append(f'throughput {metrics["steps_per_sec"]:.2f} steps/s < baseline {expected_rate:.2f}')
+
+	expected_memory = baseline.get('peak_memory_mb') or 0
+	if expected_memory and metrics['peak_memory_mb'] > expected_memory * (1 + tolerance):
+		regressions.append(f'peak memory {metrics["peak_memory_mb"]:.1f}MB > baseline {expected_memory:.1f}MB')
+
+	for phase, expected in baseline.get('phases', {}).items():
+		actual = metrics['phases'].get(phase)
+		if actual is None or expected['p95'] < MIN_COMPARABLE_PHASE_SECONDS:
+			continue
+		if actual['p95'] > expected['p95'] * (1 + tolerance):
+			regressions.append(f'{phase} p95 {actual["p95"] * 1000:.1f}ms > baseline {expected["p95"] * 1000:.1f}ms')
+
+	return regressions
+
+
+def load_baseline(path: str | Path) -> Dict[str, Any]:
+	path = Path(path)
+	if not path.exists():
+		return {}
+	return json.loads(path.read_text()).get('scenarios', {})
+
+
+def save_baseline(path: str | Path, results: List[ScenarioResult], previous: Dict[str, Any] | None = None) -> None:
+	"""Store the results as the new baseline, keeping entries of scenarios that were not run."""
+	scenarios = dict(previous or {})
+	scenarios.update({result.name: result.metrics() for result in results if result.skipped is None})
+	Path(path).write_text(json.dumps({'scenarios': dict(sorted(scenarios.items()))}, indent=2) + '\n')
+
+
+def format_results(results: List[ScenarioResult]) -> str:
+	"""Fixed-width report: one line per scenario, then p50/p95 per phase."""
+	lines = [f'{"scenario":<30}{"steps/s":>12}{"peak MB":>10}   phases (p50 / p95 ms)']
+	lines.append('-' * 100)
+	for result in results:
+		if result.skipped is not None:
+			lines.append(f'{result.name:<30}{"skipped":>12}   {result.skipped}')
+			continue
+		phases = ', '.join(
+			f'{phase} {percentile(samples, 50) * 1000:.1f}/{percentile(samples, 95) * 1000:.1f}'
+			for phase, samples in sorted(result.phases.items())
+		)
+		lines.append(f'{result.name:<30}{result.steps_per_sec:>12.1f}{result.peak_memory_mb:>10.1f}   {phases}')
+	return '\n'.join(lines)
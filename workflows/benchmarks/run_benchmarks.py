@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Run the performance benchmarks and compare them against the stored baseline.
+
+Everything is local: fixture pages come from a generated HTTP server, LLM calls go to a fake
+model, and browser scenarios use a headless Chromium (skipped when none can be launched).
+
+Usage (from the workflows/ directory):
+    python -m benchmarks.run_benchmarks                        # all scenarios, default sizes
+    python -m benchmarks.run_benchmarks -s element_lookup -z 1000
+    python -m benchmarks.run_benchmarks --offline              # skip browser scenarios
+    python -m benchmarks.run_benchmarks --update-baseline      # record current numbers as the baseline
+
+Exits with status 1 when a scenario regresses beyond the tolerance, or when a scenario that requires a
+baseline ran without one (record it with --update-baseline, or pass --allow-missing-baseline for
+exploratory sizes). Scenarios marked ``baseline_required=False`` only report a missing baseline.
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Collection, Dict, List
+
+from benchmarks.harness import (
+	DEFAULT_TOLERANCE,
+	ScenarioResult,
+	compare_to_baseline,
+	format_results,
+	load_baseline,
+	measure,
+	save_baseline,
+)
+from benchmarks.scenarios import SCENARIOS, BenchmarkEnvironment, BrowserUnavailable
+
+DEFAULT_BASELINE = Path(__file__).with_name('baseline.json')
+
+
+async def run_benchmarks(args: argparse.Namespace) -> List[ScenarioResult]:
+	env = BenchmarkEnvironment().start()
+	results: List[ScenarioResult] = []
+	browser_error = None
+
+	try:
+		for scenario in SCENARIOS:
+			if args.scenario and not any(fnmatch.fnmatch(scenario.name, pattern) for pattern in args.scenario):
+				continue
+			for size in args.sizes or scenario.sizes:
+				name = f'{scenario.name}[{size}]'
+				if scenario.requires_browser and (args.offline or browser_error):
+					results.append(ScenarioResult(name=name, skipped=browser_error or 'offline run'))
+					continue
+
+				print(f'⏱️  {name}', file=sys.stderr)
+				try:
+					run = scenario.factory(env, size)
+					results.append(await measure(name, run, repeat=args.repeat, warmup=args.warmup))
+				except BrowserUnavailable as e:
+					# No usable browser here: report the browser scenarios as skipped instead of failing
+					browser_error = str(e)
+					results.append(ScenarioResult(name=name, skipped=browser_error))
+	finally:
+		await env.close()
+
+	return results
+
+
+def check_against_baseline(
+	results: List[ScenarioResult],
+	baseline: Dict[str, Any],
+	tolerance: float,
+	allow_missing: bool = False,
+	required: Collection[str] | None = None,
+) -> bool:
+	"""Print how each scenario that ran compares to the baseline; returns whether the run fails.
+
+	A missing baseline fails the run for scenarios named in ``required`` (all of them when None).
+	"""
+	failed = False
+	for result in results:
+		if result.skipped is not None:
+			continue
+		if result.name not in baseline:
+			scenario = result.name.split('[', 1)[0]
+			if allow_missing or (required is not None and scenario not in required):
+				print(f'➖ {result.name}: no baseline')
+			else:
+				failed = True
+				print(f'❌ {result.name}: no baseline (record one with --update-baseline)')
+			continue
+		regressions = compare_to_baseline(result.metrics(), baseline[result.name], tolerance)
+		if regressions:
+			failed = True
+			print(f'❌ {result.name}: ' + '; '.join(regressions))
+		else:
+			print(f'✅ {result.name}: within {tolerance:.0%} of baseline')
+	return failed
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(
+		description='Run hermetic performance benchmarks',
+		formatter_class=argparse.RawDescriptionHelpFormatter,
+		epilog=__doc__,
+	)
+	parser.add_argument('-s', '--scenario', action='append', help='Scenario name or glob (repeatable; default: all)')
+	parser.add_argument('-z', '--sizes', type=int, action='append', help='Override the scenario sizes (repeatable)')
+	parser.add_argument('-r', '--repeat', type=int, default=3, help='Timed runs per scenario (default: 3)')
+	parser.add_argument('--warmup', type=int, default=1, help='Untimed warm-up runs per scenario (default: 1)')
+	parser.add_argument('--offline', action='store_true', help='Skip scenarios that need a browser')
+	parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='Baseline file to compare against')
+	parser.add_argument('--update-baseline', action='store_true', help='Store these results as the new baseline')
+	parser.add_argument(
+		'--allow-missing-baseline', action='store_true', help='Report scenarios without a baseline instead of failing'
+	)
+	parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='Allowed relative regression (default: 0.25)')
+	parser.add_argument('--output', type=Path, help='Also write the results as JSON to this file')
+	args = parser.parse_args()
+
+	# Workflow logs would drown the report
+	logging.basicConfig(level=logging.WARNING)
+
+	results = asyncio.run(run_benchmarks(args))
+	print(format_results(results))
+
+	if args.output:
+		args.output.write_text(json.dumps({r.name: r.metrics() for r in results if r.skipped is None}, indent=2) + '\n')
+
+	baseline = load_baseline(args.baseline)
+	if args.update_baseline:
+		save_baseline(args.baseline, results, previous=baseline)
+		print(f'\n📌 Baseline updated: {args.baseline}')
+		return 0
+
+	print()
+	required = {scenario.name for scenario in SCENARIOS if scenario.baseline_required}
+	failed = check_against_baseline(
+		results, baseline, args.tolerance, allow_missing=args.allow_missing_baseline, required=required
+	)
+	return 1 if failed else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
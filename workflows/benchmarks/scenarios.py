@@ -0,0 +1,283 @@
+"""
+Benchmark scenarios.
+
+Each scenario factory takes the shared ``BenchmarkEnvironment`` and a size and returns a
+``ScenarioRun`` for the harness. Offline scenarios exercise the Python side of the semantic layer
+on fixture element records; browser scenarios drive a local headless Chromium against the
+fixture server, with ``FakeChatModel`` standing in for every LLM.
+
+- ``mapping_build``: turn extracted element records into a semantic mapping (offline)
+- ``element_lookup``: exact and fuzzy text lookups in a mapping (offline)
+- ``semantic_extraction``: full and unchanged-page extraction on a fixture page (browser)
+- ``run_no_ai``: a complete ``Workflow.run_with_no_ai`` pass over a multi-step form (browser)
+- ``csv_bulk``: form rows run concurrently on a warm browser pool, as ``run-workflow-csv`` does (browser)
+"""
+
+import asyncio
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from benchmarks.fake_llm import FakeChatModel
+from benchmarks.fixtures import FORM_FIELDS, FixtureServer, element_labels, element_records
+from benchmarks.harness import PhaseTimer, ScenarioRun
+from workflow_use.schema.views import WorkflowDefinitionSchema
+from workflow_use.workflow.extraction_cache import ExtractionCache
+from workflow_use.workflow.semantic_extractor import SemanticExtractor
+
+# Lookups per element_lookup run
+LOOKUPS_PER_RUN = 50
+
+# Input variables of the generated form workflow, one per field
+FORM_INPUTS = ['first_name', 'last_name', 'email', 'city']
+
+# Seconds to wait for a local browser before browser scenarios are skipped
+BROWSER_START_TIMEOUT = 60
+
+
+class BrowserUnavailable(RuntimeError):
+	"""No local browser can be launched; browser scenarios are skipped rather than failed."""
+
+
+class BenchmarkEnvironment:
+	"""Fixture server, fake LLM and (lazily) a headless browser shared by all scenarios."""
+
+	def __init__(self, pool_size: int = 2) -> None:
+		self.server = FixtureServer()
+		self.llm = FakeChatModel()
+		self.pool_size = pool_size
+		self._browser = None
+		self._pool = None
+		self._tmp = tempfile.TemporaryDirectory(prefix='workflow-benchmarks-')
+		# Extractions always reach the (fake) LLM so every run does the same work
+		self.extraction_cache = ExtractionCache(cache_dir=self._tmp.name, enabled=False)
+
+	def start(self) -> 'BenchmarkEnvironment':
+		self.server.start()
+		return self
+
+	async def browser(self):
+		"""A started headless browser; raises BrowserUnavailable when none can be launched."""
+		if self._browser is None:
+			from browser_use import Browser
+
+			browser = Browser(headless=True, keep_alive=True)
+			try:
+				await asyncio.wait_for(browser.start(), BROWSER_START_TIMEOUT)
+			except Exception as e:
+				# Stop the session's event bus too, or its tasks keep the event loop from shutting down
+				await browser.kill()
+				raise BrowserUnavailable(f'Cannot launch a local browser: {e!r}') from e
+			self._browser = browser
+		return self._browser
+
+	async def pool(self):
+		"""A warm pool of ``pool_size`` headless browsers; raises BrowserUnavailable when they cannot be launched."""
+		if self._pool is None:
+			from browser_use import Browser
+
+			from workflow_use.workflow.browser_pool import BrowserPool
+			from workflow_use.workflow.browser_session import BrowserSessionManager
+
+			sessions = [BrowserSessionManager(browser=Browser(headless=True)) for _ in range(self.pool_size)]
+			pool = BrowserPool(sessions=sessions, max_waiting=1024)
+			try:
+				await asyncio.wait_for(pool.start(), BROWSER_START_TIMEOUT)
+			except Exception as e:
+				await asyncio.gather(*(session.browser.kill() for session in sessions), return_exceptions=True)
+				raise BrowserUnavailable(f'Cannot launch local browsers: {e!r}') from e
+			self._pool = pool
+		return self._pool
+
+	async def goto(self, url: str):
+		from workflow_use.workflow.page_readiness import wait_for_page_ready
+
+		page = await (await self.browser()).get_current_page()
+		await page.goto(url)
+		await wait_for_page_ready(page)
+		return page
+
+	async def close(self) -> None:
+		if self._pool is not None:
+			await self._pool.close()
+		if self._browser is not None:
+			self._browser.browser_profile.keep_alive = False
+			await self._browser.stop()
+		self.server.stop()
+		self._tmp.cleanup()
+
+
+def form_workflow(base_url: str, steps: int) -> WorkflowDefinitionSchema:
+	"""Workflow that fills and submits every page of a ``steps``-page fixture form, then extracts the result."""
+	workflow_steps: List[Dict[str, Any]] = [
+		{'type': 'navigation', 'url': f'{base_url}/form/1?steps={steps}', 'description': 'Open the form'}
+	]
+	for page in range(1, steps + 1):
+		for label, variable in zip(FORM_FIELDS, FORM_INPUTS):
+			workflow_steps.append(
+				{
+					'type': 'input',
+					'target_text': f'{label} {page}',
+					'value': f'{{{variable}}}',
+					'description': f'Fill {label} on page {page}',
+				}
+			)
+		workflow_steps.append({'type': 'click', 'target_text': f'Next {page}', 'description': f'Submit page {page}'})
+	workflow_steps.append({'type': 'extract', 'extractionGoal': 'Get the confirmation message', 'description': 'Result'})
+
+	return WorkflowDefinitionSchema(
+		name=f'Benchmark form ({steps} pages)',
+		description='Fills a generated multi-step form',
+		version='1.0',
+		input_schema=[{'name': name, 'type': 'string', 'required': True} for name in FORM_INPUTS],
+		steps=workflow_steps,
+	)
+
+
+def form_inputs(row: int = 0) -> Dict[str, str]:
+	return {'first_name': f'Ada{row}', 'last_name': f'Lovelace{row}', 'email': f'ada{row}@example.com', 'city': 'London'}
+
+
+def _record_trace_phases(timer: PhaseTimer, trace) -> None:
+	"""Per-step self time by trace category (mapping, element, action, verification, ...) as phase samples."""
+	for row in trace.summary()[:-1]:
+		if row['step'] is None:
+			continue
+		timer.record('step', row['total'])
+		for category, seconds in row.items():
+			if category not in ('step', 'label', 'total') and seconds > 0:
+				timer.record(category, seconds)
+
+
+# --- Offline scenarios ---
+
+
+def mapping_build(env: BenchmarkEnvironment, size: int) -> ScenarioRun:
+	records = element_records(size)
+
+	async def run(timer: PhaseTimer) -> int:
+		extractor = SemanticExtractor()
+
+		async def extract_interactive_elements(page):
+			return records
+
+		extractor.extract_interactive_elements = extract_interactive_elements
+		with timer.phase('build_mapping'):
+			mapping = await extractor.extract_semantic_mapping(page=None)
+		assert len(mapping) == size, f'Expected {size} mapped elements, got {len(mapping)}'
+		return 1
+
+	return run
+
+
+def element_lookup(env: BenchmarkEnvironment, size: int) -> ScenarioRun:
+	records = element_records(size)
+	labels = element_labels(size)
+	stride = max(1, len(labels) // LOOKUPS_PER_RUN)
+	targets = labels[::stride][:LOOKUPS_PER_RUN]
+
+	async def run(timer: PhaseTimer) -> int:
+		extractor = SemanticExtractor()
+
+		async def extract_interactive_elements(page):
+			return records
+
+		extractor.extract_interactive_elements = extract_interactive_elements
+		mapping = await extractor.extract_semantic_mapping(page=None)
+
+		for target in targets:
+			with timer.phase('exact_lookup'):
+				found = extractor.find_element_by_text(mapping, target)
+			assert found is not None, f'Lookup for {target!r} failed'
+			# Lower-cased partial text goes through the fuzzy strategies
+			with timer.phase('fuzzy_lookup'):
+				extractor.find_element_by_text(mapping, target.lower().replace(' ', '  ') + ' field')
+		return 2 * len(targets)
+
+	return run
+
+
+# --- Browser scenarios ---
+
+
+def semantic_extraction(env: BenchmarkEnvironment, size: int) -> ScenarioRun:
+	async def run(timer: PhaseTimer) -> int:
+		page = await env.goto(env.server.url(f'/elements/{size}'))
+		extractor = SemanticExtractor()
+		with timer.phase('full_extraction'):
+			mapping = await extractor.extract_semantic_mapping(page, incremental=True)
+		with timer.phase('unchanged_extraction'):
+			await extractor.extract_semantic_mapping(page, incremental=True)
+		assert len(mapping) >= size, f'Expected at least {size} mapped elements, got {len(mapping)}'
+		return 2
+
+	return run
+
+
+def run_no_ai(env: BenchmarkEnvironment, size: int) -> ScenarioRun:
+	from workflow_use.workflow.service import Workflow
+
+	async def run(timer: PhaseTimer) -> int:
+		browser = await env.browser()
+		schema = form_workflow(env.server.base_url, size)
+		workflow = Workflow(
+			workflow_schema=schema,
+			llm=env.llm,
+			browser=browser,
+			page_extraction_llm=env.llm,
+			extraction_cache=env.extraction_cache,
+			step_wait_time=0,
+			trace=True,
+		)
+		result = await workflow.run_with_no_ai(inputs=form_inputs(), close_browser_at_end=False)
+		_record_trace_phases(timer, workflow.last_trace)
+		return len(result.step_results)
+
+	return run
+
+
+def csv_bulk(env: BenchmarkEnvironment, size: int) -> ScenarioRun:
+	from workflow_use.workflow.service import Workflow
+
+	async def run(timer: PhaseTimer) -> int:
+		pool = await env.pool()
+		schema = form_workflow(env.server.base_url, 1)
+
+		async def run_row(row: int) -> int:
+			async with pool.session() as session:
+				workflow = Workflow(
+					workflow_schema=schema,
+					llm=env.llm,
+					session_manager=session,
+					page_extraction_llm=env.llm,
+					extraction_cache=env.extraction_cache,
+					step_wait_time=0,
+				)
+				with timer.phase('row'):
+					result = await workflow.run_with_no_ai(inputs=form_inputs(row))
+				return len(result.step_results)
+
+		return sum(await asyncio.gather(*(run_row(row) for row in range(size))))
+
+	return run
+
+
+@dataclass(frozen=True)
+class Scenario:
+	name: str
+	factory: Callable[[BenchmarkEnvironment, int], ScenarioRun]
+	sizes: tuple
+	requires_browser: bool
+	# Whether a run without a committed baseline for this scenario fails
+	baseline_required: bool = True
+
+
+# Default sizes: element counts, form pages or CSV rows. Browser scenarios have no committed baseline
+# yet; record one with --update-baseline on a machine with Chromium, then make it required.
+SCENARIOS = [
+	Scenario('mapping_build', mapping_build, (100, 1000, 10000), requires_browser=False),
+	Scenario('element_lookup', element_lookup, (100, 1000, 10000), requires_browser=False),
+	Scenario('semantic_extraction', semantic_extraction, (100, 1000, 10000), requires_browser=True, baseline_required=False),
+	Scenario('run_no_ai', run_no_ai, (3,), requires_browser=True, baseline_required=False),
+	Scenario('csv_bulk', csv_bulk, (8,), requires_browser=True, baseline_required=False),
+]
@@ -1,25 +1,24 @@
 import asyncio
+import csv
+import functools
 import json
 import os
 import subprocess
 import tempfile  # For temporary file handling
 import webbrowser
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import aiofiles
-import pandas as pd
 import typer
-from browser_use import Browser
-from browser_use.llm.base import BaseChatModel
-
-from workflow_use.builder.service import BuilderService
-from workflow_use.controller.service import WorkflowController
-from workflow_use.healing.service import HealingService
-from workflow_use.llm import get_llm, DEFAULT_LLM_MODEL
-from workflow_use.mcp.service import get_mcp_server
-from workflow_use.recorder.service import RecordingService  # Added import
-from workflow_use.storage.service import WorkflowStorageService
-from workflow_use.workflow.service import Workflow
+
+if TYPE_CHECKING:
+	from browser_use.llm.base import BaseChatModel
+
+	from workflow_use.builder.service import BuilderService
+	from workflow_use.healing.service import HealingService
+	from workflow_use.recorder.service import RecordingService
+	from workflow_use.storage.service import WorkflowStorageService
+	from workflow_use.workflow.service import Workflow
 
 # Placeholder for recorder functionality
 # from src.recorder.service import RecorderService
@@ -31,25 +30,65 @@ app = typer.Typer(
 	no_args_is_help=True,
 )
 
-# LLM Configuration
-LLM_MODEL = os.getenv('LLM_MODEL', DEFAULT_LLM_MODEL)
+# Services and heavy dependencies (browser_use, pandas, the MCP server, the recorder's FastAPI app)
+# are created on first use inside the commands that need them, so commands like list-workflows
+# start without importing them.
+
+
+@functools.cache
+def _get_llms() -> 'tuple[BaseChatModel | None, BaseChatModel | None]':
+	"""Initialize the agent and page extraction LLMs with OpenRouter (None when not configured)."""
+	from workflow_use.llm import get_llm
+
+	try:
+		return get_llm(), get_llm()
+	except ValueError as e:
+		typer.secho(f'Warning: {e}', fg=typer.colors.YELLOW)
+		return None, None
+
+
+def get_llm_instance() -> 'BaseChatModel | None':
+	"""Return the shared agent LLM."""
+	return _get_llms()[0]
+
+
+def get_page_extraction_llm() -> 'BaseChatModel | None':
+	"""Return the shared page extraction LLM."""
+	return _get_llms()[1]
+
+
+@functools.cache
+def get_builder_service() -> 'BuilderService | None':
+	"""Return the workflow builder, or None when no LLM is configured."""
+	from workflow_use.builder.service import BuilderService
+
+	llm_instance = get_llm_instance()
+	return BuilderService(llm=llm_instance) if llm_instance else None
 
-# Initialize LLM with OpenRouter
-llm_instance: BaseChatModel | None = None
-page_extraction_llm: BaseChatModel | None = None
-try:
-	llm_instance = get_llm()
-	page_extraction_llm = get_llm()
-except ValueError as e:
-	typer.secho(f'Warning: {e}', fg=typer.colors.YELLOW)
 
-builder_service = BuilderService(llm=llm_instance) if llm_instance else None
-# recorder_service = RecorderService() # Placeholder
-recording_service = (
-	RecordingService()
-)  # Assuming RecordingService does not need LLM, or handle its potential None state if it does.
-healing_service = HealingService(llm=llm_instance) if llm_instance else None
-storage_service = WorkflowStorageService()
+@functools.cache
+def get_recording_service() -> 'RecordingService':
+	"""Return the recording service (does not need an LLM)."""
+	from workflow_use.recorder.service import RecordingService
+
+	return RecordingService()
+
+
+@functools.cache
+def get_healing_service() -> 'HealingService | None':
+	"""Return the healing service, or None when no LLM is configured."""
+	from workflow_use.healing.service import HealingService
+
+	llm_instance = get_llm_instance()
+	return HealingService(llm=llm_instance) if llm_instance else None
+
+
+@functools.cache
+def get_storage_service() -> 'WorkflowStorageService':
+	"""Return the workflow storage; WORKFLOW_STORAGE_BACKEND selects 'json' (metadata.json) or 'sqlite' (workflows.db)."""
+	from workflow_use.storage.service import create_storage_service
+
+	return create_storage_service(backend=os.getenv('WORKFLOW_STORAGE_BACKEND', 'json'))
 
 
 def get_default_save_dir() -> Path:
@@ -84,6 +123,8 @@ def _build_and_save_workflow_from_recording(
 	is_temp_recording: bool = False,  # To adjust messages if it's from a live recording
 ) -> Path | None:
 	"""Builds a workflow from a recording file, prompts for details, and saves it."""
+	builder_service = get_builder_service()
+
 	if not builder_service:
 		typer.secho(
 			'BuilderService not initialized. Cannot build workflow.',
@@ -395,7 +436,7 @@ def _infer_navigation_step(from_url, to_url, all_steps, current_index):
 
 async def _convert_recording_to_semantic_workflow(recording_data, description, simulate_interactions, auto_fix_navigation=False):
 	"""Convert a recorded workflow to semantic format using target_text fields."""
-	from workflow_use.workflow.semantic_extractor import SemanticExtractor
+	from workflow_use.recorder.conversion_engine import RecordingConversionEngine
 
 	# Extract workflow metadata
 	workflow_name = recording_data.get('name', 'Recorded Workflow')
@@ -423,107 +464,10 @@ async def _convert_recording_to_semantic_workflow(recording_data, description, s
 		fixed_steps = filtered_steps
 		typer.echo('⚠️ Skipping auto-fix navigation steps (disabled)')
 
-	# Initialize semantic extractor
-	semantic_extractor = SemanticExtractor()
-
-	# Start browser to process pages
-	browser = Browser()
-
-	semantic_steps = []
-	current_url = None
-	semantic_mapping = {}
-
-	try:
-		for i, step in enumerate(fixed_steps):
-			step_type = step.get('type', '').lower()
-
-			if step_type == 'navigation':
-				# Navigation step - extract semantic mapping for new page
-				current_url = step.get('url')
-				if current_url:
-					semantic_steps.append({'description': f'Navigate to {current_url}', 'type': 'navigation', 'url': current_url})
-
-					# Extract semantic mapping for this page
-					try:
-						page = await browser.get_current_page()
-						await page.goto(current_url)
-						# Wait for page to load and dynamic content
-						await asyncio.sleep(2)
-						semantic_mapping = await semantic_extractor.extract_semantic_mapping(page)
-						if semantic_mapping is None:
-							semantic_mapping = {}
-						typer.echo(f'Extracted {len(semantic_mapping or {})} semantic elements from {current_url}')
-					except Exception as e:
-						typer.echo(f'Warning: Could not extract semantic mapping from {current_url}: {e}')
-						semantic_mapping = {}
-
-			elif step_type in ['click', 'input', 'select', 'keypress']:
-				# Before processing interactive steps, refresh semantic mapping to catch dynamic changes
-				# This is especially important after form interactions that might show/hide elements
-				if i > 0 and current_url:  # Skip refresh for first step
-					try:
-						page = await browser.get_current_page()
-						# Small delay to let any previous interactions take effect
-						await asyncio.sleep(1)
-						semantic_mapping = await semantic_extractor.extract_semantic_mapping(page)
-						if semantic_mapping is None:
-							semantic_mapping = {}
-						typer.echo(f'Refreshed semantic mapping: {len(semantic_mapping or {})} elements available')
-					except Exception as e:
-						typer.echo(f'Warning: Could not refresh semantic mapping: {e}')
-						semantic_mapping = {}
-
-				# Interactive step - convert to semantic format
-				# Ensure semantic_mapping is not None before passing it
-				if semantic_mapping is None:
-					semantic_mapping = {}
-				semantic_step = await _convert_step_to_semantic(step, semantic_mapping, browser, simulate_interactions)
-				if semantic_step:
-					semantic_steps.append(semantic_step)
-
-			elif step_type == 'scroll':
-				# Keep scroll steps as-is
-				semantic_steps.append(
-					{
-						'description': step.get('description', 'Scroll page'),
-						'type': 'scroll',
-						'scrollX': step.get('scrollX', 0),
-						'scrollY': step.get('scrollY', 0),
-					}
-				)
-
-				# After scroll, refresh semantic mapping as new elements might be visible
-				if current_url:
-					try:
-						page = await browser.get_current_page()
-						await page.evaluate(f'() => window.scrollBy({step.get("scrollX", 0)}, {step.get("scrollY", 0)})')
-						await asyncio.sleep(1)  # Wait for scroll to complete
-						semantic_mapping = await semantic_extractor.extract_semantic_mapping(page)
-						if semantic_mapping is None:
-							semantic_mapping = {}
-						typer.echo(f'Refreshed semantic mapping after scroll: {len(semantic_mapping or {})} elements available')
-					except Exception as e:
-						typer.echo(f'Warning: Could not refresh semantic mapping after scroll: {e}')
-						semantic_mapping = {}
-
-			elif step_type == 'extract':
-				# Keep extraction steps as-is with their extractionGoal
-				extraction_step = {
-					'description': step.get('description', 'Extract information with AI'),
-					'type': 'extract',
-					'extractionGoal': step.get('extractionGoal', 'Extract information from the page'),
-					'url': step.get('url', current_url),
-				}
-				semantic_steps.append(extraction_step)
-				typer.echo(f'Added extraction step: {extraction_step["extractionGoal"]}')
-
-			else:
-				# Unknown step type - keep as-is but warn
-				typer.echo(f"Warning: Unknown step type '{step_type}' - keeping as-is")
-				semantic_steps.append(step)
-
-	finally:
-		await browser.close()
+	# Replay navigation segments (in parallel unless interactions are simulated) to map recorded elements to visible text
+	engine = RecordingConversionEngine(_convert_step_to_semantic, simulate_interactions=simulate_interactions)
+	semantic_steps = await engine.convert(fixed_steps)
+	typer.echo(f'Converted {len(fixed_steps)} steps with {engine.extractions} semantic extractions')
 
 	# Build the semantic workflow
 	semantic_workflow = {
@@ -811,6 +755,8 @@ async def _convert_step_to_semantic(step, semantic_mapping, browser, simulate_in
 
 async def _simulate_step_interaction(step, browser):
 	"""Simulate the interaction to keep page state accurate (optional)."""
+	from workflow_use.workflow.page_readiness import wait_for_page_ready
+
 	step_type = step.get('type', '').lower()
 	css_selector = step.get('cssSelector', '')
 
@@ -834,8 +780,8 @@ async def _simulate_step_interaction(step, browser):
 			if key:
 				await page.press(css_selector, key, timeout=2000)
 
-		# Small delay to let the interaction take effect
-		await asyncio.sleep(0.5)
+		# Let the interaction take effect
+		await wait_for_page_ready(page, timeout=2)
 
 	except Exception:
 		# Silently ignore simulation errors - this is just for page state accuracy
@@ -892,6 +838,8 @@ def create_workflow():
 	Guides the user through recording browser actions, then uses the helper
 	to build and save the workflow definition.
 	"""
+	recording_service = get_recording_service()
+
 	if not recording_service:
 		# Adjusted RecordingService initialization check assuming it doesn't need LLM
 		typer.secho(
@@ -957,6 +905,8 @@ def create_workflow_no_ai():
 	Records browser actions and builds a semantic workflow using target_text fields
 	instead of CSS selectors, optimized for run-workflow-no-ai execution.
 	"""
+	recording_service = get_recording_service()
+
 	if not recording_service:
 		typer.secho(
 			'RecordingService not available. Cannot create workflow.',
@@ -1155,6 +1105,11 @@ def run_as_tool_command(
 	"""
 	Run the workflow and automatically parse the required variables from the input/prompt that the user provides.
 	"""
+	from workflow_use.workflow.service import Workflow
+
+	llm_instance = get_llm_instance()
+	page_extraction_llm = get_page_extraction_llm()
+
 	if not llm_instance:
 		typer.secho(
 			'LLM not initialized. Please check your OpenAI API key. Cannot run as tool.',
@@ -1194,6 +1149,16 @@ def run_as_tool_command(
 		raise typer.Exit(code=1)
 
 
+def _write_run_trace(workflow_obj: 'Workflow', trace_file: Path | None) -> None:
+	"""Write the run's timing trace (if one was recorded) and print its summary table."""
+	if trace_file is None or workflow_obj.last_trace is None:
+		return
+	workflow_obj.last_trace.write_chrome_trace(trace_file)
+	typer.echo()
+	typer.echo(workflow_obj.last_trace.format_summary())
+	typer.secho(f'Trace written to {trace_file} (open in chrome://tracing or https://ui.perfetto.dev)', fg=typer.colors.BLUE)
+
+
 @app.command(name='run-workflow', help='Runs an existing workflow from a JSON file.')
 def run_workflow_command(
 	workflow_path: Path = typer.Argument(
@@ -1206,10 +1171,29 @@ def run_workflow_command(
 		show_default=False,
 	),
 	use_cloud: bool = typer.Option(False, help='Use Browser-Use Cloud browser'),
+	extraction_cache: bool = typer.Option(
+		True, '--extraction-cache/--no-extraction-cache', help='Reuse cached LLM extraction results for unchanged pages'
+	),
+	trace_file: Path | None = typer.Option(
+		None, '--trace', help='Write per-step timings as Chrome trace-event JSON to this file and print a summary table'
+	),
+	learn_waits: bool = typer.Option(
+		False, '--learn-waits', help='Wait between steps for the p95 settle time measured on earlier runs instead of static waits'
+	),
+	incremental_mapping: bool = typer.Option(
+		False, '--incremental-mapping', help='Refresh semantic mappings from changed DOM subtrees only instead of the whole page'
+	),
 ):
 	"""
 	Loads and executes a workflow, prompting the user for required inputs.
 	"""
+	from browser_use import Browser
+
+	from workflow_use.controller.service import WorkflowController
+	from workflow_use.workflow.service import Workflow
+
+	llm_instance = get_llm_instance()
+	page_extraction_llm = get_page_extraction_llm()
 
 	async def _run_workflow():
 		typer.echo(
@@ -1228,6 +1212,10 @@ def run_workflow_command(
 				llm=llm_instance,
 				controller=controller_instance,
 				page_extraction_llm=page_extraction_llm,
+				use_extraction_cache=extraction_cache,
+				trace=trace_file is not None,
+				learn_wait_times=learn_waits,
+				incremental_mapping=incremental_mapping,
 			)
 		except Exception as e:
 			typer.secho(f'Error loading workflow: {e}', fg=typer.colors.RED)
@@ -1336,6 +1324,8 @@ def run_workflow_command(
 		except Exception as e:
 			typer.secho(f'Error running workflow: {e}', fg=typer.colors.RED)
 			raise typer.Exit(code=1)
+		finally:
+			_write_run_trace(workflow_obj, trace_file)
 
 	return asyncio.run(_run_workflow())
 
@@ -1358,12 +1348,28 @@ def run_workflow_no_ai_command(
 		help='Enable AI-powered extraction steps (requires OpenAI API key for extraction steps only)',
 	),
 	use_cloud: bool = typer.Option(False, help='Use Browser-Use Cloud browser'),
+	extraction_cache: bool = typer.Option(
+		True, '--extraction-cache/--no-extraction-cache', help='Reuse cached LLM extraction results for unchanged pages'
+	),
+	trace_file: Path | None = typer.Option(
+		None, '--trace', help='Write per-step timings as Chrome trace-event JSON to this file and print a summary table'
+	),
+	learn_waits: bool = typer.Option(
+		False, '--learn-waits', help='Wait between steps for the p95 settle time measured on earlier runs instead of static waits'
+	),
+	incremental_mapping: bool = typer.Option(
+		False, '--incremental-mapping', help='Refresh semantic mappings from changed DOM subtrees only instead of the whole page'
+	),
 ):
 	"""
 	Loads and executes a workflow using semantic abstraction without any AI/LLM involvement.
 	This uses visible text mappings to deterministic selectors instead of fragile CSS selectors.
 	Optionally enables AI-powered extraction steps while keeping semantic abstraction for interactions.
 	"""
+	from browser_use import Browser
+
+	from workflow_use.llm import get_llm
+	from workflow_use.workflow.service import Workflow
 
 	async def _run_workflow_no_ai():
 		typer.echo(
@@ -1393,6 +1399,10 @@ def run_workflow_no_ai_command(
 				browser=browser,
 				llm=dummy_llm,  # Won't be used in run_with_no_ai for interactions
 				page_extraction_llm=extraction_llm,  # Will be used for extraction steps if enabled
+				use_extraction_cache=extraction_cache,
+				trace=trace_file is not None,
+				learn_wait_times=learn_waits,
+				incremental_mapping=incremental_mapping,
 			)
 		except Exception as e:
 			typer.secho(f'Error loading workflow: {e}', fg=typer.colors.RED)
@@ -1530,6 +1540,8 @@ def run_workflow_no_ai_command(
 		except Exception as e:
 			typer.secho(f'Error running workflow: {e}', fg=typer.colors.RED)
 			raise typer.Exit(code=1)
+		finally:
+			_write_run_trace(workflow_obj, trace_file)
 
 	return asyncio.run(_run_workflow_no_ai())
 
@@ -1554,6 +1566,7 @@ def generate_semantic_mapping_command(
 		typer.echo()
 
 		try:
+			import aiofiles
 			from browser_use import Browser
 
 			from workflow_use.workflow.semantic_extractor import SemanticExtractor
@@ -1649,6 +1662,7 @@ def create_semantic_workflow_command(
 		typer.echo()
 
 		try:
+			import aiofiles
 			from browser_use import Browser
 
 			from workflow_use.workflow.semantic_extractor import SemanticExtractor
@@ -1754,6 +1768,93 @@ def create_semantic_workflow_command(
 	return asyncio.run(_create_semantic_workflow())
 
 
+CSV_RESULT_FIELDS = ['row_number', 'status', 'error', 'duration', 'steps_executed', 'failure_type']
+
+
+class _CsvResultWriter:
+	"""Appends execution results to a CSV file one row at a time, flushing after every write."""
+
+	def __init__(self, output_file: Path, input_columns: list[str]):
+		fieldnames = CSV_RESULT_FIELDS + [column for column in input_columns if column not in CSV_RESULT_FIELDS]
+		self._file = open(output_file, 'w', newline='', encoding='utf-8')
+		self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, restval='', extrasaction='ignore')
+		self._writer.writeheader()
+		self._file.flush()
+
+	def write(self, result: dict) -> None:
+		self._writer.writerow({key: '' if _is_missing(value) else value for key, value in result.items()})
+		self._file.flush()
+
+	def close(self) -> None:
+		self._file.close()
+
+
+def _is_missing(value) -> bool:
+	import pandas as pd
+
+	try:
+		return value is None or bool(pd.isna(value))
+	except (TypeError, ValueError):
+		return False
+
+
+async def _run_rows_on_pool(rows, worker_workflows: list, execute_row, on_result) -> bool:
+	"""Execute rows concurrently, one worker per workflow, fed from a bounded queue.
+
+	Args:
+		rows: Iterable of (index, row) pairs, consumed lazily by the producer
+		worker_workflows: One Workflow per worker; each owns its own browser
+		execute_row: Coroutine function (workflow, index, row) -> result dict
+		on_result: Called with each result as it completes; returning True stops the pool
+
+	Returns:
+		True if execution was stopped early by on_result
+	"""
+	worker_count = len(worker_workflows)
+	row_queue: asyncio.Queue = asyncio.Queue(maxsize=worker_count * 2)
+	stop_event = asyncio.Event()
+
+	async def _produce():
+		for item in rows:
+			if stop_event.is_set():
+				break
+			await row_queue.put(item)
+		for _ in range(worker_count):
+			await row_queue.put(None)
+
+	async def _work(worker_workflow):
+		while True:
+			item = await row_queue.get()
+			if item is None:
+				return
+			# Keep draining after a stop so the producer never blocks on a full queue
+			if stop_event.is_set():
+				continue
+			idx, row = item
+			result = await execute_row(worker_workflow, idx, row)
+			if on_result(result):
+				stop_event.set()
+
+	await asyncio.gather(_produce(), *(_work(worker_workflow) for worker_workflow in worker_workflows))
+	return stop_event.is_set()
+
+
+async def _close_pool_browsers(worker_workflows: list) -> None:
+	"""Stop every browser owned by the pool, ignoring individual shutdown errors."""
+
+	async def _close(worker_workflow):
+		try:
+			if worker_workflow.session_manager is not None:
+				await worker_workflow.session_manager.close()
+				return
+			worker_workflow.browser.browser_profile.keep_alive = False
+			await worker_workflow.browser.stop()
+		except Exception:
+			pass
+
+	await asyncio.gather(*(_close(worker_workflow) for worker_workflow in worker_workflows))
+
+
 @app.command(name='run-workflow-csv', help='Runs a workflow multiple times using input values from a CSV file.')
 def run_workflow_csv_command(
 	workflow_path: Path = typer.Argument(
@@ -1784,11 +1885,18 @@ def run_workflow_csv_command(
 		1,
 		'--max-parallel',
 		'-p',
-		help='Maximum number of parallel workflow executions (default: 1 for sequential execution)',
+		help='Number of isolated browsers executing rows concurrently (default: 1 for sequential execution)',
 		min=1,
-		max=5,
+	),
+	session_reset: str = typer.Option(
+		'same_context',
+		'--session-reset',
+		help='Browser state reset between rows on a warm browser: same_context, clear_storage or new_context',
 	),
 	use_cloud: bool = typer.Option(False, help='Use Browser-Use Cloud browser'),
+	extraction_cache: bool = typer.Option(
+		True, '--extraction-cache/--no-extraction-cache', help='Reuse cached LLM extraction results for unchanged pages'
+	),
 	output_file: Path = typer.Option(
 		None,
 		'--output',
@@ -1815,6 +1923,13 @@ def run_workflow_csv_command(
 	Each row in the CSV represents one execution with different input values.
 	CSV column headers should match the workflow input parameter names.
 	"""
+	import pandas as pd
+	from browser_use import Browser
+
+	from workflow_use.workflow.browser_session import SESSION_RESET_MODES, BrowserSessionManager
+	from workflow_use.workflow.service import Workflow
+
+	llm_instance = get_llm_instance()
 
 	async def _run_workflow_csv():
 		from datetime import datetime
@@ -1866,6 +1981,13 @@ def run_workflow_csv_command(
 		typer.echo(f'Processing rows {start_row} to {start_row + len(df) - 1} ({len(df)} total executions)')
 		typer.echo()
 
+		if session_reset not in SESSION_RESET_MODES:
+			typer.secho(
+				f'Error: --session-reset must be one of {", ".join(SESSION_RESET_MODES)} (got {session_reset}).',
+				fg=typer.colors.RED,
+			)
+			raise typer.Exit(code=1)
+
 		# Load workflow
 		try:
 			browser = Browser(use_cloud=use_cloud)
@@ -1882,6 +2004,8 @@ def run_workflow_csv_command(
 				str(workflow_path),
 				browser=browser,
 				llm=dummy_llm,
+				session_manager=BrowserSessionManager(browser, reset_mode=session_reset),
+				use_extraction_cache=extraction_cache,
 			)
 		except Exception as e:
 			typer.secho(f'Error loading workflow: {e}', fg=typer.colors.RED)
@@ -1921,41 +2045,70 @@ def run_workflow_csv_command(
 		results = []
 		start_time = datetime.now()
 
-		# Execute workflows
-		if max_parallel == 1:
-			# Sequential execution
-			typer.echo(typer.style('Starting sequential execution...', bold=True))
-			for idx, row in df.iterrows():
-				typer.echo(f'\n--- Execution {idx + 1 - start_idx} of {len(df)} ---')
-				result = await _execute_single_workflow(workflow_obj, row, idx + 1, use_ai and dummy_llm)
-				results.append(result)
-
-				# Check if we should stop execution due to critical failures
-				if result['failure_type'] in ['global_failure_limit', 'consecutive_failures']:
-					typer.echo()
-					typer.secho(
-						'🛑 STOPPING EXECUTION: Critical workflow failure detected.', fg=typer.colors.BRIGHT_RED, bold=True
+		# Each worker owns an isolated browser and Workflow instance so rows never share page or executor state.
+		# Browsers stay warm across a worker's rows and are reset between them according to --session-reset.
+		# Workers share one semantic mapping cache, so a page state extracted by any worker is reused by all.
+		worker_count = min(max_parallel, len(df))
+		worker_workflows = [workflow_obj]
+		try:
+			for _ in range(worker_count - 1):
+				worker_workflows.append(
+					Workflow(
+						workflow_schema=workflow_obj.schema,
+						llm=dummy_llm,
+						session_manager=BrowserSessionManager(Browser(use_cloud=use_cloud), reset_mode=session_reset),
+						mapping_cache=workflow_obj.mapping_cache,
+						extraction_cache=workflow_obj.extraction_cache,
 					)
-					typer.echo(f'Reason: {result["error"]}')
-					typer.echo(f'Completed {len(results)} out of {len(df)} planned executions.')
-					break
-		else:
-			# Parallel execution (simplified for now)
-			typer.echo(typer.style(f'Starting parallel execution (max {max_parallel} concurrent)...', bold=True))
-			typer.echo('Note: Parallel execution is experimental and may cause browser conflicts.')
-
-			# For now, implement as batched sequential to avoid browser conflicts
-			batch_size = max_parallel
-			for i in range(0, len(df), batch_size):
-				batch = df.iloc[i : i + batch_size]
-				typer.echo(
-					f'\n--- Batch {i // batch_size + 1}: Processing rows {i + start_row} to {min(i + batch_size - 1 + start_row, start_row + len(df) - 1)} ---'
 				)
+		except Exception as e:
+			typer.secho(f'Error creating browser pool: {e}', fg=typer.colors.RED)
+			raise typer.Exit(code=1)
+
+		if worker_count == 1:
+			typer.echo(typer.style('Starting sequential execution...', bold=True))
+		else:
+			typer.echo(typer.style(f'Starting parallel execution ({worker_count} isolated browsers)...', bold=True))
+
+		# Results are streamed to disk as rows finish so long runs keep their progress
+		result_writer = None
+		if output_file:
+			try:
+				result_writer = _CsvResultWriter(output_file, df.columns.tolist())
+			except Exception as e:
+				typer.secho(f'Error opening results file: {e}', fg=typer.colors.RED)
+				raise typer.Exit(code=1)
+
+		def _on_result(result):
+			results.append(result)
+			if result_writer:
+				try:
+					result_writer.write(result)
+				except Exception as e:
+					typer.secho(f'Error saving result for row {result["row_number"]}: {e}', fg=typer.colors.RED)
+			typer.echo(f'  Row {result["row_number"]} finished ({len(results)} of {len(df)} done)')
+
+			# Check if we should stop execution due to critical failures
+			if result.get('failure_type') in ['global_failure_limit', 'consecutive_failures']:
+				typer.echo()
+				typer.secho('🛑 STOPPING EXECUTION: Critical workflow failure detected.', fg=typer.colors.BRIGHT_RED, bold=True)
+				typer.echo(f'Reason: {result["error"]}')
+				return True
+			return False
+
+		async def _execute_row(worker_workflow, idx, row):
+			typer.echo(f'\n--- Execution {idx + 1 - start_idx} of {len(df)} (row {idx + 1}) ---')
+			return await _execute_single_workflow(worker_workflow, row, idx + 1, use_ai and dummy_llm)
 
-				for idx, row in batch.iterrows():
-					typer.echo(f'\nExecution {idx + 1 - start_idx} of {len(df)}')
-					result = await _execute_single_workflow(workflow_obj, row, idx + 1, use_ai and dummy_llm)
-					results.append(result)
+		try:
+			stopped = await _run_rows_on_pool(df.iterrows(), worker_workflows, _execute_row, _on_result)
+		finally:
+			if result_writer:
+				result_writer.close()
+			await _close_pool_browsers(worker_workflows)
+
+		if stopped:
+			typer.echo(f'Completed {len(results)} out of {len(df)} planned executions.')
 
 		# Summary
 		end_time = datetime.now()
@@ -2020,14 +2173,8 @@ def run_workflow_csv_command(
 				typer.secho('  • Verify data types match form expectations', fg=typer.colors.CYAN)
 				typer.secho('  • Check for proper validation rules in the target form', fg=typer.colors.CYAN)
 
-		# Save results if requested
 		if output_file:
-			try:
-				results_df = pd.DataFrame(results)
-				results_df.to_csv(output_file, index=False)
-				typer.secho(f'\nResults saved to: {output_file}', fg=typer.colors.GREEN, bold=True)
-			except Exception as e:
-				typer.secho(f'Error saving results: {e}', fg=typer.colors.RED)
+			typer.secho(f'\nResults saved to: {output_file}', fg=typer.colors.GREEN, bold=True)
 
 		if failed > 0:
 			raise typer.Exit(code=1)
@@ -2152,17 +2299,34 @@ def mcp_server_command(
 		'-p',
 		help='Port to run the MCP server on.',
 	),
+	pool_size: int = typer.Option(2, '--pool-size', help='Warm browsers shared by tool calls (concurrent runs)', min=1),
+	max_queued_calls: int = typer.Option(
+		16, '--max-queued-calls', help='Tool calls allowed to wait for a free browser before new calls are rejected', min=0
+	),
+	queue_timeout: float = typer.Option(
+		120.0, '--queue-timeout', help='Seconds a tool call may wait for a free browser before failing'
+	),
 ):
 	"""
 	Starts the MCP server which expose all the created workflows as tools.
 	"""
+	from workflow_use.llm import get_llm
+	from workflow_use.mcp.service import get_mcp_server
+
 	typer.echo(typer.style('Starting MCP server...', bold=True))
 	typer.echo()  # Add space
 
 	llm_instance = get_llm()
 	page_extraction_llm = get_llm()
 
-	mcp = get_mcp_server(llm_instance, page_extraction_llm=page_extraction_llm, workflow_dir='./tmp')
+	mcp = get_mcp_server(
+		llm_instance,
+		page_extraction_llm=page_extraction_llm,
+		workflow_dir='./tmp',
+		pool_size=pool_size,
+		max_queued_calls=max_queued_calls,
+		queue_timeout=queue_timeout,
+	)
 
 	mcp.run(
 		transport='sse',
@@ -2226,6 +2390,7 @@ def generate_csv_template_command(
 	Generate a CSV template file for a workflow based on its input schema.
 	This helps users understand the required CSV format for bulk execution.
 	"""
+	import pandas as pd
 
 	typer.echo(
 		typer.style(f'Loading workflow from: {typer.style(str(workflow_path.resolve()), fg=typer.colors.MAGENTA)}', bold=True)
@@ -2337,6 +2502,11 @@ def generate_workflow_from_task(
 	  python cli.py generate-workflow "Fill out the contact form on example.com"
 	  python cli.py generate-workflow "Login to PNC and get balances" --with-credentials
 	"""
+	from workflow_use.llm import DEFAULT_LLM_MODEL, get_llm
+
+	healing_service = get_healing_service()
+	storage_service = get_storage_service()
+
 	if not healing_service:
 		typer.secho('Error: HealingService not initialized. Cannot generate workflow.', fg=typer.colors.RED)
 		raise typer.Exit(code=1)
@@ -2379,7 +2549,7 @@ Look up the values from the environment and use the credentials that match the s
 	extraction_llm = get_llm()
 
 	typer.echo('Starting browser automation to complete the task...')
-	typer.echo(f'  Model: {LLM_MODEL}')
+	typer.echo(f'  Model: {os.getenv("LLM_MODEL", DEFAULT_LLM_MODEL)}')
 	typer.echo(f'  Browser: {"☁️  Cloud" if use_cloud else "🖥️  Local"}')
 	typer.echo()
 
@@ -2457,6 +2627,8 @@ def list_workflows(
 	  python cli.py list-workflows --generation-mode browser_use
 	  python cli.py list-workflows --query "contact form"
 	"""
+	storage_service = get_storage_service()
+
 	workflows = storage_service.search_workflows(query=query, generation_mode=generation_mode)
 
 	if not workflows:
@@ -2494,6 +2666,12 @@ def run_stored_workflow(
 	  python cli.py run-stored-workflow <workflow-id>
 	  python cli.py run-stored-workflow <workflow-id> --prompt "Fill with test data"
 	"""
+	from workflow_use.workflow.service import Workflow
+
+	llm_instance = get_llm_instance()
+	page_extraction_llm = get_page_extraction_llm()
+	storage_service = get_storage_service()
+
 	if not llm_instance:
 		typer.secho('Error: LLM not initialized.', fg=typer.colors.RED)
 		raise typer.Exit(code=1)
@@ -2505,7 +2683,7 @@ def run_stored_workflow(
 		typer.secho(f'Workflow not found: {workflow_id}', fg=typer.colors.RED)
 		raise typer.Exit(code=1)
 
-	metadata = storage_service.metadata.get(workflow_id)
+	metadata = storage_service.get_metadata(workflow_id)
 
 	typer.echo()
 	typer.secho(f'▶️  Running workflow: {workflow_definition.name}', fg=typer.colors.CYAN, bold=True)
@@ -2675,6 +2853,8 @@ def delete_workflow(
 	Example:
 	  python cli.py delete-workflow <workflow-id>
 	"""
+	storage_service = get_storage_service()
+
 	workflow = storage_service.get_workflow(workflow_id)
 
 	if not workflow:
@@ -2702,8 +2882,10 @@ def workflow_info(
 	Example:
 	  python cli.py workflow-info <workflow-id>
 	"""
+	storage_service = get_storage_service()
+
 	workflow = storage_service.get_workflow(workflow_id)
-	metadata = storage_service.metadata.get(workflow_id)
+	metadata = storage_service.get_metadata(workflow_id)
 
 	if not workflow or not metadata:
 		typer.secho(f'Workflow not found: {workflow_id}', fg=typer.colors.RED)
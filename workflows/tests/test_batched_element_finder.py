@@ -0,0 +1,88 @@
+"""
+Test batched multi-strategy resolution in ElementFinder.
+"""
+
+import json
+from unittest.mock import AsyncMock, Mock
+
+from workflow_use.workflow.element_finder import XPATH_BATCH_JS, ElementFinder, SelectorMapIndex
+
+
+def _node(**attrs):
+	node = {'is_visible': True}
+	node.update(attrs)
+	return node
+
+
+class TestBatchedElementFinder:
+	"""Test ElementFinder in batched resolution mode"""
+
+	def setup_method(self):
+		self.finder = ElementFinder()
+		self.page = Mock()
+		self.page.evaluate = AsyncMock()
+		self.session = Mock()
+		self.session.get_current_page = AsyncMock(return_value=self.page)
+		self.session.get_selector_map = AsyncMock(
+			return_value={
+				1: _node(text='Submit', tag_name='a'),
+				2: _node(text='Submit', role='button', is_visible=False),
+				3: _node(text='Submit', role='button'),
+				4: _node(placeholder='Email'),
+			}
+		)
+
+	def test_index_returns_first_visible_match(self):
+		"""Lookups match a linear scan: first visible node in selector map order"""
+		index = SelectorMapIndex(self.session.get_selector_map.return_value)
+
+		assert index.lookup('text_exact', 'Submit', {})[0] == 1
+		assert index.lookup('role_text', 'Submit', {'role': 'button'})[0] == 3, 'Hidden node 2 should be skipped'
+		assert index.lookup('placeholder', 'Email', {})[0] == 4
+		assert index.lookup('aria_label', 'Email', {}) is None
+
+	async def test_all_xpaths_in_one_evaluation(self):
+		"""Every XPath strategy is evaluated in a single in-page call and priority decides the winner"""
+		self.page.evaluate.return_value = json.dumps([{'found': False}, {'found': True, 'visible': True, 'tag': 'BUTTON'}])
+		strategies = [
+			{'type': 'xpath', 'value': '//button[@id="gone"]', 'priority': 1},
+			{'type': 'text_exact', 'value': 'Missing', 'priority': 2},
+			{'type': 'xpath', 'value': 'html/body/button', 'priority': 3},
+		]
+
+		result, attempts = await self.finder.find_element_with_strategies(strategies, self.session)
+
+		assert self.page.evaluate.await_count == 1, 'XPaths should be batched into one evaluation'
+		script, xpaths = self.page.evaluate.await_args.args
+		assert script == XPATH_BATCH_JS
+		assert xpaths == ['//button[@id="gone"]', '/html/body/button'], 'Relative XPaths should be normalized'
+		assert result == ('/html/body/button', strategies[2])
+		assert [(a.strategy_type, a.success) for a in attempts] == [('xpath', False), ('text_exact', False), ('xpath', True)]
+		assert attempts[0].error_message == 'XPath query returned no results'
+
+	async def test_semantic_hit_skips_lower_priority_xpaths(self):
+		"""XPaths ranked below a semantic hit are never evaluated"""
+		strategies = [
+			{'type': 'placeholder', 'value': 'Email', 'priority': 1},
+			{'type': 'xpath', 'value': '//input', 'priority': 2},
+		]
+
+		result, attempts = await self.finder.find_element_with_strategies(strategies, self.session)
+
+		assert result == (4, strategies[0])
+		assert self.page.evaluate.await_count == 0, 'No page evaluation should be needed'
+		assert len(attempts) == 1 and attempts[0].success
+
+	async def test_matches_sequential_mode(self):
+		"""Batched and sequential resolution return the same result and attempts"""
+		strategies = [
+			{'type': 'aria_label', 'value': 'Close', 'priority': 1},
+			{'type': 'css', 'value': '#submit', 'priority': 2},
+			{'type': 'text_fuzzy', 'value': 'Submt', 'priority': 3, 'metadata': {'threshold': 0.8}},
+		]
+
+		batched = await self.finder.find_element_with_strategies(strategies, self.session)
+		sequential = await ElementFinder(resolution_mode='sequential').find_element_with_strategies(strategies, self.session)
+
+		assert batched == sequential
+		assert batched[0] == (1, strategies[2])
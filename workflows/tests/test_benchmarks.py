@@ -0,0 +1,188 @@
+"""
+Test the benchmark harness, fixtures and offline scenarios.
+"""
+
+import argparse
+import sys
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks import run_benchmarks  # noqa: E402
+from benchmarks.fake_llm import FakeChatModel  # noqa: E402
+from benchmarks.fixtures import FixtureServer, element_labels, element_records, elements_page, form_page  # noqa: E402
+from benchmarks.harness import (  # noqa: E402
+	PhaseTimer,
+	ScenarioResult,
+	compare_to_baseline,
+	load_baseline,
+	measure,
+	percentile,
+	save_baseline,
+)
+from benchmarks.scenarios import (  # noqa: E402
+	BenchmarkEnvironment,
+	BrowserUnavailable,
+	Scenario,
+	element_lookup,
+	form_workflow,
+	mapping_build,
+)
+
+
+class TestHarness:
+	def test_percentile_interpolates(self):
+		samples = [4.0, 1.0, 3.0, 2.0]
+		assert percentile(samples, 0) == 1.0
+		assert percentile(samples, 100) == 4.0
+		assert percentile(samples, 50) == 2.5, 'Median of an even sample should interpolate'
+		assert percentile([], 95) == 0.0
+
+	def test_within_tolerance_is_not_a_regression(self):
+		baseline = {'steps_per_sec': 100.0, 'peak_memory_mb': 10.0, 'phases': {'lookup': {'p50': 0.01, 'p95': 0.02, 'count': 5}}}
+		metrics = {'steps_per_sec': 90.0, 'peak_memory_mb': 11.0, 'phases': {'lookup': {'p50': 0.01, 'p95': 0.024, 'count': 5}}}
+		assert compare_to_baseline(metrics, baseline, tolerance=0.25) == []
+
+	def test_regressions_are_reported(self):
+		baseline = {'steps_per_sec': 100.0, 'peak_memory_mb': 10.0, 'phases': {'lookup': {'p50': 0.01, 'p95': 0.02, 'count': 5}}}
+		metrics = {'steps_per_sec': 50.0, 'peak_memory_mb': 20.0, 'phases': {'lookup': {'p50': 0.03, 'p95': 0.05, 'count': 5}}}
+		regressions = compare_to_baseline(metrics, baseline, tolerance=0.25)
+		assert len(regressions) == 3, f'Expected throughput, memory and phase regressions, got {regressions}'
+
+	def test_tiny_phases_are_ignored(self):
+		baseline = {'phases': {'lookup': {'p50': 0.00001, 'p95': 0.00002, 'count': 5}}}
+		metrics = {'steps_per_sec': 1.0, 'peak_memory_mb': 0.0, 'phases': {'lookup': {'p50': 0.0001, 'p95': 0.0002, 'count': 5}}}
+		assert compare_to_baseline(metrics, baseline) == [], 'Sub-millisecond phases are too noisy to compare'
+
+	def test_baseline_round_trip_keeps_unrun_scenarios(self, tmp_path):
+		path = tmp_path / 'baseline.json'
+		timer = PhaseTimer()
+		timer.record('lookup', 0.01)
+		result = ScenarioResult(name='lookup[10]', steps=10, wall_time=1.0, phases=timer.samples)
+		skipped = ScenarioResult(name='browser[10]', skipped='no browser')
+
+		save_baseline(path, [result, skipped], previous={'old[1]': {'steps_per_sec': 1.0}})
+		baseline = load_baseline(path)
+
+		assert set(baseline) == {'lookup[10]', 'old[1]'}, 'Skipped scenarios must not be stored'
+		assert baseline['lookup[10]']['steps_per_sec'] == 10.0
+		assert load_baseline(tmp_path / 'missing.json') == {}
+
+	async def test_measure_aggregates_timed_runs(self):
+		runs = []
+
+		async def run(timer):
+			runs.append(timer)
+			with timer.phase('work'):
+				pass
+			return 2
+
+		result = await measure('noop', run, repeat=3, warmup=1)
+		assert len(runs) == 5, 'Expected one warm-up, three timed runs and one memory run'
+		assert result.steps == 6
+		assert len(result.phases['work']) == 3, 'Only timed runs should contribute phase samples'
+
+
+class TestFixtures:
+	def test_records_match_page(self):
+		page = elements_page(45)
+		records = element_records(45)
+		labels = element_labels(45)
+		assert len(records) == len(labels) == 45
+		for record in records:
+			assert f'id="{record["id"]}"' in page, f'{record["id"]} missing from the page'
+		assert page.count('<section') == 3, 'Elements should be grouped in sections of 20'
+
+	def test_server_serves_fixture_pages(self):
+		with FixtureServer() as server:
+			with urllib.request.urlopen(server.url('/elements/10')) as response:
+				assert 'Input 0' in response.read().decode()
+			with urllib.request.urlopen(server.url('/form/1?steps=2')) as response:
+				assert 'Next 1' in response.read().decode()
+		assert 'Form submitted' in form_page(3, 2), 'The page after the last step should show the result'
+
+	def test_form_workflow_is_valid(self):
+		schema = form_workflow('http://127.0.0.1:1', 2)
+		assert len(schema.steps) == 1 + 2 * 5 + 1, 'Navigation, four inputs and a click per page, then extract'
+		assert schema.steps[-1].type == 'extract'
+
+	async def test_fake_llm_counts_calls(self):
+		llm = FakeChatModel(answer='done')
+		completion = await llm.ainvoke([])
+		assert completion.completion == completion.content == 'done'
+		assert llm.calls == 1
+
+
+class TestOfflineScenarios:
+	def setup_method(self):
+		self.env = BenchmarkEnvironment()
+
+	def teardown_method(self):
+		self.env._tmp.cleanup()
+
+	async def test_mapping_build(self):
+		result = await measure('mapping_build[50]', mapping_build(self.env, 50), repeat=1, warmup=0, track_memory=False)
+		assert result.steps == 1
+		assert 'build_mapping' in result.phases
+
+	async def test_element_lookup(self):
+		result = await measure('element_lookup[50]', element_lookup(self.env, 50), repeat=1, warmup=0, track_memory=False)
+		assert result.steps > 0
+		assert set(result.phases) == {'exact_lookup', 'fuzzy_lookup'}
+
+
+def browser_scenario(name, error):
+	def factory(env, size):
+		async def run(timer):
+			raise error
+
+		return run
+
+	return Scenario(name, factory, (1,), requires_browser=True)
+
+
+class TestRunner:
+	def setup_method(self):
+		self.args = argparse.Namespace(scenario=None, sizes=None, offline=False, repeat=1, warmup=0)
+
+	async def test_missing_browser_skips_browser_scenarios(self, monkeypatch):
+		scenarios = [
+			browser_scenario('first', BrowserUnavailable('no chromium')),
+			browser_scenario('second', AssertionError('should not run')),
+			Scenario('offline', mapping_build, (10,), requires_browser=False),
+		]
+		monkeypatch.setattr(run_benchmarks, 'SCENARIOS', scenarios)
+
+		results = await run_benchmarks.run_benchmarks(self.args)
+
+		assert [result.skipped for result in results] == ['no chromium', 'no chromium', None]
+
+	async def test_browser_scenario_failures_are_not_skips(self, monkeypatch):
+		monkeypatch.setattr(run_benchmarks, 'SCENARIOS', [browser_scenario('broken', RuntimeError('evaluate failed'))])
+		with pytest.raises(RuntimeError, match='evaluate failed'):
+			await run_benchmarks.run_benchmarks(self.args)
+
+	def test_scenarios_without_baseline_fail(self):
+		result = ScenarioResult(name='run_no_ai[3]', steps=3, wall_time=1.0)
+		skipped = ScenarioResult(name='csv_bulk[8]', skipped='no browser')
+
+		assert run_benchmarks.check_against_baseline([result, skipped], {}, tolerance=0.25) is True
+		assert run_benchmarks.check_against_baseline([result], {}, tolerance=0.25, allow_missing=True) is False
+		assert run_benchmarks.check_against_baseline([skipped], {}, tolerance=0.25) is False, 'Skipped scenarios need no baseline'
+
+	def test_only_required_scenarios_need_a_baseline(self):
+		offline = ScenarioResult(name='mapping_build[100]', steps=1, wall_time=1.0)
+		browser = ScenarioResult(name='run_no_ai[3]', steps=3, wall_time=1.0)
+
+		assert run_benchmarks.check_against_baseline([browser], {}, tolerance=0.25, required={'mapping_build'}) is False
+		assert run_benchmarks.check_against_baseline([offline], {}, tolerance=0.25, required={'mapping_build'}) is True
+
+	def test_default_run_requires_committed_baselines_only(self):
+		baseline = load_baseline(run_benchmarks.DEFAULT_BASELINE)
+		for scenario in run_benchmarks.SCENARIOS:
+			if scenario.baseline_required:
+				missing = [size for size in scenario.sizes if f'{scenario.name}[{size}]' not in baseline]
+				assert not missing, f'{scenario.name} requires a baseline but none is committed for sizes {missing}'
@@ -0,0 +1,182 @@
+"""
+Test the warm browser pool and per-call isolation of MCP workflow tools.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import yaml
+
+from workflow_use.mcp.service import _setup_workflow_tools
+from workflow_use.workflow.browser_pool import BrowserPool
+from workflow_use.workflow.service import Workflow
+
+
+def _session():
+	session = Mock()
+	session.acquire = AsyncMock()
+	session.release = Mock()
+	session.close = AsyncMock()
+	return session
+
+
+class TestBrowserPool:
+	"""Test warming, exclusive lending and admission control"""
+
+	def setup_method(self):
+		self.sessions = [_session(), _session()]
+
+	async def test_warms_all_browsers_once(self):
+		pool = BrowserPool(sessions=self.sessions)
+
+		async with pool.session():
+			pass
+		async with pool.session():
+			pass
+
+		for session in self.sessions:
+			session.acquire.assert_awaited_once_with(reset=False)
+
+	async def test_each_session_serves_one_run_at_a_time(self):
+		pool = BrowserPool(sessions=self.sessions, max_waiting=8)
+		active = set()
+		peak = 0
+
+		async def run():
+			nonlocal peak
+			async with pool.session() as session:
+				assert session not in active, 'A browser must never be lent to two runs at once'
+				active.add(session)
+				peak = max(peak, len(active))
+				await asyncio.sleep(0.01)
+				active.discard(session)
+
+		await asyncio.gather(*(run() for _ in range(6)))
+
+		assert peak == 2, 'Runs beyond the pool size should wait for a free browser'
+
+	async def test_rejects_calls_when_queue_is_full(self):
+		pool = BrowserPool(sessions=self.sessions[:1], max_waiting=1)
+		held = asyncio.Event()
+		release = asyncio.Event()
+
+		async def hold():
+			async with pool.session():
+				held.set()
+				await release.wait()
+
+		holder = asyncio.create_task(hold())
+		await held.wait()
+		waiter = asyncio.create_task(hold())
+		await asyncio.sleep(0.01)
+		assert pool.waiting == 1
+
+		with pytest.raises(RuntimeError, match='saturated'):
+			async with pool.session():
+				pass
+
+		release.set()
+		await asyncio.gather(holder, waiter)
+
+	async def test_bounds_burst_during_warm_up(self):
+		warm = asyncio.Event()
+
+		async def slow_start(reset=True):
+			await warm.wait()
+
+		session = _session()
+		session.acquire = AsyncMock(side_effect=slow_start)
+		pool = BrowserPool(sessions=[session], max_waiting=1)
+
+		async def call():
+			async with pool.session():
+				await asyncio.sleep(0.01)
+
+		calls = [asyncio.create_task(call()) for _ in range(10)]
+		await asyncio.sleep(0.01)
+		warm.set()
+		results = await asyncio.gather(*calls, return_exceptions=True)
+
+		rejected = [result for result in results if isinstance(result, RuntimeError)]
+		assert len(rejected) == 8, 'Only one running and one waiting call should be admitted while the pool warms up'
+		assert pool.waiting == 0
+
+	async def test_times_out_waiting_for_a_browser(self):
+		pool = BrowserPool(sessions=self.sessions[:1], acquire_timeout=0.01)
+
+		async with pool.session():
+			with pytest.raises(TimeoutError):
+				async with pool.session():
+					pass
+
+		async with pool.session():
+			pass  # the timed-out waiter must not have consumed the browser
+
+
+class TestMcpToolIsolation:
+	"""Test that concurrent MCP tool calls get their own Workflow and browser"""
+
+	async def test_concurrent_calls_do_not_share_run_state(self, tmp_path, monkeypatch):
+		definition = {
+			'name': 'Lookup',
+			'description': 'Look up a value',
+			'version': '1.0',
+			'input_schema': [{'name': 'query', 'type': 'string', 'required': True}],
+			'steps': [{'type': 'extract', 'extractionGoal': 'Get {query}', 'description': 'Result'}],
+		}
+		(tmp_path / 'lookup.workflow.yaml').write_text(yaml.safe_dump(definition))
+
+		runs = []
+
+		async def fake_run(self, inputs=None, **kwargs):
+			self.context = dict(inputs)
+			await asyncio.sleep(0.01)
+			runs.append((self, self.session_manager, self.context['query']))
+			return {'query': self.context['query']}
+
+		monkeypatch.setattr(Workflow, 'run', fake_run)
+
+		registered = {}
+		mcp_app = Mock()
+		mcp_app.tool = lambda name, description: lambda func: registered.setdefault(name, func)
+		sessions = [_session(), _session()]
+
+		_setup_workflow_tools(mcp_app, Mock(), None, str(tmp_path), browser_pool=BrowserPool(sessions=sessions))
+		runner = registered['Lookup_1.0']
+
+		results = await asyncio.gather(*(runner(query=f'q{i}') for i in range(4)))
+
+		assert [f'"q{i}"' in result for i, result in enumerate(results)] == [True] * 4
+		assert len({id(workflow) for workflow, _, _ in runs}) == 4, 'Every call should get a fresh Workflow'
+		assert {session for _, session, _ in runs} == set(sessions), 'Calls should run on pooled browsers'
+
+	async def test_calls_share_caches(self, tmp_path, monkeypatch):
+		definition = {
+			'name': 'Lookup',
+			'description': 'Look up a value',
+			'version': '1.0',
+			'input_schema': [],
+			'steps': [{'type': 'extract', 'extractionGoal': 'Get the value', 'description': 'Result'}],
+		}
+		(tmp_path / 'lookup.workflow.yaml').write_text(yaml.safe_dump(definition))
+
+		caches = []
+
+		async def fake_run(self, inputs=None, **kwargs):
+			caches.append((self.mapping_cache, self.extraction_cache))
+			return {}
+
+		monkeypatch.setattr(Workflow, 'run', fake_run)
+
+		registered = {}
+		mcp_app = Mock()
+		mcp_app.tool = lambda name, description: lambda func: registered.setdefault(name, func)
+		_setup_workflow_tools(mcp_app, Mock(), None, str(tmp_path), browser_pool=BrowserPool(sessions=[_session(), _session()]))
+		runner = registered['Lookup_1.0']
+
+		await asyncio.gather(runner(), runner())
+
+		(first_mapping, first_extraction), (second_mapping, second_extraction) = caches
+		assert first_mapping is second_mapping, 'Calls should share one (initially empty) mapping cache'
+		assert first_extraction is second_extraction
@@ -0,0 +1,173 @@
+"""
+Test warm browser session reuse across workflow runs.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from browser_use.agent.views import ActionResult
+
+from workflow_use.schema.views import WorkflowDefinitionSchema
+from workflow_use.workflow.browser_session import BrowserSessionManager
+from workflow_use.workflow.service import Workflow
+
+
+def _tab(target_id, url):
+	tab = Mock()
+	tab.target_id = target_id
+	tab.url = url
+	return tab
+
+
+def _browser():
+	browser = Mock()
+	browser.start = AsyncMock()
+	browser.stop = AsyncMock()
+	browser.kill = AsyncMock()
+	browser.clear_cookies = AsyncMock()
+	browser.navigate_to = AsyncMock()
+	browser.close_page = AsyncMock()
+	browser.cdp_client.send.Storage.clearDataForOrigin = AsyncMock()
+	browser.get_tabs = AsyncMock(return_value=[_tab('t1', 'https://example.com/login'), _tab('t2', 'about:blank')])
+	current = Mock()
+	current._target_id = 't1'
+	browser.get_current_page = AsyncMock(return_value=current)
+	return browser
+
+
+class TestBrowserSessionManager:
+	"""Test BrowserSessionManager lifecycle and reset modes"""
+
+	def setup_method(self):
+		self.browser = _browser()
+
+	async def test_starts_once_and_resets_between_runs(self):
+		"""The browser starts on first use only; later runs get a reset instead"""
+		manager = BrowserSessionManager(self.browser, reset_mode='clear_storage')
+
+		for _ in range(3):
+			await manager.acquire()
+			manager.release()
+
+		assert self.browser.start.await_count == 1, 'Warm browser should start exactly once'
+		assert self.browser.clear_cookies.await_count == 2, 'Runs after the first should clear cookies'
+		self.browser.cdp_client.send.Storage.clearDataForOrigin.assert_awaited_with(
+			params={'origin': 'https://example.com', 'storageTypes': 'all'}
+		)
+		self.browser.navigate_to.assert_awaited_with('about:blank')
+		self.browser.close_page.assert_awaited_with('t2')
+		self.browser.stop.assert_not_awaited()
+
+	async def test_same_context_keeps_state(self):
+		"""same_context never touches cookies, storage or tabs"""
+		manager = BrowserSessionManager(self.browser, reset_mode='same_context')
+
+		for _ in range(2):
+			await manager.acquire()
+			manager.release()
+
+		self.browser.clear_cookies.assert_not_awaited()
+		self.browser.navigate_to.assert_not_awaited()
+
+	async def test_new_context_replaces_every_tab(self):
+		"""new_context opens a fresh tab and closes all previous ones"""
+		manager = BrowserSessionManager(self.browser, reset_mode='new_context')
+
+		await manager.acquire()
+		manager.release()
+		await manager.acquire()
+		manager.release()
+
+		self.browser.navigate_to.assert_awaited_with('about:blank', new_tab=True)
+		closed = [call.args[0] for call in self.browser.close_page.await_args_list]
+		assert closed == ['t1', 't2'], f'Expected all old tabs closed, got {closed}'
+
+	async def test_clears_origins_navigated_away_from(self):
+		"""Storage of pages the run left (A -> B) is cleared, not just the open tabs' origins"""
+		browser_use_handler = Mock()
+		self.browser.cdp_client._event_registry._handlers = {'Target.targetInfoChanged': browser_use_handler}
+		self.browser.get_tabs = AsyncMock(return_value=[_tab('t1', 'https://b.example.com/home')])
+		manager = BrowserSessionManager(self.browser, reset_mode='clear_storage')
+
+		await manager.acquire()
+		on_target_info_changed = self.browser.cdp_client.register.Target.targetInfoChanged.call_args.args[0]
+		for url in ('https://a.example.com/login', 'https://b.example.com/home'):
+			on_target_info_changed({'targetInfo': {'targetId': 't1', 'url': url}}, None)
+		manager.release()
+		await manager.acquire()
+		manager.release()
+
+		cleared = {
+			call.kwargs['params']['origin'] for call in self.browser.cdp_client.send.Storage.clearDataForOrigin.await_args_list
+		}
+		assert cleared == {'https://a.example.com', 'https://b.example.com'}
+		assert browser_use_handler.call_count == 2, "browser-use's own handler should still see every event"
+		self.browser.cdp_client.register.Target.targetInfoChanged.assert_called_once()
+
+	async def test_repeated_release_keeps_other_runs_lock(self):
+		"""A second release() must not unlock a session another task has acquired since"""
+		manager = BrowserSessionManager(self.browser, reset_mode='same_context')
+		await manager.acquire()
+		manager.release()
+
+		acquired = asyncio.Event()
+		done = asyncio.Event()
+
+		async def other_run():
+			await manager.acquire()
+			acquired.set()
+			await done.wait()
+			manager.release()
+
+		task = asyncio.create_task(other_run())
+		await acquired.wait()
+		manager.release()
+		assert manager._lock.locked(), 'The other run should still hold the session'
+		done.set()
+		await task
+		assert not manager._lock.locked()
+
+	def test_rejects_unknown_reset_mode(self):
+		with pytest.raises(ValueError):
+			BrowserSessionManager(self.browser, reset_mode='incognito')
+
+
+class TestWorkflowSessionReuse:
+	"""Test that workflows hand a managed browser back instead of stopping it"""
+
+	def setup_method(self):
+		self.browser = _browser()
+		self.manager = BrowserSessionManager(self.browser, reset_mode='clear_storage')
+		schema = WorkflowDefinitionSchema(
+			name='Session Reuse Test',
+			description='Warm browser reuse',
+			version='1.0',
+			steps=[
+				{'type': 'navigation', 'url': 'https://example.com', 'description': 'Open'},
+				{'type': 'extract', 'extractionGoal': 'Title', 'description': 'Read'},
+			],
+			input_schema=[],
+		)
+		self.workflow = Workflow(workflow_schema=schema, llm=Mock(), session_manager=self.manager)
+
+	async def test_runs_share_one_warm_browser(self):
+		"""Repeated runs never stop the browser, even with close_browser_at_end"""
+		assert self.workflow.browser is self.browser
+
+		with patch.object(Workflow, '_execute_step', new=AsyncMock(return_value=ActionResult(extracted_content='ok'))):
+			await self.workflow.run(close_browser_at_end=True)
+			await self.workflow.run(close_browser_at_end=True)
+
+		assert self.browser.start.await_count == 1, 'Browser should only be cold-started once'
+		self.browser.stop.assert_not_awaited()
+		assert self.manager.runs == 2
+		assert not self.manager._lock.locked(), 'Session should be released after each run'
+
+	async def test_failed_run_releases_session(self):
+		"""A failing step still hands the session back"""
+		with patch.object(Workflow, '_execute_step', new=AsyncMock(side_effect=RuntimeError('boom'))):
+			with pytest.raises(RuntimeError):
+				await self.workflow.run()
+
+		assert not self.manager._lock.locked(), 'Session should be released after a failed run'
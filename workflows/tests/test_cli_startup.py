@@ -0,0 +1,62 @@
+"""
+Test that cli.py starts without importing heavy dependencies or creating services.
+"""
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+CLI_DIR = Path(__file__).resolve().parent.parent
+
+# Modules only the commands that drive a browser, an LLM or a server should import
+HEAVY_MODULES = ['browser_use', 'pandas', 'fastapi', 'fastmcp', 'openai', 'workflow_use.workflow.service']
+
+# Generous wall-clock budget for a fresh interpreter importing cli.py (eagerly it took several seconds)
+IMPORT_TIME_BUDGET_SECONDS = 1.5
+
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {cli_dir!r})
+start = time.perf_counter()
+import cli
+elapsed = time.perf_counter() - start
+{command}
+print(json.dumps({{'elapsed': elapsed, 'heavy': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _probe(tmp_path, command: str = '') -> dict:
+	script = PROBE.format(cli_dir=str(CLI_DIR), heavy=HEAVY_MODULES, command=command)
+	completed = subprocess.run([sys.executable, '-c', script], cwd=tmp_path, capture_output=True, text=True, timeout=60)
+	assert completed.returncode == 0, completed.stderr
+	return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class TestCliStartup:
+	"""Test lazy service initialization in cli.py"""
+
+	def test_import_does_not_load_heavy_modules(self, tmp_path):
+		result = _probe(tmp_path)
+
+		assert result['heavy'] == [], f'Importing cli.py should not import {result["heavy"]}'
+		assert not (tmp_path / 'storage').exists(), 'Storage should only be created by commands that use it'
+
+	def test_import_time_budget(self, tmp_path):
+		_probe(tmp_path)  # warm the filesystem and bytecode caches
+		start = time.perf_counter()
+		result = _probe(tmp_path)
+
+		assert result['elapsed'] < IMPORT_TIME_BUDGET_SECONDS, f'import cli took {result["elapsed"]:.2f}s'
+		assert time.perf_counter() - start < IMPORT_TIME_BUDGET_SECONDS * 4
+
+	def test_storage_command_stays_light(self, tmp_path):
+		command = (
+			'from typer.testing import CliRunner\n'
+			"output = CliRunner().invoke(cli.app, ['list-workflows']).output\n"
+			"assert 'No workflows found' in output, output"
+		)
+		result = _probe(tmp_path, command)
+
+		assert result['heavy'] == [], f'list-workflows should not import {result["heavy"]}'
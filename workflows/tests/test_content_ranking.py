@@ -0,0 +1,52 @@
+"""
+Test relevance-ranked content selection used by extraction steps.
+"""
+
+from workflow_use.workflow.content_ranking import OMITTED_MARKER, select_relevant_content, split_into_chunks
+
+
+def _page(middle_section):
+	filler = [f'## Related article {i}\n\n' + 'Lorem ipsum dolor sit amet consectetur adipiscing elit. ' * 20 for i in range(60)]
+	return '\n\n'.join(['# Search results for laptops'] + filler[:30] + [middle_section] + filler[30:])
+
+
+class TestContentRanking:
+	"""Test select_relevant_content"""
+
+	def test_keeps_relevant_middle_section(self):
+		"""Data in the middle of a long page survives, unlike head truncation"""
+		target = '## Pricing table\n\nThinkPad X1 Carbon price: $1,299 with free shipping'
+		page = _page(target)
+
+		selected = select_relevant_content(page, 'Extract the price of the ThinkPad X1 Carbon', max_chars=4000)
+
+		assert len(selected) <= 4000, f'Selection should respect the budget, got {len(selected)} chars'
+		assert '$1,299' in selected, 'Relevant middle section should be selected'
+		assert selected.startswith('# Search results for laptops'), 'Opening section should be kept'
+		assert OMITTED_MARKER.strip() in selected, 'Skipped content should be marked'
+		assert '$1,299' not in page[:4000], 'Plain truncation would have lost the data'
+
+	def test_selected_sections_keep_document_order(self):
+		page = _page('## Shipping\n\nShipping costs $5')
+		selected = select_relevant_content(page, 'related article shipping costs', max_chars=6000)
+
+		runs = [run.strip() for run in selected.split(OMITTED_MARKER.strip()) if run.strip()]
+		positions = [page.index(run[:80]) for run in runs]
+		assert len(runs) > 1
+		assert positions == sorted(positions), 'Sections should appear in page order'
+
+	def test_short_text_unchanged_and_no_match_falls_back_to_head(self):
+		assert select_relevant_content('Short page', 'anything', max_chars=100) == 'Short page'
+
+		page = _page('## Nothing useful here')
+		selected = select_relevant_content(page, 'zzz qqq', max_chars=3000)
+		leading = split_into_chunks(page)[:3]
+		assert selected == '\n\n'.join(leading) + OMITTED_MARKER.rstrip(), 'Unmatched goal should keep only the leading sections'
+
+	def test_chunks_respect_size_limit(self):
+		text = 'x' * 5000 + '\n\n' + '\n'.join(['line of text'] * 400)
+
+		chunks = split_into_chunks(text, max_chunk_chars=1000)
+
+		assert all(len(chunk) <= 1000 for chunk in chunks)
+		assert ''.join(chunks).replace('\n', '') == text.replace('\n', '')
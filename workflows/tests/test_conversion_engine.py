@@ -0,0 +1,177 @@
+"""
+Test segmented, parallel recording conversion.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from workflow_use.recorder.conversion_engine import RecordingConversionEngine, split_into_segments
+from workflow_use.workflow.browser_pool import BrowserPool
+from workflow_use.workflow.mapping_cache import SemanticMappingCache
+
+RECORDING = [
+	{'type': 'navigation', 'url': 'https://example.com/login'},
+	{'type': 'input', 'elementText': 'Username', 'value': 'alice'},
+	{'type': 'click', 'elementText': 'Sign in'},
+	{'type': 'navigation', 'url': 'https://example.com/search'},
+	{'type': 'scroll', 'scrollX': 0, 'scrollY': 400},
+	{'type': 'click', 'elementText': 'Result'},
+	{'type': 'navigation', 'url': 'https://example.com/login'},
+	{'type': 'click', 'elementText': 'Sign in'},
+	{'type': 'extract', 'extractionGoal': 'Account name'},
+]
+
+
+class FakePage:
+	def __init__(self, browser):
+		self.browser = browser
+
+	async def goto(self, url):
+		self.browser.url = url
+		self.browser.dom_version = 0
+		await asyncio.sleep(0.01)
+
+	async def evaluate(self, script, *args):
+		return '{}'
+
+
+class FakeBrowser:
+	def __init__(self):
+		self.url = 'about:blank'
+		self.dom_version = 0
+		self.page = FakePage(self)
+
+	async def get_current_page(self):
+		return self.page
+
+
+def fake_session(browser):
+	session = Mock()
+	session.browser = browser
+	session.acquire = AsyncMock(return_value=browser)
+	session.release = Mock()
+	session.close = AsyncMock()
+	return session
+
+
+async def convert_step(step, mapping, browser, simulate_interactions):
+	return {'type': step['type'], 'target_text': step['elementText'], 'mapped': sorted(mapping)}
+
+
+class TestSegments:
+	def test_segments_start_at_navigation(self):
+		segments = split_into_segments([{'type': 'click'}] + RECORDING)
+		assert [segment.url for segment in segments] == [
+			None,
+			'https://example.com/login',
+			'https://example.com/search',
+			'https://example.com/login',
+		]
+		assert [position for segment in segments for position, _ in segment.steps] == list(range(len(RECORDING) + 1))
+
+
+class TestRecordingConversionEngine:
+	def setup_method(self):
+		self.browsers = [FakeBrowser(), FakeBrowser()]
+		self.pool = BrowserPool(sessions=[fake_session(browser) for browser in self.browsers])
+		self.extractions = []
+		self.active = 0
+		self.max_active = 0
+
+	def patches(self):
+		async def fingerprint(page):
+			return (page.browser.url, str(page.browser.dom_version))
+
+		async def extract(extractor, page):
+			self.active += 1
+			self.max_active = max(self.max_active, self.active)
+			self.extractions.append(page.browser.url)
+			await asyncio.sleep(0.02)
+			self.active -= 1
+			return {f'{page.browser.url}#{page.browser.dom_version}': {'selectors': 'button'}}
+
+		return (
+			patch('workflow_use.recorder.conversion_engine.get_page_fingerprint', fingerprint),
+			patch('workflow_use.recorder.conversion_engine.wait_for_page_ready', AsyncMock(return_value={'status': 'ready'})),
+			patch('workflow_use.recorder.conversion_engine.SemanticExtractor.extract_semantic_mapping', extract),
+		)
+
+	async def convert(self, steps, **kwargs):
+		engine = RecordingConversionEngine(convert_step, pool=self.pool, **kwargs)
+		fingerprint, ready, extract = self.patches()
+		with fingerprint, ready, extract:
+			return engine, await engine.convert(steps)
+
+	async def test_output_keeps_recording_order(self):
+		_, steps = await self.convert(RECORDING)
+
+		assert [step['type'] for step in steps] == [
+			'navigation',
+			'input',
+			'click',
+			'navigation',
+			'scroll',
+			'click',
+			'navigation',
+			'click',
+			'extract',
+		]
+		assert steps[0] == {
+			'description': 'Navigate to https://example.com/login',
+			'type': 'navigation',
+			'url': 'https://example.com/login',
+		}
+		assert steps[-1]['url'] == 'https://example.com/login', 'Extract steps should default to the segment URL'
+		assert steps[5]['mapped'] == ['https://example.com/search#0'], 'Steps should see their own segment page'
+
+	async def test_segments_run_in_parallel(self):
+		await self.convert(RECORDING)
+		assert self.max_active == 2, 'Independent segments should be extracted concurrently on both browsers'
+
+	async def test_unchanged_page_reuses_mapping(self):
+		engine, _ = await self.convert(RECORDING)
+		# One extraction per navigation; the interactive and scroll steps found the DOM unchanged
+		assert len(self.extractions) == 3
+		assert engine.extractions == 3
+
+	async def test_dom_change_triggers_extraction(self):
+		async def mutating_convert(step, mapping, browser, simulate_interactions):
+			browser.dom_version += 1
+			return await convert_step(step, mapping, browser, simulate_interactions)
+
+		engine = RecordingConversionEngine(mutating_convert, pool=self.pool)
+		fingerprint, ready, extract = self.patches()
+		with fingerprint, ready, extract:
+			steps = await engine.convert(RECORDING[:3])
+
+		assert steps[2]['mapped'] == ['https://example.com/login#1'], 'The click should see the DOM after the input changed it'
+		assert len(self.extractions) == 2
+
+	async def test_failed_navigation_does_not_stop_conversion(self):
+		self.browsers[0].page.goto = AsyncMock(side_effect=RuntimeError('net::ERR_NAME_NOT_RESOLVED'))
+		self.pool = BrowserPool(sessions=[fake_session(self.browsers[0])])
+		_, steps = await self.convert(RECORDING[:3])
+
+		assert steps[0]['type'] == 'navigation', 'The navigation step should be kept even if the page failed to load'
+		assert len(steps) == 3
+		assert steps[1]['mapped'] == ['about:blank#0'], 'Later steps should be mapped against the page actually shown'
+
+	async def test_simulated_interactions_run_in_one_browser(self):
+		browser = FakeBrowser()
+		with patch('workflow_use.recorder.conversion_engine.BrowserSessionManager', return_value=fake_session(browser)):
+			await self.convert(RECORDING, simulate_interactions=True)
+
+		assert self.max_active == 1, 'Simulated interactions must replay segments in order'
+		for pooled in self.pool.sessions:
+			pooled.acquire.assert_not_called()
+
+	def test_rejects_invalid_parallelism(self):
+		with pytest.raises(ValueError):
+			RecordingConversionEngine(convert_step, max_parallel=0)
+
+	def test_keeps_empty_shared_cache(self):
+		cache = SemanticMappingCache()
+		engine = RecordingConversionEngine(convert_step, mapping_cache=cache)
+		assert engine.mapping_cache is cache, 'An empty shared cache must not be replaced'
@@ -0,0 +1,67 @@
+"""
+Test the background debug screenshot pipeline.
+"""
+
+import asyncio
+import base64
+from unittest.mock import AsyncMock, Mock
+
+from workflow_use.workflow.debug_screenshots import DebugScreenshotPipeline, ScreenshotOptions
+
+
+def _frame(content: bytes) -> dict:
+	return {'data': base64.b64encode(content).decode('ascii')}
+
+
+class TestDebugScreenshotPipeline:
+	"""Test capture options, unchanged-frame skipping and the bounded write queue"""
+
+	def setup_method(self):
+		self.capture = AsyncMock(side_effect=[_frame(b'frame-1'), _frame(b'frame-1'), _frame(b'frame-2')])
+		cdp_session = Mock(session_id='session-1')
+		cdp_session.cdp_client.send.Page.captureScreenshot = self.capture
+		self.browser = Mock()
+		self.browser.get_or_create_cdp_session = AsyncMock(return_value=cdp_session)
+
+	async def test_writes_frames_in_background_and_skips_unchanged(self, tmp_path):
+		pipeline = DebugScreenshotPipeline(tmp_path)
+
+		first = await pipeline.capture(self.browser, 0, 'Open page', prefix='before')
+		repeat = await pipeline.capture(self.browser, 0, 'Open page', prefix='after')
+		changed = await pipeline.capture(self.browser, 1, 'Click: Submit!', prefix='before')
+		await pipeline.close()
+
+		assert repeat == first, 'An unchanged frame should point at the previous file'
+		assert first.read_bytes() == b'frame-1'
+		assert changed.read_bytes() == b'frame-2'
+		assert changed.name.startswith('step_02_before_Click_Submit_') and changed.suffix == '.jpg'
+		assert (pipeline.saved, pipeline.skipped, pipeline.dropped) == (2, 1, 0)
+		assert len(list(tmp_path.iterdir())) == 2
+
+	async def test_capture_options_reach_the_browser(self, tmp_path):
+		pipeline = DebugScreenshotPipeline(tmp_path, ScreenshotOptions(format='webp', quality=40, full_page=True))
+
+		path = await pipeline.capture(self.browser, 0, 'Step')
+		await pipeline.close()
+
+		params = self.capture.await_args.kwargs['params']
+		assert params == {'format': 'webp', 'quality': 40, 'captureBeyondViewport': True}
+		assert path.suffix == '.webp'
+
+	async def test_full_queue_drops_frames_instead_of_blocking(self, tmp_path):
+		pipeline = DebugScreenshotPipeline(tmp_path, ScreenshotOptions(max_queue_size=1, skip_unchanged=False))
+		self.capture.side_effect = [_frame(f'frame-{i}'.encode()) for i in range(3)]
+
+		# Nothing yields to the writer between captures, so only the first frame fits in the queue
+		paths = [await pipeline.capture(self.browser, i, 'Step') for i in range(3)]
+		await pipeline.close()
+
+		assert paths[1:] == [None, None]
+		assert (pipeline.saved, pipeline.dropped) == (1, 2)
+
+	async def test_capture_failure_does_not_raise(self, tmp_path):
+		self.capture.side_effect = RuntimeError('target closed')
+		pipeline = DebugScreenshotPipeline(tmp_path)
+
+		assert await pipeline.capture(self.browser, 0, 'Step') is None
+		await asyncio.wait_for(pipeline.close(), timeout=1)
@@ -0,0 +1,156 @@
+"""
+Test the overlapped lookup of the next step's element.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from workflow_use.schema.views import WorkflowDefinitionSchema
+from workflow_use.workflow.element_prefetch import ELEMENT_PREFETCH_JS, selector_candidates, wait_for_any_selector
+from workflow_use.workflow.service import Workflow
+
+
+class FakePage:
+	"""Page whose candidates become visible after a delay, polled like the in-page prober"""
+
+	def __init__(self, visible_after: dict):
+		self.start = time.monotonic()
+		self.visible_after = visible_after
+		self.calls = 0
+
+	async def evaluate(self, script, candidates, options):
+		assert script == ELEMENT_PREFETCH_JS
+		self.calls += 1
+		deadline = time.monotonic() + options['timeoutMs'] / 1000
+		while True:
+			elapsed = time.monotonic() - self.start
+			for index, candidate in enumerate(candidates):
+				if elapsed >= self.visible_after.get(candidate['value'], float('inf')):
+					return json.dumps({'found': index})
+			if time.monotonic() >= deadline:
+				return json.dumps({'found': None, 'invalid': []})
+			await asyncio.sleep(0.01)
+
+
+class TestSelectorCandidates:
+	"""Test candidate generation for the in-page prober"""
+
+	def test_includes_fallbacks_text_and_xpaths_in_order(self):
+		step = Mock(elementTag='input', elementText='', xpath='id("email")', cssSelector='input[name="email"][id="e1"]')
+
+		candidates = selector_candidates(step.cssSelector, step)
+		values = [candidate['value'] for candidate in candidates]
+
+		assert values[0] == 'input[name="email"][id="e1"]', 'The recorded selector should be tried first'
+		assert 'input[name*="email"]' in values
+		assert candidates[-2:] == [
+			{'kind': 'xpath', 'value': 'id("email")'},
+			{'kind': 'xpath', 'value': "//input[contains(@name, 'email')]"},
+		]
+		assert len(values) == len(set(values)), 'Candidates should be unique'
+
+	def test_has_text_selectors_become_text_candidates(self):
+		step = Mock(elementTag='button', elementText='Save', xpath=None)
+
+		candidates = selector_candidates('button.primary', step)
+
+		assert {'kind': 'text', 'value': "button:has-text('Save')", 'tag': 'button', 'text': 'Save'} in candidates
+
+
+class TestWaitForAnySelector:
+	"""Test wait_for_any_selector"""
+
+	async def test_checks_all_candidates_together(self):
+		candidates = [{'kind': 'css', 'value': '#a'}, {'kind': 'css', 'value': '#b'}, {'kind': 'css', 'value': '#c'}]
+		page = FakePage({'#c': 0.0})
+
+		selector = await wait_for_any_selector(page, candidates, timeout_ms=2000)
+
+		assert selector == '#c'
+		assert page.calls == 1, 'Every candidate should be checked in a single round trip'
+
+	async def test_retries_while_navigation_replaces_context(self):
+		page = Mock()
+		page.evaluate = AsyncMock(side_effect=[RuntimeError('Execution context was destroyed'), json.dumps({'found': 0})])
+
+		selector = await wait_for_any_selector(page, [{'kind': 'xpath', 'value': '//form'}], timeout_ms=2000)
+
+		assert selector == 'xpath=//form'
+
+	async def test_returns_none_at_timeout(self):
+		start = time.monotonic()
+		selector = await wait_for_any_selector(FakePage({}), [{'kind': 'css', 'value': '#missing'}], timeout_ms=200)
+
+		assert selector is None
+		assert time.monotonic() - start < 1.0, 'The wait should respect its upper bound'
+
+
+class TestNextStepPrefetch:
+	"""Test that the next step's element is found while the current action's page settles"""
+
+	def setup_method(self):
+		schema = WorkflowDefinitionSchema(
+			name='Form',
+			description='Form',
+			version='1.0',
+			input_schema=[],
+			steps=[
+				{'type': 'click', 'cssSelector': 'button#next', 'description': 'Next'},
+				{'type': 'input', 'cssSelector': 'input#email', 'value': 'a@example.com', 'description': 'Email'},
+				{'type': 'extract', 'extractionGoal': 'Result', 'description': 'Result'},
+			],
+		)
+		self.workflow = Workflow(workflow_schema=schema, llm=Mock(), browser=Mock())
+		self.workflow.controller = Mock()
+		self.workflow.controller.act = AsyncMock(return_value=Mock())
+		self.workflow.controller.registry.create_action_model.return_value = lambda **kwargs: Mock()
+
+	async def _run_first_step(self, page):
+		self.workflow.browser.get_current_page = AsyncMock(return_value=page)
+
+		async def slow_readiness(page, timeout):
+			await asyncio.sleep(0.3)
+			return {'status': 'ready', 'elapsed': 300}
+
+		with patch('workflow_use.workflow.service.wait_for_page_ready', slow_readiness):
+			start = time.monotonic()
+			await self.workflow._run_deterministic_step(self.workflow.schema.steps[0], 0)
+			return time.monotonic() - start
+
+	async def test_lookup_overlaps_page_readiness(self):
+		page = FakePage({'input#email': 0.2})
+
+		elapsed = await self._run_first_step(page)
+
+		assert elapsed < 0.45, f'The element wait should overlap the readiness wait, took {elapsed:.2f}s'
+
+	async def test_sequential_mode_waits_after_readiness(self):
+		self.workflow.prefetch_next_element = False
+		page = FakePage({'input#email': 0.45})
+
+		elapsed = await self._run_first_step(page)
+
+		assert elapsed >= 0.45
+
+	async def test_missing_element_fails_the_step(self):
+		page = FakePage({})
+
+		with patch('workflow_use.workflow.service.WAIT_FOR_ELEMENT_TIMEOUT', 100):
+			with pytest.raises(Exception, match='input#email'):
+				await self._run_first_step(page)
+
+	async def test_missing_element_waits_one_timeout(self):
+		page = FakePage({})
+
+		start = time.monotonic()
+		with patch('workflow_use.workflow.service.WAIT_FOR_ELEMENT_TIMEOUT', 300):
+			with pytest.raises(Exception, match='input#email'):
+				await self._run_first_step(page)
+		elapsed = time.monotonic() - start
+
+		# 0.3s readiness + 0.3s element timeout; a second full lookup after the prefetch would take 0.9s
+		assert elapsed < 0.8, f'A missing element should cost one element timeout after readiness, took {elapsed:.2f}s'
@@ -0,0 +1,135 @@
+"""
+Test the on-disk LLM extraction cache and its use by extraction steps.
+"""
+
+import os
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+from workflow_use.schema.views import WorkflowDefinitionSchema
+from workflow_use.workflow.extraction_cache import ExtractionCache
+from workflow_use.workflow.service import Workflow
+
+
+class TestExtractionCache:
+	"""Test ExtractionCache keys, expiry and eviction"""
+
+	def test_key_covers_model_goal_and_normalized_text(self):
+		"""Only whitespace differences in the page text map to the same key"""
+		key = ExtractionCache.make_key('openai:gpt-4.1', 'workflow_extract', 'Get the price', 'Price:  $10\n\nBuy now')
+
+		assert key == ExtractionCache.make_key('openai:gpt-4.1', 'workflow_extract', 'Get the price', 'Price: $10 Buy now')
+		assert key != ExtractionCache.make_key('openai:gpt-4.1-mini', 'workflow_extract', 'Get the price', 'Price: $10 Buy now')
+		assert key != ExtractionCache.make_key('openai:gpt-4.1', 'workflow_extract', 'Get the title', 'Price: $10 Buy now')
+		assert key != ExtractionCache.make_key('openai:gpt-4.1', 'workflow_extract', 'Get the price', 'Price: $12 Buy now')
+
+	def test_key_covers_url_and_title(self):
+		"""Pages with the same text but a different URL or title don't share an answer"""
+		key = ExtractionCache.make_key(
+			'm', 'semantic_extract', 'Which page is this?', 'Same text', url='https://a.example.com', title='A'
+		)
+
+		assert key != ExtractionCache.make_key(
+			'm', 'semantic_extract', 'Which page is this?', 'Same text', url='https://b.example.com', title='A'
+		)
+		assert key != ExtractionCache.make_key(
+			'm', 'semantic_extract', 'Which page is this?', 'Same text', url='https://a.example.com', title='B'
+		)
+
+	def test_round_trip_and_ttl(self, tmp_path):
+		cache = ExtractionCache(cache_dir=tmp_path, ttl_seconds=60)
+		cache.put('k1', '$10')
+
+		assert cache.get('k1') == '$10'
+		assert cache.get('missing') is None
+
+		cache.ttl_seconds = -1
+		assert cache.get('k1') is None, 'Expired entries should miss'
+		assert not (tmp_path / 'k1.json').exists(), 'Expired entries should be deleted'
+
+	def test_evicts_least_recently_used(self, tmp_path):
+		cache = ExtractionCache(cache_dir=tmp_path, max_entries=3)
+		old = time.time() - 100
+		for offset, key in enumerate(['a', 'b', 'c']):
+			cache.put(key, key.upper())
+			os.utime(tmp_path / f'{key}.json', (old + offset, old + offset))
+		cache.get('a')  # touching 'a' makes 'b' and 'c' the least recently used
+
+		cache.put('d', 'D')
+
+		# Over the bound, the cache is trimmed to 90% of it (2 entries), oldest first
+		assert sorted(path.stem for path in tmp_path.glob('*.json')) == ['a', 'd']
+
+	def test_scans_directory_only_when_over_bounds(self, tmp_path):
+		cache = ExtractionCache(cache_dir=tmp_path, max_entries=10)
+		with patch.object(ExtractionCache, '_evict', autospec=True, side_effect=ExtractionCache._evict) as evict:
+			for i in range(10):
+				cache.put(f'k{i}', 'value')
+			cache.put('k0', 'updated')  # replacing an entry doesn't grow the cache
+			assert evict.call_count == 1, 'Only the first write should scan while the cache is within bounds'
+
+			cache.put('k10', 'value')
+			assert evict.call_count == 2
+		assert len(list(tmp_path.glob('*.json'))) == 9
+
+	def test_bypass_flag(self, tmp_path):
+		cache = ExtractionCache(cache_dir=tmp_path, enabled=False)
+		cache.put('k1', 'value')
+
+		assert cache.get('k1') is None
+		assert not list(tmp_path.glob('*.json')), 'Disabled cache should not write'
+
+
+class TestWorkflowExtractionCache:
+	"""Test that Workflow extraction steps reuse cached LLM results"""
+
+	def setup_method(self):
+		self.schema = WorkflowDefinitionSchema(
+			name='Extraction Cache Test',
+			description='Cached extraction',
+			version='1.0',
+			steps=[{'type': 'extract', 'extractionGoal': 'Get the price', 'description': 'Price'}],
+			input_schema=[],
+		)
+		self.page = Mock()
+		self.page._extract_clean_markdown = AsyncMock(return_value=('Price: $10', None))
+		self.page.get_url = AsyncMock(return_value='https://shop.example.com/item')
+		self.browser = Mock()
+		self.browser.get_current_page = AsyncMock(return_value=self.page)
+		self.llm = Mock(provider='openai', model='gpt-4.1-mini')
+		self.llm.ainvoke = AsyncMock(return_value=Mock(completion='$10'))
+
+	def _workflow(self, tmp_path, **kwargs):
+		return Workflow(
+			workflow_schema=self.schema,
+			llm=self.llm,
+			browser=self.browser,
+			extraction_cache=ExtractionCache(cache_dir=tmp_path),
+			**kwargs,
+		)
+
+	async def test_second_run_skips_llm(self, tmp_path):
+		step = self.schema.steps[0]
+
+		first = await self._workflow(tmp_path)._run_extraction_step(step, 0)
+		second = await self._workflow(tmp_path)._run_extraction_step(step, 0)
+
+		assert first.extracted_content == second.extracted_content == '$10'
+		assert self.llm.ainvoke.await_count == 1, 'Unchanged page should be answered from the cache'
+
+	async def test_same_text_on_another_url_calls_llm(self, tmp_path):
+		step = self.schema.steps[0]
+
+		await self._workflow(tmp_path)._run_extraction_step(step, 0)
+		self.page.get_url.return_value = 'https://shop.example.com/other-item'
+		await self._workflow(tmp_path)._run_extraction_step(step, 0)
+
+		assert self.llm.ainvoke.await_count == 2, 'The URL is part of the prompt, so it must be part of the key'
+
+	async def test_bypass_always_calls_llm(self, tmp_path):
+		step = self.schema.steps[0]
+
+		await self._workflow(tmp_path, use_extraction_cache=False)._run_extraction_step(step, 0)
+		await self._workflow(tmp_path, use_extraction_cache=False)._run_extraction_step(step, 0)
+
+		assert self.llm.ainvoke.await_count == 2
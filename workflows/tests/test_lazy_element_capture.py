@@ -0,0 +1,92 @@
+"""
+Test that workflow generation captures only the elements the agent acts on.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+from browser_use import Controller
+from browser_use.agent.views import ActionResult
+
+from workflow_use.healing.service import HealingService, _action_element_indices
+
+
+def make_action(**params):
+	action = Mock()
+	action.model_dump = Mock(return_value=params)
+	return action
+
+
+def make_element(index):
+	return SimpleNamespace(
+		node_name='BUTTON',
+		attributes={'id': f'btn-{index}'},
+		text=f'Button {index}',
+		x_path=f'/html/body/button[{index}]',
+		css_selector=f'#btn-{index}',
+	)
+
+
+class FakeAgent:
+	"""Agent that performs the given actions through the controller it was created with"""
+
+	actions = []
+
+	def __init__(self, controller, **kwargs):
+		self.controller = controller
+		self.browser_session = Mock()
+		self.browser_session.get_selector_map = AsyncMock(return_value={i: make_element(i) for i in range(500)})
+		self.browser_session.get_current_url = AsyncMock(return_value='https://example.com')
+
+	async def run(self):
+		for action in self.actions:
+			await self.controller.act(action, self.browser_session)
+		return Mock()
+
+
+class TestLazyElementCapture:
+	def setup_method(self):
+		self.service = HealingService(llm=Mock())
+		self.service.create_workflow_definition = AsyncMock(return_value='workflow')
+		self.service._post_process_workflow = Mock(side_effect=lambda workflow: workflow)
+
+	async def generate(self, actions):
+		FakeAgent.actions = actions
+		with (
+			patch('workflow_use.healing.service.Agent', FakeAgent),
+			patch('workflow_use.healing.service.Browser', Mock()),
+			patch.object(Controller, 'act', AsyncMock(return_value=ActionResult())),
+			patch.object(
+				self.service.selector_generator,
+				'generate_strategies_dict',
+				wraps=self.service.selector_generator.generate_strategies_dict,
+			) as generate_strategies,
+		):
+			await self.service.generate_workflow_from_prompt('Click things', agent_llm=Mock(), extraction_llm=Mock())
+		return generate_strategies
+
+	async def test_only_target_element_is_captured(self):
+		generate_strategies = await self.generate([make_action(click_element={'index': 7})])
+
+		captured = self.service.captured_element_text_map
+		assert list(captured) == [7], 'Only the clicked element should be captured, not the whole selector map'
+		assert generate_strategies.call_count == 1
+		assert captured[7]['text'] == 'Button 7'
+		assert captured[7]['xpath'] == '/html/body/button[7]'
+		assert captured[7]['selector_strategies'], 'The captured element should still get selector strategies'
+
+	async def test_actions_without_elements_capture_nothing(self):
+		generate_strategies = await self.generate(
+			[make_action(go_to_url={'url': 'https://example.com'}), make_action(scroll={'down': True})]
+		)
+		assert self.service.captured_element_text_map == {}
+		assert generate_strategies.call_count == 0
+
+	async def test_missing_index_does_not_block_action(self):
+		await self.generate([make_action(click_element={'index': 9999}), make_action(input_text={'index': 3, 'text': 'hi'})])
+		assert list(self.service.captured_element_text_map) == [3]
+
+	def test_action_element_indices(self):
+		assert _action_element_indices(make_action(click_element={'index': 4}, input_text=None)) == [4]
+		assert _action_element_indices(make_action(done={'text': 'ok'})) == []
+		assert _action_element_indices(object()) == []
@@ -0,0 +1,53 @@
+"""
+Test event-driven page readiness used instead of fixed sleeps after navigation.
+"""
+
+import json
+import time
+from unittest.mock import AsyncMock, Mock
+
+from workflow_use.workflow.page_readiness import PAGE_READY_JS, wait_for_page_ready
+
+
+class TestPageReadiness:
+	"""Test wait_for_page_ready"""
+
+	def setup_method(self):
+		self.page = Mock()
+		self.page.evaluate = AsyncMock()
+
+	async def test_returns_in_page_result(self):
+		"""The in-page readiness result is returned as soon as the page reports it"""
+		self.page.evaluate.return_value = json.dumps({'status': 'ready', 'readyState': 'complete', 'elapsed': 120})
+
+		result = await wait_for_page_ready(self.page, timeout=5)
+
+		assert result['status'] == 'ready', f'Expected ready, got {result}'
+		assert self.page.evaluate.await_count == 1
+		script, options = self.page.evaluate.await_args.args
+		assert script == PAGE_READY_JS
+		assert options['waitUntil'] == 'load'
+		assert 0 < options['timeoutMs'] <= 5000, 'In-page wait should be bounded by the timeout'
+		assert options['maxNetworkWaitMs'] == 3000, 'Pages that never go network-quiet should not block for the timeout'
+
+	async def test_retries_while_navigation_replaces_context(self):
+		"""Evaluation errors during a navigation commit are retried"""
+		self.page.evaluate.side_effect = [
+			RuntimeError('Execution context was destroyed'),
+			json.dumps({'status': 'ready', 'readyState': 'complete', 'elapsed': 40}),
+		]
+
+		result = await wait_for_page_ready(self.page, timeout=5)
+
+		assert result['status'] == 'ready'
+		assert self.page.evaluate.await_count == 2, 'Should retry once after the context was destroyed'
+
+	async def test_gives_up_at_upper_bound(self):
+		"""A page that never answers costs at most the timeout"""
+		self.page.evaluate.side_effect = RuntimeError('Cannot find context')
+
+		start = time.monotonic()
+		result = await wait_for_page_ready(self.page, timeout=0.3)
+
+		assert result['status'] == 'timeout'
+		assert time.monotonic() - start < 1.0, 'Readiness wait should respect its upper bound'
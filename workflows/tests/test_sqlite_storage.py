@@ -0,0 +1,98 @@
+"""
+Test the SQLite workflow storage backend against the JSON backend's behaviour.
+"""
+
+import sqlite3
+
+import pytest
+
+from workflow_use.schema.views import WorkflowDefinitionSchema
+from workflow_use.storage.service import WorkflowStorageService, create_storage_service
+from workflow_use.storage.sqlite_service import SQLiteWorkflowStorageService
+
+
+def _workflow(name: str, description: str) -> WorkflowDefinitionSchema:
+	return WorkflowDefinitionSchema(
+		name=name,
+		description=description,
+		version='1.0',
+		steps=[{'type': 'extract', 'extractionGoal': 'Get the confirmation', 'description': 'Confirmation'}],
+		input_schema=[],
+	)
+
+
+class TestSQLiteWorkflowStorageService:
+	"""Test SQLiteWorkflowStorageService CRUD, search and migration"""
+
+	@pytest.fixture(autouse=True)
+	def setup_storage(self, tmp_path):
+		self.storage_dir = tmp_path
+		self.storage = SQLiteWorkflowStorageService(storage_dir=tmp_path)
+		yield
+		self.storage.close()
+
+	def test_save_get_and_update(self):
+		metadata = self.storage.save_workflow(_workflow('Contact Form', 'Fill the contact form'), original_task='Contact us')
+
+		assert self.storage.get_workflow(metadata.id).name == 'Contact Form'
+		assert self.storage.get_workflow_by_name('Contact Form').description == 'Fill the contact form'
+		assert self.storage.metadata.get(metadata.id) == metadata, 'metadata mapping should stay usable'
+
+		updated = self.storage.save_workflow(
+			_workflow('Contact Form v2', 'Updated'), generation_mode='browser_use', workflow_id=metadata.id
+		)
+
+		assert updated.created_at == metadata.created_at
+		assert updated.generation_mode == 'manual', 'Creation-time fields should survive an update'
+		assert updated.original_task == 'Contact us'
+		assert self.storage.get_metadata(metadata.id).name == 'Contact Form v2'
+		assert len(self.storage.list_workflows()) == 1
+
+	def test_search_matches_json_backend(self):
+		json_storage = WorkflowStorageService(storage_dir=self.storage_dir / 'json')
+		for service in (self.storage, json_storage):
+			service.save_workflow(_workflow('Contact Form', 'Fill the contact form'))
+			service.save_workflow(_workflow('Job Search', 'Search LinkedIn jobs'), generation_mode='browser_use')
+			service.save_workflow(_workflow('Newsletter', 'Subscribe to the FORM_V2 list'), generation_mode='browser_use')
+
+		for query, generation_mode in [
+			('form', None),
+			('ORM', None),
+			('fo', None),
+			('form', 'browser_use'),
+			(None, 'browser_use'),
+		]:
+			sqlite_names = sorted(w.name for w in self.storage.search_workflows(query=query, generation_mode=generation_mode))
+			json_names = sorted(w.name for w in json_storage.search_workflows(query=query, generation_mode=generation_mode))
+			assert sqlite_names == json_names, f'Search for {query!r}/{generation_mode!r} should match the JSON backend'
+
+		assert [w.name for w in self.storage.search_workflows(query='"form" OR')] == [], 'FTS syntax should be matched literally'
+		assert [w.name for w in self.storage.search_workflows(query='_')] == ['Newsletter'], 'LIKE wildcards should be escaped'
+
+	def test_delete_removes_row_file_and_index_entry(self):
+		metadata = self.storage.save_workflow(_workflow('Contact Form', 'Fill the contact form'))
+
+		assert self.storage.delete_workflow(metadata.id) is True
+		assert self.storage.delete_workflow(metadata.id) is False
+		assert self.storage.get_workflow(metadata.id) is None
+		assert self.storage.search_workflows(query='contact') == []
+		assert not list((self.storage_dir / 'workflows').iterdir())
+
+	def test_uses_wal_and_indexes(self):
+		connection = sqlite3.connect(self.storage.database_file)
+		journal_mode = connection.execute('PRAGMA journal_mode').fetchone()[0]
+		indexes = {row[1] for row in connection.execute('PRAGMA index_list(workflows)')}
+		connection.close()
+
+		assert journal_mode == 'wal'
+		assert {'idx_workflows_name', 'idx_workflows_generation_mode'} <= indexes
+
+	def test_imports_existing_json_metadata(self, tmp_path):
+		json_storage = WorkflowStorageService(storage_dir=tmp_path / 'existing')
+		saved = json_storage.save_workflow(_workflow('Contact Form', 'Fill the contact form'))
+
+		migrated = create_storage_service(storage_dir=tmp_path / 'existing', backend='sqlite')
+
+		assert migrated.get_metadata(saved.id) == saved
+		assert migrated.get_workflow(saved.id).name == 'Contact Form'
+		migrated.close()
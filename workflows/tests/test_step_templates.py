@@ -0,0 +1,79 @@
+"""
+Test precompiled step templates against the recursive placeholder resolver.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from workflow_use.schema.views import WorkflowDefinitionSchema
+from workflow_use.workflow.service import Workflow
+from workflow_use.workflow.step_templates import StepTemplate, compile_string
+
+STEPS = [
+	{'type': 'navigation', 'url': 'https://example.com/search?q={query}', 'description': 'Open search'},
+	{'type': 'click', 'target_text': 'Submit', 'description': 'Static click'},
+	{'type': 'input', 'target_text': 'Email', 'value': '{email}', 'description': 'Email'},
+	{'type': 'input', 'target_text': 'Phone', 'value': '{phone}', 'default_value': '555-0100', 'description': 'Phone'},
+	{'type': 'input', 'target_text': 'Notes', 'value': '', 'default_value': 'n/a', 'description': 'Notes'},
+	{
+		'type': 'click',
+		'target_text': 'Row {row:>3}',
+		'selectorStrategies': [{'type': 'text', 'value': '{name} ({count!r})'}, {'type': 'css', 'value': '#static'}],
+		'description': 'Literal {{braces}} for {name}',
+	},
+	{'type': 'extract', 'extractionGoal': 'Get the price of {product.title}', 'description': 'Price'},
+]
+
+CONTEXTS = [
+	{'query': 'shoes', 'email': 'a@example.com', 'phone': '555-1234', 'row': 7, 'name': 'Ada', 'count': 2},
+	{'query': 'hats', 'email': '', 'row': 12, 'name': 'Bob', 'count': 0.5},
+	{},
+]
+
+
+class TestStepTemplates:
+	"""Test that StepTemplate.resolve matches Workflow._resolve_placeholders"""
+
+	def setup_method(self):
+		schema = WorkflowDefinitionSchema(name='Templates', description='Templates', version='1.0', steps=STEPS, input_schema=[])
+		self.workflow = Workflow(workflow_schema=schema, llm=Mock(), browser=Mock())
+
+	@pytest.mark.parametrize('context', CONTEXTS)
+	def test_matches_recursive_resolution(self, context):
+		self.workflow.context = dict(context)
+
+		for index, step in enumerate(self.workflow.schema.steps):
+			expected = self.workflow._resolve_placeholders(step)
+			resolved = self.workflow._resolve_step(index)
+
+			assert resolved.model_dump() == expected.model_dump(), f'Step {index} resolved differently'
+
+	def test_static_steps_are_reused_as_is(self):
+		self.workflow.context = dict(CONTEXTS[0])
+
+		assert self.workflow._resolve_step(1) is self.workflow.schema.steps[1]
+		assert not StepTemplate(self.workflow.schema.steps[1]).has_placeholders
+		assert StepTemplate(self.workflow.schema.steps[4]).has_placeholders, 'An input default can replace an empty value'
+
+	def test_replaced_step_is_recompiled(self):
+		self.workflow.context = {'email': 'new@example.com'}
+		self.workflow.schema.steps[1] = self.workflow.schema.steps[2].model_copy()
+
+		assert self.workflow._resolve_step(1).value == 'new@example.com'
+
+	def test_strings_match_str_format(self):
+		context = {'a': 1, 'b': 'x', 'f': 2.5}
+		for template in ['{a}-{b}', '{{a}} {a}', '{f:.2f}', '{b!r}', 'no braces', '{missing} {a}', '} {']:
+			resolver = compile_string(template)
+			try:
+				expected = template.format(**context)
+			except KeyError:
+				expected = template
+			except ValueError:
+				with pytest.raises(ValueError):
+					resolver(context)
+				continue
+
+			actual = resolver(context) if resolver else template
+			assert actual == expected, f'{template!r} resolved to {actual!r}'
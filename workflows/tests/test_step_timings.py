@@ -0,0 +1,148 @@
+"""
+Test learned inter-step waits.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from browser_use.agent.views import ActionResult
+
+from workflow_use.schema.views import WorkflowDefinitionSchema
+from workflow_use.workflow.service import Workflow
+from workflow_use.workflow.step_timings import StepTimingStore, step_timing_key
+
+
+def make_schema(**overrides):
+	return WorkflowDefinitionSchema(
+		name='Learned Wait Test',
+		description='Test learned waits',
+		version='1.0',
+		default_wait_time=0.5,
+		steps=[
+			{'type': 'navigation', 'url': 'https://example.com', 'description': 'Step 1'},
+			{'type': 'click', 'cssSelector': '#next', 'description': 'Step 2'},
+			{'type': 'extract', 'extractionGoal': 'Result', 'description': 'Step 3', **overrides},
+		],
+		input_schema=[],
+	)
+
+
+def make_schema_key(step_index):
+	return step_timing_key(step_index, make_schema().steps[step_index])
+
+
+class TestStepTimingStore:
+	def setup_method(self):
+		self.key = '1:abc'
+
+	def test_needs_min_samples(self, tmp_path):
+		store = StepTimingStore(tmp_path / 'timings.json', min_samples=3)
+		store.record_settle(self.key, 0.2)
+		store.record_settle(self.key, 0.2)
+		assert store.learned_wait(self.key, static_wait=2.0) is None, 'Two samples should not replace the static wait'
+		store.record_settle(self.key, 0.2)
+		assert store.learned_wait(self.key, static_wait=2.0) == pytest.approx(0.2 * 1.25 + 0.05, abs=0.001)
+
+	def test_uses_p95_of_rolling_window(self, tmp_path):
+		store = StepTimingStore(tmp_path / 'timings.json', window=5, min_samples=1, safety_margin=0)
+		for seconds in [5.0, 0.1, 0.1, 0.1, 0.1, 0.1]:
+			store.record_settle(self.key, seconds)
+		assert len(store.steps[self.key]['samples']) == 5, 'Oldest sample should drop out of the window'
+		assert store.learned_wait(self.key, static_wait=10.0) == pytest.approx(0.15)
+
+	def test_never_exceeds_static_wait_without_failures(self, tmp_path):
+		store = StepTimingStore(tmp_path / 'timings.json', min_samples=1)
+		store.record_settle(self.key, 3.0)
+		assert store.learned_wait(self.key, static_wait=1.0) == 1.0
+
+	def test_failure_backs_off_and_success_relaxes(self, tmp_path):
+		store = StepTimingStore(tmp_path / 'timings.json', min_samples=1, safety_margin=0)
+		store.record_settle(self.key, 0.15)
+		base = store.learned_wait(self.key, static_wait=1.0)
+
+		store.record_failure(self.key)
+		store.record_failure(self.key)
+		assert store.learned_wait(self.key, static_wait=1.0) == pytest.approx(base * 4)
+		store.record_failure(self.key)
+		assert store.learned_wait(self.key, static_wait=1.0, max_wait=1.5) == 1.5, 'Backoff should be capped by max_wait'
+
+		store.record_success(self.key)
+		assert store.steps[self.key]['backoff'] == 4.0
+
+	def test_save_merges_concurrent_runs(self, tmp_path):
+		path = tmp_path / 'timings.json'
+		first = StepTimingStore(path)
+		second = StepTimingStore(path)
+		first.record_settle(self.key, 0.1)
+		second.record_settle(self.key, 0.3)
+		first.save()
+		second.save()
+
+		assert StepTimingStore(path).steps[self.key]['samples'] == [0.1, 0.3], 'Both runs should keep their samples'
+
+	def test_keys_follow_step_content(self):
+		schema = make_schema()
+		edited = make_schema(extractionGoal='Something else')
+		renamed = make_schema(description='Renamed')
+		assert step_timing_key(2, schema.steps[2]) != step_timing_key(2, edited.steps[2])
+		assert step_timing_key(2, schema.steps[2]) == step_timing_key(2, renamed.steps[2]), 'Descriptions do not affect timing'
+		assert step_timing_key(1, schema.steps[1]) != step_timing_key(2, schema.steps[1])
+
+
+class TestLearnedWaitsInRuns:
+	def setup_method(self):
+		self.sleep_calls = []
+		self.browser = Mock()
+		self.browser.start = AsyncMock()
+		self.browser.stop = AsyncMock()
+		self.browser.get_current_page = AsyncMock(return_value=Mock())
+
+	async def run_once(self, store, execute_step=None, settle=0.05):
+		original_sleep = asyncio.sleep
+		self.sleep_calls = []
+
+		async def mock_sleep(duration):
+			self.sleep_calls.append(duration)
+			await original_sleep(0.001)
+
+		execute_step = execute_step or AsyncMock(return_value=ActionResult(extracted_content='ok'))
+		with (
+			patch('asyncio.sleep', mock_sleep),
+			patch('workflow_use.workflow.service.measure_settle_time', AsyncMock(return_value=settle)),
+			patch.object(Workflow, '_execute_step', execute_step),
+		):
+			workflow = Workflow(workflow_schema=make_schema(), llm=Mock(), browser=self.browser, step_timings=store)
+			await workflow.run(inputs={}, close_browser_at_end=False)
+		return workflow
+
+	async def test_static_waits_until_enough_history(self, tmp_path):
+		path = tmp_path / 'timings.json'
+		for _ in range(3):
+			await self.run_once(StepTimingStore(path))
+			assert self.sleep_calls[:2] == [0.5, 0.5], 'Learning runs should keep the static waits'
+
+		store = StepTimingStore(path)
+		await self.run_once(store)
+		learned = self.sleep_calls[:2]
+		assert all(wait < 0.5 for wait in learned), f'Expected learned waits below the static 0.5s, got {learned}'
+		assert learned[0] == store.learned_wait(make_schema_key(0), 0.5)
+
+	async def test_failure_after_learned_wait_backs_off(self, tmp_path):
+		path = tmp_path / 'timings.json'
+		for _ in range(3):
+			await self.run_once(StepTimingStore(path))
+
+		async def fail_on_click(workflow, step_index, step):
+			if step_index == 1:
+				raise ValueError('element not found')
+			return ActionResult(extracted_content='ok')
+
+		with pytest.raises(ValueError):
+			await self.run_once(StepTimingStore(path), execute_step=fail_on_click)
+
+		assert StepTimingStore(path).steps[make_schema_key(0)]['backoff'] == 2.0, 'Failure should be saved as backoff'
+
+	async def test_disabled_by_default(self):
+		workflow = Workflow(workflow_schema=make_schema(), llm=Mock(), browser=self.browser)
+		assert workflow.step_timings is None
@@ -0,0 +1,257 @@
+"""
+Test page state digests in step verification.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from browser_use.agent.views import ActionResult
+
+from workflow_use.workflow.step_verifier import (
+	AI_CHECK_TEXT_CHARS,
+	PAGE_DIGEST_JS,
+	StepVerifier,
+	VerificationPolicy,
+	VerificationResult,
+)
+
+
+def digest(**overrides):
+	state = {
+		'url': 'https://example.com/form',
+		'title': 'Form',
+		'ready_state': 'complete',
+		'document_id': 'doc1',
+		'mutation_count': 5,
+		'text_hash': 'abc',
+		'text_length': 100,
+		'visible_elements_count': 40,
+		'scroll_position': {'x': 0, 'y': 0},
+	}
+	state.update(overrides)
+	return state
+
+
+class FakePage:
+	"""Page answering the digest script with queued states, as the browser-use actor does (JSON strings)"""
+
+	def __init__(self, *states):
+		self.states = list(states)
+		self.calls = []
+
+	async def evaluate(self, script, options):
+		assert script == PAGE_DIGEST_JS, 'Page state should be captured with the digest script only'
+		self.calls.append(options)
+		state = dict(self.states.pop(0))
+		if options['textChars'] > 0:
+			state['visible_text'] = 'Thank you for signing up'[: options['textChars']]
+		return json.dumps(state)
+
+
+def session_for(page):
+	session = Mock()
+	session.get_current_page = AsyncMock(return_value=page)
+	return session
+
+
+class TestPageDigests:
+	def setup_method(self):
+		self.verifier = StepVerifier()
+		self.click = SimpleNamespace(type='click', description='Submit the form')
+
+	async def test_capture_is_one_call_without_text(self):
+		page = FakePage(digest())
+		state = await self.verifier.capture_pre_step_state(session_for(page))
+
+		assert len(page.calls) == 1, 'Pre-step capture should take a single round trip'
+		assert page.calls[0]['textChars'] == 0
+		assert 'visible_text' not in state, 'Deterministic checks must not ship page text'
+		assert state['text_hash'] == 'abc'
+
+	async def test_unchanged_page_fails_state_check(self):
+		page = FakePage(digest(), digest())
+		pre_state = await self.verifier.capture_pre_step_state(session_for(page))
+		outcome = await self.verifier.verify_step(self.click, session_for(page), pre_state)
+		assert outcome.result == VerificationResult.FAILURE
+
+	async def test_changes_are_detected_from_digests(self):
+		changes = [
+			{'url': 'https://example.com/done'},
+			{'document_id': 'doc2'},
+			{'text_hash': 'def'},
+			{'visible_elements_count': 41},
+			{'mutation_count': 6},
+		]
+		for change in changes:
+			page = FakePage(digest(), digest(**change))
+			pre_state = await self.verifier.capture_pre_step_state(session_for(page))
+			outcome = await self.verifier.verify_step(self.click, session_for(page), pre_state)
+			assert outcome.result == VerificationResult.SUCCESS, f'Change {change} should count as a state change'
+
+	async def test_failed_capture_returns_empty_state(self):
+		page = Mock()
+		page.evaluate = AsyncMock(side_effect=RuntimeError('context destroyed'))
+		assert await self.verifier.capture_pre_step_state(session_for(page)) == {}
+
+	async def test_ai_check_fetches_truncated_text(self):
+		llm = Mock()
+		llm.ainvoke = AsyncMock(return_value=SimpleNamespace(content='PASS: confirmation shown'))
+		verifier = StepVerifier(llm=llm, policy=VerificationPolicy(batch_ai_checks=False))
+		# Only a mutation: too weak to skip the AI check
+		page = FakePage(digest(), digest(mutation_count=6), digest(mutation_count=6))
+
+		pre_state = await verifier.capture_pre_step_state(session_for(page))
+		outcome = await verifier.verify_step(self.click, session_for(page), pre_state)
+
+		assert outcome.result == VerificationResult.SUCCESS
+		assert outcome.confidence == 1.0, 'An AI pass should confirm a weak deterministic signal'
+		assert [call['textChars'] for call in page.calls] == [0, 0, AI_CHECK_TEXT_CHARS], 'Only the AI check should fetch text'
+		prompt = llm.ainvoke.call_args[0][0][0].content
+		assert 'Thank you for signing up' in prompt
+
+	async def test_scroll_and_load_checks_use_digest(self):
+		scroll = SimpleNamespace(type='scroll', description='Scroll down')
+		page = FakePage(digest(), digest(scroll_position={'x': 0, 'y': 500}))
+		pre_state = await self.verifier.capture_pre_step_state(session_for(page))
+		outcome = await self.verifier.verify_step(scroll, session_for(page), pre_state)
+		assert outcome.result == VerificationResult.SUCCESS
+
+		page = FakePage(digest(ready_state='loading'), digest(ready_state='loading'))
+		navigation = SimpleNamespace(type='navigation', url='https://example.com/form', description='Open')
+		outcome = await self.verifier.verify_step(navigation, session_for(page))
+		assert outcome.checks_failed == ['page_loaded'], 'A loading page should fail the page_loaded check'
+
+
+class TestAIVerificationPolicy:
+	def setup_method(self):
+		self.llm = Mock()
+		self.llm.ainvoke = AsyncMock(return_value=SimpleNamespace(content='1: PASS: ok'))
+		self.verifier = StepVerifier(llm=self.llm)
+
+	def click(self, description):
+		return SimpleNamespace(type='click', description=description, target_text=description)
+
+	async def verify_weak_click(self, description, mutation_count=6):
+		page = FakePage(digest(), digest(mutation_count=mutation_count), digest(mutation_count=mutation_count))
+		pre_state = await self.verifier.capture_pre_step_state(session_for(page))
+		return await self.verifier.verify_step(self.click(description), session_for(page), pre_state)
+
+	async def test_confident_deterministic_pass_skips_ai(self):
+		page = FakePage(digest(), digest(url='https://example.com/done'))
+		pre_state = await self.verifier.capture_pre_step_state(session_for(page))
+		outcome = await self.verifier.verify_step(self.click('Open details'), session_for(page), pre_state)
+
+		assert outcome.result == VerificationResult.SUCCESS
+		assert self.llm.ainvoke.call_count == 0, 'A URL change is conclusive without the LLM'
+		assert 'click_outcome_check: skipped' in outcome.details
+
+	async def test_deterministic_failure_skips_ai(self):
+		page = FakePage(digest(), digest())
+		pre_state = await self.verifier.capture_pre_step_state(session_for(page))
+		outcome = await self.verifier.verify_step(self.click('Open details'), session_for(page), pre_state)
+
+		assert outcome.result == VerificationResult.FAILURE
+		assert self.llm.ainvoke.call_count == 0, 'An AI pass could not rescue the step, so it should not be asked'
+
+	async def test_weak_signals_are_queued_and_batched(self):
+		first = await self.verify_weak_click('Open menu', mutation_count=6)
+		second = await self.verify_weak_click('Pick option', mutation_count=7)
+
+		assert first.result == second.result == VerificationResult.SUCCESS
+		assert first.confidence < 1.0, 'Unconfirmed weak signals should show in the confidence'
+		assert len(self.verifier.pending_ai_checks) == 2
+		assert self.llm.ainvoke.call_count == 0, 'Queued checks should not call the LLM yet'
+
+		assert await self.verifier.checkpoint(self.click('Next field')) == [], 'Ordinary steps are not checkpoints'
+
+		self.llm.ainvoke.return_value = SimpleNamespace(content='1: PASS: menu open\n2: FAIL: option not selected')
+		verdicts = await self.verifier.checkpoint(self.click('Submit order'))
+
+		assert self.llm.ainvoke.call_count == 1, 'Both queued checks should share one LLM call'
+		assert [verdict.passed for verdict in verdicts] == [True, False]
+		assert verdicts[1].step_description == 'Pick option'
+		assert self.verifier.pending_ai_checks == []
+
+	async def test_full_queue_is_flushed_at_next_step(self):
+		self.verifier.policy.max_batch_size = 2
+		await self.verify_weak_click('Open menu', mutation_count=6)
+		await self.verify_weak_click('Pick option', mutation_count=7)
+		self.llm.ainvoke.return_value = SimpleNamespace(content='1: PASS: ok\n2: UNCERTAIN: unclear')
+
+		verdicts = await self.verifier.checkpoint(self.click('Next field'))
+		assert [verdict.passed for verdict in verdicts] == [True, None]
+
+	async def test_verdicts_are_cached_by_step_and_page(self):
+		await self.verify_weak_click('Open menu')
+		await self.verifier.flush()
+		assert self.llm.ainvoke.call_count == 1
+
+		# Same step on the same page: answered from the cache
+		outcome = await self.verify_weak_click('Open menu')
+		assert self.verifier.pending_ai_checks == []
+		assert outcome.confidence == 1.0
+		assert 'cached' in outcome.details
+
+		# Same step on a different page: asked again
+		page = FakePage(digest(), digest(mutation_count=6, text_hash='xyz'), digest(mutation_count=6, text_hash='xyz'))
+		pre_state = await self.verifier.capture_pre_step_state(session_for(page))
+		# A text change is a strong signal, so force the AI check through a weaker policy threshold
+		self.verifier.policy.ai_skip_confidence = 1.1
+		await self.verifier.verify_step(self.click('Open menu'), session_for(page), pre_state)
+		assert len(self.verifier.pending_ai_checks) == 1
+
+	async def test_llm_errors_do_not_fail_queued_steps(self):
+		await self.verify_weak_click('Open menu')
+		self.llm.ainvoke.side_effect = RuntimeError('rate limited')
+		verdicts = await self.verifier.flush()
+		assert [verdict.passed for verdict in verdicts] == [None]
+
+	async def test_executor_raises_for_failed_queued_verdicts(self):
+		from workflow_use.workflow.semantic_executor import SemanticWorkflowExecutor
+
+		executor = SemanticWorkflowExecutor(Mock(), page_extraction_llm=self.llm, enable_step_verification=True)
+		executor.step_verifier = self.verifier
+		await self.verify_weak_click('Pick option')
+		self.llm.ainvoke.return_value = SimpleNamespace(content='1: FAIL: option not selected')
+
+		with pytest.raises(Exception, match='AI verification failed for earlier step'):
+			await executor.finish()
+
+	async def test_failed_run_does_not_leak_queued_checks(self):
+		from workflow_use.schema.views import WorkflowDefinitionSchema
+		from workflow_use.workflow.semantic_executor import SemanticWorkflowExecutor
+		from workflow_use.workflow.service import Workflow
+
+		schema = WorkflowDefinitionSchema(
+			name='Verification Reuse Test',
+			description='Queued checks across runs',
+			version='1.0',
+			steps=[
+				{'type': 'click', 'target_text': 'Pick option', 'description': 'Pick option'},
+				{'type': 'extract', 'extractionGoal': 'Selection', 'description': 'Read'},
+			],
+			input_schema=[],
+		)
+		session_manager = Mock()
+		session_manager.acquire = AsyncMock()
+		workflow = Workflow(workflow_schema=schema, llm=Mock(), session_manager=session_manager)
+		workflow._semantic_executor = SemanticWorkflowExecutor(
+			Mock(), page_extraction_llm=self.llm, enable_step_verification=True
+		)
+		workflow._semantic_executor.step_verifier = self.verifier
+		self.llm.ainvoke.return_value = SimpleNamespace(content='1: FAIL: option not selected')
+
+		async def failing_step(*args):
+			await self.verify_weak_click('Pick option')
+			raise RuntimeError('element not found')
+
+		with patch.object(Workflow, '_execute_step', new=failing_step):
+			with pytest.raises(RuntimeError, match='element not found'):
+				await workflow.run()
+
+		assert self.verifier.pending_ai_checks == [], 'A failed run must not leave its checks queued'
+		with patch.object(Workflow, '_execute_step', new=AsyncMock(return_value=ActionResult(extracted_content='ok'))):
+			await workflow.run()
+		assert self.llm.ainvoke.call_count == 0, "The next run must not be judged on the failed run's page"
@@ -0,0 +1,142 @@
+"""
+Test per-step timing traces and their Chrome trace and summary exports.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+from browser_use.agent.views import ActionResult
+
+from workflow_use.schema.views import WorkflowDefinitionSchema
+from workflow_use.workflow.service import Workflow
+from workflow_use.workflow.tracing import (
+	CATEGORY_ELEMENT,
+	CATEGORY_MAPPING,
+	CATEGORY_VERIFICATION,
+	RunTrace,
+	current_trace,
+	span,
+	traced,
+	traced_sleep,
+)
+
+
+@traced(CATEGORY_ELEMENT)
+def find_element():
+	time.sleep(0.01)
+	return 'found'
+
+
+@traced(CATEGORY_MAPPING)
+async def refresh_mapping():
+	await asyncio.sleep(0.01)
+
+
+class TestRunTrace:
+	"""Test span recording, nesting and exports"""
+
+	def setup_method(self):
+		self.trace = RunTrace('Checkout')
+
+	async def test_spans_nest_and_count_self_time_once(self):
+		step = Mock(type='click', description='Submit')
+		with self.trace.activate():
+			with self.trace.step(0, step):
+				with span('verify', CATEGORY_VERIFICATION):
+					await refresh_mapping()
+				assert find_element() == 'found'
+
+		spans = {s.name: s for s in self.trace.spans}
+		assert spans['refresh_mapping'].parent is spans['verify']
+		assert spans['verify'].self_time < spans['verify'].duration, 'Child time should not count as verification time'
+		assert all(s.step_index == 0 for s in self.trace.spans), 'Nested spans should be attributed to their step'
+
+		row, total = self.trace.summary()
+		assert row['label'] == 'click: Submit'
+		assert row[CATEGORY_MAPPING] >= 0.01 and row[CATEGORY_ELEMENT] >= 0.01
+		parts = sum(value for key, value in row.items() if key not in ('step', 'label', 'total'))
+		assert abs(parts - row['total']) < 1e-6, 'Self times should add up to the step wall time'
+		assert total['total'] == row['total']
+
+	async def test_sleeps_and_work_between_steps_are_recorded(self):
+		with self.trace.activate():
+			await traced_sleep(0.01, 'inter-step wait', step_index=1)
+			with span('output model llm', 'llm'):
+				pass
+
+		rows = self.trace.summary()
+		assert rows[0]['step'] == 1 and rows[0]['sleep'] >= 0.01
+		assert rows[1]['label'] == '(outside steps)'
+		table = self.trace.format_summary()
+		assert '(outside steps)' in table and 'TOTAL' in table
+
+	async def test_chrome_trace_export(self, tmp_path):
+		with self.trace.activate():
+			with self.trace.step(0, Mock(type='input', description='Email')):
+				await refresh_mapping()
+
+		path = self.trace.write_chrome_trace(tmp_path / 'trace.json')
+		data = json.loads(path.read_text())
+
+		complete = [event for event in data['traceEvents'] if event['ph'] == 'X']
+		assert [event['name'] for event in complete] == ['Step 1', 'refresh_mapping']
+		step_event, mapping_event = complete
+		assert step_event['ts'] <= mapping_event['ts']
+		assert mapping_event['ts'] + mapping_event['dur'] <= step_event['ts'] + step_event['dur']
+		assert mapping_event['cat'] == CATEGORY_MAPPING and mapping_event['args']['step'] == 1
+
+	async def test_concurrent_runs_record_into_their_own_trace(self):
+		async def run(trace):
+			with trace.activate():
+				await asyncio.sleep(0)
+				await refresh_mapping()
+
+		first, second = RunTrace('a'), RunTrace('b')
+		await asyncio.gather(run(first), run(second))
+
+		assert len(first.spans) == 1 and len(second.spans) == 1
+
+	async def test_no_active_trace_is_a_no_op(self):
+		assert current_trace() is None
+		with span('anything', CATEGORY_MAPPING) as record:
+			assert record is None
+		assert find_element() == 'found'
+
+
+class TestWorkflowTracing:
+	"""Test that workflow runs record a trace per run when enabled"""
+
+	async def test_run_with_no_ai_records_steps(self):
+		schema = WorkflowDefinitionSchema(
+			name='Traced',
+			description='Traced',
+			version='1.0',
+			input_schema=[],
+			steps=[
+				{'type': 'navigation', 'url': 'https://example.com', 'description': 'Open'},
+				{'type': 'extract', 'extractionGoal': 'Title', 'description': 'Title'},
+			],
+		)
+		workflow = Workflow(workflow_schema=schema, llm=Mock(), browser=Mock(), trace=True, step_wait_time=0)
+		workflow.browser.start = AsyncMock()
+		workflow.browser.stop = AsyncMock()
+
+		async def execute_step(step):
+			await refresh_mapping()
+			return ActionResult(extracted_content=step.type)
+
+		executor = Mock()
+		executor.execute_step = execute_step
+		executor.finish = AsyncMock()
+		with patch('workflow_use.workflow.semantic_executor.SemanticWorkflowExecutor', return_value=executor):
+			await workflow.run_with_no_ai()
+			first_trace = workflow.last_trace
+			await workflow.run_with_no_ai()
+
+		assert workflow.last_trace is not first_trace, 'Each run should get a fresh trace'
+		steps = [s for s in workflow.last_trace.spans if s.category == 'step']
+		assert [s.name for s in steps] == ['Step 1', 'Step 2']
+		assert {s.step_index for s in workflow.last_trace.spans if s.category == CATEGORY_MAPPING} == {0, 1}
+		assert current_trace() is None, 'The trace should be deactivated after the run'
@@ -0,0 +1,75 @@
+"""
+Test the single-pass validation error scan and its use in the semantic executor.
+"""
+
+import json
+from unittest.mock import AsyncMock, Mock
+
+from browser_use.agent.views import ActionResult
+
+from workflow_use.schema.views import ClickStep, NavigationStep
+from workflow_use.workflow.semantic_executor import SemanticWorkflowExecutor
+from workflow_use.workflow.validation_utils import (
+	VALIDATION_ERROR_SCAN_JS,
+	VALIDATION_ERROR_SELECTORS,
+	detect_validation_errors,
+	get_all_validation_errors,
+)
+
+
+class TestValidationScan:
+	"""Test validation error detection in one round-trip"""
+
+	def setup_method(self):
+		self.page = Mock()
+		self.page.evaluate = AsyncMock(return_value=json.dumps(['Email is required', 'Password is invalid']))
+
+	async def test_all_selectors_in_one_evaluation(self):
+		"""Every selector is evaluated by a single injected script"""
+		errors = await get_all_validation_errors(self.page)
+
+		assert errors == ['Email is required', 'Password is invalid']
+		assert self.page.evaluate.await_count == 1, 'Scan should be a single round-trip'
+		script, selectors, _, max_length = self.page.evaluate.await_args.args
+		assert script == VALIDATION_ERROR_SCAN_JS
+		assert selectors == VALIDATION_ERROR_SELECTORS
+		assert max_length == 200
+
+	async def test_detect_returns_first_error(self):
+		"""detect_validation_errors reports the first error found"""
+		assert await detect_validation_errors(self.page) == (True, 'Email is required')
+
+		self.page.evaluate.return_value = json.dumps([])
+		assert await detect_validation_errors(self.page) == (False, None)
+
+	async def test_scan_failure_means_no_errors(self):
+		"""A failed scan must not block execution"""
+		self.page.evaluate.side_effect = RuntimeError('Target closed')
+
+		assert await get_all_validation_errors(self.page) == []
+
+
+class TestExecutorValidationSkip:
+	"""Test that the executor only scans after steps that can cause validation errors"""
+
+	def setup_method(self):
+		self.executor = SemanticWorkflowExecutor(browser=Mock())
+		self.executor._detect_form_validation_errors = AsyncMock(return_value={})
+		self.step_executor = AsyncMock(return_value=ActionResult(extracted_content='ok'))
+		self.verifier = AsyncMock(return_value=True)
+
+	async def test_navigation_skips_scan(self):
+		"""Navigation steps do not trigger the validation scan"""
+		step = NavigationStep(type='navigation', url='https://example.com')
+
+		await self.executor._execute_with_verification_and_retry(self.step_executor, step, self.verifier)
+
+		assert self.executor._detect_form_validation_errors.await_count == 0, 'Navigation should skip the scan'
+
+	async def test_click_runs_scan(self):
+		"""Click steps are still scanned"""
+		step = ClickStep(type='click', target_text='Submit')
+
+		await self.executor._execute_with_verification_and_retry(self.step_executor, step, self.verifier)
+
+		assert self.executor._detect_form_validation_errors.await_count == 1, 'Click should run the scan'
@@ -0,0 +1,65 @@
+"""
+Test that visibility probing for candidate elements uses a single batched CDP call.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+from workflow_use.workflow.semantic_executor import VISIBILITY_PROBE_JS, SemanticWorkflowExecutor
+
+
+class TestVisibilityProbe:
+	"""Test batched visibility probing in SemanticWorkflowExecutor"""
+
+	def setup_method(self):
+		self.executor = SemanticWorkflowExecutor(browser=Mock())
+		self.client = Mock()
+		self.client.send.Runtime.callFunctionOn = AsyncMock()
+
+	def _element(self, object_id):
+		element = Mock()
+		element._get_remote_object_id = AsyncMock(return_value=object_id)
+		element._client = self.client
+		element._session_id = 'session-1'
+		return element
+
+	def _probe(self, visible=True, truly_visible=False):
+		return {'visible': visible, 'truly_visible': truly_visible, 'obscured': False, 'reason': 'ok', 'bbox': {}}
+
+	async def test_all_candidates_probed_in_one_call(self):
+		"""Every candidate is passed to one Runtime.callFunctionOn"""
+		elements = [self._element(f'obj-{i}') for i in range(20)]
+		self.client.send.Runtime.callFunctionOn.return_value = {'result': {'value': [self._probe() for _ in elements]}}
+
+		probes = await self.executor._probe_elements_visibility(elements)
+
+		assert len(probes) == 20, f'Expected 20 probes, got {len(probes)}'
+		assert self.client.send.Runtime.callFunctionOn.await_count == 1, 'Visibility should be probed in one round-trip'
+		params = self.client.send.Runtime.callFunctionOn.await_args.kwargs['params']
+		assert params['functionDeclaration'] == VISIBILITY_PROBE_JS
+		assert [arg['objectId'] for arg in params['arguments']] == [f'obj-{i}' for i in range(20)]
+
+	async def test_prefers_truly_visible_then_visible(self):
+		"""Truly visible candidates win over merely visible ones, checked from the end"""
+		elements = [self._element('a'), self._element('b'), self._element('c')]
+		# Probed in reverse order: c, b, a
+		self.client.send.Runtime.callFunctionOn.return_value = {
+			'result': {'value': [self._probe(visible=False), self._probe(visible=True), self._probe(truly_visible=True)]}
+		}
+
+		assert await self.executor._get_first_visible_element(elements) is elements[0]
+
+		self.client.send.Runtime.callFunctionOn.return_value = {
+			'result': {'value': [self._probe(visible=False), self._probe(visible=True), self._probe(visible=False)]}
+		}
+
+		assert await self.executor._get_first_visible_element(elements) is elements[1]
+
+	async def test_unresolved_elements_are_skipped(self):
+		"""Elements without an object ID get no probe and are not sent to the page"""
+		elements = [self._element(None), self._element('b')]
+		self.client.send.Runtime.callFunctionOn.return_value = {'result': {'value': [self._probe(truly_visible=True)]}}
+
+		probes = await self.executor._probe_elements_visibility(elements)
+
+		assert probes[0] is None, 'Unresolved element should have no probe'
+		assert probes[1]['truly_visible'], 'Resolved element should keep its probe'
@@ -1,4 +1,18 @@
+from typing import TYPE_CHECKING
+
 from workflow_use.schema.views import WorkflowDefinitionSchema
-from workflow_use.workflow.service import Workflow
+
+if TYPE_CHECKING:
+	from workflow_use.workflow.service import Workflow
 
 __all__ = ['WorkflowDefinitionSchema', 'Workflow']
+
+
+def __getattr__(name: str):
+	# Workflow pulls in browser_use; import it on first access so light entry points
+	# (e.g. CLI storage commands) do not pay for it
+	if name == 'Workflow':
+		from workflow_use.workflow.service import Workflow
+
+		return Workflow
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
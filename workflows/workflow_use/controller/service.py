@@ -16,6 +16,7 @@ from workflow_use.controller.views import (
 	ScrollDeterministicAction,
 	SelectDropdownOptionDeterministicAction,
 )
+from workflow_use.workflow.page_readiness import DEFAULT_PAGE_READY_TIMEOUT, wait_for_page_ready
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +57,8 @@ class WorkflowController(Controller):
 	def __init__(self, *args, **kwargs):
 		# Pass the list of actions to exclude to the base class constructor
 		super().__init__(*args, exclude_actions=DISABLED_DEFAULT_ACTIONS, **kwargs)
+		# Upper bound for the readiness wait after navigation; workflows override it per run
+		self.page_ready_timeout = DEFAULT_PAGE_READY_TIMEOUT
 		self.__register_actions()
 
 	def __register_actions(self):
@@ -66,9 +69,7 @@ class WorkflowController(Controller):
 			page = await browser_session.get_current_page()
 			await page.goto(params.url)
 			# Wait for page to load (CDP navigate doesn't wait automatically)
-			import asyncio
-
-			await asyncio.sleep(2)
+			await wait_for_page_ready(page, timeout=self.page_ready_timeout)
 
 			msg = f'🔗  Navigated to URL: {params.url}'
 			logger.info(msg)
@@ -26,6 +26,12 @@ StatusUpdateCallback = Callable[[str], None]
 _PROMPTS_DIR = Path(__file__).parent / 'prompts'
 
 
+def _action_element_indices(action: Any) -> List[int]:
+	"""Selector map indices an agent action targets (e.g. click_element, input_text)."""
+	action_dict = action.model_dump() if hasattr(action, 'model_dump') else {}
+	return [value['index'] for value in action_dict.values() if isinstance(value, dict) and isinstance(value.get('index'), int)]
+
+
 class HealingService:
 	def __init__(
 		self,
@@ -605,196 +611,24 @@ class HealingService:
 				self.on_step_recorded = on_step_recorded
 
 			async def act(self, action, browser_session, *args, **kwargs):
-				# Get the selector map before action
-				try:
-					selector_map = await browser_session.get_selector_map()
-
-					if selector_map:
-						print(f'📋 Captured {len(selector_map)} elements from selector_map')
-						# selector_map is a dict: {index: DOMInteractedElement}
-						# We need to extract text/attributes from each element
-						debug_count = 0
-						for index, dom_element in selector_map.items():
-							# DEBUG: Print all fields for first 3 elements to see what's available
-							if debug_count < 3:
-								print(f'\n🔍 DEBUG - Element {index}:')
-								print(f'   Type: {type(dom_element)}')
-								if isinstance(dom_element, dict):
-									print(f'   Dict keys: {list(dom_element.keys())}')
-									print(f'   Content: {dom_element}')
-								elif hasattr(dom_element, '__dict__'):
-									print(f'   Available fields: {list(dom_element.__dict__.keys())}')
-									print(f'   Values: {dom_element.__dict__}')
-								else:
-									attrs = [attr for attr in dir(dom_element) if not attr.startswith('_')]
-									print(f'   Dir (non-private): {attrs}')
-									# Print values of key attributes
-									for attr in ['text', 'inner_text', 'node_value', 'node_name', 'attributes']:
-										if hasattr(dom_element, attr):
-											val = getattr(dom_element, attr, None)
-											print(f'   {attr}: {val}')
-								debug_count += 1
-
-							# Handle dict format (from selector_map)
-							if isinstance(dom_element, dict):
-								text = dom_element.get('text', '')
-								tag_name = dom_element.get('tag_name', '')
-								attrs = dom_element.get('attributes', {})
-							else:
-								# Extract tag name first
-								tag_name = (
-									getattr(dom_element, 'node_name', '').lower() if hasattr(dom_element, 'node_name') else ''
-								)
-								attrs = getattr(dom_element, 'attributes', {})
-
-								# Extract text by trying multiple field names
-								text = ''
-								for text_field in ['text', 'inner_text', 'node_value', 'textContent', 'innerText']:
-									if hasattr(dom_element, text_field):
-										potential_text = getattr(dom_element, text_field, '')
-										if potential_text and potential_text.strip():
-											# IMPORTANT: Skip JavaScript href text (same filter as in deterministic_converter.py)
-											# browser-use sometimes provides JavaScript href as 'text' for anchor tags
-											if tag_name == 'a' and potential_text.lower().startswith('javascript:'):
-												continue
-											text = potential_text
-											break
-
-							# Normalize text (strip whitespace)
-							text = text.strip() if text else ''
-
-							# For interactive elements (links, buttons), prioritize semantic attributes
-							# over potentially meaningless text content
-							if tag_name in ['a', 'button'] and isinstance(attrs, dict):
-								# Check if current text is very short or looks like an ID/hash
-								is_poor_text = (
-									not text
-									or len(text) <= 2  # Single char or very short
-									or text.lower() in ['link', 'button', 'click', 'here']  # Generic text
-									or (len(text) == 8 and text.isalnum())  # Looks like an ID (e.g., "nboo9eyy")
-								)
-
-								if is_poor_text:
-									# Try semantic attributes first for better context
-									semantic_text = (
-										attrs.get('aria-label')
-										or attrs.get('title')
-										or attrs.get('alt')
-										or attrs.get('placeholder')
-										or attrs.get('value')
-										or ''
-									)
-
-									if semantic_text:
-										text = semantic_text
-										print(f'   📎 Using semantic attribute for better text: "{text}"')
-									# For anchor tags, try ID/class-based inference for common button patterns
-									elif tag_name == 'a':
-										element_id = attrs.get('id', '')
-										element_class = attrs.get('class', '')
-
-										# Check for common button patterns in ID/class
-										id_lower = element_id.lower() if element_id else ''
-										class_lower = element_class.lower() if element_class else ''
-
-										# Common search/submit button patterns
-										if 'search' in id_lower or 'search' in class_lower:
-											text = 'Search'
-											print(f'   📎 Inferred "Search" from ID/class: {element_id or element_class}')
-										elif 'submit' in id_lower or 'submit' in class_lower:
-											text = 'Submit'
-											print(f'   📎 Inferred "Submit" from ID/class: {element_id or element_class}')
-										elif 'action' in id_lower or 'action' in class_lower:
-											# cmdAction, btnAction, etc. in forms usually means Submit/Search
-											if 'sqlviewpro' in id_lower or 'parameter' in id_lower:
-												text = 'Search'
-												print(f'   📎 Inferred "Search" from form action button: {element_id}')
-											else:
-												text = 'Submit'
-												print(f'   📎 Inferred "Submit" from action button: {element_id}')
-										# If still no text after ID/class inference, try href extraction
-										elif 'href' in attrs:
-											href = attrs['href']
-											# Skip JavaScript hrefs - they don't have meaningful text to extract
-											if isinstance(href, str) and not href.lower().startswith('javascript:'):
-												# Extract the last meaningful part of the URL path
-												# E.g., "https://newsroom.edison.com/releases" -> "releases"
-												# Remove query params and anchors
-												href = href.split('?')[0].split('#')[0]
-												# Get the last path segment
-												path_parts = href.rstrip('/').split('/')
-												if path_parts:
-													last_part = path_parts[-1]
-													# Only use if it looks like readable text
-													# Avoid random IDs like "nboo9eyy" (all lowercase alphanumeric with no separators)
-													if last_part and last_part not in [
-														'www.edison.com',
-														'edison.com',
-														'investors',
-													]:
-														# Check if it has word separators (hyphens, underscores)
-														if '-' in last_part or '_' in last_part:
-															text = last_part.replace('-', ' ').replace('_', ' ').title()
-															print(f'   📎 Extracted from href: "{text}"')
-														# Fallback: use clean slugs without separators (e.g., "login", "dashboard")
-														# Only if they're reasonable length and look like words (not random IDs)
-														elif len(last_part) >= 3 and len(last_part) <= 20 and last_part.isalpha():
-															text = last_part.title()
-															print(f'   📎 Extracted clean slug from href: "{text}"')
-
-							# Final fallback for any element (not anchor/button): if still no text, try attributes
-							elif not text:
-								if isinstance(attrs, dict):
-									# Try common text attributes
-									text = (
-										attrs.get('aria-label')
-										or attrs.get('title')
-										or attrs.get('alt')
-										or attrs.get('placeholder')
-										or attrs.get('value')
-										or ''
-									)
-									# Note: ID/class inference for anchor tags is now handled above in the anchor/button block
-
-							# Create a simplified dict with the data we need
-							# Handle both dict and object formats
-							if isinstance(dom_element, dict):
-								element_data = {
-									'index': index,
-									'tag_name': tag_name or dom_element.get('tag_name', ''),
-									'text': text,
-									'xpath': dom_element.get('xpath', '') or dom_element.get('x_path', ''),
-									'css_selector': dom_element.get('css_selector', ''),
-									'attributes': attrs,
-								}
-							else:
-								element_data = {
-									'index': index,
-									'tag_name': tag_name,
-									'text': text,
-									'xpath': getattr(dom_element, 'x_path', '') or getattr(dom_element, 'xpath', ''),
-									'css_selector': getattr(dom_element, 'css_selector', ''),
-									'attributes': attrs,
-								}
-
-							# Generate multiple selector strategies for robust element finding
-							try:
-								strategies = self.selector_generator.generate_strategies_dict(element_data)
-								element_data['selector_strategies'] = strategies
-							except Exception as e:
-								print(f'   ⚠️  Warning: Failed to generate selector strategies: {e}')
-								element_data['selector_strategies'] = []
-
+				# Capture only the element(s) this action targets: building selector strategies for the
+				# whole selector map before every action dominated generation time on large pages
+				target_indices = _action_element_indices(action)
+				if target_indices:
+					try:
+						selector_map = await browser_session.get_selector_map()
+						for index in target_indices:
+							dom_element = selector_map.get(index) if selector_map else None
+							if dom_element is None:
+								print(f'⚠️  Warning: Element {index} not found in selector_map')
+								continue
+							element_data = self._capture_element(index, dom_element)
 							# Store in the shared map
 							element_text_map[index] = element_data
-
-							# Show first few captures for debugging
-							if len(element_text_map) <= 5:
-								text_preview = element_data['text'][:50] if element_data['text'] else '(no text)'
-								print(f'   Element {index} ({element_data["tag_name"]}): {text_preview}')
-
-				except Exception as e:
-					print(f'⚠️  Warning: Failed to capture elements before action: {e}')
+							text_preview = element_data['text'][:50] if element_data['text'] else '(no text)'
+							print(f'📋 Captured element {index} ({element_data["tag_name"]}): {text_preview}')
+					except Exception as e:
+						print(f'⚠️  Warning: Failed to capture elements before action: {e}')
 
 				# Execute the actual action
 				result = await super().act(action, browser_session, *args, **kwargs)
@@ -883,6 +717,158 @@ class HealingService:
 
 				return result
 
+			def _capture_element(self, index: int, dom_element: Any) -> Dict[str, Any]:
+				"""Build the text, selectors and selector strategies of one selector_map element."""
+				# Handle dict format (from selector_map)
+				if isinstance(dom_element, dict):
+					text = dom_element.get('text', '')
+					tag_name = dom_element.get('tag_name', '')
+					attrs = dom_element.get('attributes', {})
+				else:
+					# Extract tag name first
+					tag_name = getattr(dom_element, 'node_name', '').lower() if hasattr(dom_element, 'node_name') else ''
+					attrs = getattr(dom_element, 'attributes', {})
+
+					# Extract text by trying multiple field names
+					text = ''
+					for text_field in ['text', 'inner_text', 'node_value', 'textContent', 'innerText']:
+						if hasattr(dom_element, text_field):
+							potential_text = getattr(dom_element, text_field, '')
+							if potential_text and potential_text.strip():
+								# IMPORTANT: Skip JavaScript href text (same filter as in deterministic_converter.py)
+								# browser-use sometimes provides JavaScript href as 'text' for anchor tags
+								if tag_name == 'a' and potential_text.lower().startswith('javascript:'):
+									continue
+								text = potential_text
+								break
+
+				# Normalize text (strip whitespace)
+				text = text.strip() if text else ''
+
+				# For interactive elements (links, buttons), prioritize semantic attributes
+				# over potentially meaningless text content
+				if tag_name in ['a', 'button'] and isinstance(attrs, dict):
+					# Check if current text is very short or looks like an ID/hash
+					is_poor_text = (
+						not text
+						or len(text) <= 2  # Single char or very short
+						or text.lower() in ['link', 'button', 'click', 'here']  # Generic text
+						or (len(text) == 8 and text.isalnum())  # Looks like an ID (e.g., "nboo9eyy")
+					)
+
+					if is_poor_text:
+						# Try semantic attributes first for better context
+						semantic_text = (
+							attrs.get('aria-label')
+							or attrs.get('title')
+							or attrs.get('alt')
+							or attrs.get('placeholder')
+							or attrs.get('value')
+							or ''
+						)
+
+						if semantic_text:
+							text = semantic_text
+							print(f'   📎 Using semantic attribute for better text: "{text}"')
+						# For anchor tags, try ID/class-based inference for common button patterns
+						elif tag_name == 'a':
+							element_id = attrs.get('id', '')
+							element_class = attrs.get('class', '')
+
+							# Check for common button patterns in ID/class
+							id_lower = element_id.lower() if element_id else ''
+							class_lower = element_class.lower() if element_class else ''
+
+							# Common search/submit button patterns
+							if 'search' in id_lower or 'search' in class_lower:
+								text = 'Search'
+								print(f'   📎 Inferred "Search" from ID/class: {element_id or element_class}')
+							elif 'submit' in id_lower or 'submit' in class_lower:
+								text = 'Submit'
+								print(f'   📎 Inferred "Submit" from ID/class: {element_id or element_class}')
+							elif 'action' in id_lower or 'action' in class_lower:
+								# cmdAction, btnAction, etc. in forms usually means Submit/Search
+								if 'sqlviewpro' in id_lower or 'parameter' in id_lower:
+									text = 'Search'
+									print(f'   📎 Inferred "Search" from form action button: {element_id}')
+								else:
+									text = 'Submit'
+									print(f'   📎 Inferred "Submit" from action button: {element_id}')
+							# If still no text after ID/class inference, try href extraction
+							elif 'href' in attrs:
+								href = attrs['href']
+								# Skip JavaScript hrefs - they don't have meaningful text to extract
+								if isinstance(href, str) and not href.lower().startswith('javascript:'):
+									# Extract the last meaningful part of the URL path
+									# E.g., "https://newsroom.edison.com/releases" -> "releases"
+									# Remove query params and anchors
+									href = href.split('?')[0].split('#')[0]
+									# Get the last path segment
+									path_parts = href.rstrip('/').split('/')
+									if path_parts:
+										last_part = path_parts[-1]
+										# Only use if it looks like readable text
+										# Avoid random IDs like "nboo9eyy" (all lowercase alphanumeric with no separators)
+										if last_part and last_part not in [
+											'www.edison.com',
+											'edison.com',
+											'investors',
+										]:
+											# Check if it has word separators (hyphens, underscores)
+											if '-' in last_part or '_' in last_part:
+												text = last_part.replace('-', ' ').replace('_', ' ').title()
+												print(f'   📎 Extracted from href: "{text}"')
+											# Fallback: use clean slugs without separators (e.g., "login", "dashboard")
+											# Only if they're reasonable length and look like words (not random IDs)
+											elif len(last_part) >= 3 and len(last_part) <= 20 and last_part.isalpha():
+												text = last_part.title()
+												print(f'   📎 Extracted clean slug from href: "{text}"')
+
+				# Final fallback for any element (not anchor/button): if still no text, try attributes
+				elif not text:
+					if isinstance(attrs, dict):
+						# Try common text attributes
+						text = (
+							attrs.get('aria-label')
+							or attrs.get('title')
+							or attrs.get('alt')
+							or attrs.get('placeholder')
+							or attrs.get('value')
+							or ''
+						)
+						# Note: ID/class inference for anchor tags is now handled above in the anchor/button block
+
+				# Create a simplified dict with the data we need
+				# Handle both dict and object formats
+				if isinstance(dom_element, dict):
+					element_data = {
+						'index': index,
+						'tag_name': tag_name or dom_element.get('tag_name', ''),
+						'text': text,
+						'xpath': dom_element.get('xpath', '') or dom_element.get('x_path', ''),
+						'css_selector': dom_element.get('css_selector', ''),
+						'attributes': attrs,
+					}
+				else:
+					element_data = {
+						'index': index,
+						'tag_name': tag_name,
+						'text': text,
+						'xpath': getattr(dom_element, 'x_path', '') or getattr(dom_element, 'xpath', ''),
+						'css_selector': getattr(dom_element, 'css_selector', ''),
+						'attributes': attrs,
+					}
+
+				# Generate multiple selector strategies for robust element finding
+				try:
+					strategies = self.selector_generator.generate_strategies_dict(element_data)
+					element_data['selector_strategies'] = strategies
+				except Exception as e:
+					print(f'   ⚠️  Warning: Failed to generate selector strategies: {e}')
+					element_data['selector_strategies'] = []
+
+				return element_data
+
 			def _generate_action_description(
 				self, action_type: Optional[str], target_text: Optional[str], input_value: Optional[str], url: str
 			) -> str:
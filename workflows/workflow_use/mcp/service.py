@@ -1,3 +1,4 @@
+import asyncio
 import json as _json
 from inspect import Parameter, Signature
 from pathlib import Path
@@ -7,6 +8,10 @@ from browser_use.llm.base import BaseChatModel
 from fastmcp import FastMCP
 
 from workflow_use.schema.views import WorkflowDefinitionSchema
+from workflow_use.workflow.browser_pool import DEFAULT_ACQUIRE_TIMEOUT, DEFAULT_MAX_WAITING, DEFAULT_POOL_SIZE, BrowserPool
+from workflow_use.workflow.browser_session import SessionResetMode
+from workflow_use.workflow.extraction_cache import ExtractionCache
+from workflow_use.workflow.mapping_cache import SemanticMappingCache
 from workflow_use.workflow.service import Workflow
 
 
@@ -16,20 +21,50 @@ def get_mcp_server(
 	workflow_dir: str = './tmp',
 	name: str = 'WorkflowService',
 	description: str = 'Exposes workflows as MCP tools.',
+	session_reset: SessionResetMode = 'clear_storage',
+	pool_size: int = DEFAULT_POOL_SIZE,
+	max_queued_calls: int = DEFAULT_MAX_WAITING,
+	queue_timeout: float | None = DEFAULT_ACQUIRE_TIMEOUT,
+	run_timeout: float | None = None,
 ):
+	"""
+	Create an MCP server exposing every workflow in ``workflow_dir`` as a tool.
+
+	Tool calls run on a shared pool of ``pool_size`` warm browsers. Calls beyond the pool size wait
+	in an admission queue of at most ``max_queued_calls`` for up to ``queue_timeout`` seconds.
+	"""
 	mcp_app = FastMCP(name=name, description=description)
 
-	_setup_workflow_tools(mcp_app, llm_instance, page_extraction_llm, workflow_dir)
+	browser_pool = BrowserPool(
+		size=pool_size, reset_mode=session_reset, max_waiting=max_queued_calls, acquire_timeout=queue_timeout
+	)
+	_setup_workflow_tools(
+		mcp_app, llm_instance, page_extraction_llm, workflow_dir, browser_pool=browser_pool, run_timeout=run_timeout
+	)
 	return mcp_app
 
 
 def _setup_workflow_tools(
-	mcp_app: FastMCP, llm_instance: BaseChatModel, page_extraction_llm: BaseChatModel | None, workflow_dir: str
+	mcp_app: FastMCP,
+	llm_instance: BaseChatModel,
+	page_extraction_llm: BaseChatModel | None,
+	workflow_dir: str,
+	session_reset: SessionResetMode = 'clear_storage',
+	browser_pool: BrowserPool | None = None,
+	run_timeout: float | None = None,
 ):
 	"""
 	Scans a directory for workflow.json and workflow.yaml files, loads them, and registers them as tools
 	with the FastMCP instance by dynamically setting function signatures.
+
+	Every call runs a fresh Workflow (its own context and executor state) on a browser borrowed
+	from ``browser_pool``, which is reset according to ``session_reset`` between runs.
 	"""
+	browser_pool = browser_pool or BrowserPool(reset_mode=session_reset)
+	# Caches are keyed by page state and content, so calls can safely share them
+	mapping_cache = SemanticMappingCache()
+	extraction_cache = ExtractionCache()
+
 	# Find both JSON and YAML workflow files
 	json_files = list(Path(workflow_dir).glob('*.workflow.json'))
 	yaml_files = list(Path(workflow_dir).glob('*.workflow.yaml'))
@@ -43,9 +78,12 @@ def _setup_workflow_tools(
 			print(f'[FastMCP Service] Loading workflow from: {wf_file_path}')
 			schema = WorkflowDefinitionSchema.load_from_file(str(wf_file_path))
 
-			# Instantiate the workflow
+			# Template instance for the tool signature only; calls never run on it
 			workflow = Workflow(
-				workflow_schema=schema, llm=llm_instance, page_extraction_llm=page_extraction_llm, browser=None, controller=None
+				workflow_schema=schema,
+				llm=llm_instance,
+				page_extraction_llm=page_extraction_llm,
+				controller=None,
 			)
 
 			params_for_signature = []
@@ -76,11 +114,21 @@ def _setup_workflow_tools(
 			dynamic_func_name = f'tool_runner_{safe_workflow_name_for_func}_{schema.version.replace(".", "_")}'
 
 			# Define the actual function that will be called by FastMCP
-			# It uses a closure to capture the specific 'workflow' instance
-			def create_runner(wf_instance: Workflow):
+			# It uses a closure to capture the workflow 'schema'; each call gets its own Workflow
+			def create_runner(wf_schema: WorkflowDefinitionSchema):
 				async def actual_workflow_runner(**kwargs):
 					# kwargs will be populated by FastMCP based on the dynamic_signature
-					raw_result = await wf_instance.run(inputs=kwargs)
+					async with browser_pool.session() as session_manager:
+						wf_instance = Workflow(
+							workflow_schema=wf_schema,
+							llm=llm_instance,
+							page_extraction_llm=page_extraction_llm,
+							controller=None,
+							session_manager=session_manager,
+							mapping_cache=mapping_cache,
+							extraction_cache=extraction_cache,
+						)
+						raw_result = await asyncio.wait_for(wf_instance.run(inputs=kwargs), run_timeout)
 					try:
 						return _json.dumps(raw_result, default=str)
 					except Exception:
@@ -88,7 +136,7 @@ def _setup_workflow_tools(
 
 				return actual_workflow_runner
 
-			runner_func_impl = create_runner(workflow)
+			runner_func_impl = create_runner(schema)
 
 			# Set the dunder attributes that FastMCP will inspect
 			runner_func_impl.__name__ = dynamic_func_name
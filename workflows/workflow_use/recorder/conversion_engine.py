@@ -0,0 +1,233 @@
+"""
+Replay engine for converting recordings into semantic workflows.
+
+Converting a recording means replaying it in a browser to learn the visible text of every
+element the user interacted with. Doing that step by step in one browser, re-extracting the
+semantic mapping before every interactive step, makes conversion slower than the recording was.
+The engine instead:
+
+1. Splits the recording into segments, each starting at a navigation step.
+2. Reuses a page's semantic mapping until its DOM fingerprint changes, so consecutive steps on
+   an unchanged page cost one cheap in-page hash instead of a full extraction.
+3. Converts segments concurrently on a pool of browsers when interactions are not simulated.
+   Each segment then depends only on the URL it navigates to. With simulated interactions, the
+   page state carries over between segments, so they run in order in a single browser.
+4. Shares one mapping cache across segments, so a page state that several segments visit (a
+   search page, a form revisited after an error) is extracted once.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from workflow_use.workflow.browser_pool import BrowserPool
+from workflow_use.workflow.browser_session import BrowserSessionManager
+from workflow_use.workflow.mapping_cache import MappingCacheKey, SemanticMappingCache, get_page_fingerprint
+from workflow_use.workflow.page_readiness import wait_for_page_ready
+from workflow_use.workflow.semantic_extractor import SemanticExtractor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PARALLEL_SEGMENTS = 4
+
+INTERACTIVE_STEP_TYPES = ('click', 'input', 'select', 'keypress')
+
+# Converts one recorded interactive step given the current mapping: (step, mapping, browser, simulate) -> semantic step
+StepConverter = Callable[[Dict[str, Any], Dict[str, Dict], Any, bool], Awaitable[Optional[Dict[str, Any]]]]
+
+
+@dataclass
+class RecordingSegment:
+	"""Consecutive recorded steps from one navigation up to the next."""
+
+	url: Optional[str]
+	steps: List[Tuple[int, Dict[str, Any]]] = field(default_factory=list)  # (position in the recording, step)
+
+
+def split_into_segments(steps: List[Dict[str, Any]]) -> List[RecordingSegment]:
+	"""Start a new segment at every navigation step; steps before the first one form a segment without a URL."""
+	segments: List[RecordingSegment] = []
+	for position, step in enumerate(steps):
+		if step.get('type', '').lower() == 'navigation' or not segments:
+			url = step.get('url') if step.get('type', '').lower() == 'navigation' else None
+			segments.append(RecordingSegment(url=url))
+		segments[-1].steps.append((position, step))
+	return segments
+
+
+class _PageMapping:
+	"""Semantic mapping of one browser's current page, re-extracted only when the DOM fingerprint changes."""
+
+	def __init__(self, extractor: SemanticExtractor) -> None:
+		self.extractor = extractor
+		self.mapping: Dict[str, Dict] = {}
+		self.fingerprint: Optional[MappingCacheKey] = None
+		self.extractions = 0
+
+	async def refresh(self, page: Any, force: bool = False) -> Dict[str, Dict]:
+		fingerprint = await get_page_fingerprint(page)
+		if not force and fingerprint is not None and fingerprint == self.fingerprint:
+			logger.debug(f'Page unchanged, reusing semantic mapping ({len(self.mapping)} elements)')
+			return self.mapping
+
+		self.mapping = await self.extractor.extract_semantic_mapping(page) or {}
+		self.fingerprint = fingerprint
+		self.extractions += 1
+		return self.mapping
+
+	def clear(self) -> None:
+		self.mapping = {}
+		self.fingerprint = None
+
+
+class RecordingConversionEngine:
+	"""Replays a recording's navigation segments to build semantic steps, in parallel where they are independent."""
+
+	def __init__(
+		self,
+		convert_step: StepConverter,
+		simulate_interactions: bool = False,
+		max_parallel: int = DEFAULT_MAX_PARALLEL_SEGMENTS,
+		mapping_cache: SemanticMappingCache | None = None,
+		pool: BrowserPool | None = None,
+	) -> None:
+		"""
+		Args:
+			convert_step: Builds the semantic step for a recorded interactive step from the current mapping
+			simulate_interactions: Whether interactive steps are replayed; segments then run in order in one browser
+			max_parallel: Browsers used for independent segments
+			mapping_cache: Mapping cache shared by all segments (default: a new one per engine)
+			pool: Browser pool to convert on (default: one of up to ``max_parallel`` browsers, closed after conversion)
+		"""
+		if max_parallel < 1:
+			raise ValueError('max_parallel must be at least 1')
+		self.convert_step = convert_step
+		self.simulate_interactions = simulate_interactions
+		self.max_parallel = max_parallel
+		self.mapping_cache = mapping_cache if mapping_cache is not None else SemanticMappingCache()
+		self.pool = pool
+		self.extractions = 0
+
+	async def convert(self, steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+		"""Semantic steps for ``steps``, in recording order."""
+		segments = split_into_segments(steps)
+		if not segments:
+			return []
+
+		if self.simulate_interactions:
+			# Simulated clicks and inputs change what later segments see: keep one browser and the recorded order
+			session = BrowserSessionManager(reset_mode='same_context')
+			browser = await session.acquire(reset=False)
+			try:
+				converted = [await self._convert_segment(segment, browser) for segment in segments]
+			finally:
+				session.release()
+				await session.close()
+			return [step for segment_steps in converted for step in segment_steps]
+
+		pool = self.pool or BrowserPool(size=min(self.max_parallel, len(segments)))
+		logger.info(f'🔀 Converting {len(steps)} steps in {len(segments)} segments on {pool.size} browsers')
+		# Never queue more segments on the pool than it has browsers, so long recordings don't hit its admission limits
+		slots = asyncio.Semaphore(pool.size)
+		try:
+			converted = await asyncio.gather(*(self._convert_segment_on_pool(pool, slots, segment) for segment in segments))
+		finally:
+			if self.pool is None:
+				await pool.close()
+
+		logger.info(
+			f'✅ Converted {len(steps)} steps with {self.extractions} semantic extractions '
+			f'({self.mapping_cache.hits} shared-cache hits)'
+		)
+		return [step for segment_steps in converted for step in segment_steps]
+
+	async def _convert_segment_on_pool(
+		self, pool: BrowserPool, slots: asyncio.Semaphore, segment: RecordingSegment
+	) -> List[Dict[str, Any]]:
+		async with slots, pool.session() as session:
+			browser = await session.acquire()
+			try:
+				return await self._convert_segment(segment, browser)
+			finally:
+				session.release()
+
+	async def _convert_segment(self, segment: RecordingSegment, browser: Any) -> List[Dict[str, Any]]:
+		"""Replay one segment in ``browser`` and convert its steps."""
+		page_mapping = _PageMapping(SemanticExtractor(mapping_cache=self.mapping_cache))
+		semantic_steps: List[Dict[str, Any]] = []
+		current_url = None
+
+		try:
+			for position, step in segment.steps:
+				step_type = step.get('type', '').lower()
+
+				if step_type == 'navigation':
+					current_url = step.get('url')
+					if not current_url:
+						continue
+					semantic_steps.append({'description': f'Navigate to {current_url}', 'type': 'navigation', 'url': current_url})
+					try:
+						page = await browser.get_current_page()
+						await page.goto(current_url)
+						await wait_for_page_ready(page)
+						mapping = await page_mapping.refresh(page, force=True)
+						logger.info(f'Extracted {len(mapping)} semantic elements from {current_url}')
+					except Exception as e:
+						logger.warning(f'Could not extract semantic mapping from {current_url}: {e}')
+						page_mapping.clear()
+
+				elif step_type in INTERACTIVE_STEP_TYPES:
+					# Pick up elements shown or hidden since the last extraction (the recording's first step has no page yet)
+					if position > 0 and current_url:
+						try:
+							page = await browser.get_current_page()
+							if self.simulate_interactions:
+								# Let the previous simulated interaction take effect
+								await wait_for_page_ready(page, timeout=3)
+							await page_mapping.refresh(page)
+						except Exception as e:
+							logger.warning(f'Could not refresh semantic mapping: {e}')
+							page_mapping.clear()
+
+					semantic_step = await self.convert_step(step, page_mapping.mapping, browser, self.simulate_interactions)
+					if semantic_step:
+						semantic_steps.append(semantic_step)
+
+				elif step_type == 'scroll':
+					semantic_steps.append(
+						{
+							'description': step.get('description', 'Scroll page'),
+							'type': 'scroll',
+							'scrollX': step.get('scrollX', 0),
+							'scrollY': step.get('scrollY', 0),
+						}
+					)
+					# Scrolling can reveal lazy-loaded elements
+					if current_url:
+						try:
+							page = await browser.get_current_page()
+							await page.evaluate(f'() => window.scrollBy({step.get("scrollX", 0)}, {step.get("scrollY", 0)})')
+							await wait_for_page_ready(page, timeout=3)
+							await page_mapping.refresh(page)
+						except Exception as e:
+							logger.warning(f'Could not refresh semantic mapping after scroll: {e}')
+							page_mapping.clear()
+
+				elif step_type == 'extract':
+					semantic_steps.append(
+						{
+							'description': step.get('description', 'Extract information with AI'),
+							'type': 'extract',
+							'extractionGoal': step.get('extractionGoal', 'Extract information from the page'),
+							'url': step.get('url', current_url),
+						}
+					)
+
+				else:
+					logger.warning(f"Unknown step type '{step_type}' - keeping as-is")
+					semantic_steps.append(step)
+		finally:
+			self.extractions += page_mapping.extractions
+
+		return semantic_steps
@@ -227,6 +227,9 @@ class WorkflowDefinitionSchema(BaseModel):
 	default_wait_time: Optional[float] = Field(
 		0.1, description='Default time to wait between steps (in seconds). Can be overridden per step.'
 	)
+	page_ready_timeout: Optional[float] = Field(
+		None, description='Maximum time to wait for a page to become ready after navigation (in seconds).'
+	)
 	steps: List[WorkflowStep] = Field(
 		...,
 		min_length=1,
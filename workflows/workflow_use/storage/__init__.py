@@ -1,3 +1,4 @@
-from workflow_use.storage.service import WorkflowMetadata, WorkflowStorageService
+from workflow_use.storage.service import WorkflowMetadata, WorkflowStorageService, create_storage_service
+from workflow_use.storage.sqlite_service import SQLiteWorkflowStorageService
 
-__all__ = ['WorkflowStorageService', 'WorkflowMetadata']
+__all__ = ['WorkflowStorageService', 'SQLiteWorkflowStorageService', 'WorkflowMetadata', 'create_storage_service']
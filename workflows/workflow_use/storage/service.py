@@ -1,13 +1,14 @@
 """
 Simple file-based storage service for workflows.
-This can be extended to use a proper database (SQLite, PostgreSQL, etc.) in the future.
+Workflow definitions are YAML files; their metadata lives in metadata.json here, or in an
+indexed SQLite database with ``SQLiteWorkflowStorageService`` for large stores.
 """
 
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import uuid4
 
 import yaml
@@ -17,6 +18,9 @@ from workflow_use.schema.views import WorkflowDefinitionSchema
 
 logger = logging.getLogger(__name__)
 
+StorageBackend = Literal['json', 'sqlite']
+STORAGE_BACKENDS = ('json', 'sqlite')
+
 
 class WorkflowMetadata(BaseModel):
 	"""Metadata for a stored workflow."""
@@ -122,7 +126,17 @@ class WorkflowStorageService:
 			)
 			logger.info(f'Creating new workflow: {workflow_id}')
 
-		# Save workflow file
+		self._write_workflow_file(workflow, metadata.file_path)
+
+		# Update metadata
+		self.metadata[workflow_id] = metadata
+		self._save_metadata()
+
+		logger.info(f"Saved workflow '{workflow.name}' to {metadata.file_path}")
+		return metadata
+
+	def _write_workflow_file(self, workflow: WorkflowDefinitionSchema, file_path: str) -> None:
+		"""Write a workflow definition to its YAML file."""
 		# Exclude legacy/unnecessary fields to keep workflow files clean
 		workflow_dict = workflow.model_dump(mode='json', exclude_none=True)
 
@@ -170,15 +184,20 @@ class WorkflowStorageService:
 						else:
 							step.pop('selectorStrategies', None)
 
-		with open(metadata.file_path, 'w') as f:
+		with open(file_path, 'w') as f:
 			yaml.dump(workflow_dict, f, default_flow_style=False, sort_keys=False)
 
-		# Update metadata
-		self.metadata[workflow_id] = metadata
-		self._save_metadata()
-
-		logger.info(f"Saved workflow '{workflow.name}' to {metadata.file_path}")
-		return metadata
+	def _read_workflow_file(self, metadata: WorkflowMetadata) -> Optional[WorkflowDefinitionSchema]:
+		"""Load the workflow definition a metadata entry points to."""
+		try:
+			with open(metadata.file_path, 'r') as f:
+				data = yaml.safe_load(f)
+			workflow = WorkflowDefinitionSchema(**data)
+			logger.info(f'Loaded workflow: {metadata.id}')
+			return workflow
+		except Exception as e:
+			logger.error(f'Error loading workflow {metadata.id}: {e}')
+			return None
 
 	def get_workflow(self, workflow_id: str) -> Optional[WorkflowDefinitionSchema]:
 		"""
@@ -194,16 +213,19 @@ class WorkflowStorageService:
 			logger.warning(f'Workflow not found: {workflow_id}')
 			return None
 
-		metadata = self.metadata[workflow_id]
-		try:
-			with open(metadata.file_path, 'r') as f:
-				data = yaml.safe_load(f)
-			workflow = WorkflowDefinitionSchema(**data)
-			logger.info(f'Loaded workflow: {workflow_id}')
-			return workflow
-		except Exception as e:
-			logger.error(f'Error loading workflow {workflow_id}: {e}')
-			return None
+		return self._read_workflow_file(self.metadata[workflow_id])
+
+	def get_metadata(self, workflow_id: str) -> Optional[WorkflowMetadata]:
+		"""
+		Retrieve the metadata of a workflow by ID.
+
+		Args:
+			workflow_id: The workflow ID
+
+		Returns:
+			The workflow metadata or None if not found
+		"""
+		return self.metadata.get(workflow_id)
 
 	def get_workflow_by_name(self, name: str) -> Optional[WorkflowDefinitionSchema]:
 		"""
@@ -282,3 +304,23 @@ class WorkflowStorageService:
 			results = [w for w in results if query_lower in w.name.lower() or query_lower in w.description.lower()]
 
 		return results
+
+
+def create_storage_service(storage_dir: str | Path = './storage', backend: StorageBackend = 'json') -> WorkflowStorageService:
+	"""
+	Create a workflow storage service for the given metadata backend.
+
+	Args:
+		storage_dir: Directory to store workflow files and metadata
+		backend: "json" (metadata.json) or "sqlite" (indexed workflows.db, imports an existing metadata.json)
+
+	Returns:
+		A storage service; both backends expose the same API
+	"""
+	if backend == 'sqlite':
+		from workflow_use.storage.sqlite_service import SQLiteWorkflowStorageService
+
+		return SQLiteWorkflowStorageService(storage_dir=storage_dir)
+	if backend != 'json':
+		raise ValueError(f'Unknown storage backend: {backend!r} (expected one of {", ".join(STORAGE_BACKENDS)})')
+	return WorkflowStorageService(storage_dir=storage_dir)
@@ -0,0 +1,367 @@
+"""
+SQLite-backed workflow storage.
+
+Workflow definitions stay in YAML files; only the metadata moves from metadata.json into a
+SQLite database. Saves and deletes touch one row instead of rewriting the whole index, nothing
+is loaded at startup, and listing and search are served by indexes and an FTS5 (trigram)
+table over name, description and original task. The database runs in WAL mode so readers are
+never blocked by a writer, and writers serialize on ``BEGIN IMMEDIATE`` across processes.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Mapping
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
+from uuid import uuid4
+
+from workflow_use.schema.views import WorkflowDefinitionSchema
+from workflow_use.storage.service import WorkflowMetadata, WorkflowStorageService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATABASE_FILENAME = 'workflows.db'
+
+_COLUMNS = ('id', 'name', 'description', 'version', 'created_at', 'updated_at', 'file_path', 'generation_mode', 'original_task')
+_SELECT = f'SELECT {", ".join(_COLUMNS)} FROM workflows'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflows (
+	id TEXT PRIMARY KEY,
+	name TEXT NOT NULL,
+	description TEXT NOT NULL,
+	version TEXT NOT NULL,
+	created_at TEXT NOT NULL,
+	updated_at TEXT NOT NULL,
+	file_path TEXT NOT NULL,
+	generation_mode TEXT NOT NULL,
+	original_task TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_workflows_name ON workflows (name);
+CREATE INDEX IF NOT EXISTS idx_workflows_generation_mode ON workflows (generation_mode);
+"""
+
+# External-content FTS table kept in sync by triggers; the trigram tokenizer gives the same
+# case-insensitive substring matching as the JSON backend's search
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS workflows_fts USING fts5 (
+	name, description, original_task, content='workflows', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS workflows_fts_insert AFTER INSERT ON workflows BEGIN
+	INSERT INTO workflows_fts (rowid, name, description, original_task)
+	VALUES (new.rowid, new.name, new.description, new.original_task);
+END;
+CREATE TRIGGER IF NOT EXISTS workflows_fts_delete AFTER DELETE ON workflows BEGIN
+	INSERT INTO workflows_fts (workflows_fts, rowid, name, description, original_task)
+	VALUES ('delete', old.rowid, old.name, old.description, old.original_task);
+END;
+CREATE TRIGGER IF NOT EXISTS workflows_fts_update AFTER UPDATE ON workflows BEGIN
+	INSERT INTO workflows_fts (workflows_fts, rowid, name, description, original_task)
+	VALUES ('delete', old.rowid, old.name, old.description, old.original_task);
+	INSERT INTO workflows_fts (rowid, name, description, original_task)
+	VALUES (new.rowid, new.name, new.description, new.original_task);
+END;
+"""
+
+# Trigram FTS cannot match queries shorter than three characters
+_MIN_FTS_QUERY_LENGTH = 3
+
+
+class _MetadataView(Mapping):
+	"""Read-only ``{workflow_id: WorkflowMetadata}`` view over the database, for callers of ``service.metadata``."""
+
+	def __init__(self, service: 'SQLiteWorkflowStorageService'):
+		self._service = service
+
+	def __getitem__(self, workflow_id: str) -> WorkflowMetadata:
+		metadata = self._service.get_metadata(workflow_id)
+		if metadata is None:
+			raise KeyError(workflow_id)
+		return metadata
+
+	def __iter__(self) -> Iterator[str]:
+		return iter([row[0] for row in self._service._fetch('SELECT id FROM workflows ORDER BY created_at')])
+
+	def __len__(self) -> int:
+		return self._service._fetch('SELECT COUNT(*) FROM workflows')[0][0]
+
+	def __contains__(self, workflow_id: object) -> bool:
+		return bool(self._service._fetch('SELECT 1 FROM workflows WHERE id = ?', (workflow_id,)))
+
+
+class SQLiteWorkflowStorageService(WorkflowStorageService):
+	"""Workflow storage with metadata in an indexed SQLite database."""
+
+	def __init__(self, storage_dir: str | Path = './storage', database_filename: str = DEFAULT_DATABASE_FILENAME):
+		"""
+		Initialize the workflow storage service.
+
+		Args:
+			storage_dir: Directory to store workflow files and the metadata database
+			database_filename: Name of the SQLite database inside ``storage_dir``
+		"""
+		self.storage_dir = Path(storage_dir)
+		self.workflows_dir = self.storage_dir / 'workflows'
+		self.metadata_file = self.storage_dir / 'metadata.json'
+		self.database_file = self.storage_dir / database_filename
+
+		# Create directories if they don't exist
+		self.workflows_dir.mkdir(parents=True, exist_ok=True)
+
+		# One connection in autocommit mode; transactions are opened explicitly for writes
+		self._lock = threading.RLock()
+		self._connection = sqlite3.connect(self.database_file, timeout=30.0, isolation_level=None, check_same_thread=False)
+		self._connection.execute('PRAGMA journal_mode=WAL')
+		self._connection.execute('PRAGMA synchronous=NORMAL')
+		self._connection.executescript(_SCHEMA)
+		self.full_text_search = self._create_fts_table()
+
+		self._import_json_metadata()
+
+	def _create_fts_table(self) -> bool:
+		"""Create the FTS index, or fall back to LIKE scans when SQLite lacks FTS5 trigram support."""
+		try:
+			self._connection.executescript(_FTS_SCHEMA)
+			return True
+		except sqlite3.OperationalError as e:
+			logger.warning(f'⚠️ SQLite full-text search unavailable, searching with LIKE: {e}')
+			return False
+
+	@contextmanager
+	def _transaction(self) -> Iterator[sqlite3.Connection]:
+		"""Run a write transaction that takes the database write lock up front."""
+		with self._lock:
+			self._connection.execute('BEGIN IMMEDIATE')
+			try:
+				yield self._connection
+			except BaseException:
+				self._connection.execute('ROLLBACK')
+				raise
+			self._connection.execute('COMMIT')
+
+	def _fetch(self, sql: str, params: tuple = ()) -> list:
+		with self._lock:
+			return self._connection.execute(sql, params).fetchall()
+
+	@staticmethod
+	def _row_to_metadata(row: tuple) -> WorkflowMetadata:
+		return WorkflowMetadata(**dict(zip(_COLUMNS, row)))
+
+	@staticmethod
+	def _metadata_to_row(metadata: WorkflowMetadata) -> tuple:
+		return tuple(getattr(metadata, column) for column in _COLUMNS)
+
+	def _import_json_metadata(self) -> None:
+		"""Import an existing metadata.json into an empty database, so switching backends keeps stored workflows."""
+		if not self.metadata_file.exists() or self._fetch('SELECT 1 FROM workflows LIMIT 1'):
+			return
+		try:
+			with open(self.metadata_file, 'r') as f:
+				data = json.load(f)
+			entries = [WorkflowMetadata(**wf_data) for wf_data in data.values()]
+		except Exception as e:
+			logger.error(f'Error importing metadata.json: {e}')
+			return
+
+		placeholders = ', '.join('?' for _ in _COLUMNS)
+		with self._transaction() as connection:
+			connection.executemany(
+				f'INSERT OR IGNORE INTO workflows ({", ".join(_COLUMNS)}) VALUES ({placeholders})',
+				[self._metadata_to_row(metadata) for metadata in entries],
+			)
+		logger.info(f'Imported {len(entries)} workflow metadata entries from {self.metadata_file}')
+
+	@property
+	def metadata(self) -> Mapping:
+		"""Workflow metadata by ID, read from the database on access."""
+		return _MetadataView(self)
+
+	def save_workflow(
+		self,
+		workflow: WorkflowDefinitionSchema,
+		generation_mode: str = 'manual',
+		original_task: Optional[str] = None,
+		workflow_id: Optional[str] = None,
+	) -> WorkflowMetadata:
+		"""
+		Save a workflow to storage.
+
+		Args:
+			workflow: The workflow definition to save
+			generation_mode: How the workflow was created ("manual" or "browser_use")
+			original_task: The original task prompt (for browser_use generation)
+			workflow_id: Optional ID to use (for updates)
+
+		Returns:
+			WorkflowMetadata for the saved workflow
+		"""
+		with self._transaction() as connection:
+			existing = None
+			if workflow_id:
+				row = connection.execute(f'{_SELECT} WHERE id = ?', (workflow_id,)).fetchone()
+				existing = self._row_to_metadata(row) if row else None
+
+			if existing:
+				# Update existing workflow
+				metadata = existing.model_copy(
+					update={
+						'name': workflow.name,
+						'description': workflow.description,
+						'version': workflow.version,
+						'updated_at': datetime.utcnow().isoformat(),
+					}
+				)
+				logger.info(f'Updating existing workflow: {workflow_id}')
+			else:
+				# Create new workflow
+				workflow_id = workflow_id or str(uuid4())
+				metadata = WorkflowMetadata(
+					id=workflow_id,
+					name=workflow.name,
+					description=workflow.description,
+					version=workflow.version,
+					file_path=str(self.workflows_dir / f'{workflow_id}.workflow.yaml'),
+					generation_mode=generation_mode,
+					original_task=original_task,
+				)
+				logger.info(f'Creating new workflow: {workflow_id}')
+
+			self._write_workflow_file(workflow, metadata.file_path)
+
+			# Creation-time fields (created_at, file_path, generation_mode, original_task) are kept on update
+			placeholders = ', '.join('?' for _ in _COLUMNS)
+			connection.execute(
+				f'INSERT INTO workflows ({", ".join(_COLUMNS)}) VALUES ({placeholders}) '
+				'ON CONFLICT (id) DO UPDATE SET name = excluded.name, description = excluded.description, '
+				'version = excluded.version, updated_at = excluded.updated_at',
+				self._metadata_to_row(metadata),
+			)
+
+		logger.info(f"Saved workflow '{workflow.name}' to {metadata.file_path}")
+		return metadata
+
+	def get_metadata(self, workflow_id: str) -> Optional[WorkflowMetadata]:
+		"""
+		Retrieve the metadata of a workflow by ID.
+
+		Args:
+			workflow_id: The workflow ID
+
+		Returns:
+			The workflow metadata or None if not found
+		"""
+		rows = self._fetch(f'{_SELECT} WHERE id = ?', (workflow_id,))
+		return self._row_to_metadata(rows[0]) if rows else None
+
+	def get_workflow(self, workflow_id: str) -> Optional[WorkflowDefinitionSchema]:
+		"""
+		Retrieve a workflow by ID.
+
+		Args:
+			workflow_id: The workflow ID
+
+		Returns:
+			The workflow definition or None if not found
+		"""
+		metadata = self.get_metadata(workflow_id)
+		if metadata is None:
+			logger.warning(f'Workflow not found: {workflow_id}')
+			return None
+		return self._read_workflow_file(metadata)
+
+	def get_workflow_by_name(self, name: str) -> Optional[WorkflowDefinitionSchema]:
+		"""
+		Retrieve a workflow by name.
+
+		Args:
+			name: The workflow name
+
+		Returns:
+			The workflow definition or None if not found
+		"""
+		rows = self._fetch(f'{_SELECT} WHERE name = ? ORDER BY created_at LIMIT 1', (name,))
+		if not rows:
+			logger.warning(f'Workflow not found with name: {name}')
+			return None
+		return self._read_workflow_file(self._row_to_metadata(rows[0]))
+
+	def list_workflows(self) -> List[WorkflowMetadata]:
+		"""
+		List all stored workflows.
+
+		Returns:
+			List of workflow metadata
+		"""
+		return [self._row_to_metadata(row) for row in self._fetch(f'{_SELECT} ORDER BY created_at')]
+
+	def delete_workflow(self, workflow_id: str) -> bool:
+		"""
+		Delete a workflow.
+
+		Args:
+			workflow_id: The workflow ID
+
+		Returns:
+			True if deleted, False if not found
+		"""
+		with self._transaction() as connection:
+			row = connection.execute('SELECT file_path FROM workflows WHERE id = ?', (workflow_id,)).fetchone()
+			if row is None:
+				logger.warning(f'Cannot delete, workflow not found: {workflow_id}')
+				return False
+			connection.execute('DELETE FROM workflows WHERE id = ?', (workflow_id,))
+
+		# Delete file
+		try:
+			Path(row[0]).unlink()
+			logger.info(f'Deleted workflow file: {row[0]}')
+		except Exception as e:
+			logger.warning(f'Error deleting workflow file: {e}')
+
+		logger.info(f'Deleted workflow: {workflow_id}')
+		return True
+
+	def search_workflows(self, query: Optional[str] = None, generation_mode: Optional[str] = None) -> List[WorkflowMetadata]:
+		"""
+		Search workflows by query string or generation mode.
+
+		Args:
+			query: Search term to match in name, description or original task (case-insensitive substring)
+			generation_mode: Filter by generation mode ("manual" or "browser_use")
+
+		Returns:
+			List of matching workflow metadata
+		"""
+		conditions = []
+		params: list = []
+
+		if generation_mode:
+			conditions.append('generation_mode = ?')
+			params.append(generation_mode)
+
+		if query:
+			if self.full_text_search and len(query) >= _MIN_FTS_QUERY_LENGTH:
+				conditions.append('rowid IN (SELECT rowid FROM workflows_fts WHERE workflows_fts MATCH ?)')
+				# Quote as one FTS phrase so operators and punctuation in the query are matched literally
+				params.append('"' + query.replace('"', '""') + '"')
+			else:
+				escaped = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+				conditions.append(
+					"(name LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\' OR original_task LIKE ? ESCAPE '\\')"
+				)
+				params.extend([f'%{escaped}%'] * 3)
+
+		sql = _SELECT
+		if conditions:
+			sql += ' WHERE ' + ' AND '.join(conditions)
+		sql += ' ORDER BY created_at'
+		return [self._row_to_metadata(row) for row in self._fetch(sql, tuple(params))]
+
+	def close(self) -> None:
+		"""Close the database connection."""
+		with self._lock:
+			self._connection.close()
@@ -0,0 +1,116 @@
+"""
+Bounded pool of warm browser sessions for concurrent workflow runs.
+
+A long-running service (e.g. the MCP server) gets calls from many agents at once. Sharing one
+browser corrupts concurrent runs, and starting Chromium per call dominates short workflows.
+``BrowserPool`` owns ``size`` :class:`BrowserSessionManager` instances, started together on first
+use, and lends each one to a single run at a time. Callers beyond the pool size wait in an
+admission queue bounded by ``max_waiting``; a call is rejected immediately when the queue is full
+and fails with ``TimeoutError`` when no session frees up within ``acquire_timeout``.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+from workflow_use.workflow.browser_session import BrowserSessionManager, SessionResetMode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_WAITING = 16
+DEFAULT_ACQUIRE_TIMEOUT = 120.0
+
+
+class BrowserPool:
+	"""Lends warm browser sessions to one run at a time, with a bounded admission queue."""
+
+	def __init__(
+		self,
+		size: int = DEFAULT_POOL_SIZE,
+		reset_mode: SessionResetMode = 'clear_storage',
+		use_cloud: bool = False,
+		max_waiting: int = DEFAULT_MAX_WAITING,
+		acquire_timeout: float | None = DEFAULT_ACQUIRE_TIMEOUT,
+		sessions: List[BrowserSessionManager] | None = None,
+	) -> None:
+		"""
+		Args:
+			size: Number of browsers, i.e. runs executing concurrently
+			reset_mode: How each browser is reset between runs (see BrowserSessionManager)
+			use_cloud: Whether the browsers use browser-use cloud
+			max_waiting: Calls allowed to wait for a free browser; further calls are rejected
+			acquire_timeout: Seconds a call may wait for a free browser (None waits indefinitely)
+			sessions: Pre-built session managers to pool instead of creating ``size`` new ones
+		"""
+		if sessions is None:
+			if size < 1:
+				raise ValueError('size must be at least 1')
+			sessions = [BrowserSessionManager(reset_mode=reset_mode, use_cloud=use_cloud) for _ in range(size)]
+		if max_waiting < 0:
+			raise ValueError('max_waiting must not be negative')
+
+		self.sessions = sessions
+		self.max_waiting = max_waiting
+		self.acquire_timeout = acquire_timeout
+		self.waiting = 0
+
+		self._idle: asyncio.Queue[BrowserSessionManager] = asyncio.Queue()
+		for session in sessions:
+			self._idle.put_nowait(session)
+		self._started = False
+		self._start_lock = asyncio.Lock()
+
+	@property
+	def size(self) -> int:
+		return len(self.sessions)
+
+	async def start(self) -> None:
+		"""Start every browser in the pool concurrently (idempotent)."""
+		async with self._start_lock:
+			if self._started:
+				return
+			logger.info(f'🚀 Warming browser pool ({self.size} browsers)')
+			await asyncio.gather(*(self._warm(session) for session in self.sessions))
+			self._started = True
+
+	@staticmethod
+	async def _warm(session: BrowserSessionManager) -> None:
+		await session.acquire(reset=False)
+		session.release()
+
+	@asynccontextmanager
+	async def session(self, timeout: float | None = None) -> AsyncIterator[BrowserSessionManager]:
+		"""Borrow a warm session for one run.
+
+		Args:
+			timeout: Seconds to wait for a free browser (default: ``acquire_timeout``)
+
+		Raises:
+			RuntimeError: If ``max_waiting`` calls are already waiting
+			TimeoutError: If no browser frees up in time
+		"""
+		# Admit and count the call before any await, so a burst arriving while the pool warms up is bounded too
+		if self.waiting >= self._idle.qsize() + self.max_waiting:
+			raise RuntimeError(f'Browser pool is saturated ({self.size} running, {self.waiting} waiting); try again later')
+
+		timeout = self.acquire_timeout if timeout is None else timeout
+		self.waiting += 1
+		try:
+			await self.start()
+			session = await asyncio.wait_for(self._idle.get(), timeout)
+		except asyncio.TimeoutError:
+			raise TimeoutError(f'No browser became available within {timeout}s ({self.size} running)') from None
+		finally:
+			self.waiting -= 1
+
+		try:
+			yield session
+		finally:
+			self._idle.put_nowait(session)
+
+	async def close(self) -> None:
+		"""Stop every browser in the pool."""
+		await asyncio.gather(*(session.close() for session in self.sessions), return_exceptions=True)
+		self._started = False
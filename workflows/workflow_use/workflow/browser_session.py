@@ -0,0 +1,178 @@
+"""
+Warm browser sessions shared across workflow runs.
+
+Starting Chromium dominates the runtime of short workflows. A ``BrowserSessionManager`` keeps
+one browser process alive across ``Workflow.run`` / ``run_with_no_ai`` invocations and resets
+state between runs according to ``reset_mode``:
+
+- ``same_context``: keep cookies, storage and the open tab exactly as the last run left them.
+- ``clear_storage``: clear cookies and the storage of every origin the run visited, close extra
+  tabs, go to about:blank.
+- ``new_context``: like ``clear_storage`` but also replace the tab itself, so no document,
+  history or in-memory JS state survives.
+
+Runs that share a manager are serialized; use one manager per concurrent worker.
+"""
+
+import asyncio
+import logging
+from typing import Literal
+from urllib.parse import urlparse
+
+from browser_use import Browser
+
+logger = logging.getLogger(__name__)
+
+SessionResetMode = Literal['same_context', 'clear_storage', 'new_context']
+
+SESSION_RESET_MODES: tuple[SessionResetMode, ...] = ('same_context', 'clear_storage', 'new_context')
+
+
+class BrowserSessionManager:
+	"""Keeps a browser warm across workflow runs and resets its state between them."""
+
+	def __init__(
+		self,
+		browser: Browser | None = None,
+		reset_mode: SessionResetMode = 'clear_storage',
+		use_cloud: bool = False,
+	) -> None:
+		"""
+		Args:
+			browser: Browser to keep warm (a new one is created when omitted)
+			reset_mode: How state is reset between runs ('same_context', 'clear_storage' or 'new_context')
+			use_cloud: Whether a newly created browser should use browser-use cloud
+		"""
+		if reset_mode not in SESSION_RESET_MODES:
+			raise ValueError(f'Unknown session reset mode {reset_mode!r}, expected one of {SESSION_RESET_MODES}')
+
+		self.browser = browser or Browser(use_cloud=use_cloud)
+		# The manager owns the browser lifecycle, so individual runs must never stop it
+		self.browser.browser_profile.keep_alive = True
+		self.reset_mode = reset_mode
+
+		self.runs = 0
+		self._started = False
+		self._lock = asyncio.Lock()
+		self._owner: asyncio.Task | None = None
+		# Origins committed by any tab or out-of-process iframe since the last reset
+		self._visited_origins: set[str] = set()
+		self._watched_client = None
+
+	async def acquire(self, reset: bool = True) -> Browser:
+		"""Start the browser on first use, otherwise reset it for the next run.
+
+		Blocks while another run holds the session. Pair every call with :meth:`release`.
+
+		Args:
+			reset: Whether to apply ``reset_mode`` (single-step execution continues without it)
+		"""
+		await self._lock.acquire()
+		try:
+			if not self._started:
+				logger.info('🚀 Starting warm browser session')
+				await self.browser.start()
+				self._started = True
+			elif reset and self.runs > 0:
+				await self.reset()
+			self._watch_visited_origins()
+		except BaseException:
+			self._lock.release()
+			raise
+
+		self._owner = asyncio.current_task()
+		self.runs += 1
+		return self.browser
+
+	def release(self) -> None:
+		"""Hand the session back without stopping the browser.
+
+		Only the task that acquired the session can release it, so a repeated call is a no-op.
+		"""
+		if self._lock.locked() and self._owner is asyncio.current_task():
+			self._owner = None
+			self._lock.release()
+
+	def _watch_visited_origins(self) -> None:
+		"""Record the origin of every URL a target commits, so a reset also clears pages the run navigated away from.
+
+		Chrome reports URL changes of tabs, out-of-process (cross-site) iframes and workers through
+		``Target.targetInfoChanged``. cdp-use keeps a single handler per event, so the recorder wraps
+		the one browser-use registered instead of replacing it. The root client changes when the
+		browser reconnects, hence the check on every acquire.
+		"""
+		try:
+			client = self.browser.cdp_client
+			if client is self._watched_client:
+				return
+			previous = client._event_registry._handlers.get('Target.targetInfoChanged')
+
+			def on_target_info_changed(event, session_id=None):
+				origin = _origin(event.get('targetInfo', {}).get('url'))
+				if origin:
+					self._visited_origins.add(origin)
+				if previous:
+					return previous(event, session_id)
+
+			client.register.Target.targetInfoChanged(on_target_info_changed)
+			self._watched_client = client
+		except Exception as e:
+			logger.debug(f'Could not watch visited origins: {e}')
+
+	async def reset(self) -> None:
+		"""Reset browser state according to ``reset_mode``."""
+		if self.reset_mode == 'same_context':
+			return
+
+		tabs = await self.browser.get_tabs()
+		origins = ({_origin(tab.url) for tab in tabs} | self._visited_origins) - {None}
+		self._visited_origins = set()
+
+		try:
+			await self.browser.clear_cookies()
+			for origin in origins:
+				await self.browser.cdp_client.send.Storage.clearDataForOrigin(params={'origin': origin, 'storageTypes': 'all'})
+		except Exception as e:
+			logger.warning(f'⚠️ Failed to clear browser storage between runs: {e}')
+
+		# Keep one tab: a brand new one for 'new_context', otherwise the current one
+		if self.reset_mode == 'new_context' or not tabs:
+			await self.browser.navigate_to('about:blank', new_tab=True)
+			stale_tabs = tabs
+		else:
+			await self.browser.navigate_to('about:blank')
+			current = await self.browser.get_current_page()
+			current_id = current._target_id if current else None
+			stale_tabs = [tab for tab in tabs if tab.target_id != current_id]
+
+		for tab in stale_tabs:
+			try:
+				await self.browser.close_page(tab.target_id)
+			except Exception as e:
+				logger.debug(f'Could not close tab {tab.target_id}: {e}')
+
+		logger.info(f'🧹 Reset warm browser session ({self.reset_mode}, {len(origins)} origins cleared)')
+
+	async def close(self) -> None:
+		"""Stop the warm browser for good."""
+		async with self._lock:
+			if not self._started:
+				return
+			self.browser.browser_profile.keep_alive = False
+			try:
+				await self.browser.kill()
+			finally:
+				self._started = False
+				self.runs = 0
+				self._visited_origins = set()
+				self._watched_client = None
+
+
+def _origin(url: str | None) -> str | None:
+	"""Return the scheme://host[:port] origin of a web URL, or None for about:, chrome:, data: and similar."""
+	if not url:
+		return None
+	parsed = urlparse(url)
+	if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+		return None
+	return f'{parsed.scheme}://{parsed.netloc}'
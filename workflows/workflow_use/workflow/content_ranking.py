@@ -0,0 +1,154 @@
+"""
+Relevance-ranked content selection for LLM extraction.
+
+Long pages used to be cut at a fixed length, which drops the data whenever it sits in the
+middle of a long result page. Instead the page markdown is split into sections, each section
+is scored against the extraction goal with BM25 (lexical, offline, no model download), and the
+best sections are packed into the character budget. Selected sections keep their original
+document order, and omitted stretches are marked so the LLM knows content was skipped.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import List
+
+OMITTED_MARKER = '\n\n... [CONTENT OMITTED] ...\n\n'
+
+DEFAULT_CHUNK_CHARS = 1500
+
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+_HEADING = re.compile(r'^#{1,6}\s')
+_BLANK_LINES = re.compile(r'\n\s*\n')
+
+# Words that carry no signal about which section answers a goal
+_STOPWORDS = frozenset(
+	'a an and are as at be by for from get how in is it of on or please page that the this to what when where which '
+	'who with all any extract find list return show give me i we you their its'.split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+	"""Lowercase word tokens without stopwords."""
+	return [token for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def split_into_chunks(text: str, max_chunk_chars: int = DEFAULT_CHUNK_CHARS) -> List[str]:
+	"""Split markdown into sections of at most ``max_chunk_chars``.
+
+	Paragraphs are grouped until the size limit, a markdown heading always starts a new
+	section, and paragraphs longer than the limit are split on line and then character boundaries.
+	"""
+	pieces: List[str] = []
+	for paragraph in _BLANK_LINES.split(text):
+		paragraph = paragraph.strip()
+		if not paragraph:
+			continue
+		if len(paragraph) <= max_chunk_chars:
+			pieces.append(paragraph)
+			continue
+		line_group = ''
+		for line in paragraph.split('\n'):
+			while len(line) > max_chunk_chars:
+				if line_group:
+					pieces.append(line_group)
+					line_group = ''
+				pieces.append(line[:max_chunk_chars])
+				line = line[max_chunk_chars:]
+			if line_group and len(line_group) + 1 + len(line) > max_chunk_chars:
+				pieces.append(line_group)
+				line_group = line
+			else:
+				line_group = f'{line_group}\n{line}' if line_group else line
+		if line_group:
+			pieces.append(line_group)
+
+	chunks: List[str] = []
+	current = ''
+	for piece in pieces:
+		starts_section = bool(_HEADING.match(piece))
+		if current and (starts_section or len(current) + 2 + len(piece) > max_chunk_chars):
+			chunks.append(current)
+			current = piece
+		else:
+			current = f'{current}\n\n{piece}' if current else piece
+	if current:
+		chunks.append(current)
+	return chunks
+
+
+def bm25_scores(query_tokens: List[str], documents: List[List[str]], k1: float = 1.5, b: float = 0.75) -> List[float]:
+	"""Okapi BM25 score of every tokenized document for the query."""
+	if not documents:
+		return []
+	doc_count = len(documents)
+	average_length = sum(len(document) for document in documents) / doc_count or 1.0
+	document_frequency = Counter(token for document in documents for token in set(document))
+	query_terms = set(query_tokens)
+
+	scores = []
+	for document in documents:
+		term_counts = Counter(document)
+		length_norm = k1 * (1 - b + b * len(document) / average_length)
+		score = 0.0
+		for term in query_terms:
+			frequency = term_counts.get(term)
+			if not frequency:
+				continue
+			idf = math.log(1 + (doc_count - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+			score += idf * frequency * (k1 + 1) / (frequency + length_norm)
+		scores.append(score)
+	return scores
+
+
+def select_relevant_content(
+	text: str, goal: str, max_chars: int, max_chunk_chars: int = DEFAULT_CHUNK_CHARS, keep_first_chunk: bool = True
+) -> str:
+	"""Return the sections of ``text`` most relevant to ``goal`` that fit in ``max_chars``.
+
+	Text that already fits is returned unchanged. When the goal matches nothing, the result
+	falls back to the leading sections, like plain truncation.
+
+	Args:
+		text: Page content (markdown)
+		goal: Extraction goal used as the BM25 query
+		max_chars: Character budget for the returned content
+		max_chunk_chars: Maximum section size
+		keep_first_chunk: Always include the opening section (title, headline, summary)
+	"""
+	if not text or len(text) <= max_chars:
+		return text or ''
+
+	chunks = split_into_chunks(text, min(max_chunk_chars, max_chars))
+	scores = bm25_scores(tokenize(goal), [tokenize(chunk) for chunk in chunks])
+
+	# Highest score first; ties (including all-zero scores) keep document order
+	ranked = sorted(range(len(chunks)), key=lambda position: (-scores[position], position))
+	if keep_first_chunk and chunks:
+		ranked.remove(0)
+		ranked.insert(0, 0)
+
+	selected = set()
+	used = len(OMITTED_MARKER)
+	for position in ranked:
+		cost = len(chunks[position]) + len(OMITTED_MARKER)
+		if used + cost > max_chars:
+			if scores[position] == 0 and position != 0:
+				# Unmatched sections only fill up in page order, like truncation, so stop at the first misfit
+				break
+			continue
+		selected.add(position)
+		used += cost
+
+	parts = []
+	previous = -1
+	for position in sorted(selected):
+		if position != previous + 1:
+			parts.append(OMITTED_MARKER)
+		elif parts:
+			parts.append('\n\n')
+		parts.append(chunks[position])
+		previous = position
+	if previous != len(chunks) - 1:
+		parts.append(OMITTED_MARKER)
+	return ''.join(parts).strip()
@@ -0,0 +1,159 @@
+"""
+Background pipeline for debug screenshots.
+
+Debug mode captures the page before and after every step. Taking a full-page PNG and writing it
+to disk inline roughly doubled run time, so captures are now split in two: the step path only
+asks the browser for a (by default viewport-only JPEG) frame and enqueues it, and a writer task
+decodes and writes frames to disk off the step path. The queue is bounded, so a slow disk drops
+frames instead of stalling the workflow, and frames identical to the previous one are skipped.
+"""
+
+import asyncio
+import base64
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, Optional, Tuple
+
+if TYPE_CHECKING:
+	from browser_use import Browser
+
+logger = logging.getLogger(__name__)
+
+ScreenshotFormat = Literal['png', 'jpeg', 'webp']
+
+_FILE_EXTENSIONS = {'png': 'png', 'jpeg': 'jpg', 'webp': 'webp'}
+
+
+@dataclass
+class ScreenshotOptions:
+	"""How debug screenshots are captured and queued."""
+
+	format: ScreenshotFormat = 'jpeg'
+	# Compression quality 0-100 for JPEG and WebP (ignored for PNG)
+	quality: int = 70
+	# Capture the whole scrollable page instead of the viewport (much slower on long pages)
+	full_page: bool = False
+	# Do not write a frame whose image is identical to the previous one
+	skip_unchanged: bool = True
+	# Frames waiting to be written; further frames are dropped while the queue is full
+	max_queue_size: int = 32
+
+
+async def capture_screenshot(browser: 'Browser', options: ScreenshotOptions) -> str:
+	"""Capture the current page and return the base64-encoded image."""
+	cdp_session = await browser.get_or_create_cdp_session()
+	params = {'format': options.format, 'captureBeyondViewport': options.full_page}
+	if options.format != 'png':
+		params['quality'] = options.quality
+	result = await cdp_session.cdp_client.send.Page.captureScreenshot(params=params, session_id=cdp_session.session_id)
+	if not result or 'data' not in result:
+		raise RuntimeError('Screenshot failed - no data returned')
+	return result['data']
+
+
+def screenshot_filename(step_index: int, step_description: str, prefix: str, options: ScreenshotOptions) -> str:
+	"""Build a filesystem-safe, sortable filename for a step screenshot."""
+	clean_description = re.sub(r'[^\w\s-]', '', step_description)
+	clean_description = re.sub(r'[-\s]+', '_', clean_description)[:50]
+	timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+	prefix_str = f'{prefix}_' if prefix else ''
+	return f'step_{step_index + 1:02d}_{prefix_str}{clean_description}_{timestamp}.{_FILE_EXTENSIONS[options.format]}'
+
+
+class DebugScreenshotPipeline:
+	"""Captures screenshots on the step path and writes them to disk from a background task."""
+
+	def __init__(self, folder: str | Path, options: ScreenshotOptions | None = None):
+		"""
+		Args:
+			folder: Directory the screenshots are written to
+			options: Capture format, quality and queueing options (default: viewport JPEG, unchanged frames skipped)
+		"""
+		self.folder = Path(folder)
+		self.options = options or ScreenshotOptions()
+		self.saved = 0
+		self.skipped = 0
+		self.dropped = 0
+		self._queue: Optional[asyncio.Queue[Optional[Tuple[Path, str]]]] = None
+		self._writer: Optional[asyncio.Task] = None
+		self._last_digest: Optional[bytes] = None
+		self._last_path: Optional[Path] = None
+
+	def _ensure_writer(self) -> asyncio.Queue:
+		if self._writer is None or self._writer.done():
+			self._queue = asyncio.Queue(maxsize=self.options.max_queue_size)
+			self._writer = asyncio.create_task(self._write_frames(self._queue))
+		return self._queue
+
+	async def capture(self, browser: 'Browser', step_index: int, step_description: str, prefix: str = '') -> Optional[Path]:
+		"""Capture the current page and queue it for writing.
+
+		Returns:
+			The path the frame will be written to (the previous frame's path when the image is
+			unchanged), or None when the capture failed or the frame was dropped.
+		"""
+		try:
+			data = await capture_screenshot(browser, self.options)
+		except Exception as e:
+			logger.warning(f'Failed to capture debug screenshot: {e}')
+			return None
+
+		if self.options.skip_unchanged:
+			digest = hashlib.blake2b(data.encode('ascii'), digest_size=16).digest()
+			if digest == self._last_digest and self._last_path is not None:
+				self.skipped += 1
+				logger.debug(f'📸 Screenshot unchanged since {self._last_path.name}, skipping')
+				return self._last_path
+			self._last_digest = digest
+
+		path = self.folder / screenshot_filename(step_index, step_description, prefix, self.options)
+		try:
+			self._ensure_writer().put_nowait((path, data))
+		except asyncio.QueueFull:
+			self.dropped += 1
+			# The dropped frame was never written, so the next identical frame must not point at it
+			self._last_digest = None
+			logger.warning(f'⚠️ Screenshot queue full, dropping {path.name}')
+			return None
+		self._last_path = path
+		return path
+
+	async def _write_frames(self, queue: asyncio.Queue) -> None:
+		while True:
+			item = await queue.get()
+			try:
+				if item is None:
+					return
+				path, data = item
+				await asyncio.to_thread(self._write_frame, path, data)
+				self.saved += 1
+				logger.info(f'📸 Debug screenshot saved: {path}')
+			except Exception as e:
+				logger.warning(f'Failed to write debug screenshot: {e}')
+			finally:
+				queue.task_done()
+
+	def _write_frame(self, path: Path, data: str) -> None:
+		path.parent.mkdir(parents=True, exist_ok=True)
+		path.write_bytes(base64.b64decode(data))
+
+	async def flush(self) -> None:
+		"""Wait until every queued frame has been written."""
+		if self._queue is not None and self._writer is not None and not self._writer.done():
+			await self._queue.join()
+
+	async def close(self) -> None:
+		"""Write the remaining frames and stop the writer task."""
+		if self._writer is None:
+			return
+		if not self._writer.done():
+			await self._queue.put(None)
+			await self._writer
+		self._writer = None
+		self._queue = None
+		if self.saved or self.skipped or self.dropped:
+			logger.info(f'📸 Debug screenshots: {self.saved} saved, {self.skipped} unchanged, {self.dropped} dropped')
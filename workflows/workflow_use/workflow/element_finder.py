@@ -6,16 +6,110 @@ reducing failures when page structure changes.
 
 Uses semantic strategies with XPath fallback.
 Leverages browser-use's existing semantic finding through the controller.
+
+In the default 'batched' resolution mode the selector map is indexed once and every semantic
+strategy is answered from that index, while all XPath strategies that could still win are
+evaluated together in a single in-page call. The 'sequential' mode tries strategies one by one.
 """
 
+import json
 import logging
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from workflow_use.workflow.error_reporter import StrategyAttempt
+from workflow_use.workflow.tracing import CATEGORY_ELEMENT, traced
 
 logger = logging.getLogger(__name__)
 
+ResolutionMode = Literal['batched', 'sequential']
+
+SEMANTIC_STRATEGY_TYPES = frozenset(['text_exact', 'role_text', 'aria_label', 'placeholder', 'title', 'alt_text', 'text_fuzzy'])
+
+# Exact-match strategies answered from a single node attribute
+ATTRIBUTE_STRATEGY_FIELDS = {'aria_label': 'aria_label', 'placeholder': 'placeholder', 'title': 'title', 'alt_text': 'alt'}
+
+# Evaluates a list of XPaths in one round-trip, returning one result per XPath in input order
+XPATH_BATCH_JS = """(xpaths) => xpaths.map((xpath) => {
+	try {
+		const element = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+		if (!element) return { found: false };
+		const rect = element.getBoundingClientRect();
+		const style = window.getComputedStyle(element);
+		const visible = rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+		return { found: true, visible: visible, tag: element.tagName };
+	} catch (error) {
+		return { error: error.message };
+	}
+})"""
+
+
+def _get_attr(obj: Any, attr: str, default: Any = '') -> Any:
+	"""Read an attribute from a dict or object DOM node."""
+	if isinstance(obj, dict):
+		return obj.get(attr, default)
+	return getattr(obj, attr, default)
+
+
+def _stripped(value: Any) -> Optional[str]:
+	"""Return the stripped string value, or None for empty and non-string values."""
+	if isinstance(value, str):
+		return value.strip()
+	return None
+
+
+class SelectorMapIndex:
+	"""
+	One-pass index over browser-use's selector map for semantic strategies.
+
+	Only visible nodes are indexed. Each lookup returns the first visible node in selector map
+	order, which is exactly what scanning the map per strategy would return.
+	"""
+
+	def __init__(self, selector_map: Dict[Any, Any]):
+		self.by_text: Dict[str, Tuple[Any, Any]] = {}
+		self.by_role_text: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+		self.by_attribute: Dict[str, Dict[str, Tuple[Any, Any]]] = {
+			strategy_type: {} for strategy_type in ATTRIBUTE_STRATEGY_FIELDS
+		}
+		# (index, node, stripped text) in selector map order, for fuzzy matching
+		self.texts: List[Tuple[Any, Any, str]] = []
+
+		for index, node in selector_map.items():
+			try:
+				self._add(index, node)
+			except Exception as e:
+				logger.debug(f'Skipping element {index} while indexing selector map: {e}')
+
+	def _add(self, index: Any, node: Any) -> None:
+		if not _get_attr(node, 'is_visible', True):
+			return
+
+		entry = (index, node)
+		text = _stripped(_get_attr(node, 'text', '') or '')
+		if text is not None:
+			self.by_text.setdefault(text, entry)
+			self.texts.append((index, node, text))
+
+			role = _get_attr(node, 'role', '') or _get_attr(node, 'tag_name', '')
+			role = role.lower() if isinstance(role, str) else ''
+			self.by_role_text.setdefault((role, text), entry)
+
+		for strategy_type, attr in ATTRIBUTE_STRATEGY_FIELDS.items():
+			value = _stripped(_get_attr(node, attr, '') or '')
+			if value is not None:
+				self.by_attribute[strategy_type].setdefault(value, entry)
+
+	def lookup(self, strategy_type: str, value: str, metadata: Dict[str, Any]) -> Optional[Tuple[Any, Any]]:
+		"""Return (index, node) of the first visible node matching an exact semantic strategy."""
+		if strategy_type == 'text_exact':
+			return self.by_text.get(value)
+		if strategy_type == 'role_text':
+			return self.by_role_text.get((metadata.get('role', '').lower(), value))
+		if strategy_type in self.by_attribute:
+			return self.by_attribute[strategy_type].get(value)
+		return None
+
 
 class ElementFinder:
 	"""
@@ -26,6 +120,17 @@ class ElementFinder:
 	provide a faster path when we have semantic hints from workflow recording.
 	"""
 
+	def __init__(self, resolution_mode: ResolutionMode = 'batched'):
+		"""
+		Args:
+		    resolution_mode: 'batched' resolves all strategies against one selector map index and one
+		        XPath evaluation; 'sequential' tries each strategy on its own in priority order
+		"""
+		if resolution_mode not in ('batched', 'sequential'):
+			raise ValueError(f'Unknown resolution mode: {resolution_mode}')
+		self.resolution_mode = resolution_mode
+
+	@traced(CATEGORY_ELEMENT)
 	async def find_element_with_strategies(
 		self, strategies: List[Dict[str, Any]], browser_session: Any, target_text: Optional[str] = None
 	) -> Tuple[Optional[tuple[int, Dict[str, Any]]], List[StrategyAttempt]]:
@@ -76,6 +181,9 @@ class ElementFinder:
 		# Sort by priority (should already be sorted, but ensure it)
 		sorted_strategies = sorted(strategies, key=lambda s: s.get('priority', 999))
 
+		if self.resolution_mode == 'batched':
+			return await self._find_batched(sorted_strategies, page, selector_map, target_text)
+
 		for i, strategy in enumerate(sorted_strategies, 1):
 			strategy_type = strategy.get('type')
 			strategy_value = strategy.get('value', '')
@@ -168,6 +276,169 @@ class ElementFinder:
 		logger.warning(f'      ❌ All {len(sorted_strategies)} strategies failed')
 		return None, strategy_attempts
 
+	async def _find_batched(
+		self,
+		sorted_strategies: List[Dict[str, Any]],
+		page: Any,
+		selector_map: Optional[Dict[Any, Any]],
+		target_text: Optional[str] = None,
+	) -> Tuple[Optional[tuple[Any, Dict[str, Any]]], List[StrategyAttempt]]:
+		"""
+		Resolve all strategies with one selector map index and at most one XPath evaluation.
+
+		The highest-priority hit wins and the returned StrategyAttempt list is the same as
+		sequential resolution would produce: failures for every strategy ahead of the winner,
+		then the winner.
+		"""
+		strategy_attempts: List[StrategyAttempt] = []
+		index = SelectorMapIndex(selector_map) if selector_map else None
+
+		# Pass 1: semantic strategies against the index, in priority order until the first hit
+		semantic_results: Dict[int, Any] = {}
+		first_semantic_hit = len(sorted_strategies)
+		if index is not None:
+			for position, strategy in enumerate(sorted_strategies):
+				if strategy.get('type') not in SEMANTIC_STRATEGY_TYPES:
+					continue
+				try:
+					result = self._lookup_semantic_strategy(index, strategy)
+				except Exception as e:
+					result = e
+				semantic_results[position] = result
+				if result and not isinstance(result, Exception):
+					first_semantic_hit = position
+					break
+
+		# Pass 2: only XPaths that outrank the semantic hit, all in one evaluation
+		xpath_positions = [
+			position for position in range(first_semantic_hit) if sorted_strategies[position].get('type') == 'xpath'
+		]
+		xpath_results: Dict[int, Any] = {}
+		if xpath_positions:
+			xpaths = [sorted_strategies[position].get('value', '') for position in xpath_positions]
+			xpath_results = dict(zip(xpath_positions, await self._find_with_xpaths(xpaths, page)))
+
+		# Pass 3: report attempts in priority order and return the highest-priority hit
+		for i, strategy in enumerate(sorted_strategies, 1):
+			position = i - 1
+			strategy_type = strategy.get('type')
+			strategy_value = strategy.get('value', '')
+			priority = strategy.get('priority', 999)
+			metadata = strategy.get('metadata', {})
+			found = None
+			error_msg = None
+
+			logger.info(f'      🔍 Strategy {i}/{len(sorted_strategies)}: {strategy_type}')
+
+			if strategy_type == 'xpath':
+				result = xpath_results.get(position)
+				if isinstance(result, Exception):
+					error_msg = str(result)
+				elif result:
+					# Return XPath string for semantic_executor.py to use in JavaScript click
+					found = (result, strategy)
+				else:
+					error_msg = 'XPath query returned no results'
+
+			elif selector_map and strategy_type in SEMANTIC_STRATEGY_TYPES:
+				result = semantic_results.get(position)
+				if isinstance(result, Exception):
+					error_msg = str(result)
+				elif result:
+					element_index, node = result
+					await self._validate_element_in_map(element_index, node, target_text)
+					found = (int(element_index), strategy)
+				else:
+					error_msg = 'No matching element found in DOM'
+
+			elif not selector_map:
+				error_msg = 'Selector map not available for semantic strategy'
+			else:
+				error_msg = f'Strategy type "{strategy_type}" not supported'
+
+			if found:
+				logger.info(f'         ✅ Found element with {strategy_type}')
+				strategy_attempts.append(
+					StrategyAttempt(
+						strategy_type=strategy_type,
+						strategy_value=strategy_value,
+						priority=priority,
+						success=True,
+						metadata=metadata,
+					)
+				)
+				return found, strategy_attempts
+
+			logger.debug(f'         ⏭️  {error_msg}')
+			strategy_attempts.append(
+				StrategyAttempt(
+					strategy_type=strategy_type,
+					strategy_value=strategy_value,
+					priority=priority,
+					success=False,
+					error_message=error_msg,
+					metadata=metadata,
+				)
+			)
+
+		logger.warning(f'      ❌ All {len(sorted_strategies)} strategies failed')
+		return None, strategy_attempts
+
+	def _lookup_semantic_strategy(self, index: SelectorMapIndex, strategy: Dict[str, Any]) -> Optional[Tuple[Any, Any]]:
+		"""Answer one semantic strategy from the selector map index."""
+		strategy_type = strategy.get('type')
+		value = strategy.get('value', '')
+		metadata = strategy.get('metadata', {})
+
+		if strategy_type == 'text_fuzzy':
+			threshold = metadata.get('threshold', 0.8)
+			for element_index, node, text in index.texts:
+				if self._fuzzy_match(value, text, threshold):
+					return element_index, node
+			return None
+
+		return index.lookup(strategy_type, value, metadata)
+
+	async def _find_with_xpaths(self, xpaths: List[str], page: Any) -> List[Any]:
+		"""
+		Evaluate several XPath strategies in one in-page call.
+
+		Args:
+		    xpaths: XPath selectors in priority order
+		    page: Browser-use Page object
+
+		Returns:
+		    One entry per XPath: the normalized XPath if it matched a visible element, None if it
+		    did not, or the exception if the whole evaluation failed
+		"""
+		normalized = [xpath if not xpath or xpath.startswith(('/', '(')) else '/' + xpath for xpath in xpaths]
+		logger.info(f'         🔎 Executing {len(normalized)} XPath strategies in one evaluation')
+
+		try:
+			results = await page.evaluate(XPATH_BATCH_JS, normalized)
+			results = json.loads(results) if isinstance(results, str) else results
+		except Exception as e:
+			logger.warning(f'         ❌ Error executing XPaths: {e}')
+			return [e] * len(normalized)
+
+		if not isinstance(results, list) or len(results) != len(normalized):
+			logger.warning(f'         ❌ Unexpected XPath evaluation result: {results}')
+			return [None] * len(normalized)
+
+		found: List[Any] = []
+		for xpath, result in zip(normalized, results):
+			if not isinstance(result, dict) or not result.get('found'):
+				if isinstance(result, dict) and result.get('error'):
+					logger.warning(f'         ❌ XPath evaluation error for {xpath}: {result["error"]}')
+				found.append(None)
+			elif not result.get('visible'):
+				logger.info(f'         ⚠️  Element found but not visible: {xpath}')
+				found.append(None)
+			else:
+				logger.info(f'         ✅ Found visible element: <{result.get("tag")}> for {xpath}')
+				found.append(xpath)
+		return found
+
 	async def _find_with_semantic_strategy(
 		self,
 		strategy_type: str,
@@ -0,0 +1,172 @@
+"""
+Overlapped lookup of the next step's target element.
+
+After a deterministic action the workflow used to wait for the page to settle and only then
+look for the next step's element, trying the recorded selector and each stability-ranked
+fallback one after another with its own timeout. On long linear forms that serial wait was
+most of the per-step latency.
+
+``start_element_prefetch`` begins the lookup as soon as the current action has been dispatched,
+concurrently with the page readiness wait. Every candidate (the recorded CSS selector, its
+fallbacks from ``generate_stable_selectors``, and the recorded XPath with its alternatives) is
+checked together by a single in-page poller, which reports the first visible match in stability
+order. Polling runs in short slices so a navigation that replaces the document, or cancellation,
+never leaves a long-lived evaluation behind.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from workflow_use.controller.utils import generate_stable_selectors, generate_stable_xpaths
+
+if TYPE_CHECKING:
+	from browser_use.actor.page import Page
+
+logger = logging.getLogger(__name__)
+
+# Length of one in-page polling slice; the page is re-entered between slices
+PREFETCH_SLICE_MS = 500
+
+# Playwright-style text selectors produced by generate_stable_selectors, e.g. button:has-text('Save')
+_HAS_TEXT_PATTERN = re.compile(r"^([a-zA-Z][a-zA-Z0-9]*):has-text\('(.*)'\)$")
+
+ELEMENT_PREFETCH_JS = """(candidates, options) => new Promise((resolve) => {
+	const start = performance.now();
+	const invalid = new Set();
+
+	const isVisible = (el) => {
+		if (!el || !el.isConnected) return false;
+		const style = window.getComputedStyle(el);
+		if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+		const rect = el.getBoundingClientRect();
+		return rect.width > 0 && rect.height > 0;
+	};
+
+	const matches = (candidate, index) => {
+		try {
+			if (candidate.kind === 'xpath') {
+				const result = document.evaluate(candidate.value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+				for (let i = 0; i < result.snapshotLength; i++) {
+					if (isVisible(result.snapshotItem(i))) return true;
+				}
+				return false;
+			}
+			if (candidate.kind === 'text') {
+				for (const el of document.querySelectorAll(candidate.tag)) {
+					if ((el.textContent || '').includes(candidate.text) && isVisible(el)) return true;
+				}
+				return false;
+			}
+			for (const el of document.querySelectorAll(candidate.value)) {
+				if (isVisible(el)) return true;
+			}
+			return false;
+		} catch (e) {
+			invalid.add(index);
+			return false;
+		}
+	};
+
+	let timer = null;
+	const check = () => {
+		for (let i = 0; i < candidates.length; i++) {
+			if (!invalid.has(i) && matches(candidates[i], i)) {
+				clearInterval(timer);
+				return resolve({ found: i, elapsed: Math.round(performance.now() - start) });
+			}
+		}
+		if (performance.now() - start >= options.timeoutMs) {
+			clearInterval(timer);
+			resolve({ found: null, invalid: Array.from(invalid) });
+		}
+	};
+
+	timer = setInterval(check, options.intervalMs);
+	check();
+})"""
+
+
+def selector_candidates(css_selector: str, step: Any = None) -> List[Dict[str, str]]:
+	"""Every selector worth trying for a step, most stable first, in the in-page prober's format."""
+	candidates: List[Dict[str, str]] = []
+
+	for selector in [css_selector] + generate_stable_selectors(css_selector, step):
+		has_text = _HAS_TEXT_PATTERN.match(selector)
+		if has_text:
+			candidates.append({'kind': 'text', 'value': selector, 'tag': has_text.group(1), 'text': has_text.group(2)})
+		else:
+			candidates.append({'kind': 'css', 'value': selector})
+
+	xpath = getattr(step, 'xpath', None)
+	if xpath:
+		for alternative in [xpath] + generate_stable_xpaths(xpath, step):
+			candidates.append({'kind': 'xpath', 'value': alternative})
+
+	# Drop duplicates while keeping the stability order
+	unique = {}
+	for candidate in candidates:
+		unique.setdefault((candidate['kind'], candidate['value']), candidate)
+	return list(unique.values())
+
+
+def candidate_label(candidate: Dict[str, str]) -> str:
+	"""Selector string for logs, in the ``xpath=...`` notation get_best_element_handle returns."""
+	return f'xpath={candidate["value"]}' if candidate['kind'] == 'xpath' else candidate['value']
+
+
+async def wait_for_any_selector(
+	page: 'Page',
+	candidates: List[Dict[str, str]],
+	timeout_ms: int,
+	interval_ms: int = 50,
+) -> Optional[str]:
+	"""Wait until any candidate matches a visible element.
+
+	Args:
+		page: The page to search
+		candidates: Candidates from ``selector_candidates``, most stable first
+		timeout_ms: Upper bound for the whole wait (0 checks once)
+		interval_ms: In-page polling interval
+
+	Returns:
+		The first matching candidate in stability order (as a selector string), or None on timeout
+	"""
+	if not candidates:
+		return None
+
+	deadline = time.monotonic() + timeout_ms / 1000
+	invalid: set = set()
+
+	while True:
+		remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+		options = {'timeoutMs': min(remaining_ms, PREFETCH_SLICE_MS), 'intervalMs': interval_ms}
+		try:
+			result = await asyncio.wait_for(
+				page.evaluate(ELEMENT_PREFETCH_JS, candidates, options), timeout=options['timeoutMs'] / 1000 + 2
+			)
+			result = json.loads(result) if isinstance(result, str) else result
+			if isinstance(result, dict):
+				if result.get('found') is not None:
+					return candidate_label(candidates[result['found']])
+				invalid.update(result.get('invalid') or [])
+		except Exception as e:
+			# The execution context is replaced while a navigation commits; try again on the new document
+			logger.debug(f'Element prefetch probe failed: {e}')
+			await asyncio.sleep(0.05)
+
+		if remaining_ms <= 0 or time.monotonic() >= deadline:
+			break
+
+	if invalid:
+		skipped = ', '.join(candidate_label(candidates[i]) for i in sorted(invalid) if i < len(candidates))
+		logger.debug(f'Selectors not supported by the page: {skipped}')
+	return None
+
+
+def start_element_prefetch(page: 'Page', candidates: List[Dict[str, str]], timeout_ms: int) -> 'asyncio.Task[Optional[str]]':
+	"""Start looking for the next step's element in the background; await the task for the matched selector."""
+	return asyncio.create_task(wait_for_any_selector(page, candidates, timeout_ms))
@@ -0,0 +1,179 @@
+"""
+Persistent, content-addressed cache for LLM page extractions.
+
+Extraction steps send the page text and goal to an LLM on every run. Nightly re-runs mostly
+hit unchanged pages, so the answer is cached on disk under a SHA-256 of the model, the prompt
+kind, the extraction goal, the page URL and title, and the whitespace-normalized page text. Any
+change to one of them is a miss. Entries expire after ``ttl_seconds`` and the directory is kept
+under ``max_entries`` and ``max_bytes`` by evicting the least recently used files. The directory
+is only scanned on the first write and when the tracked totals cross a bound; eviction then goes
+down to ``EVICTION_HEADROOM`` of the bounds so the next writes don't scan again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXTRACTION_CACHE_DIR = './tmp/extraction_cache'
+DEFAULT_EXTRACTION_CACHE_TTL = 7 * 24 * 3600
+DEFAULT_EXTRACTION_CACHE_MAX_ENTRIES = 1000
+DEFAULT_EXTRACTION_CACHE_MAX_BYTES = 50 * 1024 * 1024
+# Fraction of max_entries / max_bytes an over-full cache is trimmed to
+EVICTION_HEADROOM = 0.9
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_page_text(text: str) -> str:
+	"""Collapse whitespace so formatting-only differences map to the same key."""
+	return _WHITESPACE.sub(' ', text or '').strip()
+
+
+def llm_cache_identity(llm: Any) -> str:
+	"""Identify the model behind an LLM client, e.g. 'openai:gpt-4.1-mini'."""
+	provider = getattr(llm, 'provider', None) or type(llm).__name__
+	model = getattr(llm, 'model', None) or getattr(llm, 'model_name', None) or ''
+	return f'{provider}:{model}'
+
+
+class ExtractionCache:
+	"""On-disk cache of extraction results with TTL and size-bounded LRU eviction."""
+
+	def __init__(
+		self,
+		cache_dir: str | Path = DEFAULT_EXTRACTION_CACHE_DIR,
+		ttl_seconds: float = DEFAULT_EXTRACTION_CACHE_TTL,
+		max_entries: int = DEFAULT_EXTRACTION_CACHE_MAX_ENTRIES,
+		max_bytes: int = DEFAULT_EXTRACTION_CACHE_MAX_BYTES,
+		enabled: bool = True,
+	):
+		"""
+		Args:
+			cache_dir: Directory holding one JSON file per cached extraction
+			ttl_seconds: Age after which an entry is treated as a miss and deleted
+			max_entries: Maximum number of cached extractions
+			max_bytes: Maximum total size of the cache directory
+			enabled: Bypass flag; when False every lookup misses and nothing is written
+		"""
+		self.cache_dir = Path(cache_dir)
+		self.ttl_seconds = ttl_seconds
+		self.max_entries = max_entries
+		self.max_bytes = max_bytes
+		self.enabled = enabled
+		# Entries and bytes on disk as of the last scan plus this instance's writes (None until the first write)
+		self._entry_count: int | None = None
+		self._total_bytes = 0
+
+	@staticmethod
+	def make_key(model: str, prompt_kind: str, goal: str, page_text: str, url: str = '', title: str = '') -> str:
+		"""Hash the inputs that determine an extraction result (everything the prompt shows the LLM)."""
+		digest = hashlib.sha256()
+		for part in (model, prompt_kind, goal.strip(), url or '', title or '', normalize_page_text(page_text)):
+			digest.update(part.encode('utf-8'))
+			digest.update(b'\0')
+		return digest.hexdigest()
+
+	def _path(self, key: str) -> Path:
+		return self.cache_dir / f'{key}.json'
+
+	def get(self, key: str) -> Optional[str]:
+		"""Return the cached extraction for ``key``, or None on a miss or expired entry."""
+		if not self.enabled:
+			return None
+
+		path = self._path(key)
+		try:
+			with open(path, 'r', encoding='utf-8') as f:
+				entry = json.load(f)
+		except FileNotFoundError:
+			return None
+		except (OSError, ValueError) as e:
+			logger.debug(f'Discarding unreadable extraction cache entry {path.name}: {e}')
+			path.unlink(missing_ok=True)
+			return None
+
+		if time.time() - entry.get('created_at', 0) > self.ttl_seconds:
+			path.unlink(missing_ok=True)
+			return None
+
+		# Touch the file so eviction sees it as recently used
+		try:
+			os.utime(path)
+		except OSError:
+			pass
+		return entry.get('content')
+
+	def put(self, key: str, content: str, model: str = '', goal: str = '') -> None:
+		"""Store an extraction result and evict old entries if the cache is over its bounds."""
+		if not self.enabled or not content:
+			return
+
+		entry = {'created_at': time.time(), 'model': model, 'goal': goal, 'content': content}
+		data = json.dumps(entry).encode('utf-8')
+		path = self._path(key)
+		try:
+			self.cache_dir.mkdir(parents=True, exist_ok=True)
+			try:
+				replaced_size = path.stat().st_size
+			except FileNotFoundError:
+				replaced_size = None
+			# Write atomically so concurrent runs never read a partial entry
+			fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+			with os.fdopen(fd, 'wb') as f:
+				f.write(data)
+			os.replace(tmp_path, path)
+
+			if self._entry_count is None:
+				self._evict()
+				return
+			if replaced_size is None:
+				self._entry_count += 1
+				self._total_bytes += len(data)
+			else:
+				self._total_bytes += len(data) - replaced_size
+			if self._entry_count > self.max_entries or self._total_bytes > self.max_bytes:
+				self._evict()
+		except OSError as e:
+			logger.warning(f'⚠️ Could not write extraction cache entry: {e}')
+
+	def clear(self) -> None:
+		"""Delete every cached extraction."""
+		for path in self.cache_dir.glob('*.json'):
+			path.unlink(missing_ok=True)
+		self._entry_count = 0
+		self._total_bytes = 0
+
+	def _evict(self) -> None:
+		"""Scan the directory, drop expired entries and, if over a bound, the least recently used ones."""
+		now = time.time()
+		entries = []
+		for path in self.cache_dir.glob('*.json'):
+			try:
+				stat = path.stat()
+			except OSError:
+				continue
+			# mtime is never earlier than creation, so an entry untouched for a full TTL has expired
+			if now - stat.st_mtime > self.ttl_seconds:
+				path.unlink(missing_ok=True)
+				continue
+			entries.append((stat.st_mtime, stat.st_size, path))
+
+		entries.sort()
+		total_bytes = sum(size for _, size, _ in entries)
+		if len(entries) > self.max_entries or total_bytes > self.max_bytes:
+			max_entries = int(self.max_entries * EVICTION_HEADROOM)
+			max_bytes = int(self.max_bytes * EVICTION_HEADROOM)
+			while entries and (len(entries) > max_entries or total_bytes > max_bytes):
+				_, size, path = entries.pop(0)
+				path.unlink(missing_ok=True)
+				total_bytes -= size
+		self._entry_count = len(entries)
+		self._total_bytes = total_bytes
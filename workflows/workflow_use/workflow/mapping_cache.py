@@ -0,0 +1,111 @@
+"""
+LRU cache for semantic mappings keyed by page URL and DOM fingerprint.
+
+Bulk runs revisit identical page states (the same login page, the same search page for every
+CSV row). The fingerprint is a single in-page pass hashing element tags, the attributes the
+extractor reads and visible text, so computing it costs a fraction of a full semantic extraction.
+A mapping is only cached when the fingerprint is unchanged across its extraction.
+"""
+
+import json
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+	from browser_use.actor.page import Page
+
+	from workflow_use.workflow.semantic_index import SemanticMappingIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAPPING_CACHE_SIZE = 32
+
+MappingCacheKey = Tuple[str, str]
+
+DOM_FINGERPRINT_JS = """() => {
+	const attributes = ['id', 'class', 'name', 'type', 'role', 'href', 'value', 'placeholder',
+		'aria-label', 'title', 'alt', 'for', 'hidden', 'disabled', 'style'];
+	let hash = 0x811c9dc5;
+	let count = 0;
+	const mix = (value) => {
+		for (let i = 0; i < value.length; i++) {
+			hash ^= value.charCodeAt(i);
+			hash = Math.imul(hash, 0x01000193);
+		}
+		hash ^= 0x1f;
+		hash = Math.imul(hash, 0x01000193);
+	};
+
+	const root = document.documentElement;
+	if (!root) return { url: location.href, fingerprint: null };
+
+	const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT);
+	for (let node = walker.currentNode; node; node = walker.nextNode()) {
+		if (node.nodeType === Node.TEXT_NODE) {
+			const parentTag = node.parentNode ? node.parentNode.nodeName : '';
+			if (parentTag === 'SCRIPT' || parentTag === 'STYLE' || parentTag === 'NOSCRIPT') continue;
+			const text = node.data.trim();
+			if (text) mix(text.slice(0, 64));
+			continue;
+		}
+		count++;
+		mix(node.tagName);
+		for (const name of attributes) {
+			const value = node.getAttribute(name);
+			if (value !== null) mix(name + '=' + value);
+		}
+	}
+	return { url: location.href, fingerprint: count + ':' + (hash >>> 0).toString(16) };
+}"""
+
+
+async def get_page_fingerprint(page: 'Page') -> Optional[MappingCacheKey]:
+	"""Return the (url, DOM fingerprint) cache key for the current page, or None if it cannot be computed."""
+	try:
+		result = await page.evaluate(DOM_FINGERPRINT_JS)
+		result = json.loads(result) if isinstance(result, str) else result
+	except Exception as e:
+		logger.debug(f'Could not fingerprint page: {e}')
+		return None
+
+	if not isinstance(result, dict) or not result.get('url') or not result.get('fingerprint'):
+		return None
+	return result['url'], result['fingerprint']
+
+
+class SemanticMappingCache:
+	"""Size-bounded LRU cache of semantic mappings (and their lookup indexes) by page state."""
+
+	def __init__(self, max_entries: int = DEFAULT_MAPPING_CACHE_SIZE):
+		if max_entries < 1:
+			raise ValueError('max_entries must be at least 1')
+		self.max_entries = max_entries
+		self.hits = 0
+		self.misses = 0
+		self._entries: 'OrderedDict[MappingCacheKey, Tuple[Dict[str, Dict], SemanticMappingIndex]]' = OrderedDict()
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def get(self, key: MappingCacheKey) -> Optional[Tuple[Dict[str, Dict], 'SemanticMappingIndex']]:
+		"""Return the cached (mapping, index) for ``key`` and mark it most recently used."""
+		entry = self._entries.get(key)
+		if entry is None:
+			self.misses += 1
+			return None
+		self._entries.move_to_end(key)
+		self.hits += 1
+		return entry
+
+	def put(self, key: MappingCacheKey, mapping: Dict[str, Dict], index: 'SemanticMappingIndex') -> None:
+		"""Store a mapping, evicting the least recently used entry when full."""
+		self._entries[key] = (mapping, index)
+		self._entries.move_to_end(key)
+		while len(self._entries) > self.max_entries:
+			evicted_key, _ = self._entries.popitem(last=False)
+			logger.debug(f'Evicted cached semantic mapping for {evicted_key[0]}')
+
+	def clear(self) -> None:
+		"""Drop all cached mappings."""
+		self._entries.clear()
@@ -0,0 +1,122 @@
+"""
+Event-driven page readiness.
+
+Replaces fixed sleeps after navigation and interactions with a wait that returns as soon
+as the page is actually ready:
+
+1. Document lifecycle: ``document.readyState`` reaches ``interactive`` (DOMContentLoaded)
+   or ``complete`` (load), observed through ``readystatechange`` events.
+2. Network quiet: no resource has finished loading for ``quiet_ms`` (PerformanceObserver).
+   Pages that keep polling (analytics beacons, long-poll requests) are accepted once
+   ``max_network_wait_ms`` has passed, so they never hold a step for the whole timeout.
+3. DOM stability: no mutations for ``quiet_ms`` (MutationObserver). Pages that never stop
+   mutating (carousels, clocks) are accepted once ``max_dom_wait_ms`` has passed.
+
+Everything is bounded by ``timeout``, which workflows set through ``page_ready_timeout``.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+	from browser_use.actor.page import Page
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_READY_TIMEOUT = 10.0
+
+# Longest wait for network quiet once the document is ready (the fixed sleep this replaced was 3s)
+DEFAULT_MAX_NETWORK_WAIT_MS = 3000
+
+PAGE_READY_JS = """(options) => new Promise((resolve) => {
+	const start = performance.now();
+	const requiredState = options.waitUntil === 'domcontentloaded' ? ['interactive', 'complete'] : ['complete'];
+	let lastDomActivity = start;
+	let lastNetworkActivity = start;
+
+	const mutationObserver = new MutationObserver(() => { lastDomActivity = performance.now(); });
+	mutationObserver.observe(document.documentElement || document, {
+		subtree: true, childList: true, attributes: true, characterData: true
+	});
+
+	let resourceObserver = null;
+	try {
+		resourceObserver = new PerformanceObserver(() => { lastNetworkActivity = performance.now(); });
+		resourceObserver.observe({ type: 'resource' });
+	} catch (e) {}
+
+	let timer = null;
+	const finish = (status) => {
+		mutationObserver.disconnect();
+		if (resourceObserver) resourceObserver.disconnect();
+		document.removeEventListener('readystatechange', check);
+		clearInterval(timer);
+		resolve({ status: status, readyState: document.readyState, elapsed: Math.round(performance.now() - start) });
+	};
+
+	function check() {
+		const now = performance.now();
+		if (now - start >= options.timeoutMs) return finish('timeout');
+		if (!requiredState.includes(document.readyState)) return;
+		const networkQuiet = now - lastNetworkActivity >= options.quietMs || now - start >= options.maxNetworkWaitMs;
+		const domQuiet = now - lastDomActivity >= options.quietMs || now - start >= options.maxDomWaitMs;
+		if (networkQuiet && domQuiet) finish('ready');
+	}
+
+	document.addEventListener('readystatechange', check);
+	timer = setInterval(check, 50);
+	check();
+})"""
+
+
+async def wait_for_page_ready(
+	page: 'Page',
+	timeout: float = DEFAULT_PAGE_READY_TIMEOUT,
+	wait_until: str = 'load',
+	quiet_ms: int = 300,
+	max_dom_wait_ms: int = 2000,
+	max_network_wait_ms: int = DEFAULT_MAX_NETWORK_WAIT_MS,
+) -> Dict:
+	"""Wait until the page is loaded, network-quiet and DOM-stable, or until timeout.
+
+	Args:
+		page: The page to wait on
+		timeout: Upper bound in seconds
+		wait_until: 'load' or 'domcontentloaded'
+		quiet_ms: Required quiet period for network and DOM activity
+		max_dom_wait_ms: Accept a still-mutating DOM after this long
+		max_network_wait_ms: Accept a page whose network never goes quiet after this long
+
+	Returns:
+		Dict with 'status' ('ready' or 'timeout'), 'readyState' and 'elapsed' (ms)
+	"""
+	deadline = time.monotonic() + timeout
+	last_error = None
+
+	# The execution context is replaced while a navigation commits, so retry until the new document answers
+	while True:
+		remaining = deadline - time.monotonic()
+		if remaining <= 0:
+			break
+		options = {
+			'waitUntil': wait_until,
+			'timeoutMs': int(remaining * 1000),
+			'quietMs': quiet_ms,
+			'maxDomWaitMs': max_dom_wait_ms,
+			'maxNetworkWaitMs': max_network_wait_ms,
+		}
+		try:
+			result = await asyncio.wait_for(page.evaluate(PAGE_READY_JS, options), timeout=remaining + 1)
+			result = json.loads(result) if isinstance(result, str) else result
+			if isinstance(result, dict):
+				logger.debug(f'Page readiness: {result}')
+				return result
+		except Exception as e:
+			last_error = e
+		await asyncio.sleep(0.1)
+
+	logger.debug(f'Page readiness timed out after {timeout}s (last error: {last_error})')
+	return {'status': 'timeout', 'readyState': None, 'elapsed': int(timeout * 1000)}
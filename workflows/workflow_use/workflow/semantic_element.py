@@ -0,0 +1,123 @@
+"""
+Compact record for semantic mapping entries.
+
+A semantic mapping is rebuilt on every refresh and holds one entry per interactive element.
+Storing each entry as a 14-key dict costs several hundred bytes and a hash table allocation
+per element. ``SemanticElement`` keeps the same fields in ``__slots__``, shares one read-only
+empty dict for missing nested context, and interns the low-cardinality strings (element type,
+class names) so identical values are stored once.
+
+It implements the read-only ``Mapping`` protocol, so existing ``element_info['selectors']`` and
+``element_info.get('label_text', '')`` access keeps working unchanged.
+"""
+
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, Iterator
+
+# Shared stand-in for missing nested context dicts; read-only so no entry can mutate another's
+EMPTY_CONTEXT: Mapping = MappingProxyType({})
+
+# Mapping keys in their historical order, and the slot each one is stored in
+SEMANTIC_ELEMENT_KEYS = (
+	'class',
+	'id',
+	'selectors',
+	'hierarchical_selector',
+	'fallback_selector',
+	'text_xpath',
+	'element_type',
+	'deterministic_id',
+	'original_text',
+	'label_text',
+	'dom_path',
+	'container_context',
+	'sibling_context',
+	'position',
+)
+_SLOT_FOR_KEY = {key: 'css_class' if key == 'class' else key for key in SEMANTIC_ELEMENT_KEYS}
+
+
+class SemanticElement(Mapping):
+	"""One semantic mapping entry, readable like the dict it replaces."""
+
+	__slots__ = tuple(_SLOT_FOR_KEY.values())
+
+	def __init__(
+		self,
+		css_class: str,
+		id: str,
+		selectors: str,
+		hierarchical_selector: str,
+		fallback_selector: str,
+		text_xpath: str,
+		element_type: str,
+		deterministic_id: str,
+		original_text: str,
+		label_text: str,
+		dom_path: str,
+		container_context: Mapping,
+		sibling_context: Mapping,
+		position: Mapping,
+	):
+		self.css_class = sys.intern(css_class) if isinstance(css_class, str) else css_class
+		self.id = id
+		self.selectors = selectors
+		self.hierarchical_selector = hierarchical_selector
+		self.fallback_selector = fallback_selector
+		self.text_xpath = text_xpath
+		self.element_type = sys.intern(element_type)
+		self.deterministic_id = deterministic_id
+		self.original_text = original_text
+		self.label_text = label_text
+		self.dom_path = dom_path
+		self.container_context = container_context or EMPTY_CONTEXT
+		self.sibling_context = sibling_context or EMPTY_CONTEXT
+		self.position = position or EMPTY_CONTEXT
+
+	@classmethod
+	def from_extracted(
+		cls, element_info: Dict[str, Any], element_type: str, element_id: str, original_text: str
+	) -> 'SemanticElement':
+		"""Build an entry from one element returned by the in-page extraction script."""
+		css_selector = element_info['css_selector']
+		return cls(
+			css_class=element_info.get('class', ''),
+			id=element_info.get('id', ''),
+			selectors=css_selector,
+			hierarchical_selector=element_info.get('hierarchical_selector', css_selector),
+			fallback_selector=element_info.get('fallback_selector', css_selector),
+			text_xpath=element_info.get('text_xpath', ''),
+			element_type=element_type,
+			deterministic_id=element_id,
+			original_text=original_text,
+			# IMPORTANT: Include label text for input field matching
+			label_text=element_info.get('label_text', ''),
+			dom_path=element_info.get('dom_path', ''),
+			container_context=element_info.get('container_context'),
+			sibling_context=element_info.get('sibling_context'),
+			position=element_info.get('position'),
+		)
+
+	def __getitem__(self, key: str) -> Any:
+		try:
+			return getattr(self, _SLOT_FOR_KEY[key])
+		except KeyError:
+			raise KeyError(key) from None
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(SEMANTIC_ELEMENT_KEYS)
+
+	def __len__(self) -> int:
+		return len(SEMANTIC_ELEMENT_KEYS)
+
+	def __contains__(self, key: object) -> bool:
+		return key in _SLOT_FOR_KEY
+
+	def to_dict(self) -> Dict[str, Any]:
+		"""Return a plain (JSON-serializable) dict copy, with nested context as dicts."""
+		return {key: dict(value) if isinstance(value, Mapping) else value for key, value in self.items()}
+
+	def __repr__(self) -> str:
+		return f'SemanticElement({self.element_type!r}, selectors={self.selectors!r}, original_text={self.original_text!r})'
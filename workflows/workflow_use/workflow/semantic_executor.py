@@ -1,7 +1,10 @@
 import asyncio
+import base64
 import json
 import logging
 import traceback
+from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from browser_use import Browser
@@ -21,12 +24,76 @@ from workflow_use.schema.views import (
 	SelectChangeStep,
 	WorkflowStep,
 )
+from workflow_use.workflow.content_ranking import select_relevant_content
+from workflow_use.workflow.debug_screenshots import DebugScreenshotPipeline, ScreenshotOptions, capture_screenshot
 from workflow_use.workflow.error_reporter import ErrorCategory, ErrorContext, ErrorReporter
+from workflow_use.workflow.extraction_cache import ExtractionCache, llm_cache_identity
+from workflow_use.workflow.mapping_cache import SemanticMappingCache
+from workflow_use.workflow.page_readiness import DEFAULT_PAGE_READY_TIMEOUT, wait_for_page_ready
 from workflow_use.workflow.semantic_extractor import SemanticExtractor
-from workflow_use.workflow.step_verifier import StepVerifier, VerificationResult
+from workflow_use.workflow.step_verifier import AIVerdict, StepVerifier, VerificationResult
+from workflow_use.workflow.tracing import (
+	CATEGORY_ACTION,
+	CATEGORY_ELEMENT,
+	CATEGORY_LLM,
+	CATEGORY_MAPPING,
+	CATEGORY_VERIFICATION,
+	span,
+	traced,
+	traced_sleep,
+)
 
 logger = logging.getLogger(__name__)
 
+# Step types that never submit or edit form data, so the post-step validation error scan is skipped
+STEP_TYPES_WITHOUT_VALIDATION_ERRORS = frozenset(
+	{'navigation', 'scroll', 'extract', 'extract_page_content', 'go_back', 'go_forward'}
+)
+
+# Visibility, viewport and obscuration checks for a batch of elements, evaluated in one call
+VISIBILITY_PROBE_JS = """function(...candidates) {
+	return candidates.map((el) => {
+		const rect = el.getBoundingClientRect();
+		const probe = {
+			visible: rect.width > 0 && rect.height > 0,
+			truly_visible: false,
+			obscured: false,
+			reason: 'ok',
+			bbox: { x: rect.x, y: rect.y, width: rect.width, height: rect.height }
+		};
+		if (!probe.visible) {
+			probe.reason = 'empty_bbox';
+			return probe;
+		}
+
+		// Hidden elements have no offsetParent unless they are fixed or sticky
+		const style = getComputedStyle(el);
+		if (el.offsetParent === null && style.position !== 'fixed' && style.position !== 'sticky') {
+			probe.reason = 'no_offset_parent';
+			return probe;
+		}
+		if (style.visibility === 'hidden' || style.display === 'none' || style.opacity === '0') {
+			probe.reason = 'css_hidden';
+			return probe;
+		}
+		if (rect.top > window.innerHeight || rect.bottom < 0 || rect.left > window.innerWidth || rect.right < 0) {
+			probe.reason = 'out_of_viewport';
+			return probe;
+		}
+
+		// The element at the center point should be this element, a descendant or an ancestor
+		const elementAtPoint = document.elementFromPoint(rect.left + rect.width / 2, rect.top + rect.height / 2);
+		if (elementAtPoint && !(elementAtPoint === el || el.contains(elementAtPoint) || elementAtPoint.contains(el))) {
+			probe.obscured = true;
+			probe.reason = 'obscured';
+			return probe;
+		}
+
+		probe.truly_visible = true;
+		return probe;
+	});
+}"""
+
 
 class SemanticWorkflowExecutor:
 	"""Executes workflow steps using semantic mappings with optional AI extraction."""
@@ -39,10 +106,26 @@ class SemanticWorkflowExecutor:
 		max_verification_failures: int = 3,
 		page_extraction_llm: BaseChatModel | None = None,
 		enable_step_verification: bool = False,  # Disabled by default until fully stable
+		incremental_mapping: bool = False,
+		page_ready_timeout: float = DEFAULT_PAGE_READY_TIMEOUT,
+		mapping_cache: SemanticMappingCache | None = None,
+		extraction_cache: ExtractionCache | None = None,
+		screenshot_pipeline: DebugScreenshotPipeline | None = None,
 	):
 		self.browser = browser
-		self.semantic_extractor = SemanticExtractor()
+		# A shared mapping cache lets repeated runs skip extraction on page states they have already seen
+		self.semantic_extractor = SemanticExtractor(mapping_cache=mapping_cache)
 		self.current_mapping: Dict[str, Dict] = {}
+		# Re-extract only DOM subtrees that changed since the last refresh instead of the whole page
+		self.incremental_mapping = incremental_mapping
+		# Optional on-disk cache of LLM extraction results
+		self.extraction_cache = extraction_cache
+		# Debug screenshot pipeline; failure screenshots are queued on it instead of written inline
+		self.screenshot_pipeline = screenshot_pipeline
+		# Upper bound for event-driven page readiness waits after navigation
+		self.page_ready_timeout = page_ready_timeout
+		# Step types whose execution cannot surface form validation errors
+		self.validation_scan_skip_step_types = set(STEP_TYPES_WITHOUT_VALIDATION_ERRORS)
 		self.max_retries = max_retries
 		self.max_global_failures = max_global_failures
 		self.max_verification_failures = max_verification_failures
@@ -151,63 +234,49 @@ class SemanticWorkflowExecutor:
 		3. Element is not obscured by other elements
 		4. Element passes offsetParent check (for visibility)
 		"""
+		probe = (await self._probe_elements_visibility([element]))[0]
+		if probe and probe.get('truly_visible'):
+			return True
+		logger.debug(f'Element not truly visible: {probe.get("reason") if probe else "unknown"}')
+		return False
+
+	async def _probe_elements_visibility(self, elements: list) -> List[Optional[Dict]]:
+		"""Probe visibility of all elements in a single in-page evaluation.
+
+		Object IDs are resolved concurrently, then one Runtime.callFunctionOn receives every
+		candidate as an argument, so the cost no longer grows with sequential round-trips.
+
+		Returns:
+			One dict per element with 'visible' (non-empty box), 'truly_visible', 'obscured',
+			'reason' and 'bbox', or None for elements that could not be resolved
+		"""
+		probes: List[Optional[Dict]] = [None] * len(elements)
+		if not elements:
+			return probes
+
 		try:
-			# First check basic visibility
-			bbox = await element.get_bounding_box()
-			if not bbox or bbox['width'] == 0 or bbox['height'] == 0:
-				return False
-			
-			# Use JavaScript to check if element is truly visible and focusable
-			result = await self._element_evaluate(
-				element,
-				'''(function() {
-					// Check if element has an offsetParent (hidden elements don't)
-					if (this.offsetParent === null && 
-						getComputedStyle(this).position !== 'fixed' && 
-						getComputedStyle(this).position !== 'sticky') {
-						return { visible: false, reason: 'no_offset_parent' };
-					}
-					
-					// Check computed visibility
-					const style = getComputedStyle(this);
-					if (style.visibility === 'hidden' || style.display === 'none' || style.opacity === '0') {
-						return { visible: false, reason: 'css_hidden' };
-					}
-					
-					// Check if in viewport
-					const rect = this.getBoundingClientRect();
-					if (rect.top > window.innerHeight || rect.bottom < 0 ||
-						rect.left > window.innerWidth || rect.right < 0) {
-						return { visible: false, reason: 'out_of_viewport' };
-					}
-					
-					// Check if element is at center point (not obscured)
-					const centerX = rect.left + rect.width / 2;
-					const centerY = rect.top + rect.height / 2;
-					const elementAtPoint = document.elementFromPoint(centerX, centerY);
-					
-					if (elementAtPoint) {
-						// Element at point should be this element or a descendant
-						const isVisible = (elementAtPoint === this || this.contains(elementAtPoint) || 
-										  elementAtPoint.contains(this));
-						if (!isVisible) {
-							return { visible: false, reason: 'obscured' };
-						}
-					}
-					
-					return { visible: true, reason: 'ok' };
-				})()'''
+			object_ids = await asyncio.gather(*(element._get_remote_object_id() for element in elements), return_exceptions=True)
+			resolved = [(position, object_id) for position, object_id in enumerate(object_ids) if isinstance(object_id, str)]
+			if not resolved:
+				return probes
+
+			first_element = elements[resolved[0][0]]
+			result = await first_element._client.send.Runtime.callFunctionOn(
+				params={
+					'functionDeclaration': VISIBILITY_PROBE_JS,
+					'objectId': resolved[0][1],
+					'arguments': [{'objectId': object_id} for _, object_id in resolved],
+					'returnByValue': True,
+				},
+				session_id=first_element._session_id,
 			)
-			
-			if result and result.get('visible'):
-				return True
-			else:
-				logger.debug(f"Element not truly visible: {result.get('reason') if result else 'unknown'}")
-				return False
-				
+
+			for (position, _), probe in zip(resolved, result.get('result', {}).get('value') or []):
+				probes[position] = probe
 		except Exception as e:
-			logger.debug(f'Error checking element visibility: {e}')
-			return False
+			logger.debug(f'Error probing element visibility: {e}')
+
+		return probes
 
 	async def _get_first_visible_element(self, elements: list, prefer_last: bool = True):
 		"""Get the first visible and focusable element from a list of elements.
@@ -223,25 +292,20 @@ class SemanticWorkflowExecutor:
 		# Check elements in reverse order if prefer_last is True
 		# Modal overlays are typically appended at the end of the DOM
 		elements_to_check = list(reversed(elements)) if prefer_last else elements
-		
+
+		# Probe every candidate in one round-trip
+		probes = await self._probe_elements_visibility(elements_to_check)
+
 		# First pass: try to find truly visible and focusable element
-		for element in elements_to_check:
-			try:
-				is_truly_visible = await self._element_is_truly_visible_and_focusable(element)
-				if is_truly_visible:
-					return element
-			except Exception:
-				continue
-		
+		for element, probe in zip(elements_to_check, probes):
+			if probe and probe.get('truly_visible'):
+				return element
+
 		# Second pass: fall back to basic visibility check
-		for element in elements_to_check:
-			try:
-				is_visible = await self._element_is_visible(element)
-				if is_visible:
-					return element
-			except Exception:
-				continue
-		
+		for element, probe in zip(elements_to_check, probes):
+			if probe and probe.get('visible'):
+				return element
+
 		# Fallback to last element (for overlays) or first if prefer_last is False
 		return elements[-1] if elements and prefer_last else (elements[0] if elements else None)
 
@@ -310,10 +374,15 @@ class SemanticWorkflowExecutor:
 		except Exception:
 			return ''
 
+	@traced(CATEGORY_MAPPING)
 	async def _refresh_semantic_mapping(self) -> None:
 		"""Refresh the semantic mapping for the current page."""
 		page = await self.browser.get_current_page()
-		self.current_mapping = await self.semantic_extractor.extract_semantic_mapping(page)
+		previous_mapping = self.current_mapping
+		self.current_mapping = await self.semantic_extractor.extract_semantic_mapping(page, incremental=self.incremental_mapping)
+		if self.current_mapping is previous_mapping:
+			logger.info(f'Semantic mapping unchanged ({len(self.current_mapping)} elements)')
+			return
 		logger.info(f'Refreshed semantic mapping with {len(self.current_mapping)} elements')
 
 		# Print detailed mapping for debugging
@@ -325,6 +394,7 @@ class SemanticWorkflowExecutor:
 				)
 			logger.debug('=== End Semantic Mapping ===')
 
+	@traced(CATEGORY_ELEMENT)
 	def _find_element_by_text(self, target_text: str, context_hints: List[str] = None) -> Optional[Dict]:
 		"""Find element by visible text using semantic mapping with improved hierarchical fallback strategies."""
 		if not target_text:
@@ -345,14 +415,17 @@ class SemanticWorkflowExecutor:
 
 		# Enhanced fallback strategies for repeated elements
 		target_lower = target_text.lower()
+		index = self.semantic_extractor.get_mapping_index(self.current_mapping)
 
 		# Strategy 1: Try to find by hierarchical selector (if available and more specific)
 		best_hierarchical_match = None
 		best_hierarchical_score = 0
+		matched_text = ''
 
-		for text, element_info in self.current_mapping.items():
-			text_lower = text.lower()
-			original_text = element_info.get('original_text', '').lower()
+		for entry in index.containment_candidates(target_lower):
+			text_lower = entry.text_lower
+			original_text = entry.original_lower
+			element_info = entry.element_info
 
 			# Check if target matches either the full text or original text
 			text_match_score = 0
@@ -386,25 +459,21 @@ class SemanticWorkflowExecutor:
 					if combined_score > best_hierarchical_score:
 						best_hierarchical_match = element_info
 						best_hierarchical_score = combined_score
+						matched_text = entry.text
 
 		if best_hierarchical_match:
-			# Find the corresponding text key for logging
-			matched_text = ''
-			for text, element_info in self.current_mapping.items():
-				if element_info == best_hierarchical_match:
-					matched_text = text
-					break
 			logger.info(
 				f"Found element by hierarchical selector: '{target_text}' -> '{matched_text}' (score: {best_hierarchical_score:.2f})"
 			)
 			return best_hierarchical_match
 
 		# Strategy 2: Try partial matches with different strategies (including label_text for input fields)
-		for text, element_info in self.current_mapping.items():
-			text_lower = text.lower()
-			original_text = element_info.get('original_text', '').lower()
+		for entry in index.containment_candidates(target_lower, include_labels=True):
+			text_lower = entry.text_lower
+			original_text = entry.original_lower
 			# IMPORTANT: Check label_text for input fields (labels are in separate elements)
-			label_text = element_info.get('label_text', '').lower()
+			label_text = entry.label_lower
+			element_info = entry.element_info
 
 			# Check if target text is contained in element text, original text, OR label text
 			if (
@@ -422,7 +491,7 @@ class SemanticWorkflowExecutor:
 						return element_info
 
 				# For other elements, use the match
-				logger.info(f"Found element by partial text match: '{target_text}' -> '{text}'")
+				logger.info(f"Found element by partial text match: '{target_text}' -> '{entry.text}'")
 				return element_info
 
 		# Strategy 3: Try to find by checking common form patterns (original fallback)
@@ -430,27 +499,19 @@ class SemanticWorkflowExecutor:
 		best_match = None
 		best_score = 0
 
-		for text, element_info in self.current_mapping.items():
-			text_words = text.lower().split()
-			original_words = element_info.get('original_text', '').lower().split()
-
+		for entry in index.word_candidates(target_words):
 			# Calculate word overlap score for both full text and original text
-			for word_set in [text_words, original_words]:
-				if word_set:
-					overlap = len(set(target_words) & set(word_set))
+			for word_list, word_set in [(entry.text_words, entry.text_word_set), (entry.original_words, entry.original_word_set)]:
+				if word_list:
+					overlap = len(set(target_words) & word_set)
 					if overlap > 0:
-						score = overlap / max(len(target_words), len(word_set))
+						score = overlap / max(len(target_words), len(word_list))
 						if score > best_score and score > 0.3:  # At least 30% overlap
-							best_match = element_info
+							best_match = entry.element_info
 							best_score = score
+							matched_text = entry.text
 
 		if best_match:
-			# Find the corresponding text key for logging
-			matched_text = ''
-			for text, element_info in self.current_mapping.items():
-				if element_info == best_match:
-					matched_text = text
-					break
 			logger.info(f"Found element by word overlap: '{target_text}' -> '{matched_text}' (score: {best_score:.2f})")
 			return best_match
 
@@ -895,8 +956,9 @@ class SemanticWorkflowExecutor:
 		# Perform navigation
 		await page.goto(step.url)
 
-		# Wait for page to load and dynamic content (SPAs, etc.)
-		await asyncio.sleep(3)
+		# Wait for page to load and dynamic content (SPAs, etc.) to settle
+		readiness = await wait_for_page_ready(page, timeout=self.page_ready_timeout)
+		logger.info(f'Page {readiness["status"]} after {readiness["elapsed"]}ms')
 
 		# Wait for common form elements to be present (indicates page is ready)
 		try:
@@ -1398,7 +1460,7 @@ class SemanticWorkflowExecutor:
 								logger.info(f'🔄 Detected submit button (type={button_type}), will wait for navigation')
 
 								# Give form state time to settle before submitting (important for React forms)
-								await asyncio.sleep(0.5)
+								await traced_sleep(0.5)
 
 								# Get current URL before clicking
 								current_url = await page.get_url()
@@ -1410,7 +1472,7 @@ class SemanticWorkflowExecutor:
 									logger.info(f'✅ Clicked submit button, waiting for navigation from {current_url}')
 
 									# Wait for navigation to complete (up to 5 seconds)
-									await asyncio.sleep(2)  # Give page time to start navigating
+									await traced_sleep(2)  # Give page time to start navigating
 									new_url = await page.get_url()
 
 									if new_url != current_url:
@@ -1423,7 +1485,7 @@ class SemanticWorkflowExecutor:
 										)
 
 										# Wait a bit more for dynamic content to load
-										await asyncio.sleep(1)
+										await traced_sleep(1)
 
 										# For same-page updates, assume success if no validation errors
 										# The semantic mapping will be refreshed before the next step
@@ -1442,7 +1504,7 @@ class SemanticWorkflowExecutor:
 								# Regular button click
 								await button_element.click()
 								logger.info(f"✅ Successfully clicked button by text content: '{target_text}'")
-								await asyncio.sleep(1)
+								await traced_sleep(1)
 								return True
 						elif len(matching_buttons) > 1:
 							# Multiple matches, use the first one
@@ -1451,7 +1513,7 @@ class SemanticWorkflowExecutor:
 							)
 							await matching_buttons[0].click()
 							# Wait for potential navigation
-							await asyncio.sleep(1)
+							await traced_sleep(1)
 							return True
 						else:
 							logger.warning(f"❌ No buttons found with text containing '{target_text}'")
@@ -1756,7 +1818,7 @@ class SemanticWorkflowExecutor:
 						await element.fill('')  # Clear first
 						await asyncio.sleep(0.1)
 						await element.fill(step.value)
-						await asyncio.sleep(0.3)
+						await traced_sleep(0.3)
 					except Exception as fill_error:
 						logger.debug(f'Element {idx} fill failed: {fill_error}')
 						if idx < len(elements_to_try) - 1:
@@ -2161,6 +2223,28 @@ class SemanticWorkflowExecutor:
 		else:
 			raise Exception(f'Unsupported step type: {step.type}')
 
+	async def finish(self) -> None:
+		"""Settle verifications still queued at workflow end; raises if one of them failed."""
+		if self.step_verifier:
+			self._raise_for_failed_ai_verdicts(await self.step_verifier.flush())
+
+	def discard_pending_verifications(self) -> None:
+		"""Drop verifications still queued when a run ends early, so they can't fail the next run on another page."""
+		if self.step_verifier:
+			dropped = self.step_verifier.discard_pending()
+			if dropped:
+				logger.info(f'Dropped {dropped} queued AI verification(s) from the unfinished run')
+
+	def _raise_for_failed_ai_verdicts(self, verdicts: List[AIVerdict]) -> None:
+		for verdict in verdicts:
+			if verdict.passed is None:
+				logger.warning(f'⚠️ AI verification uncertain for step "{verdict.step_description}": {verdict.detail}')
+		failed = [verdict for verdict in verdicts if verdict.passed is False]
+		if failed:
+			details = '; '.join(f'"{verdict.step_description}": {verdict.detail}' for verdict in failed)
+			logger.error(f'❌ AI verification failed for earlier step(s): {details}')
+			raise Exception(f'AI verification failed for earlier step(s): {details}')
+
 	async def print_semantic_mapping(self) -> None:
 		"""Print current semantic mapping for debugging."""
 		if not self.current_mapping:
@@ -2189,6 +2273,10 @@ class SemanticWorkflowExecutor:
 			logger.error(error_msg)
 			raise Exception(error_msg)
 
+		# Queued AI verifications of earlier steps are settled before a step that commits the page
+		if self.step_verifier:
+			self._raise_for_failed_ai_verdicts(await self.step_verifier.checkpoint(step))
+
 		last_exception = None
 		last_result = None
 		pre_step_state = None
@@ -2200,18 +2288,22 @@ class SemanticWorkflowExecutor:
 					# Refresh semantic mapping before retry
 					await self._refresh_semantic_mapping()
 					# Small delay before retry
-					await asyncio.sleep(1)
+					await traced_sleep(1)
 
 				# Capture state before step execution (for deterministic verification)
 				if self.step_verifier:
-					pre_step_state = await self.step_verifier.capture_pre_step_state(self.browser)
+					with span('capture_pre_step_state', CATEGORY_VERIFICATION):
+						pre_step_state = await self.step_verifier.capture_pre_step_state(self.browser)
 
 				# Execute the step
-				result = await step_executor()
+				with span(f'{getattr(step, "type", "step")} action', CATEGORY_ACTION, attempt=attempt):
+					result = await step_executor()
 				last_result = result
 
-				# Check for validation errors immediately after execution
-				validation_errors = await self._detect_form_validation_errors()
+				# Check for validation errors immediately after execution (skipped for steps that can't cause them)
+				validation_errors = {}
+				if getattr(step, 'type', None) not in self.validation_scan_skip_step_types:
+					validation_errors = await self._detect_form_validation_errors()
 				if validation_errors:
 					logger.warning(f'⚠️ Form validation errors detected after step execution: {validation_errors}')
 					if attempt < self.max_retries:
@@ -2332,23 +2424,26 @@ class SemanticWorkflowExecutor:
 
 			# Capture error screenshot for debugging
 			try:
-				from pathlib import Path
-
-				# Create screenshots directory if it doesn't exist
-				screenshot_dir = Path('./.workflow_screenshots')
-				screenshot_dir.mkdir(exist_ok=True)
-
-				# Generate unique screenshot filename
-				from datetime import datetime
+				step_desc = step.description if hasattr(step, 'description') else 'unknown'
+				if self.screenshot_pipeline is not None:
+					queued_path = await self.screenshot_pipeline.capture(
+						self.browser, self.current_step_index, step_desc, prefix='error'
+					)
+					screenshot_path = str(queued_path) if queued_path else None
+				else:
+					options = ScreenshotOptions(skip_unchanged=False)
+					data = await capture_screenshot(self.browser, options)
 
-				timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-				step_desc = step.description[:30].replace(' ', '_') if hasattr(step, 'description') else 'unknown'
-				screenshot_filename = f'error_{timestamp}_step{self.current_step_index}_{step_desc}.png'
-				screenshot_path = str(screenshot_dir / screenshot_filename)
+					# Create screenshots directory if it doesn't exist
+					screenshot_dir = Path('./.workflow_screenshots')
+					screenshot_dir.mkdir(exist_ok=True)
 
-				# Capture screenshot
-				await page.screenshot(path=screenshot_path)
-				logger.info(f'📸 Error screenshot saved: {screenshot_path}')
+					timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+					safe_desc = step_desc[:30].replace(' ', '_')
+					screenshot_filename = f'error_{timestamp}_step{self.current_step_index}_{safe_desc}.jpg'
+					(screenshot_dir / screenshot_filename).write_bytes(base64.b64decode(data))
+					screenshot_path = str(screenshot_dir / screenshot_filename)
+					logger.info(f'📸 Error screenshot saved: {screenshot_path}')
 
 			except Exception as screenshot_error:
 				logger.debug(f'Failed to capture error screenshot: {screenshot_error}')
@@ -2389,6 +2484,7 @@ class SemanticWorkflowExecutor:
 
 		return last_result
 
+	@traced(CATEGORY_VERIFICATION)
 	async def _detect_form_validation_errors(self) -> Dict[str, str]:
 		"""Detect form validation errors that might indicate invalid input data."""
 		from workflow_use.workflow.validation_utils import get_all_validation_errors
@@ -2591,7 +2687,7 @@ class SemanticWorkflowExecutor:
 			page = await self.browser.get_current_page()
 
 			# Small delay to let the click effect take place
-			await asyncio.sleep(0.5)
+			await traced_sleep(0.5)
 
 			# Check for validation errors first - if there are validation errors after a button click,
 			# it usually means the click didn't achieve its intended purpose
@@ -2686,7 +2782,7 @@ class SemanticWorkflowExecutor:
 				or any(keyword in target_text.lower() for keyword in ['submit', 'next', 'continue', 'save', 'finish'])
 			):
 				# Wait a bit for any page changes
-				await asyncio.sleep(1)
+				await traced_sleep(1)
 
 				# Check for validation errors again after waiting (some forms show errors after delay)
 				validation_errors = await self._detect_form_validation_errors()
@@ -2782,7 +2878,7 @@ class SemanticWorkflowExecutor:
 			page = await self.browser.get_current_page()
 
 			# Small delay to let the input effect take place
-			await asyncio.sleep(0.3)
+			await traced_sleep(0.3)
 
 			elements = await self._get_elements_by_selector(selector)
 
@@ -2899,11 +2995,9 @@ class SemanticWorkflowExecutor:
 			# Limit content size to avoid token limits (keep most relevant content)
 			max_content_length = 50000  # Adjust based on your LLM's context window
 			if len(markdown_content) > max_content_length:
-				# Try to keep the beginning and end, which often contain the most relevant info
-				content_start = markdown_content[: max_content_length // 2]
-				content_end = markdown_content[-(max_content_length // 2) :]
-				markdown_content = content_start + '\n\n... [CONTENT TRUNCATED] ...\n\n' + content_end
-				logger.info(f'Content truncated to {max_content_length} characters for LLM processing')
+				# Keep the sections that best match the goal, wherever they are on the page
+				markdown_content = select_relevant_content(markdown_content, step.extractionGoal, max_content_length)
+				logger.info(f'Content reduced to the most relevant {len(markdown_content)} characters for LLM processing')
 
 			# Create extraction prompt
 			extraction_prompt = """You are an expert at extracting structured information from web pages.
@@ -2930,25 +3024,45 @@ Instructions:
 EXTRACTED INFORMATION:"""
 
 			# Format the prompt with page data
+			page_url = await page.get_url()
+			page_title = await page.get_title()
 			formatted_prompt = extraction_prompt.format(
-				goal=step.extractionGoal, url=await page.get_url(), title=await page.get_title(), content=markdown_content
+				goal=step.extractionGoal, url=page_url, title=page_title, content=markdown_content
 			)
 
+			# Reuse a previous answer for the same model, goal, URL, title and page content
+			cache_key = None
+			cached_content = None
+			if self.extraction_cache is not None:
+				model_identity = llm_cache_identity(self.page_extraction_llm)
+				cache_key = self.extraction_cache.make_key(
+					model_identity, 'semantic_extract', step.extractionGoal, markdown_content, url=page_url, title=page_title
+				)
+				cached_content = self.extraction_cache.get(cache_key)
+
 			# Call LLM for extraction
-			logger.info('Sending extraction request to LLM...')
 			try:
-				llm_response = await self.page_extraction_llm.ainvoke(formatted_prompt)
-				extracted_content = llm_response.content if hasattr(llm_response, 'content') else str(llm_response)
+				if cached_content is not None:
+					logger.info('♻️  Using cached extraction result')
+					extracted_content = cached_content
+				else:
+					logger.info('Sending extraction request to LLM...')
+					with span('extraction llm', CATEGORY_LLM):
+						llm_response = await self.page_extraction_llm.ainvoke(formatted_prompt)
+					extracted_content = llm_response.content if hasattr(llm_response, 'content') else str(llm_response)
+					if cache_key is not None:
+						self.extraction_cache.put(cache_key, extracted_content, model=model_identity, goal=step.extractionGoal)
 
 				# Create structured extracted data
 				extracted_data = {
 					'extraction_goal': step.extractionGoal,
-					'page_url': await page.get_url(),
-					'page_title': await page.get_title(),
+					'page_url': page_url,
+					'page_title': page_title,
 					'extracted_content': extracted_content,
 					'content_length': len(markdown_content),
 					'timestamp': asyncio.get_event_loop().time(),
 					'extraction_method': 'AI-powered',
+					'cached': cached_content is not None,
 				}
 
 				msg = f'🤖 AI Extraction Complete: {step.extractionGoal}\n\nExtracted Information:\n{extracted_content}'
@@ -3385,7 +3499,7 @@ EXTRACTED INFORMATION:"""
 
 			except Exception:
 				# Wait for dynamic content to load
-				await asyncio.sleep(timeout / 1000)  # Convert ms to seconds
+				await traced_sleep(timeout / 1000)  # Convert ms to seconds
 				logger.info('Dynamic content loading completed (timeout-based)')
 				return True
 
@@ -1,10 +1,15 @@
 import asyncio
 import logging
 import re
+import uuid
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import aiofiles
 
+from workflow_use.workflow.mapping_cache import SemanticMappingCache, get_page_fingerprint
+from workflow_use.workflow.semantic_element import SemanticElement
+from workflow_use.workflow.semantic_index import SemanticMappingIndex
+
 if TYPE_CHECKING:
 	from browser_use.actor.page import Page
 
@@ -14,8 +19,16 @@ logger = logging.getLogger(__name__)
 class SemanticExtractor:
 	"""Extracts semantic mappings from HTML pages by mapping visible text to deterministic selectors."""
 
-	def __init__(self):
+	def __init__(self, mapping_cache: Optional[SemanticMappingCache] = None):
 		self.element_counters = {'input': 0, 'button': 0, 'select': 0, 'textarea': 0, 'a': 0, 'radio': 0, 'checkbox': 0}
+		# Incremental extraction state: element data keyed by in-page tracker id, and the last mapping built from it
+		self._tracker_token = uuid.uuid4().hex
+		self._element_cache: Dict[int, Dict] = {}
+		self._incremental_mapping: Optional[Dict[str, Dict]] = None
+		# Lookup index for the most recently extracted (or queried) mapping
+		self._mapping_index: Optional[SemanticMappingIndex] = None
+		# Optional mapping cache keyed by URL and DOM fingerprint, shareable across extractors
+		self.mapping_cache = mapping_cache
 
 	def _reset_counters(self):
 		"""Reset element counters for a new page."""
@@ -205,12 +218,23 @@ class SemanticExtractor:
 
 	async def extract_interactive_elements(self, page: 'Page') -> List[Dict]:
 		"""Extract interactive elements with enhanced context for complex UI widgets."""
+		result = await self._evaluate_extraction(page)
+		return result.get('elements', [])
+
+	async def _evaluate_extraction(self, page: 'Page', incremental: Optional[Dict] = None) -> Dict:
+		"""Run the in-page extraction script and return its raw result.
+
+		When ``incremental`` is given ({"token": str, "reset": bool}), a MutationObserver installed once per
+		document tracks dirty subtrees and only elements inside them (or never seen before) are re-extracted.
+		The result then carries a ``status`` ("full", "delta" or "unchanged"), the ``order`` of element ids and,
+		for clean elements, ``refreshed`` [id, label_text, x, y, width, height] entries.
+		"""
 
 		# Add debugging flag
 		debug_mode = False  # Set to True for debugging
 
 		js_code = """
-        (debugMode = false) => {
+        (debugMode = false, incremental = null) => {
             const debugLog = [];
             
             function debugMessage(msg, data = null) {
@@ -248,6 +272,46 @@ class SemanticExtractor:
             const elements = [];
             let allElements;
             
+            // Incremental mode: a MutationObserver installed once per document records dirty subtrees
+            // between extractions, so clean elements that were already extracted can be skipped.
+            let tracker = null;
+            const order = [];
+            const refreshed = [];
+            if (incremental) {
+                tracker = window.__wfSemanticTracker;
+                if (!tracker) {
+                    tracker = { nextId: 1, known: new Set(), lastOrder: '', dirty: new Set(), full: true, token: null };
+                    tracker.observer = new MutationObserver((records) => {
+                        if (tracker.full) return;
+                        for (const record of records) {
+                            const node = record.target.nodeType === 1 ? record.target : record.target.parentElement;
+                            if (node) tracker.dirty.add(node);
+                        }
+                        if (tracker.dirty.size > 100) {
+                            tracker.full = true;
+                            tracker.dirty.clear();
+                        }
+                    });
+                    tracker.observer.observe(document.documentElement, {
+                        subtree: true, childList: true, attributes: true, characterData: true
+                    });
+                    window.__wfSemanticTracker = tracker;
+                }
+                if (incremental.reset || tracker.token !== incremental.token) {
+                    tracker.full = true;
+                }
+                tracker.token = incremental.token;
+            }
+            const dirtyRoots = tracker && !tracker.full ? Array.from(tracker.dirty).filter(node => node.isConnected) : [];
+            
+            function isClean(el) {
+                if (!tracker || tracker.full || !el.__wfSemanticId || !tracker.known.has(el.__wfSemanticId)) return false;
+                for (const root of dirtyRoots) {
+                    if (root.contains(el) || el.contains(root)) return false;
+                }
+                return true;
+            }
+            
             try {
                 allElements = document.querySelectorAll(interactiveSelectors);
                 debugMessage(`Found ${allElements.length} potential interactive elements`);
@@ -646,6 +710,15 @@ class SemanticExtractor:
                 try {
                     const rect = el.getBoundingClientRect();
                     
+                    // Clean elements keep the data extracted last time, except the fields that can change without
+                    // a mutation inside their subtree: layout (scrolling, resizes) and text of a separate <label>
+                    if (tracker && rect.width !== 0 && rect.height !== 0 && isClean(el)) {
+                        order.push(el.__wfSemanticId);
+                        refreshed.push([el.__wfSemanticId, safeGetLabelText(el), Math.round(rect.x), Math.round(rect.y),
+                                        Math.round(rect.width), Math.round(rect.height)]);
+                        return;
+                    }
+                    
                     // Skip hidden elements
                     if (rect.width === 0 || rect.height === 0 || 
                         getComputedStyle(el).visibility === 'hidden' ||
@@ -743,6 +816,12 @@ class SemanticExtractor:
                         }
                     };
                     
+                    if (tracker) {
+                        if (!el.__wfSemanticId) el.__wfSemanticId = tracker.nextId++;
+                        elementData.wf_id = el.__wfSemanticId;
+                        order.push(el.__wfSemanticId);
+                    }
+                    
                     elements.push(elementData);
                     processedCount++;
                     
@@ -762,8 +841,21 @@ class SemanticExtractor:
                 total: allElements.length 
             });
             
+            let status = null;
+            if (tracker) {
+                const orderKey = order.join(',');
+                status = tracker.full ? 'full' : (elements.length === 0 && orderKey === tracker.lastOrder ? 'unchanged' : 'delta');
+                tracker.known = new Set(order);
+                tracker.lastOrder = orderKey;
+                tracker.dirty.clear();
+                tracker.full = false;
+            }
+            
             return {
                 elements: elements,
+                status: status,
+                order: order,
+                refreshed: refreshed,
                 debugLog: debugLog,
                 stats: {
                     processed: processedCount,
@@ -775,7 +867,7 @@ class SemanticExtractor:
         """
 
 		try:
-			result_str = await page.evaluate(js_code, debug_mode)
+			result_str = await page.evaluate(js_code, debug_mode, incremental)
 
 			# Parse the JSON result
 			import json
@@ -798,7 +890,7 @@ class SemanticExtractor:
 				if 'error' in result:
 					logger.error(f'JavaScript extraction error: {result["error"]}')
 
-			return result.get('elements', [])
+			return result
 
 		except Exception as e:
 			logger.error(f'Failed to extract interactive elements: {e}')
@@ -811,20 +903,103 @@ class SemanticExtractor:
 					await f.write(f'Timestamp: {asyncio.get_event_loop().time()}\n')
 				logger.info(f'Error information saved to: {error_file}')
 
-			return []
+			return {'elements': []}
+
+	async def _extract_elements_incrementally(self, page: 'Page') -> Optional[List[Dict]]:
+		"""Re-extract only elements whose subtree changed since the previous call.
 
-	async def extract_semantic_mapping(self, page: 'Page') -> Dict[str, Dict]:
+		Returns the full ordered element list, or None when the page has not changed.
+		"""
+		for attempt in range(2):
+			result = await self._evaluate_extraction(
+				page, {'token': self._tracker_token, 'reset': attempt > 0 or not self._element_cache}
+			)
+			status = result.get('status')
+			refreshed = self._refresh_clean_elements(result.get('refreshed', [])) if status != 'full' else False
+
+			if status == 'unchanged' and self._element_cache and not refreshed:
+				return None
+			if status not in ('full', 'delta', 'unchanged'):
+				# Extraction failed in-page; drop the cache so the next call starts over
+				self._element_cache = {}
+				return result.get('elements', [])
+
+			changed = {element_info['wf_id']: element_info for element_info in result.get('elements', [])}
+			cache = {} if status == 'full' else self._element_cache
+			elements = []
+			for element_id in result.get('order', []):
+				element_info = changed.get(element_id) or cache.get(element_id)
+				if element_info is None:
+					break
+				elements.append(element_info)
+			else:
+				self._element_cache = {element_info['wf_id']: element_info for element_info in elements}
+				logger.debug(f'Incremental extraction ({status}): {len(changed)} of {len(elements)} elements re-extracted')
+				return elements
+
+			# The page tracker knows elements this extractor never received; force a full extraction
+			logger.debug('Incremental extraction out of sync with page tracker, retrying with full extraction')
+
+		self._element_cache = {}
+		return await self.extract_interactive_elements(page)
+
+	def _refresh_clean_elements(self, refreshed: List[List]) -> bool:
+		"""Update cached label text and position of clean elements; returns whether any of them changed."""
+		changed = False
+		for element_id, label_text, x, y, width, height in refreshed:
+			element_info = self._element_cache.get(element_id)
+			if element_info is None:
+				continue
+			position = {'x': x, 'y': y, 'width': width, 'height': height}
+			if element_info.get('label_text', '') != label_text or element_info.get('position', {}) != position:
+				# Replace rather than mutate: mappings built earlier keep their own element data
+				self._element_cache[element_id] = {**element_info, 'label_text': label_text, 'position': position}
+				changed = True
+		return changed
+
+	async def extract_semantic_mapping(self, page: 'Page', incremental: bool = False) -> Dict[str, Dict]:
 		"""Extract semantic mapping from the current page.
 
+		With ``incremental=True`` only changed subtrees are re-extracted in the page, and the previously
+		returned mapping object is reused as-is when nothing changed. With a ``mapping_cache`` a page state
+		seen before (same URL and DOM fingerprint) returns its cached mapping without extraction.
+
 		Returns mapping: visible_text -> {"class": "", "id": "", "selectors": ""}
 		"""
-		self._reset_counters()
+		if self.mapping_cache is None:
+			return await self._build_semantic_mapping(page, incremental)
+
+		cache_key = await get_page_fingerprint(page)
+		cached = self.mapping_cache.get(cache_key) if cache_key else None
+		if cached is not None:
+			mapping, self._mapping_index = cached
+			logger.debug(f'Reusing cached semantic mapping for {cache_key[0]} ({len(mapping)} elements)')
+			return mapping
+
+		mapping = await self._build_semantic_mapping(page, incremental)
 
-		# Get all interactive elements with enhanced context
-		elements = await self.extract_interactive_elements(page)
+		# Only cache when the page did not change while it was being extracted
+		if cache_key and await get_page_fingerprint(page) == cache_key:
+			self.mapping_cache.put(cache_key, mapping, self._mapping_index)
+		return mapping
+
+	async def _build_semantic_mapping(self, page: 'Page', incremental: bool) -> Dict[str, Dict]:
+		"""Extract elements from the page and build the text -> selector mapping."""
+		if incremental:
+			elements = await self._extract_elements_incrementally(page)
+			if elements is None and self._incremental_mapping is not None:
+				return self._incremental_mapping
+			if elements is None:
+				elements = list(self._element_cache.values())
+		else:
+			# Get all interactive elements with enhanced context
+			elements = await self.extract_interactive_elements(page)
+
+		self._reset_counters()
 
 		mapping = {}
 		existing_keys = set()
+		log_mappings = logger.isEnabledFor(logging.DEBUG)
 
 		for element_info in elements:
 			# Determine element type and generate ID
@@ -841,81 +1016,76 @@ class SemanticExtractor:
 			final_text = self._handle_duplicate_text(text, existing_keys, element_info)
 			existing_keys.add(final_text)
 
-			# Store mapping with enhanced selector options
-			mapping[final_text] = {
-				'class': element_info.get('class', ''),
-				'id': element_info.get('id', ''),
-				'selectors': element_info['css_selector'],
-				'hierarchical_selector': element_info.get('hierarchical_selector', element_info['css_selector']),
-				'fallback_selector': element_info.get('fallback_selector', element_info['css_selector']),
-				'text_xpath': element_info.get('text_xpath', ''),
-				# Additional info for internal use
-				'element_type': element_type,
-				'deterministic_id': element_id,
-				'original_text': text,
-				'label_text': element_info.get('label_text', ''),  # IMPORTANT: Include label text for input field matching
-				'dom_path': element_info.get('dom_path', ''),
-				'container_context': element_info.get('container_context', {}),
-				'sibling_context': element_info.get('sibling_context', {}),
-				'position': element_info.get('position', {}),
-			}
-
-			logger.debug(f"Mapped '{final_text}' -> {element_info['css_selector']}")
+			# Store mapping with enhanced selector options (compact record, readable like a dict)
+			mapping[final_text] = SemanticElement.from_extracted(element_info, element_type, element_id, text)
+
+			if log_mappings:
+				logger.debug(f"Mapped '{final_text}' -> {element_info['css_selector']}")
+
+		if incremental:
+			self._incremental_mapping = mapping
+		self._mapping_index = SemanticMappingIndex(mapping)
 
 		return mapping
 
+	def get_mapping_index(self, mapping: Dict[str, Dict]) -> SemanticMappingIndex:
+		"""Return the lookup index for ``mapping``, building it if the cached one belongs to another mapping."""
+		if self._mapping_index is None or not self._mapping_index.matches(mapping):
+			self._mapping_index = SemanticMappingIndex(mapping)
+		return self._mapping_index
+
 	def find_element_by_text(self, mapping: Dict[str, Dict], target_text: str) -> Optional[Dict]:
 		"""Find element by text with intelligent fuzzy matching and hierarchical context understanding."""
 		if not target_text or not mapping:
 			return None
 
+		index = self.get_mapping_index(mapping)
 		target_lower = target_text.lower().strip()
 
 		# Strategy 1: Exact match (case-insensitive)
-		for text, element_info in mapping.items():
-			if text.lower() == target_lower:
-				logger.debug(f"Exact match found: '{target_text}' -> '{text}'")
-				return element_info
+		entry = index.exact(target_lower)
+		if entry:
+			logger.debug(f"Exact match found: '{target_text}' -> '{entry.text}'")
+			return entry.element_info
 
 		# Strategy 2: Check if target looks like an element ID or name attribute
 		if target_text.replace('_', '').replace('-', '').isalnum():
-			for text, element_info in mapping.items():
-				selectors = element_info.get('selectors', '')
-				# Check if the selector contains the target as an ID or name
-				if (
-					f'#{target_text}' in selectors
-					or f'[name="{target_text}"]' in selectors
-					or f'[id="{target_text}"]' in selectors
-				):
-					logger.debug(f"ID/name match found: '{target_text}' -> '{text}' (selector: {selectors})")
-					return element_info
+			# Check if the selector contains the target as an ID or name
+			entry = index.attribute_match(target_text)
+			if entry:
+				logger.debug(
+					f"ID/name match found: '{target_text}' -> '{entry.text}' (selector: {entry.element_info.get('selectors', '')})"
+				)
+				return entry.element_info
 
 		# Strategy 3: Hierarchical context matching
 		# If target contains context information like "Submit (in Contact Form)", parse it
 		if '(' in target_text and target_text.endswith(')'):
 			base_text = target_text.split('(')[0].strip()
 			context_part = target_text.split('(')[1].rstrip(')').strip()
+			base_lower = base_text.lower()
+			context_lower = context_part.lower()
 
 			# Look for elements that match both the base text and context
 			candidates = []
-			for text, element_info in mapping.items():
-				if base_text.lower() in text.lower():
+			for entry in index.entries:
+				if base_lower in entry.text_lower:
 					# Check if the context matches
-					if context_part.lower() in text.lower():
-						candidates.append((text, element_info, 1.0))  # High score for full context match
+					if context_lower in entry.text_lower:
+						candidates.append((entry.text, entry.element_info, 1.0))  # High score for full context match
 					else:
 						# Check if context matches container or DOM path
-						container_context = element_info.get('container_context', {})
-						dom_path = element_info.get('dom_path', '')
+						container_context = entry.element_info.get('container_context', {})
+						dom_path = entry.element_info.get('dom_path', '')
 
 						context_match = False
-						if container_context and context_part.lower() in str(container_context).lower():
+						if container_context and context_lower in str(container_context).lower():
 							context_match = True
-						elif context_part.lower() in dom_path.lower():
+						elif context_lower in dom_path.lower():
 							context_match = True
 
 						if context_match:
-							candidates.append((text, element_info, 0.8))  # Good score for context match
+							candidates.append((entry.text, entry.element_info, 0.8))  # Good score for context match
 
 			if candidates:
 				# Return the best candidate
@@ -925,13 +1095,19 @@ class SemanticExtractor:
 				return best_element
 
 		# Strategy 4: Enhanced fuzzy text matching with hierarchical scoring
+		# Only entries sharing a word with the target, or long enough to clear the threshold by containment, can score
 		best_match = None
 		best_score = 0.0
 		best_text = ''
+		target_words = set(target_lower.split())
 
-		for text, element_info in mapping.items():
-			text_lower = text.lower()
-			original_text = element_info.get('original_text', '').lower()
+		candidates = {entry.seq: entry for entry in index.containment_candidates(target_lower, min_length_ratio=0.3)}
+		candidates.update((entry.seq, entry) for entry in index.word_candidates(target_words))
+
+		for seq in sorted(candidates):
+			entry = candidates[seq]
+			text_lower = entry.text_lower
+			original_text = entry.original_lower
 
 			# Calculate different types of matches
 			scores = []
@@ -949,13 +1125,8 @@ class SemanticExtractor:
 				if original_text in target_lower:
 					scores.append(len(original_text) / len(target_lower))
 
-			# Word-based matching
-			target_words = set(target_lower.split())
-			text_words = set(text_lower.split())
-			original_words = set(original_text.split()) if original_text else set()
-
-			# Check against both full text and original text
-			for word_set in [text_words, original_words]:
+			# Word-based matching against both full text and original text
+			for word_set in [entry.text_word_set, entry.original_word_set]:
 				if target_words and word_set:
 					# Calculate Jaccard similarity (intersection over union)
 					intersection = len(target_words & word_set)
@@ -973,9 +1144,9 @@ class SemanticExtractor:
 			if scores:
 				element_score = max(scores)
 				if element_score > best_score and element_score > 0.3:  # Minimum threshold
-					best_match = element_info
+					best_match = entry.element_info
 					best_score = element_score
-					best_text = text
+					best_text = entry.text
 
 		if best_match:
 			logger.debug(f"Fuzzy match found: '{target_text}' -> '{best_text}' (score: {best_score:.2f})")
@@ -986,28 +1157,25 @@ class SemanticExtractor:
 		if len(target_words) == 1:  # Single word target
 			word = target_words[0]
 
-			for text, element_info in mapping.items():
-				text_lower = text.lower()
-				original_text = element_info.get('original_text', '').lower()
-
-				# Check both full text and original text for pattern matching
-				for check_text in [text_lower, original_text]:
-					if not check_text:
-						continue
+			# Split camelCase or snake_case
+			word_parts = re.findall(r'[a-z]+|[A-Z][a-z]*', word)
+			word_parts = [part.lower() for part in word_parts if part]
 
-					# Split camelCase or snake_case
-					word_parts = re.findall(r'[a-z]+|[A-Z][a-z]*', word)
-					word_parts = [part.lower() for part in word_parts if part]
+			if word_parts:
+				for entry in index.entries:
+					# Check both full text and original text for pattern matching
+					for check_text in [entry.text_lower, entry.original_lower]:
+						if not check_text:
+							continue
 
-					if word_parts:
 						# Check if all parts of the target word appear in the element text
 						parts_found = sum(1 for part in word_parts if part in check_text)
 						if parts_found >= len(word_parts) * 0.7:  # At least 70% of parts match
 							score = parts_found / len(word_parts)
 							if score > best_score:
-								best_match = element_info
+								best_match = entry.element_info
 								best_score = score
-								best_text = text
+								best_text = entry.text
 
 		if best_match:
 			logger.debug(f"Pattern match found: '{target_text}' -> '{best_text}' (score: {best_score:.2f})")
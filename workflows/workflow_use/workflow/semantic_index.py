@@ -0,0 +1,191 @@
+"""
+Lookup index over a semantic mapping.
+
+Text lookups used to scan every mapping entry several times per call, lowercasing and
+splitting the same strings on each pass. The index precomputes those values once per
+mapping and narrows every lookup to the entries that can possibly match:
+
+- exact lowercase text -> first entry
+- word -> entries containing it (word overlap / Jaccard candidates)
+- character trigram -> entries containing it (target-in-text substring candidates)
+- lowercase text -> entries (text-in-target candidates, found by enumerating substrings of the target)
+- id / name attribute values from the selectors
+
+Candidates are always returned in mapping order so callers keep the original
+first-match-wins tie breaking.
+"""
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional
+
+# Targets longer than this are matched against length buckets instead of enumerating their substrings
+MAX_ENUMERATED_TARGET_LENGTH = 128
+
+
+class IndexedEntry:
+	"""A mapping entry with its lowercase text and word sets precomputed."""
+
+	__slots__ = (
+		'seq',
+		'text',
+		'element_info',
+		'text_lower',
+		'original_lower',
+		'label_lower',
+		'text_words',
+		'original_words',
+		'text_word_set',
+		'original_word_set',
+	)
+
+	def __init__(self, seq: int, text: str, element_info: Dict):
+		self.seq = seq
+		self.text = text
+		self.element_info = element_info
+		self.text_lower = text.lower()
+		self.original_lower = (element_info.get('original_text', '') or '').lower()
+		self.label_lower = (element_info.get('label_text', '') or '').lower()
+		self.text_words = self.text_lower.split()
+		self.original_words = self.original_lower.split()
+		self.text_word_set = frozenset(self.text_words)
+		self.original_word_set = frozenset(self.original_words)
+
+
+class SemanticMappingIndex:
+	"""Precomputed lookup structures for one semantic mapping."""
+
+	def __init__(self, mapping: Dict[str, Dict]):
+		self.mapping = mapping
+		self.size = len(mapping)
+		self.entries: List[IndexedEntry] = []
+		self._exact: Dict[str, IndexedEntry] = {}
+		self._by_field: Dict[str, List[IndexedEntry]] = {}
+		self._by_label: Dict[str, List[IndexedEntry]] = {}
+		self._by_length: Dict[int, List[IndexedEntry]] = {}
+		self._words: Dict[str, List[IndexedEntry]] = {}
+		self._trigrams: Dict[str, List[IndexedEntry]] = {}
+		self._attribute_values: Dict[str, List[IndexedEntry]] = {}
+		id_suffixes = []
+
+		for seq, (text, element_info) in enumerate(mapping.items()):
+			entry = IndexedEntry(seq, text, element_info)
+			self.entries.append(entry)
+			self._exact.setdefault(entry.text_lower, entry)
+
+			fields = {entry.text_lower, entry.original_lower}
+			for field in fields:
+				self._by_field.setdefault(field, []).append(entry)
+				self._by_length.setdefault(len(field), []).append(entry)
+			self._by_label.setdefault(entry.label_lower, []).append(entry)
+
+			for word in entry.text_word_set | entry.original_word_set:
+				self._words.setdefault(word, []).append(entry)
+
+			trigrams = set()
+			for field in fields | {entry.label_lower}:
+				trigrams.update(field[i : i + 3] for i in range(len(field) - 2))
+			for trigram in trigrams:
+				self._trigrams.setdefault(trigram, []).append(entry)
+
+			selectors = element_info.get('selectors', '') or ''
+			position = selectors.find('#')
+			while position != -1:
+				id_suffixes.append((selectors[position + 1 :], seq))
+				position = selectors.find('#', position + 1)
+			for attribute in ('name', 'id'):
+				marker = f'[{attribute}="'
+				start = selectors.find(marker)
+				while start != -1:
+					end = selectors.find('"]', start + len(marker))
+					if end == -1:
+						break
+					self._attribute_values.setdefault(selectors[start + len(marker) : end], []).append(entry)
+					start = selectors.find(marker, end)
+
+		id_suffixes.sort()
+		self._id_suffixes = id_suffixes
+
+	def matches(self, mapping: Dict[str, Dict]) -> bool:
+		"""Whether this index was built for ``mapping`` in its current state."""
+		return self.mapping is mapping and self.size == len(mapping)
+
+	def exact(self, text_lower: str) -> Optional[IndexedEntry]:
+		"""First entry whose lowercase key equals ``text_lower``."""
+		return self._exact.get(text_lower)
+
+	def attribute_match(self, target: str) -> Optional[IndexedEntry]:
+		"""First entry whose selectors contain ``#target``, ``[name="target"]`` or ``[id="target"]``."""
+		candidates = list(self._attribute_values.get(target, []))
+
+		# '#target' is a substring of the selectors exactly when some text following a '#' starts with target
+		position = bisect_left(self._id_suffixes, (target, -1))
+		while position < len(self._id_suffixes) and self._id_suffixes[position][0].startswith(target):
+			candidates.append(self.entries[self._id_suffixes[position][1]])
+			position += 1
+
+		return min(candidates, key=lambda entry: entry.seq) if candidates else None
+
+	def word_candidates(self, words: Iterable[str]) -> List[IndexedEntry]:
+		"""Entries sharing at least one word with ``words``, in mapping order."""
+		found: Dict[int, IndexedEntry] = {}
+		for word in set(words):
+			for entry in self._words.get(word, []):
+				found[entry.seq] = entry
+		return [found[seq] for seq in sorted(found)]
+
+	def containment_candidates(
+		self, target_lower: str, min_length_ratio: float = 0.0, include_labels: bool = False
+	) -> List[IndexedEntry]:
+		"""Superset of entries where the target contains, or is contained in, the text or original text.
+
+		Args:
+			target_lower: Lowercase target text
+			min_length_ratio: Only consider texts contained in the target if longer than this fraction of it
+			include_labels: Also consider label text
+
+		Returns:
+			Candidate entries in mapping order; callers still perform the exact containment checks
+		"""
+		length = len(target_lower)
+		if length == 0:
+			return list(self.entries)
+
+		found: Dict[int, IndexedEntry] = {}
+
+		# Target inside a field: every field containing it contains its rarest trigram
+		if length >= 3:
+			trigram_postings = [self._trigrams.get(target_lower[i : i + 3], []) for i in range(length - 2)]
+			for entry in min(trigram_postings, key=len):
+				found[entry.seq] = entry
+		else:
+			for entry in self.entries:
+				if (
+					target_lower in entry.text_lower
+					or target_lower in entry.original_lower
+					or (include_labels and target_lower in entry.label_lower)
+				):
+					found[entry.seq] = entry
+
+		# Field inside the target: look up every long enough substring of the target
+		min_length = int(length * min_length_ratio) + 1 if min_length_ratio > 0 else 0
+		if length <= MAX_ENUMERATED_TARGET_LENGTH:
+			substrings = {
+				target_lower[start : start + size] for size in range(min_length, length + 1) for start in range(length - size + 1)
+			}
+			for substring in substrings:
+				for entry in self._by_field.get(substring, []):
+					found[entry.seq] = entry
+				if include_labels:
+					for entry in self._by_label.get(substring, []):
+						found[entry.seq] = entry
+		else:
+			for size, entries in self._by_length.items():
+				if min_length <= size <= length:
+					for entry in entries:
+						found[entry.seq] = entry
+			if include_labels:
+				for entry in self.entries:
+					if len(entry.label_lower) <= length:
+						found[entry.seq] = entry
+
+		return [found[seq] for seq in sorted(found)]
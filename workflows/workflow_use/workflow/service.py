@@ -3,8 +3,9 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, TypeVar
+from typing import Any, Dict, Iterator, List, TypeVar
 from typing import cast as _cast
 
 import yaml
@@ -16,7 +17,7 @@ from browser_use.tools.views import NoParamsAction
 from pydantic import BaseModel, Field, create_model
 
 from workflow_use.controller.service import WorkflowController
-from workflow_use.controller.utils import get_best_element_handle
+from workflow_use.controller.utils import truncate_selector
 from workflow_use.schema.views import (
 	AgenticWorkflowStep,
 	DeterministicWorkflowStep,
@@ -24,14 +25,36 @@ from workflow_use.schema.views import (
 	WorkflowInputSchemaDefinition,
 	WorkflowStep,
 )
+from workflow_use.workflow.browser_session import BrowserSessionManager
+from workflow_use.workflow.content_ranking import select_relevant_content
+from workflow_use.workflow.debug_screenshots import DebugScreenshotPipeline, ScreenshotOptions
 from workflow_use.workflow.element_finder import ElementFinder
+from workflow_use.workflow.element_prefetch import selector_candidates, start_element_prefetch, wait_for_any_selector
+from workflow_use.workflow.extraction_cache import ExtractionCache, llm_cache_identity
+from workflow_use.workflow.mapping_cache import SemanticMappingCache
+from workflow_use.workflow.page_readiness import DEFAULT_PAGE_READY_TIMEOUT, wait_for_page_ready
 from workflow_use.workflow.prompts import AGENT_STEP_SYSTEM_PROMPT, STRUCTURED_OUTPUT_PROMPT
 from workflow_use.workflow.step_agent.controller import WorkflowStepAgentController
+from workflow_use.workflow.step_templates import StepTemplate
+from workflow_use.workflow.step_timings import StepTimingStore, measure_settle_time, step_timing_key
+from workflow_use.workflow.tracing import (
+	CATEGORY_ACTION,
+	CATEGORY_AGENT,
+	CATEGORY_ELEMENT,
+	CATEGORY_LLM,
+	CATEGORY_READINESS,
+	RunTrace,
+	span,
+	step_span,
+	traced,
+	traced_sleep,
+)
 from workflow_use.workflow.views import WorkflowRunOutput
 
 logger = logging.getLogger(__name__)
 
 WAIT_FOR_ELEMENT_TIMEOUT = 2500
+MAX_EXTRACTION_CONTENT_CHARS = 10000
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -52,6 +75,16 @@ class Workflow:
 		debug: bool = False,
 		debug_log_folder: str | Path | None = None,
 		step_wait_time: float | None = None,
+		session_manager: BrowserSessionManager | None = None,
+		mapping_cache: SemanticMappingCache | None = None,
+		extraction_cache: ExtractionCache | None = None,
+		use_extraction_cache: bool = True,
+		screenshot_options: ScreenshotOptions | None = None,
+		prefetch_next_element: bool = True,
+		trace: bool = False,
+		learn_wait_times: bool = False,
+		step_timings: StepTimingStore | None = None,
+		incremental_mapping: bool = False,
 	) -> None:
 		"""Initialize a new Workflow instance from a schema object.
 
@@ -65,6 +98,16 @@ class Workflow:
 			debug: Whether to enable debug mode (captures screenshots for each step)
 			debug_log_folder: Custom folder path for debug logs and screenshots (default: ./logs/workflow_debug)
 			step_wait_time: Time to wait between steps in seconds (default: uses workflow's default_wait_time or 0.1)
+			session_manager: Optional warm browser session shared across runs; its browser is used and never stopped by a run
+			mapping_cache: Optional semantic mapping cache to share with other workflows (default: one per workflow)
+			extraction_cache: Optional on-disk LLM extraction cache (default: ./tmp/extraction_cache)
+			use_extraction_cache: Whether extraction steps may reuse cached LLM results (False bypasses the cache)
+			screenshot_options: Debug screenshot format, quality and capture options (default: viewport JPEG, unchanged frames skipped)
+			prefetch_next_element: Whether to look up the next step's element while the current action's page settles
+			trace: Whether to record per-step timing spans for each run (available afterwards as ``last_trace``)
+			learn_wait_times: Whether to replace static inter-step waits with the p95 settle time measured on earlier runs
+			step_timings: Optional store of measured settle times (default with learn_wait_times: ./tmp/step_timings)
+			incremental_mapping: Whether semantic steps re-extract only DOM subtrees that changed since the last mapping
 
 		Raises:
 			ValueError: If the workflow schema is invalid (though Pydantic handles most).
@@ -73,7 +116,17 @@ class Workflow:
 
 		self.controller = controller or WorkflowController()
 
-		self.browser = browser or Browser(use_cloud=use_cloud)
+		# Upper bound for event-driven page readiness waits
+		self.page_ready_timeout = workflow_schema.page_ready_timeout or DEFAULT_PAGE_READY_TIMEOUT
+		if isinstance(self.controller, WorkflowController):
+			self.controller.page_ready_timeout = self.page_ready_timeout
+
+		# A session manager owns a warm browser that outlives individual runs
+		self.session_manager = session_manager
+		if session_manager is not None:
+			self.browser = session_manager.browser
+		else:
+			self.browser = browser or Browser(use_cloud=use_cloud)
 
 		# Hack to not close it after agent kicks in
 		self.browser.browser_profile.keep_alive = True
@@ -86,6 +139,8 @@ class Workflow:
 		# Debug mode settings
 		self.debug = debug
 		self.debug_log_folder = Path(debug_log_folder) if debug_log_folder else Path('./logs/workflow_debug')
+		# Screenshots are queued and written by a background task so debug mode stays off the step path
+		self.screenshot_pipeline = DebugScreenshotPipeline(self.debug_log_folder, screenshot_options) if debug else None
 
 		# Step execution settings - use workflow's default_wait_time if not explicitly provided
 		# Check for None explicitly to allow default_wait_time=0 to disable waits
@@ -96,6 +151,33 @@ class Workflow:
 		else:
 			self.step_wait_time = 0.1
 
+		# Look up the next step's target concurrently with the current action instead of after it
+		self.prefetch_next_element = prefetch_next_element
+
+		# Timing spans of the most recent run, when tracing is enabled
+		self.trace = trace
+		self.last_trace: RunTrace | None = None
+
+		# Settle times measured after each step, used as the inter-step wait once a step has enough history
+		self.step_timings = step_timings or (StepTimingStore.for_workflow(workflow_schema) if learn_wait_times else None)
+		self._step_timing_keys: List[str] = (
+			[step_timing_key(i, step) for i, step in enumerate(workflow_schema.steps)] if self.step_timings else []
+		)
+		# Step whose learned wait preceded the running step, credited with the running step's outcome
+		self._learned_wait_step: str | None = None
+
+		# Passed to semantic executors: refresh mappings from changed subtrees only
+		self.incremental_mapping = incremental_mapping
+
+		# Semantic mappings by URL and DOM fingerprint, reused across steps and runs that revisit a page state
+		# An empty shared cache is falsy (it has __len__), so test for None to keep sharing it
+		self.mapping_cache = mapping_cache if mapping_cache is not None else SemanticMappingCache()
+
+		# Content-addressed LLM extraction results, reused when model, goal and page text are unchanged
+		self.extraction_cache = extraction_cache or ExtractionCache()
+		if not use_extraction_cache:
+			self.extraction_cache.enabled = False
+
 		# Initialize multi-strategy element finder
 		self.element_finder = ElementFinder()
 
@@ -104,6 +186,9 @@ class Workflow:
 		self.inputs_def: List[WorkflowInputSchemaDefinition] = self.schema.input_schema
 		self._input_model: type[BaseModel] = self._build_input_model()
 
+		# Placeholder substitution compiled once per step; steps without placeholders are reused as-is
+		self._step_templates: List[StepTemplate] = [StepTemplate(step) for step in self.schema.steps]
+
 	# --- Loaders ---
 	@classmethod
 	def load_from_file(
@@ -118,6 +203,11 @@ class Workflow:
 		debug: bool = False,
 		debug_log_folder: str | Path | None = None,
 		step_wait_time: float = 0.1,
+		session_manager: BrowserSessionManager | None = None,
+		use_extraction_cache: bool = True,
+		trace: bool = False,
+		learn_wait_times: bool = False,
+		incremental_mapping: bool = False,
 	) -> Workflow:
 		"""Load a workflow from a file."""
 		with open(file_path, 'r', encoding='utf-8') as f:
@@ -133,6 +223,11 @@ class Workflow:
 			debug=debug,
 			debug_log_folder=debug_log_folder,
 			step_wait_time=step_wait_time,
+			session_manager=session_manager,
+			use_extraction_cache=use_extraction_cache,
+			trace=trace,
+			learn_wait_times=learn_wait_times,
+			incremental_mapping=incremental_mapping,
 		)
 
 	# --- Runners ---
@@ -240,47 +335,105 @@ class Workflow:
 		else:
 			action_model = ActionModel(**{action_name: params})
 
+		# Candidates for the next step's target, looked up while this action's page settles
+		next_candidates = self._next_step_candidates(step_index)
+
 		try:
-			result = await self.controller.act(action_model, self.browser, page_extraction_llm=self.page_extraction_llm)
+			with span(f'{action_name} action', CATEGORY_ACTION):
+				result = await self.controller.act(action_model, self.browser, page_extraction_llm=self.page_extraction_llm)
 		except Exception as e:
 			raise RuntimeError(f"Deterministic action '{action_name}' failed: {str(e)}")
 
 		# Wait for page to stabilize after certain actions
 		actions_requiring_wait = {'navigation', 'click', 'go_back', 'go_forward'}
-		if action_name in actions_requiring_wait:
+		waits_for_page = action_name in actions_requiring_wait
+
+		prefetch = None
+		if next_candidates and self.prefetch_next_element:
+			page = await self.browser.get_current_page()
+			# Budget covers the readiness wait plus the usual element timeout once the page is ready
+			budget_ms = WAIT_FOR_ELEMENT_TIMEOUT + (int(self.page_ready_timeout * 1000) if waits_for_page else 0)
+			prefetch = start_element_prefetch(page, next_candidates[1], budget_ms)
+
+		if waits_for_page:
 			try:
 				page = await self.browser.get_current_page()
-				# Wait for network to be idle (no more than 2 connections for at least 500ms)
-				await page.wait_for_load_state('networkidle', timeout=10000)
-				logger.info(f'Page stabilized after {action_name} action')
+				# Wait for load, network quiet and a stable DOM, bounded by the workflow's page_ready_timeout
+				with span('wait_for_page_ready', CATEGORY_READINESS):
+					readiness = await wait_for_page_ready(page, timeout=self.page_ready_timeout)
+				logger.info(f'Page stabilized after {action_name} action ({readiness["status"]} in {readiness["elapsed"]}ms)')
 			except Exception as e:
 				# Don't fail if wait times out, just log and continue
 				logger.warning(f'Timeout waiting for page to stabilize after {action_name}: {e}')
 
-		# Helper function to truncate long selectors in logs
-		def truncate_selector(selector: str) -> str:
-			return selector if len(selector) <= 45 else f'{selector[:45]}...'
-
-		# Determine if this is not the last step, and extract next step's cssSelector if available
-		current_index = step_index
-		if current_index < len(self.schema.steps) - 1:
-			next_step = self.schema.steps[current_index + 1]
-			next_step_resolved = self._resolve_placeholders(next_step)
-			css_selector = getattr(next_step_resolved, 'cssSelector', None)
-			if css_selector:
-				try:
+		if next_candidates:
+			await self._wait_for_next_element(next_candidates[0], next_candidates[1], prefetch, confirm=waits_for_page)
+
+		return result
+
+	def _next_step_candidates(self, step_index: int) -> tuple[str, List[Dict[str, str]]] | None:
+		"""The next step's recorded cssSelector and every selector candidate for it, if it has one."""
+		if step_index >= len(self.schema.steps) - 1:
+			return None
+		next_step_resolved = self._resolve_step(step_index + 1)
+		css_selector = getattr(next_step_resolved, 'cssSelector', None)
+		if not css_selector:
+			return None
+		return css_selector, selector_candidates(css_selector, next_step_resolved)
+
+	@traced(CATEGORY_ELEMENT)
+	async def _wait_for_next_element(
+		self,
+		css_selector: str,
+		candidates: List[Dict[str, str]],
+		prefetch: asyncio.Task[str | None] | None,
+		confirm: bool,
+	) -> str:
+		"""Wait until the next step's element is visible, reusing a prefetch started with the current action.
+
+		Args:
+			css_selector: The next step's recorded selector (for logs and errors)
+			candidates: Every selector candidate for the next step
+			prefetch: Lookup started right after the action was dispatched, if any
+			confirm: Whether the action may have replaced the page, so an early match is re-checked on the settled page
+
+		Raises:
+			Exception: If no candidate matches a visible element in time
+		"""
+		selector_used = None
+		# One element timeout from here on, shared by the prefetch and any fallback lookup
+		loop = asyncio.get_running_loop()
+		deadline = loop.time() + WAIT_FOR_ELEMENT_TIMEOUT / 1000
+		try:
+			if prefetch is not None:
+				if confirm and prefetch.done() and prefetch.result():
+					# Matched before the page settled: it may have been the previous document, so check once more
 					page = await self.browser.get_current_page()
+					selector_used = await wait_for_any_selector(page, candidates, timeout_ms=0)
+				else:
+					selector_used = await asyncio.wait_for(asyncio.shield(prefetch), timeout=WAIT_FOR_ELEMENT_TIMEOUT / 1000)
+		except asyncio.TimeoutError:
+			pass
+		finally:
+			if prefetch is not None and not prefetch.done():
+				prefetch.cancel()
 
-					logger.info(f'Waiting for element with selector: {truncate_selector(css_selector)}')
-					locator, selector_used = await get_best_element_handle(
-						page, css_selector, next_step_resolved, timeout_ms=WAIT_FOR_ELEMENT_TIMEOUT
-					)
-					logger.info(f'Element with selector found: {truncate_selector(selector_used)}')
-				except Exception as e:
-					logger.error(f'Failed to wait for element with selector: {truncate_selector(css_selector)}. Error: {e}')
-					raise Exception(f'Failed to wait for element. Selector: {css_selector}') from e
+		if selector_used is None:
+			# Only the budget the prefetch left; once it has been used up, the element is missing
+			remaining_ms = int((deadline - loop.time()) * 1000)
+			if remaining_ms > 0:
+				page = await self.browser.get_current_page()
+				logger.info(f'Waiting for element with selector: {truncate_selector(css_selector)}')
+				selector_used = await wait_for_any_selector(page, candidates, timeout_ms=remaining_ms)
+		else:
+			logger.info(f'Next element prefetched with selector: {truncate_selector(selector_used)}')
 
-		return result
+		if selector_used is None:
+			logger.error(f'Failed to wait for element with selector: {truncate_selector(css_selector)}')
+			raise Exception(f'Failed to wait for element. Selector: {css_selector}')
+
+		logger.info(f'Element with selector found: {truncate_selector(selector_used)}')
+		return selector_used
 
 	def _format_agent_step_context(self, current_step: AgenticWorkflowStep, step_index: int) -> str:
 		"""Format the workflow step context for the agent with extended context (last 2, current, next 2 steps)."""
@@ -349,7 +502,8 @@ class Workflow:
 			override_system_message=AGENT_STEP_SYSTEM_PROMPT,
 		)
 
-		return await agent.run()
+		with span('agent', CATEGORY_AGENT):
+			return await agent.run()
 
 	async def _run_extraction_step(self, step, step_index: int) -> ActionResult:
 		"""
@@ -376,8 +530,8 @@ class Workflow:
 		extraction_llm = self.page_extraction_llm or self.llm
 
 		# Build extraction prompt
-		# Limit page text to avoid token limits
-		truncated_page_text = page_text[:10000] if page_text else ''
+		# Limit page text to avoid token limits, keeping the sections most relevant to the goal
+		truncated_page_text = select_relevant_content(page_text, extraction_goal, MAX_EXTRACTION_CONTENT_CHARS)
 
 		extraction_prompt = f"""You are extracting information from a web page.
 
@@ -397,17 +551,28 @@ Instructions:
 
 Extracted Information:"""
 
-		# Call LLM directly
-		messages = [UserMessage(content=extraction_prompt)]
-		response = await extraction_llm.ainvoke(messages)
-
-		# Extract the text content from response
-		# ainvoke returns ChatInvokeCompletion with a 'completion' attribute
-		extracted_content = ''
-		if hasattr(response, 'completion'):
-			extracted_content = response.completion
-		elif isinstance(response, str):
-			extracted_content = response
+		# Reuse a previous answer for the same model, goal, URL and page text
+		model_identity = llm_cache_identity(extraction_llm)
+		cache_key = self.extraction_cache.make_key(
+			model_identity, 'workflow_extract', extraction_goal, truncated_page_text, url=page_url
+		)
+		extracted_content = self.extraction_cache.get(cache_key)
+		if extracted_content is not None:
+			logger.info('♻️  Using cached extraction result')
+		else:
+			# Call LLM directly
+			messages = [UserMessage(content=extraction_prompt)]
+			with span('extraction llm', CATEGORY_LLM):
+				response = await extraction_llm.ainvoke(messages)
+
+			# Extract the text content from response
+			# ainvoke returns ChatInvokeCompletion with a 'completion' attribute
+			extracted_content = ''
+			if hasattr(response, 'completion'):
+				extracted_content = response.completion
+			elif isinstance(response, str):
+				extracted_content = response
+			self.extraction_cache.put(cache_key, extracted_content, model=model_identity, goal=extraction_goal)
 
 		logger.info(f'Extracted content: {extracted_content[:200]}...')
 
@@ -505,6 +670,17 @@ Extracted Information:"""
 		except Exception as e:
 			raise ValueError(f'Invalid workflow inputs: {e}') from e
 
+	def _resolve_step(self, step_index: int) -> WorkflowStep:
+		"""Return step *step_index* with placeholders filled from the current context."""
+		step = self.schema.steps[step_index]
+		if len(self._step_templates) != len(self.schema.steps):
+			self._step_templates = [StepTemplate(schema_step) for schema_step in self.schema.steps]
+		template = self._step_templates[step_index]
+		if template.step is not step:
+			# The step was replaced after construction (e.g. edited or healed); recompile it
+			template = self._step_templates[step_index] = StepTemplate(step)
+		return template.resolve(self.context)
+
 	def _resolve_placeholders(self, data: Any) -> Any:
 		"""Recursively replace placeholders in *data* using current context variables.
 
@@ -656,7 +832,13 @@ Extracted Information:"""
 
 					if not hasattr(self, '_semantic_executor'):
 						self._semantic_executor = SemanticWorkflowExecutor(
-							self.browser, page_extraction_llm=self.page_extraction_llm
+							self.browser,
+							page_extraction_llm=self.page_extraction_llm,
+							page_ready_timeout=self.page_ready_timeout,
+							incremental_mapping=self.incremental_mapping,
+							mapping_cache=self.mapping_cache,
+							extraction_cache=self.extraction_cache,
+							screenshot_pipeline=self.screenshot_pipeline,
 						)
 					result = await self._semantic_executor.execute_step(step_resolved)
 				else:
@@ -765,7 +947,8 @@ Extracted Information:"""
 			UserMessage(content=combined_text),
 		]
 
-		response = await self.llm.ainvoke(messages, output_format=output_model)
+		with span('output model llm', CATEGORY_LLM):
+			response = await self.llm.ainvoke(messages, output_format=output_model)
 		return response.completion
 
 	async def run_step(self, step_index: int, inputs: dict[str, Any] | None = None):
@@ -794,9 +977,19 @@ Extracted Information:"""
 			else:
 				self.context.update(runtime_inputs)
 
+		if self.session_manager is not None:
+			# Single steps continue on the warm session as-is, without a per-run reset
+			await self.session_manager.acquire(reset=False)
+			try:
+				step_resolved = self._resolve_step(step_index)
+				result = await self._execute_step(step_index, step_resolved)
+				self._store_output(step_resolved, result)
+			finally:
+				self.session_manager.release()
+			return result
+
 		async with self.browser:
-			raw_step_cfg = self.schema.steps[step_index]
-			step_resolved = self._resolve_placeholders(raw_step_cfg)
+			step_resolved = self._resolve_step(step_index)
 			result = await self._execute_step(step_index, step_resolved)
 			# Persist outputs (if declared) for future steps
 			self._store_output(step_resolved, result)
@@ -807,46 +1000,92 @@ Extracted Information:"""
 		# await self.browser.close() # <-- Commented out for testing
 		return result
 
+	async def _acquire_browser(self) -> None:
+		"""Start the browser, or take the warm session (reset for this run) when a session manager is set."""
+		if self.session_manager is not None:
+			await self.session_manager.acquire()
+		else:
+			await self.browser.start()
+
+	async def _release_browser(self, close_browser_at_end: bool) -> None:
+		"""Clean up the browser after a run. Warm sessions are handed back instead of stopped."""
+		if self.session_manager is not None:
+			self.session_manager.release()
+			return
+		if close_browser_at_end:
+			self.browser.browser_profile.keep_alive = False
+			await self.browser.stop()
+
+	@contextmanager
+	def _trace_run(self) -> Iterator[RunTrace | None]:
+		"""Record the enclosed run in a fresh ``last_trace`` when tracing is enabled."""
+		if not self.trace:
+			yield None
+			return
+		self.last_trace = RunTrace(self.schema.name)
+		with self.last_trace.activate() as trace:
+			try:
+				yield trace
+			finally:
+				logger.info('\n' + trace.format_summary())
+
+	async def _wait_between_steps(self, step_index: int) -> None:
+		"""Wait after the previous step: its learned settle time when known, otherwise its static wait."""
+		# Get wait time from previous step's wait_time or use default
+		# Use 'is not None' to allow wait_time=0 to skip the delay intentionally
+		previous_step = self.schema.steps[step_index - 1]
+		step_wait_time_value = getattr(previous_step, 'wait_time', None)
+		wait_time = step_wait_time_value if step_wait_time_value is not None else self.step_wait_time
+
+		if self.step_timings is None or wait_time <= 0:
+			await traced_sleep(wait_time, 'inter-step wait', step_index=step_index)
+			if wait_time > 0:
+				logger.debug(f'Waited {wait_time}s between steps')
+			return
+
+		key = self._step_timing_keys[step_index - 1]
+		learned = self.step_timings.learned_wait(key, wait_time, max_wait=self.page_ready_timeout)
+		if learned is not None:
+			logger.debug(f'Learned wait after step {step_index}: {learned}s (static {wait_time}s)')
+			wait_time = learned
+			self._learned_wait_step = key
+
+		# Measure how long the page actually takes to settle while sleeping
+		page = await self.browser.get_current_page()
+		probe = asyncio.create_task(measure_settle_time(page, timeout=self.page_ready_timeout))
+		try:
+			await traced_sleep(wait_time, 'inter-step wait', step_index=step_index, learned=learned is not None)
+		finally:
+			settled = probe.result() if probe.done() and not probe.cancelled() and probe.exception() is None else None
+			probe.cancel()
+		# A page still busy when the wait ended needed at least the whole wait
+		self.step_timings.record_settle(key, settled if settled is not None else wait_time)
+
+	@contextmanager
+	def _learned_wait_outcome(self) -> Iterator[None]:
+		"""Back off the preceding learned wait if the enclosed step fails, relax it if the step succeeds."""
+		key, self._learned_wait_step = self._learned_wait_step, None
+		if key is None or self.step_timings is None:
+			yield
+			return
+		try:
+			yield
+		except Exception:
+			self.step_timings.record_failure(key)
+			raise
+		self.step_timings.record_success(key)
+
 	async def _capture_debug_screenshot(self, step_index: int, step_description: str, prefix: str = '') -> None:
-		"""Capture a screenshot for debugging purposes.
+		"""Capture a screenshot for debugging purposes and queue it for writing.
 
 		Args:
 			step_index: The index of the current step
 			step_description: Description of the step for the filename
 			prefix: Optional prefix for the filename (e.g., 'before', 'after', 'error')
 		"""
-		if not self.debug:
+		if not self.debug or self.screenshot_pipeline is None:
 			return
-
-		try:
-			# Create debug log folder if it doesn't exist
-			self.debug_log_folder.mkdir(parents=True, exist_ok=True)
-
-			# Clean step description for filename (remove special characters)
-			import re
-
-			clean_description = re.sub(r'[^\w\s-]', '', step_description)
-			clean_description = re.sub(r'[-\s]+', '_', clean_description)
-			clean_description = clean_description[:50]  # Limit length
-
-			# Create timestamp for uniqueness
-			from datetime import datetime
-
-			timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-			# Build filename
-			prefix_str = f'{prefix}_' if prefix else ''
-			filename = f'step_{step_index + 1:02d}_{prefix_str}{clean_description}_{timestamp}.png'
-			screenshot_path = self.debug_log_folder / filename
-
-			# Capture screenshot
-			page = await self.browser.get_current_page()
-			await page.screenshot(path=str(screenshot_path), full_page=True)
-
-			logger.info(f'📸 Debug screenshot saved: {screenshot_path}')
-
-		except Exception as e:
-			logger.warning(f'Failed to capture debug screenshot: {e}')
+		await self.screenshot_pipeline.capture(self.browser, step_index, step_description, prefix)
 
 	async def run(
 		self,
@@ -861,7 +1100,7 @@ Extracted Information:"""
 
 		Args:
 			inputs: Optional dictionary of workflow inputs
-			close_browser_at_end: Whether to close the browser when done
+			close_browser_at_end: Whether to close the browser when done (ignored when a session manager owns the browser)
 			cancel_event: Optional event to signal cancellation
 			output_model: Optional Pydantic model class to convert results to
 
@@ -886,61 +1125,64 @@ Extracted Information:"""
 		if self.step_wait_time > 0.1:  # Only log if it's been changed from default
 			logger.info(f'⏱️  Step wait time configured: {self.step_wait_time}s between steps')
 
-		await self.browser.start()
-		try:
-			for step_index, step_dict in enumerate(self.schema.steps):  # self.steps now holds dictionaries
-				# Wait between steps (configurable)
-				if step_index > 0:  # Don't wait before the first step
-					# Get wait time from previous step's wait_time or use default
-					# Use 'is not None' to allow wait_time=0 to skip the delay intentionally
-					previous_step = self.schema.steps[step_index - 1]
-					step_wait_time_value = getattr(previous_step, 'wait_time', None)
-					wait_time = step_wait_time_value if step_wait_time_value is not None else self.step_wait_time
-					await asyncio.sleep(wait_time)
-					if wait_time > 0:
-						logger.debug(f'Waited {wait_time}s between steps')
-
-				# Check if cancellation was requested
-				if cancel_event and cancel_event.is_set():
-					logger.info('Cancellation requested - stopping workflow execution')
-					break
-
-				# Use description from the step dictionary
-				step_description = step_dict.description or 'No description provided'
-				logger.info(f'--- Running Step {step_index + 1}/{len(self.schema.steps)} -- {step_description} ---')
-
-				# Capture screenshot before step execution (if debug enabled)
-				await self._capture_debug_screenshot(step_index, step_description, prefix='before')
-
-				# Resolve placeholders using the current context (works on the dictionary)
-				step_resolved = self._resolve_placeholders(step_dict)
-
-				# Execute step using the unified _execute_step method
-				try:
-					result = await self._execute_step(step_index, step_resolved)
-
-					# Capture screenshot after successful step execution (if debug enabled)
-					await self._capture_debug_screenshot(step_index, step_description, prefix='after')
-				except Exception as e:
-					# Capture screenshot on error (if debug enabled)
-					await self._capture_debug_screenshot(step_index, step_description, prefix='error')
-					raise  # Re-raise the exception after capturing screenshot
-
-				results.append(result)
-				# Persist outputs using the resolved step dictionary
-				self._store_output(step_resolved, result)
-				logger.info(f'--- Finished Step {step_index + 1} ---\n')
-
-			# Convert results to output model if requested
-			output_model_result: T | None = None
-			if output_model:
-				output_model_result = await self._convert_results_to_output_model(results, output_model)
-
-		finally:
-			# Clean-up browser after finishing workflow
-			if close_browser_at_end:
-				self.browser.browser_profile.keep_alive = False
-				await self.browser.stop()
+		with self._trace_run():
+			await self._acquire_browser()
+			try:
+				for step_index, step_dict in enumerate(self.schema.steps):  # self.steps now holds dictionaries
+					# Wait between steps (configurable)
+					if step_index > 0:  # Don't wait before the first step
+						await self._wait_between_steps(step_index)
+
+					# Check if cancellation was requested
+					if cancel_event and cancel_event.is_set():
+						logger.info('Cancellation requested - stopping workflow execution')
+						break
+
+					# Use description from the step dictionary
+					step_description = step_dict.description or 'No description provided'
+					logger.info(f'--- Running Step {step_index + 1}/{len(self.schema.steps)} -- {step_description} ---')
+
+					with step_span(step_index, step_dict), self._learned_wait_outcome():
+						# Capture screenshot before step execution (if debug enabled)
+						await self._capture_debug_screenshot(step_index, step_description, prefix='before')
+
+						# Resolve placeholders using the current context (works on the dictionary)
+						step_resolved = self._resolve_step(step_index)
+
+						# Execute step using the unified _execute_step method
+						try:
+							result = await self._execute_step(step_index, step_resolved)
+
+							# Capture screenshot after successful step execution (if debug enabled)
+							await self._capture_debug_screenshot(step_index, step_description, prefix='after')
+						except Exception as e:
+							# Capture screenshot on error (if debug enabled)
+							await self._capture_debug_screenshot(step_index, step_description, prefix='error')
+							raise  # Re-raise the exception after capturing screenshot
+
+						results.append(result)
+						# Persist outputs using the resolved step dictionary
+						self._store_output(step_resolved, result)
+					logger.info(f'--- Finished Step {step_index + 1} ---\n')
+
+				if hasattr(self, '_semantic_executor'):
+					await self._semantic_executor.finish()
+
+				# Convert results to output model if requested
+				output_model_result: T | None = None
+				if output_model:
+					output_model_result = await self._convert_results_to_output_model(results, output_model)
+
+			finally:
+				# The executor outlives the run: checks a failed run left queued belong to its page, not the next run's
+				if hasattr(self, '_semantic_executor'):
+					self._semantic_executor.discard_pending_verifications()
+				if self.screenshot_pipeline is not None:
+					# Write out queued screenshots before the run returns
+					await self.screenshot_pipeline.close()
+				if self.step_timings is not None:
+					self.step_timings.save()
+				await self._release_browser(close_browser_at_end)
 
 		return WorkflowRunOutput(step_results=results, output_model=output_model_result)
 
@@ -1058,7 +1300,7 @@ Extract the values from the user's prompt and return them in the required format
 
 		Args:
 			inputs: Optional dictionary of workflow inputs
-			close_browser_at_end: Whether to close the browser when done
+			close_browser_at_end: Whether to close the browser when done (ignored when a session manager owns the browser)
 			cancel_event: Optional event to signal cancellation
 			output_model: Optional Pydantic model class to convert results to
 
@@ -1075,57 +1317,64 @@ Extract the values from the user's prompt and return them in the required format
 
 		results: List[ActionResult | AgentHistoryList] = []
 
-		await self.browser.start()
-		semantic_executor = SemanticWorkflowExecutor(self.browser, page_extraction_llm=self.page_extraction_llm)
-
-		try:
-			for step_index, step_dict in enumerate(self.schema.steps):
-				# Wait between steps (configurable) - same logic as run() method
-				if step_index > 0:  # Don't wait before the first step
-					# Get wait time from previous step's wait_time or use default
-					# Use 'is not None' to allow wait_time=0 to skip the delay intentionally
-					previous_step = self.schema.steps[step_index - 1]
-					step_wait_time_value = getattr(previous_step, 'wait_time', None)
-					wait_time = step_wait_time_value if step_wait_time_value is not None else self.step_wait_time
-					await asyncio.sleep(wait_time)
-					if wait_time > 0:
-						logger.debug(f'Waited {wait_time}s between steps')
-
-				# Check if cancellation was requested
-				if cancel_event and cancel_event.is_set():
-					logger.info('Cancellation requested - stopping workflow execution')
-					break
-
-				# Use description from the step dictionary
-				step_description = step_dict.description or 'No description provided'
-				logger.info(f'--- Running Step {step_index + 1}/{len(self.schema.steps)} -- {step_description} ---')
-
-				# Resolve placeholders using the current context (works on the dictionary)
-				step_resolved = self._resolve_placeholders(step_dict)
-
-				# Only process deterministic steps (no agent steps)
-				if step_resolved.type == 'agent':
-					raise Exception(
-						f'Agent steps are not supported in run_with_no_ai mode. Step {step_index + 1} is an agent step.'
-					)
-
-				# Execute step using semantic executor
-				result = await semantic_executor.execute_step(step_resolved)
-
-				results.append(result)
-				# Persist outputs using the resolved step dictionary
-				self._store_output(step_resolved, result)
-				logger.info(f'--- Finished Step {step_index + 1} ---\n')
-
-			# Convert results to output model if requested
-			output_model_result: T | None = None
-			if output_model:
-				output_model_result = await self._convert_results_to_output_model(results, output_model)
+		with self._trace_run():
+			await self._acquire_browser()
+			semantic_executor = SemanticWorkflowExecutor(
+				self.browser,
+				page_extraction_llm=self.page_extraction_llm,
+				page_ready_timeout=self.page_ready_timeout,
+				incremental_mapping=self.incremental_mapping,
+				mapping_cache=self.mapping_cache,
+				extraction_cache=self.extraction_cache,
+				screenshot_pipeline=self.screenshot_pipeline,
+			)
 
-		finally:
-			# Clean-up browser after finishing workflow
-			if close_browser_at_end:
-				self.browser.browser_profile.keep_alive = False
-				await self.browser.stop()
+			try:
+				for step_index, step_dict in enumerate(self.schema.steps):
+					# Wait between steps (configurable) - same logic as run() method
+					if step_index > 0:  # Don't wait before the first step
+						await self._wait_between_steps(step_index)
+
+					# Check if cancellation was requested
+					if cancel_event and cancel_event.is_set():
+						logger.info('Cancellation requested - stopping workflow execution')
+						break
+
+					# Use description from the step dictionary
+					step_description = step_dict.description or 'No description provided'
+					logger.info(f'--- Running Step {step_index + 1}/{len(self.schema.steps)} -- {step_description} ---')
+
+					with step_span(step_index, step_dict), self._learned_wait_outcome():
+						# Resolve placeholders using the current context (works on the dictionary)
+						step_resolved = self._resolve_step(step_index)
+
+						# Only process deterministic steps (no agent steps)
+						if step_resolved.type == 'agent':
+							raise Exception(
+								f'Agent steps are not supported in run_with_no_ai mode. Step {step_index + 1} is an agent step.'
+							)
+
+						# Execute step using semantic executor
+						result = await semantic_executor.execute_step(step_resolved)
+
+						results.append(result)
+						# Persist outputs using the resolved step dictionary
+						self._store_output(step_resolved, result)
+					logger.info(f'--- Finished Step {step_index + 1} ---\n')
+
+				# Verifications deferred to a batched AI call are settled before the run reports success
+				await semantic_executor.finish()
+
+				# Convert results to output model if requested
+				output_model_result: T | None = None
+				if output_model:
+					output_model_result = await self._convert_results_to_output_model(results, output_model)
+
+			finally:
+				if self.screenshot_pipeline is not None:
+					await self.screenshot_pipeline.close()
+				if self.step_timings is not None:
+					self.step_timings.save()
+				await self._release_browser(close_browser_at_end)
 
 		return WorkflowRunOutput(step_results=results, output_model=output_model_result)
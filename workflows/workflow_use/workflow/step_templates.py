@@ -0,0 +1,141 @@
+"""
+Precompiled placeholder substitution for workflow steps.
+
+Steps reference inputs and earlier outputs with Python format placeholders such as
+``"{email}"``. Resolving them by walking every field of every step and calling ``str.format``
+on each run is wasted work when only a handful of fields are templated, and CSV runs repeat
+it for every row. A ``StepTemplate`` walks its step once, records which (possibly nested)
+fields contain placeholders and builds a substitution closure for each of them. Resolving
+then only touches those fields, and steps without placeholders are returned as-is.
+
+The result matches ``Workflow._resolve_placeholders``: strings are formatted with the context
+as keyword arguments, a missing key leaves the string unchanged, and an ``InputStep`` falls
+back to its ``default_value`` when its value is empty or unresolved.
+"""
+
+from string import Formatter
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from pydantic import BaseModel
+
+from workflow_use.schema.views import InputStep
+
+# Returns the resolved value for a context; None stands for "no placeholders, use the value as-is"
+Resolver = Callable[[Mapping[str, Any]], Any]
+
+_FORMATTER = Formatter()
+
+
+def compile_string(template: str) -> Optional[Resolver]:
+	"""Compile a string with ``{name}`` placeholders into a substitution closure."""
+	# Same cheap test the recursive resolver uses to decide whether to format at all
+	if '{' not in template or '}' not in template:
+		return None
+
+	try:
+		parsed = list(_FORMATTER.parse(template))
+	except ValueError:
+		parsed = None
+
+	# Plain {name} fields are substituted directly; anything else (conversions, format specs,
+	# attribute or index access, malformed braces) goes through str.format for identical results
+	if parsed is None or any(
+		field is not None and (not field.isidentifier() or conversion or spec) for _, field, spec, conversion in parsed
+	):
+
+		def resolve_with_format(context: Mapping[str, Any]) -> str:
+			try:
+				return template.format(**context)
+			except KeyError:
+				return template
+
+		return resolve_with_format
+
+	pieces = tuple((literal, field) for literal, field, _, _ in parsed)
+
+	def resolve(context: Mapping[str, Any]) -> str:
+		try:
+			return ''.join([literal + format(context[field], '') if field is not None else literal for literal, field in pieces])
+		except KeyError:
+			return template
+
+	return resolve
+
+
+def compile_value(value: Any) -> Optional[Resolver]:
+	"""Compile any step value (string, list, dict or model); None when it contains no placeholders."""
+	if isinstance(value, str):
+		return compile_string(value)
+	if isinstance(value, list):
+		return _compile_list(value)
+	if isinstance(value, dict):
+		return _compile_dict(value)
+	if isinstance(value, BaseModel):
+		return _compile_model(value)
+	return None
+
+
+def _compile_list(items: List[Any]) -> Optional[Resolver]:
+	resolvers = [compile_value(item) for item in items]
+	if not any(resolvers):
+		return None
+	pairs = tuple(zip(items, resolvers))
+
+	def resolve(context: Mapping[str, Any]) -> List[Any]:
+		return [resolver(context) if resolver else item for item, resolver in pairs]
+
+	return resolve
+
+
+def _compile_dict(data: Dict[str, Any]) -> Optional[Resolver]:
+	resolvers = {key: resolver for key, value in data.items() if (resolver := compile_value(value))}
+	if not resolvers:
+		return None
+
+	def resolve(context: Mapping[str, Any]) -> Dict[str, Any]:
+		resolved = dict(data)
+		for key, resolver in resolvers.items():
+			resolved[key] = resolver(context)
+		return resolved
+
+	return resolve
+
+
+def _compile_model(model: BaseModel) -> Optional[Resolver]:
+	resolvers = {name: resolver for name in type(model).model_fields if (resolver := compile_value(getattr(model, name)))}
+	# An input step with a default may swap its value for the default even without placeholders
+	input_default = isinstance(model, InputStep) and bool(model.default_value or 'default_value' in resolvers)
+	if not resolvers and not input_default:
+		return None
+
+	def resolve(context: Mapping[str, Any]) -> BaseModel:
+		update = {name: resolver(context) for name, resolver in resolvers.items()}
+		if input_default:
+			value = update.get('value', model.value)
+			default_value = update.get('default_value', model.default_value)
+			# Use the default when the value is empty or still holds an unresolved placeholder
+			if default_value and (not value or not value.strip() or ('{' in value and '}' in value and value == model.value)):
+				update['value'] = default_value
+		return model.model_copy(update=update) if update else model
+
+	return resolve
+
+
+class StepTemplate:
+	"""A workflow step with its placeholder substitution compiled once."""
+
+	__slots__ = ('step', '_resolver')
+
+	def __init__(self, step: BaseModel):
+		self.step = step
+		self._resolver = compile_value(step)
+
+	@property
+	def has_placeholders(self) -> bool:
+		return self._resolver is not None
+
+	def resolve(self, context: Mapping[str, Any]) -> BaseModel:
+		"""Return the step with placeholders filled from ``context`` (the step itself when it has none)."""
+		if self._resolver is None:
+			return self.step
+		return self._resolver(context)
@@ -0,0 +1,190 @@
+"""
+Learned inter-step waits from run history.
+
+Inter-step delays normally come from static values (``default_wait_time``, a step's
+``wait_time`` or the agent duration recorded at generation time), which are usually far
+longer than the page needs. With learning enabled, every run measures how long the page took
+to settle after each step and keeps the last ``window`` samples per step in a small JSON file
+per workflow. Once a step has ``min_samples`` samples, later runs wait for the rolling p95 plus
+a safety margin instead, never longer than the static wait.
+
+A settle sample is the time until network and DOM went quiet, observed by an event-driven
+readiness probe that runs alongside the inter-step sleep. A probe still busy when the sleep
+ends records the sleep itself, so a step whose page keeps changing drifts back towards its
+static wait. When a step fails after a learned wait, the wait before it is multiplied by
+``backoff_factor`` (up to ``max_backoff``, and beyond the static wait if needed); every success
+halves the backoff again.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from workflow_use.workflow.page_readiness import DEFAULT_PAGE_READY_TIMEOUT, wait_for_page_ready
+
+if TYPE_CHECKING:
+	from browser_use.actor.page import Page
+
+	from workflow_use.schema.views import WorkflowDefinitionSchema, WorkflowStep
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STEP_TIMINGS_DIR = './tmp/step_timings'
+
+# Rolling window of settle samples kept per step
+DEFAULT_WINDOW = 20
+
+# Samples needed before a learned wait replaces the static one
+DEFAULT_MIN_SAMPLES = 3
+
+# Learned wait = p95 * (1 + SAFETY_MARGIN) + MIN_MARGIN_SECONDS
+DEFAULT_SAFETY_MARGIN = 0.25
+MIN_MARGIN_SECONDS = 0.05
+
+DEFAULT_BACKOFF_FACTOR = 2.0
+DEFAULT_MAX_BACKOFF = 8.0
+
+# Quiet period the settle probe requires; the page settled this long before the probe returned
+SETTLE_QUIET_MS = 100
+
+# Step fields that don't change what the page does after the step
+_UNKEYED_FIELDS = {'description', 'wait_time', 'output', 'agent_reasoning'}
+
+
+def step_timing_key(step_index: int, step: 'WorkflowStep') -> str:
+	"""Identify a step by position and content, so editing a step starts its history afresh."""
+	fields = {k: v for k, v in step.model_dump(exclude_none=True).items() if k not in _UNKEYED_FIELDS}
+	digest = hashlib.sha256(json.dumps(fields, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+	return f'{step_index}:{digest[:12]}'
+
+
+def _percentile(samples: List[float], q: float) -> float:
+	ordered = sorted(samples)
+	rank = (len(ordered) - 1) * q / 100
+	low, high = math.floor(rank), math.ceil(rank)
+	return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+async def measure_settle_time(page: 'Page', timeout: float = DEFAULT_PAGE_READY_TIMEOUT) -> Optional[float]:
+	"""Seconds until the page's network and DOM went quiet, or None if it never did within ``timeout``."""
+	readiness = await wait_for_page_ready(page, timeout=timeout, quiet_ms=SETTLE_QUIET_MS)
+	if readiness.get('status') != 'ready':
+		return None
+	return max(0.0, (readiness['elapsed'] - SETTLE_QUIET_MS) / 1000)
+
+
+class StepTimingStore:
+	"""Per-step settle samples and failure backoff of one workflow, persisted as JSON."""
+
+	def __init__(
+		self,
+		path: str | Path,
+		window: int = DEFAULT_WINDOW,
+		min_samples: int = DEFAULT_MIN_SAMPLES,
+		safety_margin: float = DEFAULT_SAFETY_MARGIN,
+		backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+		max_backoff: float = DEFAULT_MAX_BACKOFF,
+	):
+		"""
+		Args:
+			path: JSON file holding the workflow's step timings (created on first save)
+			window: Samples kept per step
+			min_samples: Samples needed before a learned wait is used
+			safety_margin: Relative margin added to the p95
+			backoff_factor: Multiplier applied to a step's wait each time the following step fails
+			max_backoff: Upper bound of the accumulated backoff multiplier
+		"""
+		self.path = Path(path)
+		self.window = window
+		self.min_samples = min_samples
+		self.safety_margin = safety_margin
+		self.backoff_factor = backoff_factor
+		self.max_backoff = max_backoff
+
+		self.steps: Dict[str, Dict[str, Any]] = self._read()
+		# Samples and backoff changes of this run, merged into the file on save so concurrent runs don't clobber each other
+		self._new_samples: Dict[str, List[float]] = {}
+		self._changed_backoff: Dict[str, float] = {}
+
+	@classmethod
+	def for_workflow(
+		cls, schema: 'WorkflowDefinitionSchema', timings_dir: str | Path = DEFAULT_STEP_TIMINGS_DIR, **kwargs: Any
+	) -> 'StepTimingStore':
+		"""Store for ``schema``, in a file named after the workflow and its version."""
+		identity = f'{schema.name}\0{schema.version}'
+		slug = re.sub(r'[^a-z0-9]+', '-', schema.name.lower()).strip('-')[:40] or 'workflow'
+		digest = hashlib.sha256(identity.encode('utf-8')).hexdigest()[:8]
+		return cls(Path(timings_dir) / f'{slug}-{digest}.json', **kwargs)
+
+	def _read(self) -> Dict[str, Dict[str, Any]]:
+		try:
+			with open(self.path, 'r', encoding='utf-8') as f:
+				return json.load(f).get('steps', {})
+		except FileNotFoundError:
+			return {}
+		except (OSError, ValueError) as e:
+			logger.debug(f'Ignoring unreadable step timings {self.path}: {e}')
+			return {}
+
+	def learned_wait(self, key: str, static_wait: float, max_wait: float = DEFAULT_PAGE_READY_TIMEOUT) -> Optional[float]:
+		"""Wait to use after the step, or None while it has too few samples to replace ``static_wait``."""
+		entry = self.steps.get(key)
+		if not entry or len(entry.get('samples', [])) < self.min_samples:
+			return None
+		learned = min(_percentile(entry['samples'], 95) * (1 + self.safety_margin) + MIN_MARGIN_SECONDS, static_wait)
+		backoff = entry.get('backoff', 1.0)
+		if backoff > 1.0:
+			learned = min(learned * backoff, max(max_wait, static_wait))
+		return round(learned, 3)
+
+	def record_settle(self, key: str, seconds: float) -> None:
+		entry = self.steps.setdefault(key, {'samples': [], 'backoff': 1.0})
+		entry['samples'] = (entry['samples'] + [round(seconds, 3)])[-self.window :]
+		self._new_samples.setdefault(key, []).append(round(seconds, 3))
+
+	def record_failure(self, key: str) -> None:
+		"""The step after a learned wait failed: wait longer after ``key`` next time."""
+		entry = self.steps.setdefault(key, {'samples': [], 'backoff': 1.0})
+		entry['backoff'] = min(entry.get('backoff', 1.0) * self.backoff_factor, self.max_backoff)
+		self._changed_backoff[key] = entry['backoff']
+		logger.info(f'⏱️  Backing off learned wait for step {key.split(":")[0]} (x{entry["backoff"]:g})')
+
+	def record_success(self, key: str) -> None:
+		"""The step after a learned wait succeeded: relax any backoff."""
+		entry = self.steps.get(key)
+		if entry and entry.get('backoff', 1.0) > 1.0:
+			entry['backoff'] = max(1.0, entry['backoff'] / self.backoff_factor)
+			self._changed_backoff[key] = entry['backoff']
+
+	def save(self) -> None:
+		"""Merge this run's samples into the file on disk."""
+		if not self._new_samples and not self._changed_backoff:
+			return
+
+		steps = self._read()
+		for key, samples in self._new_samples.items():
+			entry = steps.setdefault(key, {'samples': [], 'backoff': 1.0})
+			entry['samples'] = (entry.get('samples', []) + samples)[-self.window :]
+		for key, backoff in self._changed_backoff.items():
+			steps.setdefault(key, {'samples': [], 'backoff': 1.0})['backoff'] = backoff
+
+		try:
+			self.path.parent.mkdir(parents=True, exist_ok=True)
+			# Write atomically so concurrent runs never read a partial file
+			fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+			with os.fdopen(fd, 'w', encoding='utf-8') as f:
+				json.dump({'steps': steps}, f, indent=2, sort_keys=True)
+			os.replace(tmp_path, self.path)
+		except OSError as e:
+			logger.warning(f'⚠️ Could not write step timings: {e}')
+			return
+
+		self.steps = steps
+		self._new_samples.clear()
+		self._changed_backoff.clear()
@@ -3,15 +3,102 @@ Step verification system for workflow execution.
 
 This module provides deterministic and AI-based verification checks
 to ensure each step completed successfully and achieved its intended goal.
+
+Page state is captured before and after steps with a single in-page call that returns
+compact digests: a hash and length of the visible text, the node count, a mutation counter
+kept by a MutationObserver installed on first capture, the scroll position and a per-document
+id. Deterministic checks compare digests only; the visible text itself is fetched (truncated)
+only when an AI check needs it.
+
+AI checks are gated by a ``VerificationPolicy``. They are skipped when the deterministic checks
+already decide the outcome: everything passed on strong signals, or enough failed that an AI
+pass could not change the result. Checks that still need the LLM are queued with a snapshot of
+the page and answered in one batched call at the next checkpoint (before a submit-like step,
+when the queue is full, or at workflow end). Verdicts are cached by step and page digest, so an
+unchanged page is never asked about twice.
 """
 
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from workflow_use.workflow.tracing import CATEGORY_LLM, CATEGORY_VERIFICATION, span, traced
 
 logger = logging.getLogger(__name__)
 
+# Visible text sent to Python for AI checks
+AI_CHECK_TEXT_CHARS = 2000
+
+# Visible text per step included in an AI verification prompt
+AI_PROMPT_TEXT_CHARS = 500
+
+# Confidence of a passing state-change check that only saw attribute/class mutations or had no pre-step state
+WEAK_SIGNAL_CONFIDENCE = 0.6
+
+# Share of passed checks needed for a step to count as successful
+SUCCESS_CONFIDENCE = 0.7
+
+DEFAULT_AI_SKIP_CONFIDENCE = 0.9
+DEFAULT_AI_BATCH_SIZE = 8
+DEFAULT_VERDICT_CACHE_SIZE = 256
+
+# Steps whose description or target mentions one of these commit the page; pending AI checks are settled first
+CHECKPOINT_KEYWORDS = (
+	'submit',
+	'send',
+	'pay',
+	'purchase',
+	'checkout',
+	'check out',
+	'place order',
+	'confirm',
+	'book',
+	'sign up',
+	'register',
+	'save',
+)
+
+_VERDICT_LINE = re.compile(r'^\W*(?:step\s*)?(\d+)\W*(PASS|FAIL|UNCERTAIN)\b\W*(.*)$', re.IGNORECASE)
+
+PAGE_DIGEST_JS = """(options) => {
+	let tracker = window.__workflowUseDigest;
+	if (!tracker) {
+		tracker = window.__workflowUseDigest = { id: Math.random().toString(36).slice(2), mutations: 0 };
+		try {
+			new MutationObserver((records) => { tracker.mutations += records.length; }).observe(
+				document.documentElement || document, { subtree: true, childList: true, attributes: true, characterData: true }
+			);
+		} catch (e) {}
+	}
+
+	const text = (document.body && document.body.innerText) || '';
+	// 32-bit FNV-1a, enough to tell whether the visible text changed
+	let hash = 0x811c9dc5;
+	for (let i = 0; i < text.length; i++) {
+		hash ^= text.charCodeAt(i);
+		hash = Math.imul(hash, 0x01000193);
+	}
+
+	const digest = {
+		url: location.href,
+		title: document.title,
+		ready_state: document.readyState,
+		document_id: tracker.id,
+		mutation_count: tracker.mutations,
+		text_hash: (hash >>> 0).toString(16),
+		text_length: text.length,
+		visible_elements_count: document.getElementsByTagName('*').length,
+		scroll_position: { x: window.scrollX, y: window.scrollY },
+	};
+	if (options.textChars > 0) digest.visible_text = text.slice(0, options.textChars);
+	return digest;
+}"""
+
 
 class VerificationMethod(Enum):
 	"""Types of verification methods available."""
@@ -63,6 +150,37 @@ class VerificationOutcome:
 			self.suggestions = []
 
 
+@dataclass
+class VerificationPolicy:
+	"""When AI-assisted checks run and how they are batched."""
+
+	ai_skip_confidence: float = DEFAULT_AI_SKIP_CONFIDENCE  # Skip AI when deterministic checks pass at least this confidently
+	batch_ai_checks: bool = True  # Queue AI checks for a batched call instead of calling the LLM per step
+	max_batch_size: int = DEFAULT_AI_BATCH_SIZE  # Flush the queue at the next checkpoint once it holds this many checks
+	checkpoint_keywords: Tuple[str, ...] = CHECKPOINT_KEYWORDS
+	verdict_cache_size: int = DEFAULT_VERDICT_CACHE_SIZE
+
+
+@dataclass
+class PendingAICheck:
+	"""An AI check queued for the next batch, with the page state captured right after its step."""
+
+	check: VerificationCheck
+	step: Any
+	page_state: Dict[str, Any]
+	cache_key: str
+
+
+@dataclass
+class AIVerdict:
+	"""Answer to one AI check; ``passed`` is None when the model was uncertain."""
+
+	step_description: str
+	passed: Optional[bool]
+	detail: str
+	cached: bool = field(default=False)
+
+
 class StepVerifier:
 	"""
 	Verify that workflow steps completed successfully.
@@ -71,21 +189,32 @@ class StepVerifier:
 	and optional AI-assisted verification for complex scenarios.
 	"""
 
-	def __init__(self, llm: Optional[Any] = None):
+	def __init__(self, llm: Optional[Any] = None, policy: Optional[VerificationPolicy] = None):
 		"""
 		Initialize step verifier.
 
 		Args:
 		    llm: Optional language model for AI-assisted verification
+		    policy: When AI checks run and how they are batched (default: VerificationPolicy())
 		"""
 		self.llm = llm
+		self.policy = policy or VerificationPolicy()
+		# AI checks waiting for the next batched call
+		self.pending_ai_checks: List[PendingAICheck] = []
+		# (passed, detail) by step and page digest, least recently used first
+		self._verdicts: 'OrderedDict[str, Tuple[bool, str]]' = OrderedDict()
 
+	@traced(CATEGORY_VERIFICATION)
 	async def verify_step(
 		self, step: Any, browser_session: Any, pre_state: Optional[Dict[str, Any]] = None
 	) -> VerificationOutcome:
 		"""
 		Verify that a step completed successfully.
 
+		Deterministic checks run first; AI checks only run (or are queued) when those leave the
+		outcome open. A queued check doesn't affect this outcome, its verdict is reported by the
+		next ``checkpoint``/``flush``.
+
 		Args:
 		    step: The workflow step that was executed
 		    browser_session: Browser session for DOM inspection
@@ -116,8 +245,14 @@ class StepVerifier:
 		checks_passed = []
 		checks_failed = []
 		details_list = []
+		# Confidence of each passed deterministic check's signal
+		signal_confidences = []
+		ai_confirmed = False
+
+		deterministic_checks = [check for check in checks if check.method != VerificationMethod.AI_ASSISTED]
+		ai_checks = [check for check in checks if check.method == VerificationMethod.AI_ASSISTED]
 
-		for check in checks:
+		for check in deterministic_checks:
 			checks_run.append(check.name)
 			logger.debug(f'      Running check: {check.name}')
 
@@ -125,13 +260,12 @@ class StepVerifier:
 				# Run the check
 				if check.method == VerificationMethod.DETERMINISTIC:
 					passed, detail = await self._run_deterministic_check(check, step, browser_session, pre_state)
-				elif check.method == VerificationMethod.AI_ASSISTED:
-					passed, detail = await self._run_ai_check(check, step, browser_session, pre_state)
 				else:  # HYBRID
 					passed, detail = await self._run_hybrid_check(check, step, browser_session, pre_state)
 
 				if passed:
 					checks_passed.append(check.name)
+					signal_confidences.append(check.parameters.get('confidence', 1.0))
 					logger.info(f'      ✅ {check.name}: PASSED')
 				else:
 					checks_failed.append(check.name)
@@ -144,6 +278,34 @@ class StepVerifier:
 				logger.warning(f'      ❌ {check.name}: ERROR - {e}')
 				details_list.append(f'{check.name}: Error - {e}')
 
+		skip_reason = self._ai_skip_reason(len(checks_passed), len(checks_failed), len(ai_checks), signal_confidences)
+		for check in ai_checks:
+			if skip_reason:
+				logger.debug(f'      ⏭️  {check.name}: skipped ({skip_reason})')
+				details_list.append(f'{check.name}: skipped ({skip_reason})')
+				continue
+
+			try:
+				verdict = await self._ai_verdict(check, step, browser_session)
+			except Exception as e:
+				verdict = (False, f'Error - {e}')
+
+			if verdict is None:
+				logger.info(f'      ⏳ {check.name}: queued for batched AI verification')
+				details_list.append(f'{check.name}: queued for batched AI verification')
+				continue
+
+			passed, detail = verdict
+			checks_run.append(check.name)
+			if passed:
+				checks_passed.append(check.name)
+				ai_confirmed = True
+				logger.info(f'      ✅ {check.name}: PASSED')
+			else:
+				checks_failed.append(check.name)
+				logger.warning(f'      ❌ {check.name}: FAILED - {detail}')
+			details_list.append(f'{check.name}: {detail}')
+
 		# Determine overall result
 		total_checks = len(checks_run)
 		passed_count = len(checks_passed)
@@ -154,14 +316,15 @@ class StepVerifier:
 			confidence = 0.0
 		elif failed_count == 0:
 			result = VerificationResult.SUCCESS
-			confidence = 1.0
+			# Weak signals stay visible in the confidence until an AI check confirms them
+			confidence = 1.0 if ai_confirmed else min(signal_confidences, default=1.0)
 		elif passed_count == 0:
 			result = VerificationResult.FAILURE
 			confidence = 1.0
 		else:
 			# Mixed results
 			confidence = passed_count / total_checks
-			if confidence >= 0.7:
+			if confidence >= SUCCESS_CONFIDENCE:
 				result = VerificationResult.SUCCESS
 			else:
 				result = VerificationResult.FAILURE
@@ -179,6 +342,17 @@ class StepVerifier:
 			details=details,
 		)
 
+	def _ai_skip_reason(self, passed: int, failed: int, ai_count: int, signal_confidences: List[float]) -> Optional[str]:
+		"""Why the AI checks can be skipped for a step, or None if they are needed."""
+		if failed:
+			# Even if every AI check passed, the step would still fail
+			if (passed + ai_count) / (passed + failed + ai_count) < SUCCESS_CONFIDENCE:
+				return 'deterministic checks failed'
+			return None
+		if passed and min(signal_confidences) >= self.policy.ai_skip_confidence:
+			return f'deterministic checks passed with confidence {min(signal_confidences):.0%}'
+		return None
+
 	def _get_verification_checks(self, step: Any, pre_state: Optional[Dict[str, Any]] = None) -> List[VerificationCheck]:
 		"""
 		Get verification checks for a specific step type.
@@ -322,7 +496,7 @@ class StepVerifier:
 		if check_fn == 'check_url_matches':
 			expected_url = check.expected_outcome
 			page = await browser_session.get_current_page()
-			current_url = page.url if page else None
+			current_url = (await self._capture_page_state(page)).get('url') if page else None
 
 			if not current_url:
 				return False, 'Could not get current URL'
@@ -341,7 +515,7 @@ class StepVerifier:
 
 			try:
 				# Check if page is in a loading state
-				ready_state = await page.evaluate('document.readyState')
+				ready_state = (await self._capture_page_state(page)).get('ready_state')
 				if ready_state == 'complete':
 					return True, 'Page fully loaded'
 				else:
@@ -360,15 +534,18 @@ class StepVerifier:
 				current_state = await self._capture_page_state(page)
 
 				# Compare with pre-state if available
-				if pre_state:
+				if pre_state and current_state:
 					# Check if URL changed
 					if current_state.get('url') != pre_state.get('url'):
 						return True, f'URL changed from {pre_state.get("url")} to {current_state.get("url")}'
 
-					# Check if DOM changed significantly
-					dom_changed = current_state.get('dom_hash') != pre_state.get('dom_hash')
-					if dom_changed:
-						return True, 'DOM structure changed'
+					# A new document was loaded (same URL reloaded or replaced)
+					if current_state.get('document_id') != pre_state.get('document_id'):
+						return True, 'Page was reloaded'
+
+					# Check if the visible text changed
+					if current_state.get('text_hash') != pre_state.get('text_hash'):
+						return True, 'Visible text changed'
 
 					# Check if visible elements changed
 					visible_changed = current_state.get('visible_elements_count') != pre_state.get('visible_elements_count')
@@ -378,9 +555,16 @@ class StepVerifier:
 							f'Visible elements changed: {pre_state.get("visible_elements_count")} → {current_state.get("visible_elements_count")}',
 						)
 
+					# Check if the DOM was mutated at all (e.g. attributes or classes toggled)
+					mutations = current_state.get('mutation_count', 0) - pre_state.get('mutation_count', 0)
+					if mutations > 0:
+						check.parameters['confidence'] = WEAK_SIGNAL_CONFIDENCE
+						return True, f'DOM changed ({mutations} mutations)'
+
 					return False, 'No significant page state changes detected'
 				else:
 					# Without pre-state, assume change occurred
+					check.parameters['confidence'] = WEAK_SIGNAL_CONFIDENCE
 					return True, 'State change assumed (no pre-state to compare)'
 
 			except Exception as e:
@@ -505,8 +689,10 @@ class StepVerifier:
 				return False, 'No page available'
 
 			try:
-				current_scroll = await page.evaluate('({x: window.scrollX, y: window.scrollY})')
-				pre_scroll = check.parameters.get('pre_state', {}).get('scroll_position', {})
+				current_scroll = (await self._capture_page_state(page)).get('scroll_position')
+				pre_scroll = (check.parameters.get('pre_state') or {}).get('scroll_position', {})
+				if not current_scroll:
+					return False, 'Could not read scroll position'
 
 				if current_scroll != pre_scroll:
 					return True, f'Scroll changed: {pre_scroll} → {current_scroll}'
@@ -535,7 +721,7 @@ class StepVerifier:
 		self, check: VerificationCheck, step: Any, browser_session: Any, pre_state: Optional[Dict[str, Any]]
 	) -> tuple[bool, str]:
 		"""
-		Run an AI-assisted verification check.
+		Run an AI-assisted verification check immediately.
 
 		Args:
 		    check: The verification check to run
@@ -554,48 +740,172 @@ class StepVerifier:
 			return False, 'No page available'
 
 		try:
-			# Get current page state
-			current_state = await self._capture_page_state(page)
+			# Get current page state, including the visible text the prompt needs
+			current_state = await self._capture_page_state(page, text_chars=AI_CHECK_TEXT_CHARS)
+			verdict = (await self._ask_ai([PendingAICheck(check, step, current_state, cache_key='')]))[0]
+		except Exception as e:
+			return False, f'AI verification error: {e}'
 
-			# Prepare prompt for LLM
-			prompt_text = f"""You are verifying a workflow step execution.
+		if verdict.passed:
+			return True, f'AI verification passed: {verdict.detail}'
+		if verdict.passed is False:
+			return False, f'AI verification failed: {verdict.detail}'
+		return False, f'AI verification uncertain: {verdict.detail}'
 
-Step Type: {getattr(step, 'type', 'unknown')}
-Step Description: {getattr(step, 'description', 'No description')}
-Expected Outcome: {check.expected_outcome or 'Verify step completed successfully'}
+	async def _ai_verdict(self, check: VerificationCheck, step: Any, browser_session: Any) -> Optional[tuple[bool, str]]:
+		"""
+		Answer an AI check from the verdict cache, queue it for the next batch, or run it now.
 
-Current Page State:
-- URL: {current_state.get('url')}
-- Title: {current_state.get('title')}
-- Visible Text: {current_state.get('visible_text', '')[:500]}...
+		Returns:
+		    Tuple of (passed, detail_message), or None if the check was queued
+		"""
+		if not self.llm:
+			return False, 'AI verification requested but no LLM available'
 
-Question: Did this step complete successfully and achieve its intended outcome?
+		page = await browser_session.get_current_page()
+		if not page:
+			return False, 'No page available'
 
-Respond with ONLY one of:
-- PASS: <brief reason>
-- FAIL: <brief reason>
-- UNCERTAIN: <brief reason>
-"""
+		# The page will have moved on by the time a batch runs, so snapshot what the check needs now
+		page_state = await self._capture_page_state(page, text_chars=AI_CHECK_TEXT_CHARS)
+		cache_key = self._verdict_key(check, step, page_state)
+		cached = self._cached_verdict(cache_key)
+		if cached is not None:
+			passed, detail = cached
+			return passed, f'{detail} (cached)'
+
+		pending = PendingAICheck(check, step, page_state, cache_key)
+		if self.policy.batch_ai_checks:
+			self.pending_ai_checks.append(pending)
+			return None
+
+		verdict = (await self._ask_ai([pending]))[0]
+		if verdict.passed is None:
+			return False, f'AI verification uncertain: {verdict.detail}'
+		return verdict.passed, f'AI verification {"passed" if verdict.passed else "failed"}: {verdict.detail}'
+
+	def is_checkpoint(self, step: Any) -> bool:
+		"""Whether ``step`` commits the page (submit, pay, ...), so earlier steps must be verified first."""
+		text = ' '.join(str(getattr(step, attr, None) or '') for attr in ('description', 'target_text')).lower()
+		return any(keyword in text for keyword in self.policy.checkpoint_keywords)
+
+	async def checkpoint(self, next_step: Any = None) -> List[AIVerdict]:
+		"""
+		Settle queued AI checks if ``next_step`` is a checkpoint or the queue is full.
 
-			# Call LLM using ainvoke (BaseChatModel API)
-			from browser_use.llm import UserMessage
+		Args:
+		    next_step: The step about to run
 
-			messages = [UserMessage(content=prompt_text)]
-			result = await self.llm.ainvoke(messages)
-			response_text = result.content.strip().upper()
+		Returns:
+		    Verdicts of the checks that were settled (empty if none were due)
+		"""
+		if not self.pending_ai_checks:
+			return []
+		if len(self.pending_ai_checks) >= self.policy.max_batch_size or (next_step is not None and self.is_checkpoint(next_step)):
+			return await self.flush()
+		return []
+
+	def discard_pending(self) -> int:
+		"""Drop queued AI checks unanswered (e.g. when a run fails); returns how many were dropped."""
+		dropped, self.pending_ai_checks = len(self.pending_ai_checks), []
+		return dropped
+
+	async def flush(self) -> List[AIVerdict]:
+		"""Answer every queued AI check in one LLM call (as at workflow end)."""
+		pending, self.pending_ai_checks = self.pending_ai_checks, []
+		if not pending:
+			return []
+
+		logger.info(f'   🧠 Verifying {len(pending)} queued step(s) in one AI call')
+		try:
+			return await self._ask_ai(pending)
+		except Exception as e:
+			# Deferred checks are advisory: a verifier outage must not fail a workflow whose steps already passed
+			logger.warning(f'⚠️ Batched AI verification failed: {e}')
+			return [
+				AIVerdict(getattr(item.step, 'description', '') or item.check.name, None, f'AI verification error: {e}')
+				for item in pending
+			]
+
+	async def _ask_ai(self, pending: List[PendingAICheck]) -> List[AIVerdict]:
+		"""One LLM call answering every check in ``pending``; verdicts are cached by step and page digest."""
+		from browser_use.llm import UserMessage
+
+		sections = []
+		for number, item in enumerate(pending, start=1):
+			state = item.page_state
+			sections.append(
+				f"""Step {number}:
+Step Type: {getattr(item.step, 'type', 'unknown')}
+Step Description: {getattr(item.step, 'description', 'No description')}
+Expected Outcome: {item.check.expected_outcome or 'Verify step completed successfully'}
+Page State After Step:
+- URL: {state.get('url')}
+- Title: {state.get('title')}
+- Visible Text: {(state.get('visible_text') or '')[:AI_PROMPT_TEXT_CHARS]}..."""
+			)
 
-			if response_text.startswith('PASS'):
-				reason = response_text.replace('PASS:', '').strip()
-				return True, f'AI verification passed: {reason}'
-			elif response_text.startswith('FAIL'):
-				reason = response_text.replace('FAIL:', '').strip()
-				return False, f'AI verification failed: {reason}'
-			else:
-				reason = response_text.replace('UNCERTAIN:', '').strip()
-				return False, f'AI verification uncertain: {reason}'
+		prompt_text = f"""You are verifying workflow step executions.
 
-		except Exception as e:
-			return False, f'AI verification error: {e}'
+{chr(10).join(sections)}
+
+Question: Did each step complete successfully and achieve its intended outcome?
+
+Respond with exactly one line per step, in order, each ONLY of the form:
+<step number>: PASS: <brief reason>
+<step number>: FAIL: <brief reason>
+<step number>: UNCERTAIN: <brief reason>
+"""
+
+		with span('AI verification', CATEGORY_LLM, checks=len(pending)):
+			result = await self.llm.ainvoke([UserMessage(content=prompt_text)])
+		completion = getattr(result, 'completion', None)
+		response_text = completion if isinstance(completion, str) else result.content
+
+		answers: Dict[int, Tuple[str, str]] = {}
+		for line in response_text.strip().splitlines():
+			match = _VERDICT_LINE.match(line.strip())
+			if match:
+				answers.setdefault(int(match.group(1)), (match.group(2).upper(), match.group(3).strip()))
+		# A lone step may be answered without its number
+		if len(pending) == 1 and not answers:
+			text = response_text.strip()
+			status = text.split(':', 1)[0].strip().upper()
+			answers[1] = (status, text.split(':', 1)[1].strip() if ':' in text else '')
+
+		verdicts = []
+		for number, item in enumerate(pending, start=1):
+			status, reason = answers.get(number, ('UNCERTAIN', 'no answer for this step'))
+			passed = {'PASS': True, 'FAIL': False}.get(status)
+			if passed is not None and item.cache_key:
+				self._store_verdict(item.cache_key, passed, f'AI verification {"passed" if passed else "failed"}: {reason}')
+			verdicts.append(AIVerdict(getattr(item.step, 'description', '') or item.check.name, passed, reason))
+		return verdicts
+
+	def _verdict_key(self, check: VerificationCheck, step: Any, page_state: Dict[str, Any]) -> str:
+		"""Same step, same check and same visible page: same verdict."""
+		parts = [
+			check.name,
+			str(check.expected_outcome or ''),
+			str(getattr(step, 'type', '')),
+			str(getattr(step, 'description', '') or ''),
+			str(getattr(step, 'target_text', '') or ''),
+			str(page_state.get('url', '')),
+			str(page_state.get('text_hash', '')),
+		]
+		return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+	def _cached_verdict(self, key: str) -> Optional[Tuple[bool, str]]:
+		verdict = self._verdicts.get(key)
+		if verdict is not None:
+			self._verdicts.move_to_end(key)
+		return verdict
+
+	def _store_verdict(self, key: str, passed: bool, detail: str) -> None:
+		self._verdicts[key] = (passed, detail)
+		self._verdicts.move_to_end(key)
+		while len(self._verdicts) > self.policy.verdict_cache_size:
+			self._verdicts.popitem(last=False)
 
 	async def _run_hybrid_check(
 		self, check: VerificationCheck, step: Any, browser_session: Any, pre_state: Optional[Dict[str, Any]]
@@ -624,34 +934,21 @@ Respond with ONLY one of:
 
 		return passed, detail
 
-	async def _capture_page_state(self, page: Any) -> Dict[str, Any]:
+	async def _capture_page_state(self, page: Any, text_chars: int = 0) -> Dict[str, Any]:
 		"""
-		Capture current page state for comparison.
+		Capture compact digests of the current page state in one round trip.
 
 		Args:
-		    page: Playwright page object
+		    page: Page to inspect
+		    text_chars: How much visible text to include (0 leaves it out)
 
 		Returns:
-		    Dictionary with page state information
+		    Dictionary with page state digests, empty if the page could not be inspected
 		"""
 		try:
-			state = {
-				'url': page.url,
-				'title': await page.title(),
-				'visible_text': await page.evaluate('document.body?.innerText || ""'),
-				'visible_elements_count': await page.evaluate('document.querySelectorAll("*").length'),
-				'scroll_position': await page.evaluate('({x: window.scrollX, y: window.scrollY})'),
-			}
-
-			# Calculate simple DOM hash
-			try:
-				dom_structure = await page.evaluate('document.documentElement?.outerHTML?.substring(0, 1000) || ""')
-				state['dom_hash'] = hash(dom_structure)
-			except Exception:
-				state['dom_hash'] = 0
-
-			return state
-
+			state = await page.evaluate(PAGE_DIGEST_JS, {'textChars': text_chars})
+			state = json.loads(state) if isinstance(state, str) else state
+			return state if isinstance(state, dict) else {}
 		except Exception as e:
 			logger.debug(f'Error capturing page state: {e}')
 			return {}
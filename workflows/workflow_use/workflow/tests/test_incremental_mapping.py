@@ -0,0 +1,137 @@
+"""
+Tests for incremental semantic mapping extraction.
+"""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from browser_use.agent.views import ActionResult
+
+from workflow_use.schema.views import WorkflowDefinitionSchema
+from workflow_use.workflow.semantic_extractor import SemanticExtractor
+from workflow_use.workflow.service import Workflow
+
+
+def _element(wf_id, text, element_id=''):
+	return {
+		'wf_id': wf_id,
+		'tag': 'BUTTON',
+		'type': 'button',
+		'role': '',
+		'id': element_id,
+		'name': '',
+		'class': '',
+		'text_content': text,
+		'css_selector': f'#{element_id}' if element_id else 'button',
+	}
+
+
+class FakePage:
+	"""Replays canned extraction results and records the incremental options it received."""
+
+	def __init__(self, results):
+		self.results = list(results)
+		self.calls = []
+
+	async def evaluate(self, js_code, debug_mode, incremental=None):
+		self.calls.append(incremental)
+		return json.dumps(self.results.pop(0))
+
+
+class TestIncrementalMapping:
+	"""Test suite for SemanticExtractor incremental mode."""
+
+	@pytest.fixture
+	def extractor(self):
+		return SemanticExtractor()
+
+	async def test_unchanged_page_reuses_mapping(self, extractor):
+		page = FakePage(
+			[
+				{'status': 'full', 'order': [1, 2], 'elements': [_element(1, 'Save', 'save'), _element(2, 'Cancel', 'cancel')]},
+				{'status': 'unchanged', 'order': [1, 2], 'elements': []},
+			]
+		)
+
+		first = await extractor.extract_semantic_mapping(page, incremental=True)
+		second = await extractor.extract_semantic_mapping(page, incremental=True)
+
+		assert second is first, 'Unchanged page should return the cached mapping object'
+		assert page.calls[0]['reset'] is True, 'First extraction must request a full scan'
+		assert page.calls[1]['reset'] is False
+
+	async def test_delta_patches_changed_and_removed_elements(self, extractor):
+		page = FakePage(
+			[
+				{'status': 'full', 'order': [1, 2], 'elements': [_element(1, 'Save', 'save'), _element(2, 'Cancel', 'cancel')]},
+				{'status': 'delta', 'order': [1, 3], 'elements': [_element(3, 'Delete', 'delete')]},
+			]
+		)
+
+		await extractor.extract_semantic_mapping(page, incremental=True)
+		mapping = await extractor.extract_semantic_mapping(page, incremental=True)
+
+		assert list(mapping.keys()) == ['Save', 'Delete'], f'Unexpected mapping keys: {list(mapping.keys())}'
+		assert mapping['Delete']['selectors'] == '#delete'
+		assert mapping['Delete']['deterministic_id'] == 'button_2', 'IDs should follow document order like a full extraction'
+
+	async def test_out_of_sync_delta_falls_back_to_full(self, extractor):
+		page = FakePage(
+			[
+				{'status': 'delta', 'order': [7], 'elements': []},
+				{'status': 'full', 'order': [7], 'elements': [_element(7, 'Next', 'next')]},
+			]
+		)
+		extractor._element_cache = {1: _element(1, 'Stale')}
+
+		mapping = await extractor.extract_semantic_mapping(page, incremental=True)
+
+		assert list(mapping.keys()) == ['Next']
+		assert page.calls[1]['reset'] is True, 'Retry should force a full extraction'
+
+	async def test_clean_elements_pick_up_label_and_layout_changes(self, extractor):
+		position = {'x': 10, 'y': 20, 'width': 80, 'height': 30}
+		page = FakePage(
+			[
+				{
+					'status': 'full',
+					'order': [1],
+					'elements': [{**_element(1, '', 'email'), 'label_text': 'Email', 'position': position}],
+				},
+				{'status': 'unchanged', 'order': [1], 'elements': [], 'refreshed': [[1, 'Email', 10, 20, 80, 30]]},
+				{'status': 'unchanged', 'order': [1], 'elements': [], 'refreshed': [[1, 'Work email', 10, 420, 80, 30]]},
+			]
+		)
+
+		first = await extractor.extract_semantic_mapping(page, incremental=True)
+		second = await extractor.extract_semantic_mapping(page, incremental=True)
+		third = await extractor.extract_semantic_mapping(page, incremental=True)
+
+		assert second is first, 'Unchanged label and layout should keep the mapping'
+		assert list(third.keys()) == ['Work email'], 'A changed <label> outside the element should rename its entry'
+		assert third['Work email'].position['y'] == 420, 'Clean elements should report their current position'
+
+
+class TestIncrementalMappingOption:
+	"""Test that Workflow passes incremental_mapping to its semantic executor."""
+
+	async def test_workflow_enables_incremental_executor(self):
+		schema = WorkflowDefinitionSchema(
+			name='Incremental',
+			description='Incremental mapping option',
+			version='1.0',
+			steps=[{'type': 'extract', 'extractionGoal': 'Result', 'description': 'Extract'}],
+			input_schema=[],
+		)
+		browser = Mock()
+		browser.start = AsyncMock()
+		executor = Mock()
+		executor.execute_step = AsyncMock(return_value=ActionResult(extracted_content='ok'))
+		executor.finish = AsyncMock()
+
+		with patch('workflow_use.workflow.semantic_executor.SemanticWorkflowExecutor', return_value=executor) as executor_class:
+			workflow = Workflow(workflow_schema=schema, llm=Mock(), browser=browser, incremental_mapping=True)
+			await workflow.run_with_no_ai(close_browser_at_end=False)
+
+		assert executor_class.call_args.kwargs['incremental_mapping'] is True
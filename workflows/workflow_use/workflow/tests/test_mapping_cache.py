@@ -0,0 +1,90 @@
+"""
+Tests for the semantic mapping cache keyed by URL and DOM fingerprint.
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from workflow_use.schema.views import WorkflowDefinitionSchema
+from workflow_use.workflow.mapping_cache import DOM_FINGERPRINT_JS, SemanticMappingCache
+from workflow_use.workflow.semantic_extractor import SemanticExtractor
+from workflow_use.workflow.service import Workflow
+
+
+def _element(text, element_id):
+	return {'tag': 'BUTTON', 'type': 'button', 'id': element_id, 'text_content': text, 'css_selector': f'#{element_id}'}
+
+
+class FakePage:
+	"""Answers fingerprint requests from a list and counts full extractions."""
+
+	def __init__(self, fingerprints, url='https://example.com/login'):
+		self.fingerprints = list(fingerprints)
+		self.url = url
+		self.extractions = 0
+
+	async def evaluate(self, js_code, *args):
+		if js_code == DOM_FINGERPRINT_JS:
+			return json.dumps({'url': self.url, 'fingerprint': self.fingerprints.pop(0)})
+		self.extractions += 1
+		return json.dumps({'elements': [_element('Sign in', 'signin')]})
+
+
+class TestSemanticMappingCache:
+	"""Test suite for SemanticMappingCache and its use in SemanticExtractor."""
+
+	@pytest.fixture
+	def cache(self):
+		return SemanticMappingCache(max_entries=2)
+
+	def test_lru_eviction(self, cache):
+		cache.put(('a', '1'), {'A': {}}, None)
+		cache.put(('b', '1'), {'B': {}}, None)
+		assert cache.get(('a', '1')) is not None, 'Reading an entry marks it recently used'
+
+		cache.put(('c', '1'), {'C': {}}, None)
+
+		assert len(cache) == 2
+		assert cache.get(('b', '1')) is None, 'Least recently used entry should be evicted'
+		assert cache.get(('a', '1')) is not None
+		assert (cache.hits, cache.misses) == (2, 1)
+
+	async def test_same_page_state_skips_extraction(self, cache):
+		page = FakePage(['10:abc', '10:abc', '10:abc'])
+		first_extractor = SemanticExtractor(mapping_cache=cache)
+		second_extractor = SemanticExtractor(mapping_cache=cache)
+
+		first = await first_extractor.extract_semantic_mapping(page)
+		second = await second_extractor.extract_semantic_mapping(page)
+
+		assert page.extractions == 1, 'Identical page state should be extracted once'
+		assert second is first
+		assert second_extractor.find_element_by_text(second, 'sign in') is first['Sign in']
+
+	async def test_changed_fingerprint_extracts_again(self, cache):
+		# The DOM changes during the first extraction, so that mapping must not be cached
+		page = FakePage(['10:abc', '11:def', '11:def', '11:def', '11:def'])
+		extractor = SemanticExtractor(mapping_cache=cache)
+
+		await extractor.extract_semantic_mapping(page)
+		await extractor.extract_semantic_mapping(page)
+		await extractor.extract_semantic_mapping(page)
+
+		assert page.extractions == 2, 'Unstable and new page states need extraction, the repeat does not'
+		assert len(cache) == 1
+
+	def test_workflow_keeps_empty_shared_cache(self, cache):
+		schema = WorkflowDefinitionSchema(
+			name='Shared Cache',
+			description='Share a mapping cache',
+			version='1.0',
+			steps=[{'type': 'extract', 'extractionGoal': 'Result', 'description': 'Extract'}],
+			input_schema=[],
+		)
+		first = Workflow(workflow_schema=schema, llm=Mock(), browser=Mock(), mapping_cache=cache)
+		second = Workflow(workflow_schema=schema, llm=Mock(), browser=Mock(), mapping_cache=first.mapping_cache)
+
+		assert len(cache) == 0
+		assert first.mapping_cache is cache and second.mapping_cache is cache, 'An empty shared cache must not be replaced'
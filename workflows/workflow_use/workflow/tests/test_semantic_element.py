@@ -0,0 +1,73 @@
+"""
+Tests for the compact semantic mapping entry record.
+"""
+
+import json
+import sys
+
+import pytest
+
+from workflow_use.workflow.semantic_element import SEMANTIC_ELEMENT_KEYS, SemanticElement
+from workflow_use.workflow.semantic_extractor import SemanticExtractor
+
+
+def _extracted(**overrides):
+	element_info = {
+		'tag': 'BUTTON',
+		'type': 'submit',
+		'id': 'save',
+		'class': 'btn btn-primary',
+		'text_content': 'Save',
+		'css_selector': '#save',
+		'label_text': '',
+		'container_context': {'text': 'Profile form', 'id': 'profile'},
+	}
+	element_info.update(overrides)
+	return element_info
+
+
+class TestSemanticElement:
+	"""Test suite for SemanticElement."""
+
+	@pytest.fixture
+	def element(self):
+		return SemanticElement.from_extracted(_extracted(), 'button', 'button_1', 'Save')
+
+	def test_dict_compatible_access(self, element):
+		assert element['selectors'] == '#save'
+		assert element['class'] == 'btn btn-primary'
+		assert element.get('hierarchical_selector') == '#save', 'Selector fallbacks default to the CSS selector'
+		assert element.get('placeholder', 'none') == 'none', 'Unknown keys fall back to the default'
+		assert element['container_context'].get('text', '') == 'Profile form'
+		assert element.get('sibling_context', {}).get('position') is None
+		assert 'label_text' in element and 'placeholder' not in element
+		assert list(element.keys()) == list(SEMANTIC_ELEMENT_KEYS)
+		with pytest.raises(KeyError):
+			element['placeholder']
+
+	def test_to_dict_round_trips_through_json(self, element):
+		as_dict = element.to_dict()
+
+		assert json.loads(json.dumps(as_dict)) == as_dict
+		assert element == as_dict, 'Record should compare equal to the dict it replaces'
+
+	def test_compact_and_interned(self, element):
+		other = SemanticElement.from_extracted(_extracted(id='cancel'), ''.join(['but', 'ton']), 'button_2', 'Cancel')
+
+		assert other.element_type is element.element_type, 'Element types should be interned'
+		assert other.css_class is element.css_class, 'Class names should be interned'
+		assert sys.getsizeof(element) < sys.getsizeof(element.to_dict()) / 2
+		with pytest.raises(AttributeError):
+			element.extra = 'no __dict__'
+
+	async def test_extractor_builds_records(self):
+		class FakePage:
+			async def evaluate(self, js_code, *args):
+				return json.dumps({'elements': [_extracted()]})
+
+		mapping = await SemanticExtractor().extract_semantic_mapping(FakePage())
+
+		entry = mapping['Save']
+		assert isinstance(entry, SemanticElement)
+		assert entry['element_type'] == 'button'
+		assert entry['original_text'] == 'Save'
@@ -0,0 +1,63 @@
+"""
+Tests for the semantic mapping lookup index.
+"""
+
+import pytest
+
+from workflow_use.workflow.semantic_extractor import SemanticExtractor
+from workflow_use.workflow.semantic_index import SemanticMappingIndex
+
+
+def _info(selectors, original_text, label_text=''):
+	return {'selectors': selectors, 'original_text': original_text, 'label_text': label_text}
+
+
+class TestSemanticMappingIndex:
+	"""Test suite for SemanticMappingIndex."""
+
+	@pytest.fixture
+	def mapping(self):
+		return {
+			'Email Address': _info('#email', 'Email Address', 'Email'),
+			'Submit': _info('button', 'Submit'),
+			'Submit (2)': _info('#submitSecondary', 'Submit'),
+			'First Name': _info('input[name="first_name"]', 'First Name'),
+			'Search flights': _info('#searchBox', 'Search flights'),
+		}
+
+	def test_exact_match_returns_first_in_mapping_order(self, mapping):
+		index = SemanticMappingIndex(mapping)
+
+		assert index.exact('submit').text == 'Submit'
+		assert index.exact('missing') is None
+
+	def test_attribute_match_covers_id_prefix_and_name(self, mapping):
+		index = SemanticMappingIndex(mapping)
+
+		assert index.attribute_match('first_name').text == 'First Name'
+		assert index.attribute_match('submit').text == 'Submit (2)', "'#submit' is a substring of '#submitSecondary'"
+		assert index.attribute_match('password') is None
+
+	def test_candidates_are_in_mapping_order(self, mapping):
+		index = SemanticMappingIndex(mapping)
+
+		words = [entry.text for entry in index.word_candidates(['submit', 'name'])]
+		contained = [entry.text for entry in index.containment_candidates('email address field', min_length_ratio=0.3)]
+
+		assert words == ['Submit', 'Submit (2)', 'First Name']
+		assert 'Email Address' in contained
+		assert all(a.seq < b.seq for a, b in zip(index.containment_candidates('sub'), index.containment_candidates('sub')[1:]))
+
+	def test_extractor_lookups_use_cached_index(self, mapping):
+		extractor = SemanticExtractor()
+
+		assert extractor.find_element_by_text(mapping, 'email address') is mapping['Email Address']
+		assert extractor.find_element_by_text(mapping, 'search') is mapping['Search flights']
+		assert extractor.find_element_by_text(mapping, 'first_name') is mapping['First Name']
+
+		index = extractor.get_mapping_index(mapping)
+		assert extractor.get_mapping_index(mapping) is index, 'Index should be reused for the same mapping'
+
+		mapping['Cancel'] = _info('button', 'Cancel')
+		assert extractor.get_mapping_index(mapping) is not index, 'Index should be rebuilt after the mapping grows'
+		assert extractor.find_element_by_text(mapping, 'cancel') is mapping['Cancel']
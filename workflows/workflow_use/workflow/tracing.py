@@ -0,0 +1,283 @@
+"""
+Structured per-step timing traces for workflow runs.
+
+A run's wall time is spread over mapping refreshes, element resolution, the browser action,
+verification, LLM calls and fixed sleeps, and nothing in the logs says how much went where.
+``RunTrace`` records nested timing spans for one run. Instrumented code opens spans through
+the module-level ``span`` context manager, the ``traced`` decorator or ``traced_sleep``; they
+attach to the trace active in the current task (a context variable), so concurrent runs in one
+process (MCP server, CSV batches) never mix their spans, and code running without an active
+trace pays only a context variable lookup.
+
+A finished trace exports as Chrome trace-event JSON (open it in ``chrome://tracing`` or
+Perfetto) and as a per-step summary table of self time by category, so time spent in a child
+span (e.g. a mapping refresh during verification) is only counted once.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Span categories, in summary-table column order
+CATEGORY_STEP = 'step'
+CATEGORY_MAPPING = 'mapping'
+CATEGORY_ELEMENT = 'element'
+CATEGORY_ACTION = 'action'
+CATEGORY_READINESS = 'readiness'
+CATEGORY_VERIFICATION = 'verification'
+CATEGORY_LLM = 'llm'
+CATEGORY_AGENT = 'agent'
+CATEGORY_SLEEP = 'sleep'
+
+SUMMARY_CATEGORIES = [
+	CATEGORY_MAPPING,
+	CATEGORY_ELEMENT,
+	CATEGORY_ACTION,
+	CATEGORY_READINESS,
+	CATEGORY_VERIFICATION,
+	CATEGORY_LLM,
+	CATEGORY_AGENT,
+	CATEGORY_SLEEP,
+]
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+	"""One timed phase of a run (times in seconds relative to the trace start)."""
+
+	name: str
+	category: str
+	start: float
+	duration: float = 0.0
+	step_index: Optional[int] = None
+	parent: Optional['Span'] = field(default=None, repr=False)
+	thread: int = 0
+	args: Dict[str, Any] = field(default_factory=dict)
+	children_duration: float = 0.0
+
+	@property
+	def self_time(self) -> float:
+		"""Duration not covered by child spans (clamped, since concurrent children can overlap)."""
+		return max(0.0, self.duration - self.children_duration)
+
+
+_active_trace: contextvars.ContextVar[Optional['RunTrace']] = contextvars.ContextVar('workflow_run_trace', default=None)
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar('workflow_trace_span', default=None)
+
+
+class RunTrace:
+	"""Timing spans recorded for one workflow run."""
+
+	def __init__(self, name: str = 'workflow') -> None:
+		self.name = name
+		self.spans: List[Span] = []
+		self.steps: Dict[int, str] = {}
+		self._origin = time.perf_counter()
+		self._threads: Dict[int, int] = {}
+
+	@contextmanager
+	def activate(self) -> Iterator['RunTrace']:
+		"""Make this the trace that spans in the current task (and tasks it starts) record into."""
+		token = _active_trace.set(self)
+		span_token = _current_span.set(None)
+		try:
+			yield self
+		finally:
+			_current_span.reset(span_token)
+			_active_trace.reset(token)
+
+	def _thread_id(self) -> int:
+		# Chrome traces lay spans out per thread; concurrent asyncio tasks get their own lane
+		try:
+			task = asyncio.current_task()
+		except RuntimeError:
+			task = None
+		return self._threads.setdefault(id(task), len(self._threads) + 1)
+
+	@contextmanager
+	def span(self, name: str, category: str, step_index: Optional[int] = None, **args: Any) -> Iterator[Span]:
+		"""Record the enclosed block as a span; nests under the span open in the current task."""
+		parent = _current_span.get()
+		if step_index is None and parent is not None:
+			step_index = parent.step_index
+		record = Span(
+			name=name,
+			category=category,
+			start=time.perf_counter() - self._origin,
+			step_index=step_index,
+			parent=parent,
+			thread=self._thread_id(),
+			args=args,
+		)
+		token = _current_span.set(record)
+		try:
+			yield record
+		finally:
+			record.duration = time.perf_counter() - self._origin - record.start
+			_current_span.reset(token)
+			if parent is not None:
+				parent.children_duration += record.duration
+			self.spans.append(record)
+
+	@contextmanager
+	def step(self, step_index: int, step: Any) -> Iterator[Span]:
+		"""Record one workflow step; spans opened inside it are attributed to the step."""
+		label = f'{getattr(step, "type", "step")}: {getattr(step, "description", None) or ""}'.strip().rstrip(':')
+		self.steps[step_index] = label
+		with self.span(
+			f'Step {step_index + 1}', CATEGORY_STEP, step_index=step_index, type=getattr(step, 'type', None)
+		) as record:
+			yield record
+
+	# --- Export ---
+
+	def to_chrome_trace(self) -> Dict[str, Any]:
+		"""Return the trace in Chrome trace-event format (complete events, microseconds)."""
+		pid = os.getpid()
+		events: List[Dict[str, Any]] = [
+			{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': self.name}},
+		]
+		for thread in sorted(set(self._threads.values())):
+			events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread, 'args': {'name': f'task {thread}'}})
+
+		for record in sorted(self.spans, key=lambda s: s.start):
+			args = {
+				key: value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+				for key, value in record.args.items()
+			}
+			if record.step_index is not None:
+				args['step'] = record.step_index + 1
+			events.append(
+				{
+					'name': record.name,
+					'cat': record.category,
+					'ph': 'X',
+					'ts': round(record.start * 1_000_000, 1),
+					'dur': round(record.duration * 1_000_000, 1),
+					'pid': pid,
+					'tid': record.thread,
+					'args': args,
+				}
+			)
+		return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': {'workflow': self.name}}
+
+	def write_chrome_trace(self, path: str | Path) -> Path:
+		"""Write the Chrome trace-event JSON to ``path``."""
+		path = Path(path)
+		path.parent.mkdir(parents=True, exist_ok=True)
+		path.write_text(json.dumps(self.to_chrome_trace()))
+		logger.info(f'🧭 Trace written to {path}')
+		return path
+
+	def summary(self) -> List[Dict[str, Any]]:
+		"""Per-step rows: wall time and self time (seconds) by category, plus a final total row."""
+		rows: Dict[Optional[int], Dict[str, Any]] = {}
+
+		def row_for(step_index: Optional[int]) -> Dict[str, Any]:
+			if step_index not in rows:
+				label = self.steps.get(step_index, '') if step_index is not None else '(outside steps)'
+				rows[step_index] = {'step': step_index, 'label': label, 'total': 0.0, **{c: 0.0 for c in SUMMARY_CATEGORIES}}
+				rows[step_index]['other'] = 0.0
+			return rows[step_index]
+
+		for record in self.spans:
+			row = row_for(record.step_index)
+			# Wall time comes from top-level spans (steps, and work done between steps)
+			if record.parent is None:
+				row['total'] += record.duration
+			column = record.category if record.category in SUMMARY_CATEGORIES else 'other'
+			row[column] += record.self_time
+
+		ordered = [rows[key] for key in sorted(rows, key=lambda k: (k is None, k if k is not None else 0))]
+		total = {'step': None, 'label': 'TOTAL', 'total': 0.0, **{c: 0.0 for c in SUMMARY_CATEGORIES}, 'other': 0.0}
+		for row in ordered:
+			for key in ['total', *SUMMARY_CATEGORIES, 'other']:
+				total[key] += row[key]
+		return ordered + [total]
+
+	def format_summary(self, label_width: int = 32) -> str:
+		"""Render ``summary()`` as a fixed-width table (seconds)."""
+		columns = ['total', *SUMMARY_CATEGORIES, 'other']
+		header = f'{"step":<{label_width}}' + ''.join(f'{column:>13}' for column in columns)
+		lines = [f'Trace summary for {self.name}', header, '-' * len(header)]
+		for row in self.summary():
+			name = row['label'] if row['step'] is None else f'{row["step"] + 1}. {row["label"]}'
+			if len(name) > label_width - 1:
+				name = name[: label_width - 4] + '...'
+			lines.append(f'{name:<{label_width}}' + ''.join(f'{row[column]:>13.3f}' for column in columns))
+		return '\n'.join(lines)
+
+
+def current_trace() -> Optional[RunTrace]:
+	"""The trace active in the current task, if any."""
+	return _active_trace.get()
+
+
+@contextmanager
+def span(name: str, category: str, **args: Any) -> Iterator[Optional[Span]]:
+	"""Record the enclosed block in the active trace; does nothing when no trace is active."""
+	trace = _active_trace.get()
+	if trace is None:
+		yield None
+		return
+	with trace.span(name, category, **args) as record:
+		yield record
+
+
+@contextmanager
+def step_span(step_index: int, step: Any) -> Iterator[Optional[Span]]:
+	"""Record one workflow step in the active trace; does nothing when no trace is active."""
+	trace = _active_trace.get()
+	if trace is None:
+		yield None
+		return
+	with trace.step(step_index, step) as record:
+		yield record
+
+
+def traced(category: str, name: str | None = None) -> Callable[[F], F]:
+	"""Decorator recording each call of a sync or async function as a span."""
+
+	def decorator(func: F) -> F:
+		span_name = name or func.__name__
+
+		if inspect.iscoroutinefunction(func):
+
+			@functools.wraps(func)
+			async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+				if _active_trace.get() is None:
+					return await func(*args, **kwargs)
+				with span(span_name, category):
+					return await func(*args, **kwargs)
+
+			return async_wrapper  # type: ignore[return-value]
+
+		@functools.wraps(func)
+		def wrapper(*args: Any, **kwargs: Any) -> Any:
+			if _active_trace.get() is None:
+				return func(*args, **kwargs)
+			with span(span_name, category):
+				return func(*args, **kwargs)
+
+		return wrapper  # type: ignore[return-value]
+
+	return decorator
+
+
+async def traced_sleep(seconds: float, name: str = 'sleep', **args: Any) -> None:
+	"""``asyncio.sleep`` recorded as a sleep span, so fixed waits show up in the trace."""
+	with span(name, CATEGORY_SLEEP, seconds=seconds, **args):
+		await asyncio.sleep(seconds)
@@ -5,6 +5,7 @@ This module provides common functionality for identifying form validation errors
 and other error messages displayed on web pages.
 """
 
+import json
 from typing import List, Optional, Tuple
 
 # Common CSS selectors for error messages across different frameworks and patterns
@@ -22,6 +23,41 @@ VALIDATION_ERROR_SELECTORS = [
 	'.help-block.error',
 ]
 
+# Text containing any of these is browser-internal code rather than a user-facing message
+INTERNAL_CODE_PATTERNS = [
+	'document.getElementById',
+	'function addPageBinding',
+	'serializeAsCallArgument',
+	'__next_f',
+	'globalThis',
+	'self.__next_f',
+]
+
+# Longer messages are likely technical content, not user-facing errors
+MAX_ERROR_MESSAGE_LENGTH = 200
+
+# Evaluates every selector in one pass and applies the visibility, internal-code and length filters in the page
+VALIDATION_ERROR_SCAN_JS = """(selectors, internalPatterns, maxLength) => {
+	const errors = [];
+	for (const selector of selectors) {
+		let elements;
+		try {
+			elements = document.querySelectorAll(selector);
+		} catch (e) {
+			continue;
+		}
+		for (const el of elements) {
+			const rect = el.getBoundingClientRect();
+			if (rect.width === 0 || rect.height === 0 || getComputedStyle(el).visibility === 'hidden') continue;
+			const text = (el.textContent || '').trim();
+			if (!text || text.length > maxLength) continue;
+			if (internalPatterns.some((pattern) => text.includes(pattern))) continue;
+			if (!errors.includes(text)) errors.push(text);
+		}
+	}
+	return errors;
+}"""
+
 
 async def detect_validation_errors(page) -> Tuple[bool, Optional[str]]:
 	"""
@@ -43,54 +79,19 @@ async def detect_validation_errors(page) -> Tuple[bool, Optional[str]]:
 	    if has_errors:
 	        print(f"Validation error: {error_text}")
 	"""
-	try:
-		for selector in VALIDATION_ERROR_SELECTORS:
-			try:
-				elements = await page.query_selector_all(selector)
-				if elements:
-					# Check if any are visible
-					for elem in elements:
-						is_visible = await elem.is_visible()
-						if is_visible:
-							text = await elem.text_content()
-							if text and text.strip():
-								# Filter out browser internal scripts and technical content
-								clean_text = text.strip()
-
-								# Skip if it looks like browser internal code
-								if any(
-									pattern in clean_text
-									for pattern in [
-										'document.getElementById',
-										'function addPageBinding',
-										'serializeAsCallArgument',
-										'__next_f',
-										'globalThis',
-										'self.__next_f',
-									]
-								):
-									continue
-
-								# Skip very long messages (likely technical content, not user-facing errors)
-								if len(clean_text) > 200:
-									continue
-
-								return True, clean_text
-			except Exception:
-				# Ignore errors for individual selectors, try next one
-				continue
-
-		return False, None
-
-	except Exception as e:
-		# If we can't check for errors, assume no errors to avoid blocking
-		return False, None
+	errors = await get_all_validation_errors(page)
+	if errors:
+		return True, errors[0]
+	return False, None
 
 
 async def get_all_validation_errors(page) -> List[str]:
 	"""
 	Get all validation error messages visible on the page.
 
+	All selectors are evaluated together in a single round-trip; filtering and
+	deduplication happen in the page.
+
 	Args:
 	    page: Playwright Page object
 
@@ -102,43 +103,12 @@ async def get_all_validation_errors(page) -> List[str]:
 	    for error in errors:
 	        print(f"Error: {error}")
 	"""
-	errors = []
-
 	try:
-		for selector in VALIDATION_ERROR_SELECTORS:
-			try:
-				elements = await page.query_selector_all(selector)
-				if elements:
-					for elem in elements:
-						is_visible = await elem.is_visible()
-						if is_visible:
-							text = await elem.text_content()
-							if text and text.strip():
-								clean_text = text.strip()
-
-								# Skip browser internal code
-								if any(
-									pattern in clean_text
-									for pattern in [
-										'document.getElementById',
-										'function addPageBinding',
-										'serializeAsCallArgument',
-										'__next_f',
-										'globalThis',
-										'self.__next_f',
-									]
-								):
-									continue
-
-								# Skip very long messages
-								if len(clean_text) > 200:
-									continue
-
-								if clean_text not in errors:  # Avoid duplicates
-									errors.append(clean_text)
-			except Exception:
-				continue
+		result = await page.evaluate(
+			VALIDATION_ERROR_SCAN_JS, VALIDATION_ERROR_SELECTORS, INTERNAL_CODE_PATTERNS, MAX_ERROR_MESSAGE_LENGTH
+		)
+		errors = json.loads(result) if isinstance(result, str) else result
+		return [str(error) for error in errors] if isinstance(errors, list) else []
 	except Exception:
-		pass
-
-	return errors
+		# If we can't check for errors, assume no errors to avoid blocking
+		return []